@@ -1,4 +1,5 @@
 import os
+from functools import wraps
 
 NO_BPY = int(os.environ.get('NO_BPY', '0'))
 
@@ -16,3 +17,17 @@ class BPYLogger(_BPYLogger):
 
 class BPYLoggingManager(_BPYLoggingManager):
     pass
+
+
+def flush_logs(execute):
+    """Operator execute decorator, writes lines buffered during operator to log text datablocks once"""
+
+    # Blender validates argument count of execute, so wrapper has to keep (self, context) signature
+    @wraps(execute)
+    def wrapper(self, context):
+        try:
+            return execute(self, context)
+        finally:
+            BPYLoggingManager().flush()
+
+    return wrapper
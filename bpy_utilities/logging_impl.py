@@ -1,9 +1,21 @@
+import os
+import time
+from collections import deque
+
 import bpy
 
 from typing import Dict
 
 from ..utilities.singleton import SingletonMeta
 
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARN': 30, 'ERROR': 40}
+# Initial level, one of LOG_LEVELS keys, can be changed later with BPYLoggingManager.set_level
+DEFAULT_LOG_LEVEL = os.environ.get('SOURCEIO_LOG_LEVEL', 'INFO').upper()
+# Max number of lines kept between flushes, oldest lines are dropped first
+LOG_BUFFER_SIZE = 20000
+# Min number of seconds between two progress lines of one logger
+PROGRESS_INTERVAL = 1.0
+
 
 def get_log_file(filename):
     return bpy.data.texts.get(filename, None) or bpy.data.texts.new(filename)
@@ -12,19 +24,39 @@ def get_log_file(filename):
 class BPYLoggingManager(metaclass=SingletonMeta):
     def __init__(self):
         self.loggers: Dict[str, BPYLogger] = {}
+        self.level = LOG_LEVELS.get(DEFAULT_LOG_LEVEL, LOG_LEVELS['INFO'])
+        self.buffer = deque(maxlen=LOG_BUFFER_SIZE)
 
     def get_logger(self, name):
-        logger = self.loggers[name] = BPYLogger(name)
+        logger = self.loggers.get(name, None)
+        if logger is None:
+            logger = self.loggers[name] = BPYLogger(name, self)
         return logger
 
+    def set_level(self, level_name):
+        self.level = LOG_LEVELS[level_name]
+
+    def flush(self):
+        """Writes buffered lines to text datablock of every logger, must be called from main thread"""
+        lines_per_logger: Dict[str, list] = {}
+        while self.buffer:
+            name, line = self.buffer.popleft()
+            lines_per_logger.setdefault(name, []).append(line)
+        for name, lines in lines_per_logger.items():
+            get_log_file(name).write(''.join(lines))
+
 
 class BPYLogger:
-    def __init__(self, name):
+    def __init__(self, name, manager: BPYLoggingManager):
         self.name = name
+        self._manager = manager
+        self._last_progress = 0.0
 
     def log(self, log_level, message, module=None):
-        file = get_log_file(self.name)
-        file.write(f'[{log_level:8}]-[{f"{module}:" if module is not None else ""}{self.name}] {message}\n')
+        if LOG_LEVELS[log_level] < self._manager.level:
+            return
+        self._manager.buffer.append(
+            (self.name, f'[{log_level:8}]-[{f"{module}:" if module is not None else ""}{self.name}] {message}\n'))
         print(f'[{log_level:8}]-[{self.name}] {message}')
 
     def debug(self, message, module=None):
@@ -38,3 +70,11 @@ class BPYLogger:
 
     def error(self, message, module=None):
         self.log('ERROR', message, module)
+
+    def progress(self, message, current, total, module=None):
+        """Logs "message current/total" at most once per PROGRESS_INTERVAL, last item is always logged"""
+        now = time.monotonic()
+        if current < total and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self.log('INFO', f'{message} {current}/{total}', module)
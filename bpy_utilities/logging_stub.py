@@ -1,22 +1,43 @@
+import os
+import time
 from typing import Dict
 
 from ..utilities.singleton import SingletonMeta
 
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARN': 30, 'ERROR': 40}
+# Initial level, one of LOG_LEVELS keys, can be changed later with BPYLoggingManager.set_level
+DEFAULT_LOG_LEVEL = os.environ.get('SOURCEIO_LOG_LEVEL', 'INFO').upper()
+# Min number of seconds between two progress lines of one logger
+PROGRESS_INTERVAL = 1.0
+
 
 class BPYLoggingManager(metaclass=SingletonMeta):
     def __init__(self):
         self.loggers: Dict[str, BPYLogger] = {}
+        self.level = LOG_LEVELS.get(DEFAULT_LOG_LEVEL, LOG_LEVELS['INFO'])
 
     def get_logger(self, name):
-        logger = self.loggers[name] = BPYLogger(name)
+        logger = self.loggers.get(name, None)
+        if logger is None:
+            logger = self.loggers[name] = BPYLogger(name, self)
         return logger
 
+    def set_level(self, level_name):
+        self.level = LOG_LEVELS[level_name]
+
+    def flush(self):
+        pass
+
 
 class BPYLogger:
-    def __init__(self, name):
+    def __init__(self, name, manager: BPYLoggingManager):
         self.name = name
+        self._manager = manager
+        self._last_progress = 0.0
 
     def log(self, log_level, message, module=None):
+        if LOG_LEVELS[log_level] < self._manager.level:
+            return
         print(f'[{log_level:8}]--[{f"{module}:" if module is not None else ""}{self.name}] {message}')
 
     def debug(self, message, module=None):
@@ -30,3 +51,10 @@ class BPYLogger:
 
     def error(self, message, module=None):
         self.log('ERROR', message, module)
+
+    def progress(self, message, current, total, module=None):
+        now = time.monotonic()
+        if current < total and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self.log('INFO', f'{message} {current}/{total}', module)
@@ -1,10 +1,11 @@
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 
 import bpy
 import numpy as np
 
 from .node_arranger import nodes_iterate
+from .texture_processing import channel_to_grayscale
 from ...bpy_utilities.logging import BPYLoggingManager
 
 
@@ -112,6 +113,8 @@ log_manager = BPYLoggingManager()
 
 class ShaderBase:
     SHADER: str = "Unknown"
+    # Batch imports may turn node layout off, nodes then stay where they were created
+    arrange_nodes: bool = True
 
     @classmethod
     def all_subclasses(cls):
@@ -135,36 +138,77 @@ class ShaderBase:
                 image.pixels[:] = image_data
             return image
 
-    def load_texture(self, texture_name, texture_path) -> Optional[bpy.types.Image]:
+    def load_texture(self, texture_name, texture_path, postprocess=None) -> Optional[bpy.types.Image]:
         pass
 
     @staticmethod
-    def make_texture(texture_name, texture_dimm, texture_data, raw_texture=False):
+    def get_pixels(image: bpy.types.Image) -> np.ndarray:
+        buffer = np.zeros(image.size[0] * image.size[1] * 4, np.float32)
+        if bpy.app.version > (2, 83, 0):
+            image.pixels.foreach_get(buffer)
+        else:
+            buffer[:] = image.pixels[:]
+        return buffer
+
+    @staticmethod
+    def set_pixels(image: bpy.types.Image, pixels: np.ndarray):
+        if bpy.app.version > (2, 83, 0):
+            image.pixels.foreach_set(pixels)
+        else:
+            image.pixels[:] = pixels.tolist()
+
+    @staticmethod
+    def image_postprocess(flag: str, process: Callable[[np.ndarray], Any]):
+        """Wraps in-place pixel conversion to run on decoded texture data, marking image with flag"""
+
+        def postprocess(image: bpy.types.Image, pixels: np.ndarray):
+            process(pixels)
+            image[flag] = True
+
+        return postprocess
+
+    @classmethod
+    def process_image(cls, image: bpy.types.Image, flag: str, process: Callable[[np.ndarray], Any]):
+        """Converts pixels of already created image, unless it was converted before"""
+        if image.get(flag, None):
+            return image
+        pixels = cls.get_pixels(image)
+        process(pixels)
+        cls.set_pixels(image, pixels)
+        image.pack()
+        image[flag] = True
+        return image
+
+    @classmethod
+    def make_texture(cls, texture_name, texture_dimm, texture_data, raw_texture=False):
         image = bpy.data.images.new(texture_name, width=texture_dimm[0], height=texture_dimm[1], alpha=True)
         image.alpha_mode = 'CHANNEL_PACKED'
         image.file_format = 'TARGA'
-        if bpy.app.version > (2, 83, 0):
-            image.pixels.foreach_set(texture_data.flatten().tolist())
-        else:
-            image.pixels[:] = texture_data.flatten().tolist()
+        cls.set_pixels(image, np.ascontiguousarray(texture_data, np.float32).reshape(-1))
         image.pack()
         if raw_texture:
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
         return image
 
-    @staticmethod
-    def split_to_channels(image):
-        if bpy.app.version > (2, 83, 0):
-            buffer = np.zeros(image.size[0] * image.size[1] * 4, np.float32)
-            image.pixels.foreach_get(buffer)
-        else:
-            buffer = np.array(image.pixels[:])
+    @classmethod
+    def make_channel_texture(cls, image: bpy.types.Image, channel: int, suffix: str, invert=False):
+        """Returns grayscale texture made from one channel of image, reusing one made earlier"""
+        texture_name = cls.new_texture_name_with_suffix(image.name, suffix, 'tga')
+        texture = bpy.data.images.get(texture_name, None)
+        if texture is None:
+            texture = cls.make_texture(texture_name, image.size,
+                                       channel_to_grayscale(cls.get_pixels(image), channel, invert))
+        return texture
+
+    @classmethod
+    def split_to_channels(cls, image):
+        buffer = cls.get_pixels(image)
         return buffer[0::4], buffer[1::4], buffer[2::4], buffer[3::4],
 
-    def load_texture_or_default(self, file: str, default_color: tuple = (1.0, 1.0, 1.0, 1.0)):
+    def load_texture_or_default(self, file: str, default_color: tuple = (1.0, 1.0, 1.0, 1.0), postprocess=None):
         texture_name = Path(file).stem
-        texture = self.load_texture(texture_name, file)
+        texture = self.load_texture(texture_name, file, postprocess)
         return texture or self.get_missing_texture(f'missing_{texture_name}', default_color)
 
     @staticmethod
@@ -193,6 +237,24 @@ class ShaderBase:
     def connect_nodes(self, output_socket, input_socket):
         self.bpy_material.node_tree.links.new(output_socket, input_socket)
 
+    @classmethod
+    def get_or_create_node_group(cls, group_name: str, build: Callable[[bpy.types.NodeTree], None]):
+        """Returns node group from current .blend, building it only when missing"""
+        node_group = bpy.data.node_groups.get(group_name, None)
+        if node_group is None:
+            node_group = bpy.data.node_groups.new(group_name, 'ShaderNodeTree')
+            build(node_group)
+            if cls.arrange_nodes:
+                nodes_iterate(node_group)
+        return node_group
+
+    def create_shader_group(self, build: Callable[..., None], **flags):
+        """Instances template group with fixed logic of shader, one template per combination of feature flags"""
+        group_name = self.SHADER + ''.join(f'_{flag}' for flag, enabled in sorted(flags.items()) if enabled)
+        group_node = self.create_node(Nodes.ShaderNodeGroup, self.SHADER)
+        group_node.node_tree = self.get_or_create_node_group(group_name, lambda group: build(group, **flags))
+        return group_node
+
     def insert_node(self, output_socket, middle_input_socket, middle_output_socket):
         receivers = []
         for link in output_socket.links:
@@ -222,5 +284,7 @@ class ShaderBase:
         self.bpy_material['source_loaded'] = True
 
     def align_nodes(self):
+        if not self.arrange_nodes:
+            return
         nodes_iterate(self.bpy_material.node_tree)
         self.bpy_material.node_tree.nodes.update()
@@ -16,7 +16,8 @@ class LightmapGeneric(Source1ShaderBase):
     def bumpmap(self):
         texture_path = self._vavle_material.get_param('$bumpmap', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.6, 0.0, 0.6, 1.0))
+            image = self.load_texture_or_default(texture_path, (0.6, 0.0, 0.6, 1.0),
+                                                 self.ssbump_postprocess if self.ssbump else None)
             if self.ssbump:
                 image = self.convert_ssbump(image)
             image.colorspace_settings.is_data = True
@@ -44,12 +45,29 @@ class LightmapGeneric(Source1ShaderBase):
     def translucent(self):
         return self._vavle_material.get_param('$translucent', 0) == 1
 
+    @staticmethod
+    def build_shader_group(group, alpha=False, phong=False):
+        group.inputs.new('NodeSocketColor', '$basetexture').default_value = (0.8, 0.8, 0.8, 1.0)
+        group.inputs.new('NodeSocketFloat', '$basetexture alpha').default_value = 1.0
+        group.outputs.new('NodeSocketShader', 'BSDF')
+        group_inputs = group.nodes.new('NodeGroupInput')
+        group_outputs = group.nodes.new('NodeGroupOutput')
+
+        shader = group.nodes.new(Nodes.ShaderNodeBsdfPrincipled)
+        group.links.new(group_inputs.outputs['$basetexture'], shader.inputs['Base Color'])
+        if alpha:
+            group.links.new(group_inputs.outputs['$basetexture alpha'], shader.inputs['Alpha'])
+        if not phong:
+            shader.inputs['Specular'].default_value = 0
+        group.links.new(shader.outputs['BSDF'], group_outputs.inputs['BSDF'])
+
     def create_nodes(self, material_name):
         if super().create_nodes(material_name) in ['UNKNOWN', 'LOADED']:
             return
 
         material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
-        shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled,self.SHADER)
+        shader = self.create_shader_group(self.build_shader_group,
+                                          alpha=self.translucent or self.alphatest, phong=self.phong)
         self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
 
         basetexture = self.basetexture
@@ -58,13 +76,8 @@ class LightmapGeneric(Source1ShaderBase):
             basetexture_node = self.create_node(Nodes.ShaderNodeTexImage, '$basetexture')
             basetexture_node.image = basetexture
 
-            self.connect_nodes(basetexture_node.outputs['Color'], shader.inputs['Base Color'])
-
-            if self.translucent or self.alphatest:
-                self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['Alpha'])
-
-        if not self.phong:
-            shader.inputs['Specular'].default_value = 0
+            self.connect_nodes(basetexture_node.outputs['Color'], shader.inputs['$basetexture'])
+            self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['$basetexture alpha'])
 
 
 class ReflectiveLightmapGeneric(LightmapGeneric):
@@ -1,6 +1,5 @@
 from ...shader_base import Nodes
 from ..source1_shader_base import Source1ShaderBase
-import bpy
 
 
 class Lightmapped4WayBlend(Source1ShaderBase):
@@ -152,46 +151,46 @@ class Lightmapped4WayBlend(Source1ShaderBase):
             self.connect_nodes(color_mixer.outputs['Color'], shader.inputs['Base Color'])
 
     def get_or_create_4way_mix_group(self):
-        mixer_group = bpy.data.node_groups.get("4way_mixer", None)
-        if mixer_group is None:
-            mixer_group = bpy.data.node_groups.new("4way_mixer", "ShaderNodeTree")
-            nodes = mixer_group.nodes
-            links = mixer_group.links
-            link_nodes = links.new
-
-            group_inputs = mixer_group.nodes.new('NodeGroupInput')
-            group_inputs.location = (-350, 0)
-            mixer_group.inputs.new('NodeSocketColor', 'MultiBlend Mask')
-            mixer_group.inputs.new('NodeSocketColor', 'MultiBlend Alpha')
-            mixer_group.inputs.new('NodeSocketColor', 'Color1')
-            mixer_group.inputs.new('NodeSocketColor', 'Color2')
-            mixer_group.inputs.new('NodeSocketColor', 'Color3')
-            mixer_group.inputs.new('NodeSocketColor', 'Color4')
-
-            # create group outputs
-            group_outputs = mixer_group.nodes.new('NodeGroupOutput')
-            group_outputs.location = (300, 0)
-            mixer_group.outputs.new('NodeSocketColor', 'Color')
-
-            split = nodes.new(Nodes.ShaderNodeSeparateRGB)
-            link_nodes(group_inputs.outputs['MultiBlend Mask'], split.inputs['Image'])
-
-            color_mix_0 = nodes.new(Nodes.ShaderNodeMixRGB)
-            color_mix_0.blend_type = 'MIX'
-
-            link_nodes(group_inputs.outputs['Color1'], color_mix_0.inputs['Color1'])
-            link_nodes(group_inputs.outputs['Color2'], color_mix_0.inputs['Color2'])
-            link_nodes(split.outputs['R'], color_mix_0.inputs['Fac'])
-            color_mix_1 = nodes.new(Nodes.ShaderNodeMixRGB)
-            color_mix_1.blend_type = 'MIX'
-            link_nodes(color_mix_0.outputs['Color'], color_mix_1.inputs['Color1'])
-            link_nodes(group_inputs.outputs['Color3'], color_mix_1.inputs['Color2'])
-            link_nodes(split.outputs['G'], color_mix_1.inputs['Fac'])
-            color_mix_2 = nodes.new(Nodes.ShaderNodeMixRGB)
-            color_mix_2.blend_type = 'MIX'
-            link_nodes(color_mix_1.outputs['Color'], color_mix_2.inputs['Color1'])
-            link_nodes(group_inputs.outputs['Color4'], color_mix_2.inputs['Color2'])
-            link_nodes(split.outputs['B'], color_mix_2.inputs['Fac'])
-
-            link_nodes(color_mix_2.outputs['Color'], group_outputs.inputs['Color'])
-        return mixer_group
+        return self.get_or_create_node_group('4way_mixer', self.build_4way_mix_group)
+
+    @staticmethod
+    def build_4way_mix_group(mixer_group):
+        nodes = mixer_group.nodes
+        links = mixer_group.links
+        link_nodes = links.new
+
+        group_inputs = mixer_group.nodes.new('NodeGroupInput')
+        group_inputs.location = (-350, 0)
+        mixer_group.inputs.new('NodeSocketColor', 'MultiBlend Mask')
+        mixer_group.inputs.new('NodeSocketColor', 'MultiBlend Alpha')
+        mixer_group.inputs.new('NodeSocketColor', 'Color1')
+        mixer_group.inputs.new('NodeSocketColor', 'Color2')
+        mixer_group.inputs.new('NodeSocketColor', 'Color3')
+        mixer_group.inputs.new('NodeSocketColor', 'Color4')
+
+        # create group outputs
+        group_outputs = mixer_group.nodes.new('NodeGroupOutput')
+        group_outputs.location = (300, 0)
+        mixer_group.outputs.new('NodeSocketColor', 'Color')
+
+        split = nodes.new(Nodes.ShaderNodeSeparateRGB)
+        link_nodes(group_inputs.outputs['MultiBlend Mask'], split.inputs['Image'])
+
+        color_mix_0 = nodes.new(Nodes.ShaderNodeMixRGB)
+        color_mix_0.blend_type = 'MIX'
+
+        link_nodes(group_inputs.outputs['Color1'], color_mix_0.inputs['Color1'])
+        link_nodes(group_inputs.outputs['Color2'], color_mix_0.inputs['Color2'])
+        link_nodes(split.outputs['R'], color_mix_0.inputs['Fac'])
+        color_mix_1 = nodes.new(Nodes.ShaderNodeMixRGB)
+        color_mix_1.blend_type = 'MIX'
+        link_nodes(color_mix_0.outputs['Color'], color_mix_1.inputs['Color1'])
+        link_nodes(group_inputs.outputs['Color3'], color_mix_1.inputs['Color2'])
+        link_nodes(split.outputs['G'], color_mix_1.inputs['Fac'])
+        color_mix_2 = nodes.new(Nodes.ShaderNodeMixRGB)
+        color_mix_2.blend_type = 'MIX'
+        link_nodes(color_mix_1.outputs['Color'], color_mix_2.inputs['Color1'])
+        link_nodes(group_inputs.outputs['Color4'], color_mix_2.inputs['Color2'])
+        link_nodes(split.outputs['B'], color_mix_2.inputs['Fac'])
+
+        link_nodes(color_mix_2.outputs['Color'], group_outputs.inputs['Color'])
@@ -12,7 +12,7 @@ class VertexLitGeneric(Source1ShaderBase):
     def bumpmap(self):
         texture_path = self._vavle_material.get_param('$bumpmap', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
+            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0), self.normalmap_postprocess)
             image = self.convert_normalmap(image)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
@@ -108,86 +108,120 @@ class VertexLitGeneric(Source1ShaderBase):
     def phongtint(self):
         return self._vavle_material.get_param('$phongtint', (1.0, 1.0, 1.0))
 
+    @staticmethod
+    def build_shader_group(group, tint=False, alpha=False, additive=False, bumpmap=False, selfillum=False,
+                           selfillummask=False, phongexponenttexture=False):
+        group.inputs.new('NodeSocketColor', '$basetexture').default_value = (0.8, 0.8, 0.8, 1.0)
+        group.inputs.new('NodeSocketFloat', '$basetexture alpha').default_value = 1.0
+        group.inputs.new('NodeSocketColor', 'Color tint').default_value = (1.0, 1.0, 1.0, 1.0)
+        group.inputs.new('NodeSocketColor', '$bumpmap').default_value = (0.5, 0.5, 1.0, 1.0)
+        group.inputs.new('NodeSocketColor', '$selfillummask').default_value = (0.0, 0.0, 0.0, 1.0)
+        group.inputs.new('NodeSocketColor', '$phongexponenttexture').default_value = (0.5, 0.0, 0.0, 1.0)
+        group.inputs.new('NodeSocketFloat', 'Specular').default_value = 0.5
+        group.inputs.new('NodeSocketFloat', 'Roughness').default_value = 0.5
+        group.outputs.new('NodeSocketShader', 'BSDF')
+        group_inputs = group.nodes.new('NodeGroupInput')
+        group_outputs = group.nodes.new('NodeGroupOutput')
+        nodes = group.nodes
+        link_nodes = group.links.new
+
+        shader = nodes.new(Nodes.ShaderNodeBsdfPrincipled)
+        basetexture = group_inputs.outputs['$basetexture']
+        color = basetexture
+        if additive:
+            basetexture_invert_node = nodes.new(Nodes.ShaderNodeInvert)
+            basetexture_additive_mix_node = nodes.new(Nodes.ShaderNodeMixRGB)
+            basetexture_additive_mix_node.inputs['Color2'].default_value = (1.0, 1.0, 1.0, 1.0)
+            link_nodes(basetexture, basetexture_additive_mix_node.inputs['Color1'])
+            link_nodes(basetexture, basetexture_invert_node.inputs['Color'])
+            link_nodes(basetexture_invert_node.outputs['Color'], shader.inputs['Transmission'])
+            link_nodes(basetexture_invert_node.outputs['Color'], basetexture_additive_mix_node.inputs['Fac'])
+            color = basetexture_additive_mix_node.outputs['Color']
+        if tint:
+            color_mix = nodes.new(Nodes.ShaderNodeMixRGB)
+            color_mix.blend_type = 'MULTIPLY'
+            color_mix.inputs['Fac'].default_value = 1.0
+            link_nodes(color, color_mix.inputs['Color1'])
+            link_nodes(group_inputs.outputs['Color tint'], color_mix.inputs['Color2'])
+            color = color_mix.outputs['Color']
+        link_nodes(color, shader.inputs['Base Color'])
+        if alpha:
+            link_nodes(group_inputs.outputs['$basetexture alpha'], shader.inputs['Alpha'])
+
+        if bumpmap:
+            normalmap_node = nodes.new(Nodes.ShaderNodeNormalMap)
+            link_nodes(group_inputs.outputs['$bumpmap'], normalmap_node.inputs['Color'])
+            link_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
+
+        if selfillum:
+            if selfillummask:
+                link_nodes(group_inputs.outputs['$selfillummask'], shader.inputs['Emission Strength'])
+            else:
+                link_nodes(group_inputs.outputs['$basetexture alpha'], shader.inputs['Emission Strength'])
+            link_nodes(basetexture, shader.inputs['Emission'])
+
+        link_nodes(group_inputs.outputs['Specular'], shader.inputs['Specular'])
+        if phongexponenttexture:
+            phongexponenttexture_split_node = nodes.new(Nodes.ShaderNodeSeparateRGB)
+            link_nodes(group_inputs.outputs['$phongexponenttexture'], phongexponenttexture_split_node.inputs['Image'])
+
+            phongexponenttexture_r_invert_node = nodes.new(Nodes.ShaderNodeInvert)
+            link_nodes(phongexponenttexture_split_node.outputs['R'], phongexponenttexture_r_invert_node.inputs['Color'])
+            link_nodes(phongexponenttexture_split_node.outputs['G'], shader.inputs['Metallic'])
+            link_nodes(phongexponenttexture_r_invert_node.outputs['Color'], shader.inputs['Roughness'])
+        else:
+            link_nodes(group_inputs.outputs['Roughness'], shader.inputs['Roughness'])
+        link_nodes(shader.outputs['BSDF'], group_outputs.inputs['BSDF'])
+
     def create_nodes(self, material_name):
         if super().create_nodes(material_name) in ['UNKNOWN', 'LOADED']:
             return
 
+        basetexture = self.basetexture
+        bumpmap = self.bumpmap
+        selfillummask = self.selfillummask if self.selfillum else None
+        phongexponenttexture = self.phongexponenttexture
+        color = self.color or self.color2
+
         material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
-        shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled, self.SHADER)
+        shader = self.create_shader_group(self.build_shader_group,
+                                          tint=bool(basetexture and color),
+                                          alpha=bool(basetexture and (self.translucent or self.alphatest)),
+                                          additive=bool(basetexture and self.additive),
+                                          bumpmap=bumpmap is not None,
+                                          selfillum=self.selfillum,
+                                          selfillummask=selfillummask is not None,
+                                          phongexponenttexture=phongexponenttexture is not None)
         self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
 
-        basetexture = self.basetexture
         if basetexture:
             basetexture_node = self.create_node(Nodes.ShaderNodeTexImage, '$basetexture')
             basetexture_node.image = basetexture
+            self.connect_nodes(basetexture_node.outputs['Color'], shader.inputs['$basetexture'])
+            self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['$basetexture alpha'])
 
-            if self.color or self.color2:
-                color_mix = self.create_node(Nodes.ShaderNodeMixRGB)
-                color_mix.blend_type = 'MULTIPLY'
-                self.connect_nodes(basetexture_node.outputs['Color'], color_mix.inputs['Color1'])
-                color = (self.color or self.color2)
+            if color:
                 if isinstance(color, Iterable) and sum(color) > 3:
                     color = list(np.divide(color, 255))
-                color_mix.inputs['Color2'].default_value = (*color, 1.0)
-                color_mix.inputs['Fac'].default_value = 1.0
-                self.connect_nodes(color_mix.outputs['Color'], shader.inputs['Base Color'])
-            else:
-                self.connect_nodes(basetexture_node.outputs['Color'], shader.inputs['Base Color'])
-            if self.translucent or self.alphatest:
-                self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['Alpha'])
-
-            if self.additive:
-                basetexture_invert_node = self.create_node(Nodes.ShaderNodeInvert)
-                basetexture_additive_mix_node = self.create_node(Nodes.ShaderNodeMixRGB)
-                self.insert_node(basetexture_node.outputs['Color'], basetexture_additive_mix_node.inputs['Color1'],
-                                 basetexture_additive_mix_node.outputs['Color'])
-                basetexture_additive_mix_node.inputs['Color2'].default_value = (1.0, 1.0, 1.0, 1.0)
-
-                self.connect_nodes(basetexture_node.outputs['Color'], basetexture_invert_node.inputs['Color'])
-                self.connect_nodes(basetexture_invert_node.outputs['Color'], shader.inputs['Transmission'])
-                self.connect_nodes(basetexture_invert_node.outputs['Color'],
-                                   basetexture_additive_mix_node.inputs['Fac'])
+                shader.inputs['Color tint'].default_value = (*color, 1.0)
 
-        bumpmap = self.bumpmap
         if bumpmap:
             bumpmap_node = self.create_node(Nodes.ShaderNodeTexImage, '$bumpmap')
             bumpmap_node.image = bumpmap
+            self.connect_nodes(bumpmap_node.outputs['Color'], shader.inputs['$bumpmap'])
 
-            normalmap_node = self.create_node(Nodes.ShaderNodeNormalMap)
-
-            self.connect_nodes(bumpmap_node.outputs['Color'], normalmap_node.inputs['Color'])
-            self.connect_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
-
-        if self.selfillum:
-            selfillummask = self.selfillummask
-            basetexture_node = self.get_node('$basetexture')
-            if selfillummask is not None:
-                selfillummask_node = self.create_node(Nodes.ShaderNodeTexImage, '$selfillummask')
-                selfillummask_node.image = selfillummask
-                self.connect_nodes(selfillummask_node.outputs['Color'], shader.inputs['Emission Strength'])
-
-            else:
-                self.connect_nodes(basetexture_node.outputs['Alpha'], shader.inputs['Emission Strength'])
-            self.connect_nodes(basetexture_node.outputs['Color'], shader.inputs['Emission'])
+        if selfillummask is not None:
+            selfillummask_node = self.create_node(Nodes.ShaderNodeTexImage, '$selfillummask')
+            selfillummask_node.image = selfillummask
+            self.connect_nodes(selfillummask_node.outputs['Color'], shader.inputs['$selfillummask'])
 
         if not self.phong:
             shader.inputs['Specular'].default_value = 0
         elif self.phongboost is not None:
             shader.inputs['Specular'].default_value = self.clamp_value(self.phongboost / 64)
-        phongexponenttexture = self.phongexponenttexture
-        if self.phongexponent is not None and phongexponenttexture is None:
+        if phongexponenttexture is None:
             shader.inputs['Roughness'].default_value = self.clamp_value(self.phongexponent / 256)
-        elif self.phongexponenttexture is not None:
+        else:
             phongexponenttexture_node = self.create_node(Nodes.ShaderNodeTexImage, '$phongexponenttexture')
             phongexponenttexture_node.image = phongexponenttexture
-            phongexponenttexture_split_node = self.create_node(Nodes.ShaderNodeSeparateRGB)
-            self.connect_nodes(phongexponenttexture_node.outputs['Color'],
-                               phongexponenttexture_split_node.inputs['Image'])
-
-            phongexponenttexture_r_invert_node = self.create_node(Nodes.ShaderNodeInvert)
-            self.connect_nodes(phongexponenttexture_split_node.outputs['R'],
-                               phongexponenttexture_r_invert_node.inputs['Color'])
-            self.connect_nodes(phongexponenttexture_split_node.outputs['G'],
-                               shader.inputs['Metallic'])
-
-            self.connect_nodes(phongexponenttexture_r_invert_node.outputs['Color'], shader.inputs['Roughness'])
+            self.connect_nodes(phongexponenttexture_node.outputs['Color'], shader.inputs['$phongexponenttexture'])
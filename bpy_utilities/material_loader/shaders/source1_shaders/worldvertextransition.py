@@ -63,33 +63,47 @@ class WorldVertexTransition(Source1ShaderBase):
     def phongboost(self):
         return self._vavle_material.get_param('$phongboost', 1)
 
+    @staticmethod
+    def build_shader_group(group, blend=False, phong=False):
+        group.inputs.new('NodeSocketColor', '$basetexture').default_value = (0.8, 0.8, 0.8, 1.0)
+        group.inputs.new('NodeSocketColor', '$basetexture2').default_value = (0.8, 0.8, 0.8, 1.0)
+        group.outputs.new('NodeSocketShader', 'BSDF')
+        group_inputs = group.nodes.new('NodeGroupInput')
+        group_outputs = group.nodes.new('NodeGroupOutput')
+
+        shader = group.nodes.new(Nodes.ShaderNodeBsdfPrincipled)
+        if blend:
+            vertex_color = group.nodes.new(Nodes.ShaderNodeVertexColor)
+
+            color_mix = group.nodes.new(Nodes.ShaderNodeMixRGB)
+            color_mix.blend_type = 'MIX'
+
+            group.links.new(group_inputs.outputs['$basetexture'], color_mix.inputs['Color1'])
+            group.links.new(group_inputs.outputs['$basetexture2'], color_mix.inputs['Color2'])
+            group.links.new(vertex_color.outputs['Color'], color_mix.inputs['Fac'])
+            group.links.new(color_mix.outputs['Color'], shader.inputs['Base Color'])
+        if not phong:
+            shader.inputs['Specular'].default_value = 0
+        group.links.new(shader.outputs['BSDF'], group_outputs.inputs['BSDF'])
+
     def create_nodes(self, material_name):
         if super().create_nodes(material_name) in ['UNKNOWN', 'LOADED']:
             return
 
-        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
-        shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled,self.SHADER)
-        self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
-
         basetexture = self.basetexture
         basetexture2 = self.basetexture2
+        blend = bool(basetexture and basetexture2)
 
-        if basetexture and basetexture2:
+        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
+        shader = self.create_shader_group(self.build_shader_group, blend=blend, phong=self.phong)
+        self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
+
+        if blend:
             basetexture_node = self.create_node(Nodes.ShaderNodeTexImage, '$basetexture')
             basetexture_node.image = basetexture
 
             basetexture2_node = self.create_node(Nodes.ShaderNodeTexImage, '$basetexture2')
             basetexture2_node.image = basetexture2
 
-            vertex_color = self.create_node(Nodes.ShaderNodeVertexColor)
-
-            color_mix = self.create_node(Nodes.ShaderNodeMixRGB)
-            color_mix.blend_type = 'MIX'
-
-            self.connect_nodes(basetexture_node.outputs['Color'], color_mix.inputs['Color1'])
-            self.connect_nodes(basetexture2_node.outputs['Color'], color_mix.inputs['Color2'])
-            self.connect_nodes(vertex_color.outputs['Color'], color_mix.inputs['Fac'])
-            self.connect_nodes(color_mix.outputs['Color'], shader.inputs['Base Color'])
-
-        if not self.phong:
-            shader.inputs['Specular'].default_value = 0
+            self.connect_nodes(basetexture_node.outputs['Color'], shader.inputs['$basetexture'])
+            self.connect_nodes(basetexture2_node.outputs['Color'], shader.inputs['$basetexture2'])
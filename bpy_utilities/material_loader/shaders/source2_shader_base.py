@@ -4,6 +4,7 @@ from typing import Dict, Any, Union
 import numpy as np
 
 from ..shader_base import ShaderBase
+from ..texture_processing import split_normal_roughness
 from ....source2.resouce_types.valve_texture import ValveCompiledTexture
 from ....source_shared.content_manager import ContentManager
 
@@ -39,36 +40,31 @@ class Source2ShaderBase(ShaderBase):
     def get_dynamic_texture(self, name, default):
         return self._get_param('m_dynamicTextureParams', name, 'error', default)
 
+    def _split_normal_postprocess(self, image: bpy.types.Image, pixels: np.ndarray):
+        roughness_name = self.new_texture_name_with_suffix(image.name, 'roughness', 'tga')
+        self.make_texture(roughness_name, image.size, split_normal_roughness(pixels), True)
+        image['normalmap_converted'] = True
+
+    def load_normal_texture(self, texture_path, default_color: tuple = (0.5, 0.5, 1.0, 1.0)):
+        """Loads normal map with roughness split off while texture is decoded"""
+        return self.load_texture_or_default(texture_path, default_color, self._split_normal_postprocess)
+
     def split_normal(self, image: bpy.types.Image):
         roughness_name = self.new_texture_name_with_suffix(image.name, 'roughness', 'tga')
         if image.get('normalmap_converted', None):
             return image, bpy.data.images.get(roughness_name, None)
-        if bpy.app.version > (2, 83, 0):
-            buffer = np.zeros(image.size[0] * image.size[1] * 4, np.float32)
-            image.pixels.foreach_get(buffer)
-        else:
-            buffer = np.array(image.pixels[:])
-
-        mask = buffer[2::4]
-        roughness_rgb = np.dstack((mask, mask, mask, np.ones_like(mask)))
-
-        roughness_texture = Source2ShaderBase.make_texture(roughness_name, image.size, roughness_rgb, True)
-        buffer[1::4] = np.subtract(1, buffer[1::4])
-        buffer[2::4] = 1.0
-        if bpy.app.version > (2, 83, 0):
-            image.pixels.foreach_set(buffer.tolist())
-        else:
-            image.pixels[:] = buffer.tolist()
+        pixels = self.get_pixels(image)
+        self._split_normal_postprocess(image, pixels)
+        self.set_pixels(image, pixels)
         image.pack()
-        image['normalmap_converted'] = True
-        return image, roughness_texture
+        return image, bpy.data.images.get(roughness_name, None)
 
-    def load_texture(self, texture_name, texture_path):
+    def load_texture(self, texture_name, texture_path, postprocess=None):
 
         if texture_path in self.resources:
             proper_path = self.resources[texture_path]
             texture_path = ContentManager().find_file(proper_path)
             if texture_path:
                 texture = ValveCompiledTexture(texture_path)
-                return texture.load(proper_path.stem, True)
+                return texture.load(proper_path.stem, True, postprocess)
         return None
@@ -31,7 +31,7 @@ class VrComplex(Source2ShaderBase):
     def normal_texture(self):
         texture_path = self.get_texture('g_tNormal', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
+            image = self.load_normal_texture(texture_path)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
             image, roughness = self.split_normal(image)
@@ -75,53 +75,74 @@ class VrComplex(Source2ShaderBase):
             return
         return value[0]
 
+    @staticmethod
+    def build_shader_group(group, tint=False, alpha=False, metalness=False):
+        group.inputs.new('NodeSocketColor', 'albedo').default_value = (0.8, 0.8, 0.8, 1.0)
+        group.inputs.new('NodeSocketFloat', 'albedo alpha').default_value = 1.0
+        group.inputs.new('NodeSocketColor', 'Color tint').default_value = (1.0, 1.0, 1.0, 1.0)
+        group.inputs.new('NodeSocketColor', 'normal').default_value = (0.5, 0.5, 1.0, 1.0)
+        group.inputs.new('NodeSocketFloat', 'Roughness').default_value = 0.5
+        group.outputs.new('NodeSocketShader', 'BSDF')
+        group_inputs = group.nodes.new('NodeGroupInput')
+        group_outputs = group.nodes.new('NodeGroupOutput')
+        nodes = group.nodes
+        link_nodes = group.links.new
+
+        shader = nodes.new(Nodes.ShaderNodeBsdfPrincipled)
+        if tint:
+            color_mix = nodes.new(Nodes.ShaderNodeMixRGB)
+            color_mix.blend_type = 'MULTIPLY'
+            color_mix.inputs['Fac'].default_value = 1.0
+            link_nodes(group_inputs.outputs['albedo'], color_mix.inputs['Color1'])
+            link_nodes(group_inputs.outputs['Color tint'], color_mix.inputs['Color2'])
+            link_nodes(color_mix.outputs['Color'], shader.inputs['Base Color'])
+        else:
+            link_nodes(group_inputs.outputs['albedo'], shader.inputs['Base Color'])
+
+        if alpha:
+            link_nodes(group_inputs.outputs['albedo alpha'], shader.inputs['Alpha'])
+        elif metalness:
+            link_nodes(group_inputs.outputs['albedo alpha'], shader.inputs['Metallic'])
+
+        normalmap_node = nodes.new(Nodes.ShaderNodeNormalMap)
+        link_nodes(group_inputs.outputs['normal'], normalmap_node.inputs['Color'])
+        link_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
+
+        link_nodes(group_inputs.outputs['Roughness'], shader.inputs['Roughness'])
+        link_nodes(shader.outputs['BSDF'], group_outputs.inputs['BSDF'])
+
     def create_nodes(self, material_name):
         if super().create_nodes(material_name) in ['UNKNOWN', 'LOADED']:
             return
 
-        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
-        shader = self.create_node(Nodes.ShaderNodeBsdfPrincipled,self.SHADER)
-        self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
-
         color_texture = self.color_texture
         normal_texture, roughness_texture = self.normal_texture
         self_illum_mask_texture = self.self_illum_mask_texture
+        color = self.color
+        tint = color[0] != 1.0 and color[1] != 1.0 and color[2] != 1.0
+
+        material_output = self.create_node(Nodes.ShaderNodeOutputMaterial)
+        shader = self.create_shader_group(self.build_shader_group, tint=tint,
+                                          alpha=bool(self.translucent or self.alpha_test),
+                                          metalness=bool(self.metalness))
+        self.connect_nodes(shader.outputs['BSDF'], material_output.inputs['Surface'])
 
         albedo_node = self.create_node(Nodes.ShaderNodeTexImage, 'albedo')
         albedo_node.image = color_texture
+        self.connect_nodes(albedo_node.outputs['Color'], shader.inputs['albedo'])
+        self.connect_nodes(albedo_node.outputs['Alpha'], shader.inputs['albedo alpha'])
 
-        if self.color[0] != 1.0 and self.color[1] != 1.0 and self.color[2] != 1.0:
-            color_mix = self.create_node(Nodes.ShaderNodeMixRGB)
-            color_mix.blend_type = 'MULTIPLY'
-            self.connect_nodes(albedo_node.outputs['Color'], color_mix.inputs['Color1'])
-            color = self.color
+        if tint:
             if sum(color) > 3:
                 color = list(np.divide(color, 255))
-            color_mix.inputs['Color2'].default_value = color
-            color_mix.inputs['Fac'].default_value = 1.0
-            self.connect_nodes(color_mix.outputs['Color'], shader.inputs['Base Color'])
-        else:
-            self.connect_nodes(albedo_node.outputs['Color'], shader.inputs['Base Color'])
-
-        if self.translucent or self.alpha_test:
-            self.connect_nodes(albedo_node.outputs['Alpha'], shader.inputs['Alpha'])
-        elif self.metalness:
-            self.connect_nodes(albedo_node.outputs['Alpha'], shader.inputs['Metallic'])
+            shader.inputs['Color tint'].default_value = color
 
         normal_map_texture = self.create_node(Nodes.ShaderNodeTexImage, 'normal')
         normal_map_texture.image = normal_texture
+        self.connect_nodes(normal_map_texture.outputs['Color'], shader.inputs['normal'])
 
-        normalmap_node = self.create_node(Nodes.ShaderNodeNormalMap)
-
-        self.connect_nodes(normal_map_texture.outputs['Color'], normalmap_node.inputs['Color'])
-        self.connect_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
-
-        if self.specular and self.self_illum_mask_texture:
-            r, g, b, a = self.split_to_channels(self.self_illum_mask_texture)
-            b = 1 - b
-            roughness_texture = self.make_texture(
-                self.new_texture_name_with_suffix(self.self_illum_mask_texture.name, 'roughness', 'tga'),
-                self_illum_mask_texture.size, np.dstack((b, b, b, np.ones_like(b))))
+        if self.specular and self_illum_mask_texture:
+            roughness_texture = self.make_channel_texture(self_illum_mask_texture, 2, 'roughness', invert=True)
             roughness_node = self.create_node(Nodes.ShaderNodeTexImage, 'roughness')
             roughness_node.image = roughness_texture
             self.connect_nodes(roughness_node.outputs['Color'], shader.inputs['Roughness'])
@@ -129,7 +150,7 @@ class VrComplex(Source2ShaderBase):
             roughness_node = self.create_node(Nodes.ShaderNodeTexImage, 'roughness')
             roughness_node.image = roughness_texture
             self.connect_nodes(roughness_node.outputs['Color'], shader.inputs['Roughness'])
-        elif self.roughness_value is not None:
+        else:
             shader.inputs['Roughness'].default_value = self.roughness_value
         # if self.selfillum:
         #     selfillummask = self.selfillummask
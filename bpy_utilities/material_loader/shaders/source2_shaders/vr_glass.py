@@ -31,7 +31,7 @@ class VrSimple(Source2ShaderBase):
     def normal_texture(self):
         texture_path = self.get_texture('g_tNormal', None)
         if texture_path is not None:
-            image = self.load_texture_or_default(texture_path, (0.5, 0.5, 1.0, 1.0))
+            image = self.load_normal_texture(texture_path)
             image.colorspace_settings.is_data = True
             image.colorspace_settings.name = 'Non-Color'
             image, roughness = self.split_normal(image)
@@ -138,11 +138,7 @@ class VrSimple(Source2ShaderBase):
         self.connect_nodes(normalmap_node.outputs['Normal'], shader.inputs['Normal'])
 
         if self.specular and self.self_illum_mask_texture:
-            r, g, b, a = self.split_to_channels(self.self_illum_mask_texture)
-            b = 1 - b
-            roughness_texture = self.make_texture(
-                self.new_texture_name_with_suffix(self.self_illum_mask_texture.name, 'roughness', 'tga'),
-                self_illum_mask_texture.size, np.dstack((b, b, b, np.ones_like(b))))
+            roughness_texture = self.make_channel_texture(self_illum_mask_texture, 2, 'roughness', invert=True)
             roughness_node = self.create_node(Nodes.ShaderNodeTexImage, 'roughness')
             roughness_node.image = roughness_texture
             self.connect_nodes(roughness_node.outputs['Color'], shader.inputs['Roughness'])
@@ -0,0 +1,38 @@
+import numpy as np
+
+# Functions below work in place on flat float32 RGBA pixel buffers, as produced by texture decoders
+
+SSBUMP_SCALE = np.array([0.5, 0.5, 0.2], np.float32)
+SSBUMP_OFFSET = np.array([0.33, 0.33, 0.8], np.float32)
+
+
+def ssbump_to_normal(pixels: np.ndarray):
+    """Approximates tangent space normal map from self-shadowed bump map"""
+    rgb = pixels.reshape((-1, 4))[:, :3]
+    rgb *= SSBUMP_SCALE
+    rgb += SSBUMP_OFFSET
+
+
+def flip_green(pixels: np.ndarray):
+    """Converts DirectX style normal map to OpenGL style one"""
+    green = pixels[1::4]
+    np.subtract(1, green, out=green)
+
+
+def channel_to_grayscale(pixels: np.ndarray, channel: int, invert=False) -> np.ndarray:
+    """Returns new opaque RGBA buffer with given channel copied into R, G and B"""
+    rgba = pixels.reshape((-1, 4))
+    grayscale = np.ones_like(rgba)
+    if invert:
+        np.subtract(1, rgba[:, channel:channel + 1], out=grayscale[:, :3])
+    else:
+        grayscale[:, :3] = rgba[:, channel:channel + 1]
+    return grayscale.reshape(-1)
+
+
+def split_normal_roughness(pixels: np.ndarray) -> np.ndarray:
+    """Strips roughness from blue channel of Source 2 normal map and returns it as separate RGBA buffer"""
+    roughness = channel_to_grayscale(pixels, 2)
+    flip_green(pixels)
+    pixels[2::4] = 1.0
+    return roughness
@@ -1,5 +1,6 @@
 import bpy
 import random
+import numpy as np
 
 
 def get_material(mat_name, model_ob):
@@ -35,3 +36,36 @@ def get_new_unique_collection(model_name, parent_collection):
     master_collection = get_or_create_collection(model_name + (f'_{copy_count}' if copy_count > 0 else ''),
                                                  parent_collection)
     return master_collection
+
+
+def find_layer_collection(layer_collection: bpy.types.LayerCollection, collection: bpy.types.Collection):
+    if layer_collection.collection == collection:
+        return layer_collection
+    for child in layer_collection.children:
+        found = find_layer_collection(child, collection)
+        if found is not None:
+            return found
+    return None
+
+
+def set_collection_excluded(collection: bpy.types.Collection, exclude: bool):
+    layer_collection = find_layer_collection(bpy.context.view_layer.layer_collection, collection)
+    if layer_collection is not None:
+        layer_collection.exclude = exclude
+
+
+def fill_triangle_mesh(mesh: bpy.types.Mesh, vertices: np.ndarray, triangles: np.ndarray):
+    """Fills empty mesh from (N, 3) vertex and (M, 3) triangle arrays without Python lists.
+
+    Polygon and loop counts match input, so per-face data can be set right after; call mesh.validate() once done.
+    """
+    triangles = np.asarray(triangles, dtype=np.int32).reshape(-1)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', np.asarray(vertices, dtype=np.float32).reshape(-1))
+    mesh.loops.add(len(triangles))
+    mesh.loops.foreach_set('vertex_index', triangles)
+    polygon_count = len(triangles) // 3
+    mesh.polygons.add(polygon_count)
+    mesh.polygons.foreach_set('loop_start', np.arange(0, len(triangles), 3, dtype=np.int32))
+    mesh.polygons.foreach_set('loop_total', np.full(polygon_count, 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
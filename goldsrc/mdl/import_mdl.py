@@ -88,7 +88,8 @@ def import_model(mdl_file: BinaryIO, mdl_texture_file: Optional[BinaryIO], scale
                 mesh_obj_original = bpy.data.objects.get(model_name, None)
                 mesh_data_original = bpy.data.meshes.get(f'{model_name}_mesh', False)
                 if mesh_obj_original and mesh_data_original:
-                    model_mesh = mesh_data_original.copy()
+                    # Linked duplicate, mesh data is shared with the original object
+                    model_mesh = mesh_data_original
                     model_object = mesh_obj_original.copy()
                     # mesh_obj['skin_groups'] = mesh_obj_original['skin_groups']
                     # mesh_obj['active_skin'] = mesh_obj_original['active_skin']
@@ -3,6 +3,7 @@ from pathlib import Path
 import bpy
 from bpy.props import StringProperty, CollectionProperty, BoolProperty, FloatProperty
 
+from .bpy_utilities.logging import flush_logs
 from .goldsrc.bsp.import_bsp import BSP
 from .goldsrc.bsp.mgr import GoldSrcContentManager
 from .goldsrc.mdl.import_mdl import import_model
@@ -22,6 +23,7 @@ class GBSPImport_OT_operator(bpy.types.Operator):
     scale: FloatProperty(name="World scale", default=HAMMER_UNIT_TO_METERS, precision=6)
     use_hd: BoolProperty(name="Load HD models", default=False, subtype='UNSIGNED')
 
+    @flush_logs
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -54,6 +56,7 @@ class GMDLImport_OT_operator(bpy.types.Operator):
     filter_glob: StringProperty(default="*.mdl", options={'HIDDEN'})
     scale: FloatProperty(name="World scale", default=HAMMER_UNIT_TO_METERS, precision=6)
 
+    @flush_logs
     def execute(self, context):
 
         if Path(self.filepath).is_file():
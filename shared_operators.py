@@ -1,9 +1,12 @@
 import math
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 import bpy
 
-from .bpy_utilities.utils import get_or_create_collection
+from .bpy_utilities.logging import flush_logs
+from .bpy_utilities.utils import get_or_create_collection, get_new_unique_collection, set_collection_excluded
 from .source1.mdl.import_mdl import import_model, import_materials
 from .source2.resouce_types.valve_model import ValveCompiledModel
 from .source_shared.content_manager import ContentManager
@@ -22,111 +25,202 @@ class LoadEntity_OT_operator(bpy.types.Operator):
     bl_label = "Load Entity"
     bl_options = {'UNDO'}
 
+    use_instances: bpy.props.BoolProperty(name="Instance repeated models", default=True)
+
+    @flush_logs
     def execute(self, context):
         content_manager = ContentManager()
         content_manager.deserialize(bpy.context.scene.get('content_manager_data', {}))
 
+        placeholder_groups: Dict[Tuple[str, str], List[bpy.types.Object]] = defaultdict(list)
         for obj in context.selected_objects:
-            print(f'Loading {obj.name}')
             if obj.get("entity_data", None):
                 custom_prop_data = obj['entity_data']
                 if 'prop_path' not in custom_prop_data:
                     continue
-                model_type = Path(custom_prop_data['prop_path']).suffix
-                parent = get_parent(obj.users_collection[0])
-                collection = get_or_create_collection(custom_prop_data['type'], parent)
-                # collection = (bpy.data.collections.get(custom_prop_data['type'], None) or
-                #               bpy.data.collections.new(custom_prop_data['type']))
-
-                if model_type in ['.vmdl_c', '.vmdl_c']:
-                    mld_file = content_manager.find_file(custom_prop_data['prop_path'])
-                    if mld_file:
-                        skin = custom_prop_data.get('skin', None)
-                        model = ValveCompiledModel(mld_file)
-                        model.load_mesh(True, parent_collection=collection)
-                        for ob in model.objects:  # type:bpy.types.Object
-                            ob.location = obj.location
-                            ob.rotation_mode = "XYZ"
-                            ob.rotation_euler = obj.rotation_euler
-                            ob.scale = obj.scale
-
-                            # if skin:
-                            #     if str(skin) in ob['skin_groups']:
-                            #         skin = str(skin)
-                            #         skin_materials = ob['skin_groups'][skin]
-                            #         current_materials = ob['skin_groups'][ob['active_skin']]
-                            #         print(skin_materials, current_materials)
-                            #         for skin_material, current_material in zip(skin_materials, current_materials):
-                            #             swap_materials(ob, skin_material[-63:], current_material[-63:])
-                            #         ob['active_skin'] = skin
-                            #     else:
-                            #         print(f'Skin {skin} not found')
-                        bpy.data.objects.remove(obj)
-                    else:
-                        self.report({'INFO'}, f"Model '{custom_prop_data['prop_path']}_c' not found!")
-                elif model_type == '.mdl':
-                    prop_path = Path(custom_prop_data['prop_path'])
-                    mld_file = content_manager.find_file(prop_path)
-                    if mld_file:
-                        vvd_file = content_manager.find_file(prop_path.with_suffix('.vvd'))
-                        vtx_file = find_vtx_cm(prop_path, content_manager)
-                        model_container = import_model(mld_file, vvd_file, vtx_file, 1.0, False, collection,
-                                                       True, True)
-
-                        entity_data_holder = bpy.data.objects.new(model_container.mdl.header.name, None)
-                        entity_data_holder['entity_data'] = {}
-                        entity_data_holder['entity_data']['entity'] = obj['entity_data']['entity']
-                        if model_container.collection:
-                            model_container.collection.objects.link(entity_data_holder)
-                        else:
-                            collection.collection.objects.link(entity_data_holder)
-                        if model_container.armature is not None:
-                            armature = model_container.armature
-                            # armature.location = obj.location
-                            armature.rotation_mode = "XYZ"
-                            # armature.rotation_euler = obj.rotation_euler
-                            # armature.rotation_euler[2] += math.radians(90)
-                            # armature.scale = obj.scale
-                            entity_data_holder.parent = armature
-
-                            bpy.context.view_layer.update()
-                            armature.parent = obj.parent
-                            armature.matrix_world = obj.matrix_world.copy()
-                            armature.rotation_euler[2] += math.radians(90)
-                        else:
-                            if model_container.objects:
-                                entity_data_holder.parent = model_container.objects[0]
-                            else:
-                                entity_data_holder.location = obj.location
-                                entity_data_holder.rotation_euler = obj.rotation_euler
-                                entity_data_holder.scale = obj.scale
-                            for mesh_obj in model_container.objects:
-                                # mesh_obj.location = obj.location
-                                mesh_obj.rotation_mode = "XYZ"
-                                # mesh_obj.rotation_euler = obj.rotation_euler
-                                # mesh_obj.scale = obj.scale
-
-                                bpy.context.view_layer.update()
-                                mesh_obj.parent = obj.parent
-                                mesh_obj.matrix_world = obj.matrix_world.copy()
-                        import_materials(model_container.mdl)
-                        skin = custom_prop_data.get('skin', None)
-                        if skin:
-                            for model in model_container.objects:
-                                if str(skin) in model['skin_groups']:
-                                    skin = str(skin)
-                                    skin_materials = model['skin_groups'][skin]
-                                    current_materials = model['skin_groups'][model['active_skin']]
-                                    print(skin_materials, current_materials)
-                                    for skin_material, current_material in zip(skin_materials, current_materials):
-                                        swap_materials(model, skin_material[-63:], current_material[-63:])
-                                    model['active_skin'] = skin
-                                else:
-                                    print(f'Skin {skin} not found')
-
-                        bpy.data.objects.remove(obj)
+                group_key = (custom_prop_data['prop_path'], str(custom_prop_data.get('skin', None)))
+                placeholder_groups[group_key].append(obj)
+
+        for placeholders in placeholder_groups.values():
+            if self.use_instances and len(placeholders) > 1:
+                self.load_instanced(content_manager, placeholders)
+            else:
+                for obj in placeholders:
+                    print(f'Loading {obj.name}')
+                    self.load_placeholder(content_manager, obj)
         return {'FINISHED'}
 
+    def load_placeholder(self, content_manager: ContentManager, obj: bpy.types.Object):
+        custom_prop_data = obj['entity_data']
+        model_type = Path(custom_prop_data['prop_path']).suffix
+        parent = get_parent(obj.users_collection[0])
+        collection = get_or_create_collection(custom_prop_data['type'], parent)
+        # collection = (bpy.data.collections.get(custom_prop_data['type'], None) or
+        #               bpy.data.collections.new(custom_prop_data['type']))
+
+        if model_type in ['.vmdl_c', '.vmdl_c']:
+            mld_file = content_manager.find_file(custom_prop_data['prop_path'])
+            if mld_file:
+                skin = custom_prop_data.get('skin', None)
+                model = ValveCompiledModel(mld_file)
+                model.load_mesh(True, parent_collection=collection)
+                for ob in model.objects:  # type:bpy.types.Object
+                    ob.location = obj.location
+                    ob.rotation_mode = "XYZ"
+                    ob.rotation_euler = obj.rotation_euler
+                    ob.scale = obj.scale
+
+                    # if skin:
+                    #     if str(skin) in ob['skin_groups']:
+                    #         skin = str(skin)
+                    #         skin_materials = ob['skin_groups'][skin]
+                    #         current_materials = ob['skin_groups'][ob['active_skin']]
+                    #         print(skin_materials, current_materials)
+                    #         for skin_material, current_material in zip(skin_materials, current_materials):
+                    #             swap_materials(ob, skin_material[-63:], current_material[-63:])
+                    #         ob['active_skin'] = skin
+                    #     else:
+                    #         print(f'Skin {skin} not found')
+                bpy.data.objects.remove(obj)
+            else:
+                self.report({'INFO'}, f"Model '{custom_prop_data['prop_path']}_c' not found!")
+        elif model_type == '.mdl':
+            prop_path = Path(custom_prop_data['prop_path'])
+            mld_file = content_manager.find_file(prop_path)
+            if mld_file:
+                vvd_file = content_manager.find_file(prop_path.with_suffix('.vvd'))
+                vtx_file = find_vtx_cm(prop_path, content_manager)
+                model_container = import_model(mld_file, vvd_file, vtx_file, 1.0, False, collection,
+                                               True, True)
+
+                entity_data_holder = bpy.data.objects.new(model_container.mdl.header.name, None)
+                entity_data_holder['entity_data'] = {}
+                entity_data_holder['entity_data']['entity'] = obj['entity_data']['entity']
+                if model_container.collection:
+                    model_container.collection.objects.link(entity_data_holder)
+                else:
+                    collection.collection.objects.link(entity_data_holder)
+                if model_container.armature is not None:
+                    armature = model_container.armature
+                    # armature.location = obj.location
+                    armature.rotation_mode = "XYZ"
+                    # armature.rotation_euler = obj.rotation_euler
+                    # armature.rotation_euler[2] += math.radians(90)
+                    # armature.scale = obj.scale
+                    entity_data_holder.parent = armature
+
+                    bpy.context.view_layer.update()
+                    armature.parent = obj.parent
+                    armature.matrix_world = obj.matrix_world.copy()
+                    armature.rotation_euler[2] += math.radians(90)
+                else:
+                    if model_container.objects:
+                        entity_data_holder.parent = model_container.objects[0]
+                    else:
+                        entity_data_holder.location = obj.location
+                        entity_data_holder.rotation_euler = obj.rotation_euler
+                        entity_data_holder.scale = obj.scale
+                    for mesh_obj in model_container.objects:
+                        # mesh_obj.location = obj.location
+                        mesh_obj.rotation_mode = "XYZ"
+                        # mesh_obj.rotation_euler = obj.rotation_euler
+                        # mesh_obj.scale = obj.scale
+
+                        bpy.context.view_layer.update()
+                        mesh_obj.parent = obj.parent
+                        mesh_obj.matrix_world = obj.matrix_world.copy()
+                import_materials(model_container.mdl)
+                apply_source1_skin(model_container.objects, custom_prop_data.get('skin', None))
+
+                bpy.data.objects.remove(obj)
+
+    def load_instanced(self, content_manager: ContentManager, placeholders: List[bpy.types.Object]):
+        """Builds model once into hidden instance source collection and replaces every placeholder
+        with a collection instance of it"""
+        custom_prop_data = placeholders[0]['entity_data']
+        prop_path = Path(custom_prop_data['prop_path'])
+        skin = custom_prop_data.get('skin', None)
+        source_key = f'{prop_path.as_posix()}:{skin}'
+        print(f'Loading {len(placeholders)} instances of {prop_path}')
+
+        sources_collection = get_or_create_collection('SourceIO_instance_sources', bpy.context.scene.collection)
+        source_collection = None
+        for child in sources_collection.children:
+            if child.get('instance_source_key', None) == source_key:
+                source_collection = child
+                break
+        if source_collection is None:
+            set_collection_excluded(sources_collection, False)
+            source_collection = get_new_unique_collection(prop_path.stem, sources_collection)
+            if prop_path.suffix == '.vmdl_c':
+                loaded = self.load_source2_instance_source(content_manager, prop_path, source_collection)
+            elif prop_path.suffix == '.mdl':
+                loaded = self.load_source1_instance_source(content_manager, prop_path, skin, source_collection)
+            else:
+                loaded = False
+            set_collection_excluded(sources_collection, True)
+            if not loaded:
+                bpy.data.collections.remove(source_collection)
+                self.report({'INFO'}, f"Model '{prop_path}' not found!")
+                return
+            source_collection['instance_source_key'] = source_key
+
+        for obj in placeholders:
+            parent = get_parent(obj.users_collection[0])
+            collection = get_or_create_collection(obj['entity_data']['type'], parent)
+            instance = bpy.data.objects.new(obj.name, None)
+            instance.instance_type = 'COLLECTION'
+            instance.instance_collection = source_collection
+            instance['entity_data'] = {'entity': obj['entity_data'].get('entity', {})}
+            collection.objects.link(instance)
+            instance.parent = obj.parent
+            instance.matrix_world = obj.matrix_world.copy()
+            if source_collection.get('instance_source_rotate', False):
+                instance.rotation_mode = "XYZ"
+                instance.rotation_euler[2] += math.radians(90)
+            bpy.data.objects.remove(obj)
+
+    @staticmethod
+    def load_source1_instance_source(content_manager: ContentManager, prop_path: Path, skin,
+                                     source_collection: bpy.types.Collection):
+        mld_file = content_manager.find_file(prop_path)
+        if not mld_file:
+            return False
+        vvd_file = content_manager.find_file(prop_path.with_suffix('.vvd'))
+        vtx_file = find_vtx_cm(prop_path, content_manager)
+        model_container = import_model(mld_file, vvd_file, vtx_file, 1.0, False, source_collection,
+                                       True, True)
+        import_materials(model_container.mdl)
+        apply_source1_skin(model_container.objects, skin)
+        source_collection['instance_source_rotate'] = model_container.armature is not None
+        return True
+
+    @staticmethod
+    def load_source2_instance_source(content_manager: ContentManager, prop_path: Path,
+                                     source_collection: bpy.types.Collection):
+        mld_file = content_manager.find_file(prop_path)
+        if not mld_file:
+            return False
+        model = ValveCompiledModel(mld_file)
+        model.load_mesh(True, parent_collection=source_collection)
+        return True
+
+
+def apply_source1_skin(objects: List[bpy.types.Object], skin):
+    if not skin:
+        return
+    for model in objects:
+        if str(skin) in model['skin_groups']:
+            skin = str(skin)
+            skin_materials = model['skin_groups'][skin]
+            current_materials = model['skin_groups'][model['active_skin']]
+            print(skin_materials, current_materials)
+            for skin_material, current_material in zip(skin_materials, current_materials):
+                swap_materials(model, skin_material[-63:], current_material[-63:])
+            model['active_skin'] = skin
+        else:
+            print(f'Skin {skin} not found')
+
 
 class ChangeSkin_OT_operator(bpy.types.Operator):
     bl_idname = "source_io.select_skin"
@@ -135,6 +229,7 @@ class ChangeSkin_OT_operator(bpy.types.Operator):
 
     skin_name: bpy.props.StringProperty(name="skin_name", default="default")
 
+    @flush_logs
     def execute(self, context):
         obj = context.active_object
         if obj.get('model_type', False):
@@ -168,11 +263,17 @@ class ChangeSkin_OT_operator(bpy.types.Operator):
 def swap_materials(obj, new_material_name, target_name):
     mat = bpy.data.materials.get(new_material_name, None) or bpy.data.materials.new(name=new_material_name)
     print(f'Swapping {target_name} with {new_material_name}')
-    for n, obj_mat in enumerate(obj.data.materials):
+    for slot in obj.material_slots:
+        obj_mat = slot.material
+        if obj_mat is None:
+            continue
         print(target_name, obj_mat.name)
         if obj_mat.name == target_name:
             print(obj_mat.name, "->", mat.name)
-            obj.data.materials[n] = mat
+            if obj.data.users > 1:
+                # Mesh is shared between linked duplicates, swap only on this object
+                slot.link = 'OBJECT'
+            slot.material = mat
             break
 
 
@@ -1,19 +1,18 @@
+from __future__ import annotations
+
 import math
 import re
 from pathlib import Path
 from pprint import pprint
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
 
 import numpy as np
 
 import bpy
 from mathutils import Vector, Euler
 
-from .base_entity_classes import func_door, worldspawn, prop_dynamic, parse_float_vector, BasePropPhysics, \
-    prop_physics_override, func_brush, func_lod, trigger_hurt, trigger_multiple, func_tracktrain, point_spotlight, \
-    light_spot, Base, Targetname, env_lightglow, env_sun, light_environment, env_sprite, light, prop_dynamic_override, \
-    logic_relay, move_rope, keyframe_rope, trigger_once, path_track, infodecal, prop_physics_multiplayer
-from .base_entity_classes import entity_class_handle as base_entity_classes
+from .base_entity_classes import entity_class_handle as base_entity_classes, parse_float_vector, Base
+from .entity_schema import get_entity_parser
 from ..bsp_file import BSPFile
 from ..datatypes.face import Face
 from ..datatypes.model import Model
@@ -28,6 +27,12 @@ from ....bpy_utilities.utils import get_material, get_or_create_collection
 from ....source_shared.content_manager import ContentManager
 from ....utilities.math_utilities import HAMMER_UNIT_TO_METERS, lerp_vec
 
+if TYPE_CHECKING:
+    from .base_entity_classes import func_door, worldspawn, prop_dynamic, BasePropPhysics, prop_physics_override, \
+        func_brush, func_lod, trigger_hurt, trigger_multiple, func_tracktrain, point_spotlight, light_spot, \
+        Targetname, env_lightglow, env_sun, light_environment, env_sprite, light, prop_dynamic_override, logic_relay, \
+        move_rope, keyframe_rope, trigger_once, path_track, infodecal, prop_physics_multiplayer
+
 strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
 log_manager = BPYLoggingManager()
 
@@ -77,6 +82,7 @@ class BaseEntityHandler:
         self._entites = self._bsp.get_lump('LUMP_ENTITIES').entities
         self._handled_paths = []
         self._entity_by_name_cache = {}
+        self._parsed_entities = {}
 
     def _get_entity_by_name(self, name):
         if not self._entity_by_name_cache:
@@ -84,9 +90,7 @@ class BaseEntityHandler:
         entity = self._entity_by_name_cache.get(name, None)
         if entity is None:
             return None, None
-        entity_class = self._get_class(entity['classname'])
-        entity_class.from_dict(entity_class, entity)
-        return entity_class, entity
+        return self._parse_entity(entity), entity
 
     def _get_string(self, string_id):
         strings: List[str] = self._bsp.get_lump('LUMP_TEXDATA_STRING_TABLE').strings
@@ -274,16 +278,23 @@ class BaseEntityHandler:
         line.location = [0, 0, 0]
         return line
 
-    def _get_class(self, class_name):
+    def _parse_entity(self, entity_raw: dict):
+        # Same raw entity is parsed by handle_entity, resolve_parents and name lookups, parse it only once
+        cached = self._parsed_entities.get(id(entity_raw), None)
+        if cached is not None:
+            return cached[0]
+        class_name = entity_raw['classname']
         if class_name in self.entity_lookup_table:
-            entity_object = self.entity_lookup_table[class_name]()
-            return entity_object
+            entity_class = self.entity_lookup_table[class_name]
         else:
-            return Base()
+            entity_class = Base
+        entity = get_entity_parser(entity_class)(entity_raw)
+        # Keep raw dict alive so its id can't be reused by another entity
+        self._parsed_entities[id(entity_raw)] = entity, entity_raw
+        return entity
 
     def resolve_parents(self, entity_raw: dict):
-        entity = self._get_class(entity_raw['classname'])
-        entity.from_dict(entity, entity_raw)
+        entity = self._parse_entity(entity_raw)
         if hasattr(entity, 'targetname') and hasattr(entity, 'parentname'):
             if entity.targetname and entity.targetname in bpy.data.objects:
                 obj = bpy.data.objects[entity.targetname]
@@ -302,8 +313,7 @@ class BaseEntityHandler:
     def handle_entity(self, entity_data):
         entity_class = entity_data['classname']
         if hasattr(self, f'handle_{entity_class}') and entity_class in self.entity_lookup_table:
-            entity_object = self._get_class(entity_class)
-            entity_object.from_dict(entity_object, entity_data)
+            entity_object = self._parse_entity(entity_data)
             handler_function = getattr(self, f'handle_{entity_class}')
             # try:
             handler_function(entity_object, entity_data)
@@ -0,0 +1,152 @@
+from functools import lru_cache
+from typing import Dict, Tuple, Any, Mapping, Callable
+
+# Entities repeat the same origins, angles and colors a lot, parsed vectors are shared and copied on return
+VECTOR_CACHE_SIZE = 16384
+
+
+@lru_cache(VECTOR_CACHE_SIZE)
+def _parse_int_vector(string):
+    return tuple(int(val) for val in string.split(' '))
+
+
+@lru_cache(VECTOR_CACHE_SIZE)
+def _parse_float_vector(string):
+    return tuple(float(val) for val in string.split(' '))
+
+
+def parse_int_vector(string):
+    return list(_parse_int_vector(string))
+
+
+def parse_float_vector(string):
+    return list(_parse_float_vector(string))
+
+
+# Converters of raw entity values by property kind used in generated schemas
+PROPERTY_PARSERS = {
+    'int': int,
+    'float': float,
+    'int_vector': parse_int_vector,
+    'float_vector': parse_float_vector,
+    'raw': None,
+}
+
+# (attribute name, entity key, property kind, default value)
+PropertyInfo = Tuple[str, str, str, Any]
+# (parent class names, class attributes, own properties)
+EntityClassInfo = Tuple[Tuple[str, ...], Dict[str, Any], Tuple[PropertyInfo, ...]]
+
+
+class Base:
+    hammer_id_counter = 0
+    entity_properties: Tuple[PropertyInfo, ...] = ()
+
+    def __init__(self):
+        self.hammer_id = 0
+        self.class_name = 'ANY'
+
+    @classmethod
+    def new_hammer_id(cls):
+        new_id = cls.hammer_id_counter
+        cls.hammer_id_counter += 1
+        return new_id
+
+    @classmethod
+    def from_dict(cls, instance, entity_data: dict):
+        if cls is Base:
+            if 'hammerid' in entity_data:
+                instance.hammer_id = int(entity_data.get('hammerid'))
+            else:  # Titanfall
+                instance.hammer_id = Base.new_hammer_id()
+            instance.class_name = entity_data.get('classname')
+            return
+        for parent in cls.__bases__:
+            parent.from_dict(instance, entity_data)
+        for name, key, kind, default in cls.__dict__.get('entity_properties', ()):
+            value = entity_data.get(key, default)
+            parser = PROPERTY_PARSERS[kind]
+            if parser is not None:
+                value = parser(value)
+            setattr(instance, name, value)
+
+
+class EntityClassRegistry(Mapping):
+    """Maps entity class names to classes, building each class from schema on first access"""
+
+    def __init__(self, module_name: str, schema: Dict[str, EntityClassInfo]):
+        self.module_name = module_name
+        self.schema = schema
+        self._classes: Dict[str, type] = {}
+
+    def __getitem__(self, class_name) -> type:
+        entity_class = self._classes.get(class_name, None)
+        if entity_class is None:
+            parents, class_attributes, properties = self.schema[class_name]
+            bases = tuple(self[parent] for parent in parents) or (Base,)
+            namespace = dict(class_attributes)
+            namespace['entity_properties'] = properties
+            namespace['__module__'] = self.module_name
+            entity_class = self._classes[class_name] = type(class_name, bases, namespace)
+        return entity_class
+
+    def __contains__(self, class_name):
+        return class_name in self.schema
+
+    def __iter__(self):
+        return iter(self.schema)
+
+    def __len__(self):
+        return len(self.schema)
+
+
+def _collect_properties(entity_class, properties: Dict[str, Tuple[str, Any, Any]]):
+    """Flattens property tables in same order as Base.from_dict applies them, later entries win"""
+    if entity_class is Base:
+        return
+    for parent in entity_class.__bases__:
+        _collect_properties(parent, properties)
+    for name, key, kind, default in entity_class.__dict__.get('entity_properties', ()):
+        properties[name] = key, PROPERTY_PARSERS[kind], default
+
+
+def compile_entity_parser(entity_class) -> Callable[[dict], Base]:
+    """Builds function converting raw entity dict into entity_class instance in single pass"""
+    if getattr(entity_class.from_dict, '__func__', None) is not Base.from_dict.__func__:
+        # Handwritten classes keep their own from_dict chain
+        def parse_entity(entity_data: dict):
+            entity = entity_class()
+            entity.from_dict(entity, entity_data)
+            return entity
+
+        return parse_entity
+
+    properties = {}
+    _collect_properties(entity_class, properties)
+    property_table = tuple((name, key, parser, default) for name, (key, parser, default) in properties.items())
+
+    def parse_entity(entity_data: dict):
+        entity = entity_class()
+        if 'hammerid' in entity_data:
+            entity.hammer_id = int(entity_data['hammerid'])
+        else:  # Titanfall
+            entity.hammer_id = Base.new_hammer_id()
+        entity.class_name = entity_data.get('classname')
+        values = vars(entity)
+        get = entity_data.get
+        for name, key, parser, default in property_table:
+            value = get(key, default)
+            values[name] = value if parser is None else parser(value)
+        return entity
+
+    return parse_entity
+
+
+_entity_parsers: Dict[type, Callable[[dict], Base]] = {}
+
+
+def get_entity_parser(entity_class) -> Callable[[dict], Base]:
+    parser = _entity_parsers.get(entity_class, None)
+    if parser is None:
+        parser = _entity_parsers[entity_class] = compile_entity_parser(entity_class)
+    return parser
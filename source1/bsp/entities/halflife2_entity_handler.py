@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 from mathutils import Euler
 
 from .base_entity_handler import BaseEntityHandler
-from .halflife2_entity_classes import *
+from .halflife2_entity_classes import entity_class_handle, parse_float_vector
+
+if TYPE_CHECKING:
+    from .halflife2_entity_classes import *
 
 
 class HalfLifeEntityHandler(BaseEntityHandler):
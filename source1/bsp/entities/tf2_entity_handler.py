@@ -1,17 +1,22 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
 from ....utilities.math_utilities import HAMMER_UNIT_TO_METERS
 from .base_entity_handler import BaseEntityHandler
-from .tf_entity_classes import entity_class_handle as tf2_entity_handlers, func_respawnroom, func_regenerate, \
-    func_respawnroomvisualizer, item_healthkit_small, parse_float_vector, info_player_teamspawn, info_observer_point, \
-    item_healthkit_medium, item_healthkit_full, item_ammopack_full, item_ammopack_small, item_ammopack_medium, \
-    dispenser_touch_trigger, trigger_capture_area, team_control_point
-from .tf_entity_classes import func_nobuild
+from .tf_entity_classes import entity_class_handle as tf2_entity_handlers, parse_float_vector
 from ..bsp_file import BSPFile
 
+if TYPE_CHECKING:
+    from .tf_entity_classes import func_respawnroom, func_regenerate, func_respawnroomvisualizer, item_healthkit_small, \
+        info_player_teamspawn, info_observer_point, item_healthkit_medium, item_healthkit_full, item_ammopack_full, \
+        item_ammopack_small, item_ammopack_medium, dispenser_touch_trigger, trigger_capture_area, team_control_point, \
+        func_nobuild
+
 
 class TF2EntityHandler(BaseEntityHandler):
     entity_lookup_table = tf2_entity_handlers
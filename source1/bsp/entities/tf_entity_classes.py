@@ -1,9204 +1,2760 @@
-def parse_int_vector(string):
-    return [int(val) for val in string.split(' ')]
-
-
-def parse_float_vector(string):
-    return [float(val) for val in string.split(' ')]
-
-
-class Base:
-    hammer_id_counter = 0
-
-    def __init__(self):
-        self.hammer_id = 0
-        self.class_name = 'ANY'
-
-    @classmethod
-    def new_hammer_id(cls):
-        new_id = cls.hammer_id_counter
-        cls.hammer_id_counter += 1
-        return new_id
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        if 'hammerid' in entity_data:
-            instance.hammer_id = int(entity_data.get('hammerid'))
-        else:  # Titanfall
-            instance.hammer_id = Base.new_hammer_id()
-        instance.class_name = entity_data.get('classname')
-
-
-class Angles(Base):
-    def __init__(self):
-        super().__init__()
-        self.angles = [0.0, 0.0, 0.0]  # Type: angle
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.angles = parse_float_vector(entity_data.get('angles', "0 0 0"))  # Type: angle
-
-
-class Origin(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = None  # Type: origin
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))  # Type: origin
-
-
-class Studiomodel(Base):
-    def __init__(self):
-        super().__init__()
-        self.model = None  # Type: studio
-        self.skin = None  # Type: integer
-        self.modelscale = 1.0  # Type: float
-        self.disableshadows = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.model = entity_data.get('model', None)  # Type: studio
-        instance.skin = int(entity_data.get('skin', 0))  # Type: integer
-        instance.modelscale = float(entity_data.get('modelscale', 1.0))  # Type: float
-        instance.disableshadows = entity_data.get('disableshadows', None)  # Type: choices
-
-
-class BasePlat(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class Targetname(Base):
-    def __init__(self):
-        super().__init__()
-        self.targetname = None  # Type: target_source
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.targetname = entity_data.get('targetname', None)  # Type: target_source
-
-
-class Parentname(Base):
-    def __init__(self):
-        super().__init__()
-        self.parentname = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.parentname = entity_data.get('parentname', None)  # Type: target_destination
-
-
-class BaseBrush(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class EnableDisable(Base):
-    def __init__(self):
-        super().__init__()
-        self.StartDisabled = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.StartDisabled = entity_data.get('startdisabled', None)  # Type: choices
-
-
-class RenderFxChoices(Base):
-    def __init__(self):
-        super().__init__()
-        self.renderfx = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.renderfx = entity_data.get('renderfx', None)  # Type: choices
-
-
-class Shadow(Base):
-    def __init__(self):
-        super().__init__()
-        self.disableshadows = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.disableshadows = entity_data.get('disableshadows', None)  # Type: choices
-
-
-class RenderFields(RenderFxChoices):
-    def __init__(self):
-        super(RenderFxChoices).__init__()
-        self.rendermode = None  # Type: choices
-        self.renderamt = 255  # Type: integer
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.disablereceiveshadows = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        RenderFxChoices.from_dict(instance, entity_data)
-        instance.rendermode = entity_data.get('rendermode', None)  # Type: choices
-        instance.renderamt = int(entity_data.get('renderamt', 255))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.disablereceiveshadows = entity_data.get('disablereceiveshadows', None)  # Type: choices
-
-
-class DXLevelChoice(Base):
-    def __init__(self):
-        super().__init__()
-        self.mindxlevel = None  # Type: choices
-        self.maxdxlevel = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.mindxlevel = entity_data.get('mindxlevel', None)  # Type: choices
-        instance.maxdxlevel = entity_data.get('maxdxlevel', None)  # Type: choices
-
-
-class Inputfilter(Base):
-    def __init__(self):
-        super().__init__()
-        self.InputFilter = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.InputFilter = entity_data.get('inputfilter', None)  # Type: choices
-
-
-class Global(Base):
-    def __init__(self):
-        super().__init__()
-        self.globalname = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.globalname = entity_data.get('globalname', None)  # Type: string
-
-
-class EnvGlobal(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.initialstate = None  # Type: choices
-        self.counter = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.initialstate = entity_data.get('initialstate', None)  # Type: choices
-        instance.counter = int(entity_data.get('counter', 0))  # Type: integer
-
-
-class DamageFilter(Base):
-    def __init__(self):
-        super().__init__()
-        self.damagefilter = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.damagefilter = entity_data.get('damagefilter', None)  # Type: target_destination
-
-
-class ResponseContext(Base):
-    def __init__(self):
-        super().__init__()
-        self.ResponseContext = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.ResponseContext = entity_data.get('responsecontext', None)  # Type: string
-
-
-class Breakable(DamageFilter, Shadow, Targetname):
-    def __init__(self):
-        super(DamageFilter).__init__()
-        super(Shadow).__init__()
-        super(Targetname).__init__()
-        self.ExplodeDamage = None  # Type: float
-        self.ExplodeRadius = None  # Type: float
-        self.PerformanceMode = None  # Type: choices
-        self.BreakModelMessage = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        DamageFilter.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.ExplodeDamage = float(entity_data.get('explodedamage', 0))  # Type: float
-        instance.ExplodeRadius = float(entity_data.get('exploderadius', 0))  # Type: float
-        instance.PerformanceMode = entity_data.get('performancemode', None)  # Type: choices
-        instance.BreakModelMessage = entity_data.get('breakmodelmessage', None)  # Type: string
-
-
-class BreakableBrush(Parentname, Global, Breakable):
-    def __init__(self):
-        super(Breakable).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        self.propdata = None  # Type: choices
-        self.health = 1  # Type: integer
-        self.material = None  # Type: choices
-        self.explosion = None  # Type: choices
-        self.gibdir = [0.0, 0.0, 0.0]  # Type: angle
-        self.nodamageforces = None  # Type: choices
-        self.gibmodel = None  # Type: string
-        self.spawnobject = None  # Type: choices
-        self.explodemagnitude = None  # Type: integer
-        self.pressuredelay = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Breakable.from_dict(instance, entity_data)
-        instance.propdata = entity_data.get('propdata', None)  # Type: choices
-        instance.health = int(entity_data.get('health', 1))  # Type: integer
-        instance.material = entity_data.get('material', None)  # Type: choices
-        instance.explosion = entity_data.get('explosion', None)  # Type: choices
-        instance.gibdir = parse_float_vector(entity_data.get('gibdir', "0 0 0"))  # Type: angle
-        instance.nodamageforces = entity_data.get('nodamageforces', None)  # Type: choices
-        instance.gibmodel = entity_data.get('gibmodel', None)  # Type: string
-        instance.spawnobject = entity_data.get('spawnobject', None)  # Type: choices
-        instance.explodemagnitude = int(entity_data.get('explodemagnitude', 0))  # Type: integer
-        instance.pressuredelay = float(entity_data.get('pressuredelay', 0))  # Type: float
-
-
-class BreakableProp(Breakable):
-    def __init__(self):
-        super(Breakable).__init__()
-        self.pressuredelay = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Breakable.from_dict(instance, entity_data)
-        instance.pressuredelay = float(entity_data.get('pressuredelay', 0))  # Type: float
-
-
-class BaseNPC(RenderFields, ResponseContext, DamageFilter, Targetname, Shadow, Angles):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(ResponseContext).__init__()
-        super(DamageFilter).__init__()
-        super(Targetname).__init__()
-        super(Shadow).__init__()
-        super(Angles).__init__()
-        self.target = None  # Type: target_destination
-        self.squadname = None  # Type: string
-        self.hintgroup = None  # Type: string
-        self.hintlimiting = None  # Type: choices
-        self.sleepstate = None  # Type: choices
-        self.wakeradius = None  # Type: float
-        self.wakesquad = None  # Type: choices
-        self.enemyfilter = None  # Type: target_destination
-        self.ignoreunseenenemies = None  # Type: choices
-        self.physdamagescale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        RenderFields.from_dict(instance, entity_data)
-        ResponseContext.from_dict(instance, entity_data)
-        DamageFilter.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.squadname = entity_data.get('squadname', None)  # Type: string
-        instance.hintgroup = entity_data.get('hintgroup', None)  # Type: string
-        instance.hintlimiting = entity_data.get('hintlimiting', None)  # Type: choices
-        instance.sleepstate = entity_data.get('sleepstate', None)  # Type: choices
-        instance.wakeradius = float(entity_data.get('wakeradius', 0))  # Type: float
-        instance.wakesquad = entity_data.get('wakesquad', None)  # Type: choices
-        instance.enemyfilter = entity_data.get('enemyfilter', None)  # Type: target_destination
-        instance.ignoreunseenenemies = entity_data.get('ignoreunseenenemies', None)  # Type: choices
-        instance.physdamagescale = float(entity_data.get('physdamagescale', 1.0))  # Type: float
-
-
-class info_npc_spawn_destination(Parentname, Targetname, Angles):
-    icon_sprite = "editor/info_target.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.ReuseDelay = 1  # Type: float
-        self.RenameNPC = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.ReuseDelay = float(entity_data.get('reusedelay', 1))  # Type: float
-        instance.RenameNPC = entity_data.get('renamenpc', None)  # Type: string
-
-
-class BaseNPCMaker(EnableDisable, Targetname, Angles):
-    icon_sprite = "editor/npc_maker.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.MaxNPCCount = 1  # Type: integer
-        self.SpawnFrequency = "5"  # Type: string
-        self.MaxLiveChildren = 5  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.MaxNPCCount = int(entity_data.get('maxnpccount', 1))  # Type: integer
-        instance.SpawnFrequency = entity_data.get('spawnfrequency', "5")  # Type: string
-        instance.MaxLiveChildren = int(entity_data.get('maxlivechildren', 5))  # Type: integer
-
-
-class npc_template_maker(BaseNPCMaker):
-    icon_sprite = "editor/npc_maker.vmt"
-    def __init__(self):
-        super(BaseNPCMaker).__init__()
-        self.origin = [0, 0, 0]
-        self.TemplateName = None  # Type: target_destination
-        self.Radius = 256  # Type: float
-        self.DestinationGroup = None  # Type: target_destination
-        self.CriterionVisibility = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.CriterionDistance = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.MinSpawnDistance = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseNPCMaker.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.TemplateName = entity_data.get('templatename', None)  # Type: target_destination
-        instance.Radius = float(entity_data.get('radius', 256))  # Type: float
-        instance.DestinationGroup = entity_data.get('destinationgroup', None)  # Type: target_destination
-        instance.CriterionVisibility = entity_data.get('criterionvisibility', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.CriterionDistance = entity_data.get('criteriondistance', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.MinSpawnDistance = int(entity_data.get('minspawndistance', 0))  # Type: integer
-
-
-class BaseHelicopter(BaseNPC):
-    def __init__(self):
-        super(BaseNPC).__init__()
-        self.InitialSpeed = "0"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseNPC.from_dict(instance, entity_data)
-        instance.InitialSpeed = entity_data.get('initialspeed', "0")  # Type: string
-
-
-class PlayerClass(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class Light(Base):
-    def __init__(self):
-        super().__init__()
-        self._light = [255, 255, 255, 200]  # Type: color255
-        self._lightHDR = [-1, -1, -1, 1]  # Type: color255
-        self._lightscaleHDR = 1  # Type: float
-        self.style = None  # Type: choices
-        self.pattern = None  # Type: string
-        self._constant_attn = "0"  # Type: string
-        self._linear_attn = "0"  # Type: string
-        self._quadratic_attn = "1"  # Type: string
-        self._fifty_percent_distance = "0"  # Type: string
-        self._zero_percent_distance = "0"  # Type: string
-        self._hardfalloff = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance._light = parse_int_vector(entity_data.get('_light', "255 255 255 200"))  # Type: color255
-        instance._lightHDR = parse_int_vector(entity_data.get('_lighthdr', "-1 -1 -1 1"))  # Type: color255
-        instance._lightscaleHDR = float(entity_data.get('_lightscalehdr', 1))  # Type: float
-        instance.style = entity_data.get('style', None)  # Type: choices
-        instance.pattern = entity_data.get('pattern', None)  # Type: string
-        instance._constant_attn = entity_data.get('_constant_attn', "0")  # Type: string
-        instance._linear_attn = entity_data.get('_linear_attn', "0")  # Type: string
-        instance._quadratic_attn = entity_data.get('_quadratic_attn', "1")  # Type: string
-        instance._fifty_percent_distance = entity_data.get('_fifty_percent_distance', "0")  # Type: string
-        instance._zero_percent_distance = entity_data.get('_zero_percent_distance', "0")  # Type: string
-        instance._hardfalloff = int(entity_data.get('_hardfalloff', 0))  # Type: integer
-
-
-class Node(Base):
-    def __init__(self):
-        super().__init__()
-        self.nodeid = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.nodeid = int(entity_data.get('nodeid', 0))  # Type: integer
-
-
-class HintNode(Node):
-    def __init__(self):
-        super(Node).__init__()
-        self.hinttype = None  # Type: choices
-        self.hintactivity = None  # Type: string
-        self.nodeFOV = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.StartHintDisabled = None  # Type: choices
-        self.Group = None  # Type: string
-        self.TargetNode = -1  # Type: node_dest
-        self.IgnoreFacing = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.MinimumState = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.MaximumState = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Node.from_dict(instance, entity_data)
-        instance.hinttype = entity_data.get('hinttype', None)  # Type: choices
-        instance.hintactivity = entity_data.get('hintactivity', None)  # Type: string
-        instance.nodeFOV = entity_data.get('nodefov', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.StartHintDisabled = entity_data.get('starthintdisabled', None)  # Type: choices
-        instance.Group = entity_data.get('group', None)  # Type: string
-        instance.TargetNode = int(entity_data.get('targetnode', -1))  # Type: node_dest
-        instance.IgnoreFacing = entity_data.get('ignorefacing', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.MinimumState = entity_data.get('minimumstate', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.MaximumState = entity_data.get('maximumstate', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class TriggerOnce(Parentname, Global, Origin, EnableDisable, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Origin).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.filtername = None  # Type: filterclass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.filtername = entity_data.get('filtername', None)  # Type: filterclass
-
-
-class Trigger(TriggerOnce):
-    def __init__(self):
-        super(TriggerOnce).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        TriggerOnce.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class worldbase(Base):
-    def __init__(self):
-        super().__init__()
-        self.message = None  # Type: string
-        self.skyname = "sky_day01_01"  # Type: string
-        self.chaptertitle = None  # Type: string
-        self.startdark = None  # Type: choices
-        self.gametitle = None  # Type: choices
-        self.newunit = None  # Type: choices
-        self.maxoccludeearea = 0  # Type: float
-        self.minoccluderarea = 0  # Type: float
-        self.maxoccludeearea_x360 = 0  # Type: float
-        self.minoccluderarea_x360 = 0  # Type: float
-        self.maxpropscreenwidth = -1  # Type: float
-        self.minpropscreenwidth = None  # Type: float
-        self.detailvbsp = "detail.vbsp"  # Type: string
-        self.detailmaterial = "detail/detailsprites"  # Type: string
-        self.coldworld = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.message = entity_data.get('message', None)  # Type: string
-        instance.skyname = entity_data.get('skyname', "sky_day01_01")  # Type: string
-        instance.chaptertitle = entity_data.get('chaptertitle', None)  # Type: string
-        instance.startdark = entity_data.get('startdark', None)  # Type: choices
-        instance.gametitle = entity_data.get('gametitle', None)  # Type: choices
-        instance.newunit = entity_data.get('newunit', None)  # Type: choices
-        instance.maxoccludeearea = float(entity_data.get('maxoccludeearea', 0))  # Type: float
-        instance.minoccluderarea = float(entity_data.get('minoccluderarea', 0))  # Type: float
-        instance.maxoccludeearea_x360 = float(entity_data.get('maxoccludeearea_x360', 0))  # Type: float
-        instance.minoccluderarea_x360 = float(entity_data.get('minoccluderarea_x360', 0))  # Type: float
-        instance.maxpropscreenwidth = float(entity_data.get('maxpropscreenwidth', -1))  # Type: float
-        instance.minpropscreenwidth = float(entity_data.get('minpropscreenwidth', 0))  # Type: float
-        instance.detailvbsp = entity_data.get('detailvbsp', "detail.vbsp")  # Type: string
-        instance.detailmaterial = entity_data.get('detailmaterial', "detail/detailsprites")  # Type: string
-        instance.coldworld = entity_data.get('coldworld', None)  # Type: choices
-
-
-class worldspawn(ResponseContext, worldbase, Targetname):
-    def __init__(self):
-        super(ResponseContext).__init__()
-        super(worldbase).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        ResponseContext.from_dict(instance, entity_data)
-        worldbase.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class ambient_generic(Targetname):
-    icon_sprite = "editor/ambient_generic.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.message = None  # Type: sound
-        self.health = 10  # Type: integer
-        self.preset = None  # Type: choices
-        self.volstart = None  # Type: integer
-        self.fadeinsecs = None  # Type: integer
-        self.fadeoutsecs = None  # Type: integer
-        self.pitch = 100  # Type: integer
-        self.pitchstart = 100  # Type: integer
-        self.spinup = None  # Type: integer
-        self.spindown = None  # Type: integer
-        self.lfotype = None  # Type: integer
-        self.lforate = None  # Type: integer
-        self.lfomodpitch = None  # Type: integer
-        self.lfomodvol = None  # Type: integer
-        self.cspinup = None  # Type: integer
-        self.radius = "1250"  # Type: string
-        self.SourceEntityName = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.message = entity_data.get('message', None)  # Type: sound
-        instance.health = int(entity_data.get('health', 10))  # Type: integer
-        instance.preset = entity_data.get('preset', None)  # Type: choices
-        instance.volstart = int(entity_data.get('volstart', 0))  # Type: integer
-        instance.fadeinsecs = int(entity_data.get('fadeinsecs', 0))  # Type: integer
-        instance.fadeoutsecs = int(entity_data.get('fadeoutsecs', 0))  # Type: integer
-        instance.pitch = int(entity_data.get('pitch', 100))  # Type: integer
-        instance.pitchstart = int(entity_data.get('pitchstart', 100))  # Type: integer
-        instance.spinup = int(entity_data.get('spinup', 0))  # Type: integer
-        instance.spindown = int(entity_data.get('spindown', 0))  # Type: integer
-        instance.lfotype = int(entity_data.get('lfotype', 0))  # Type: integer
-        instance.lforate = int(entity_data.get('lforate', 0))  # Type: integer
-        instance.lfomodpitch = int(entity_data.get('lfomodpitch', 0))  # Type: integer
-        instance.lfomodvol = int(entity_data.get('lfomodvol', 0))  # Type: integer
-        instance.cspinup = int(entity_data.get('cspinup', 0))  # Type: integer
-        instance.radius = entity_data.get('radius', "1250")  # Type: string
-        instance.SourceEntityName = entity_data.get('sourceentityname', None)  # Type: target_destination
-
-
-class func_lod(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.DisappearDist = 2000  # Type: integer
-        self.Solid = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.DisappearDist = int(entity_data.get('disappeardist', 2000))  # Type: integer
-        instance.Solid = entity_data.get('solid', None)  # Type: choices
-
-
-class env_zoom(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.Rate = 1.0  # Type: float
-        self.FOV = 75  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.Rate = float(entity_data.get('rate', 1.0))  # Type: float
-        instance.FOV = int(entity_data.get('fov', 75))  # Type: integer
-
-
-class env_screenoverlay(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.OverlayName1 = None  # Type: string
-        self.OverlayTime1 = 1.0  # Type: float
-        self.OverlayName2 = None  # Type: string
-        self.OverlayTime2 = 1.0  # Type: float
-        self.OverlayName3 = None  # Type: string
-        self.OverlayTime3 = 1.0  # Type: float
-        self.OverlayName4 = None  # Type: string
-        self.OverlayTime4 = 1.0  # Type: float
-        self.OverlayName5 = None  # Type: string
-        self.OverlayTime5 = 1.0  # Type: float
-        self.OverlayName6 = None  # Type: string
-        self.OverlayTime6 = 1.0  # Type: float
-        self.OverlayName7 = None  # Type: string
-        self.OverlayTime7 = 1.0  # Type: float
-        self.OverlayName8 = None  # Type: string
-        self.OverlayTime8 = 1.0  # Type: float
-        self.OverlayName9 = None  # Type: string
-        self.OverlayTime9 = 1.0  # Type: float
-        self.OverlayName10 = None  # Type: string
-        self.OverlayTime10 = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.OverlayName1 = entity_data.get('overlayname1', None)  # Type: string
-        instance.OverlayTime1 = float(entity_data.get('overlaytime1', 1.0))  # Type: float
-        instance.OverlayName2 = entity_data.get('overlayname2', None)  # Type: string
-        instance.OverlayTime2 = float(entity_data.get('overlaytime2', 1.0))  # Type: float
-        instance.OverlayName3 = entity_data.get('overlayname3', None)  # Type: string
-        instance.OverlayTime3 = float(entity_data.get('overlaytime3', 1.0))  # Type: float
-        instance.OverlayName4 = entity_data.get('overlayname4', None)  # Type: string
-        instance.OverlayTime4 = float(entity_data.get('overlaytime4', 1.0))  # Type: float
-        instance.OverlayName5 = entity_data.get('overlayname5', None)  # Type: string
-        instance.OverlayTime5 = float(entity_data.get('overlaytime5', 1.0))  # Type: float
-        instance.OverlayName6 = entity_data.get('overlayname6', None)  # Type: string
-        instance.OverlayTime6 = float(entity_data.get('overlaytime6', 1.0))  # Type: float
-        instance.OverlayName7 = entity_data.get('overlayname7', None)  # Type: string
-        instance.OverlayTime7 = float(entity_data.get('overlaytime7', 1.0))  # Type: float
-        instance.OverlayName8 = entity_data.get('overlayname8', None)  # Type: string
-        instance.OverlayTime8 = float(entity_data.get('overlaytime8', 1.0))  # Type: float
-        instance.OverlayName9 = entity_data.get('overlayname9', None)  # Type: string
-        instance.OverlayTime9 = float(entity_data.get('overlaytime9', 1.0))  # Type: float
-        instance.OverlayName10 = entity_data.get('overlayname10', None)  # Type: string
-        instance.OverlayTime10 = float(entity_data.get('overlaytime10', 1.0))  # Type: float
-
-
-class env_screeneffect(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.type = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.type = entity_data.get('type', None)  # Type: choices
-
-
-class env_texturetoggle(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class env_splash(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.scale = 8.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.scale = float(entity_data.get('scale', 8.0))  # Type: float
-
-
-class env_particlelight(Parentname):
-    def __init__(self):
-        super(Parentname).__init__()
-        self.origin = [0, 0, 0]
-        self.Color = [255, 0, 0]  # Type: color255
-        self.Intensity = 5000  # Type: integer
-        self.directional = None  # Type: choices
-        self.PSName = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.Color = parse_int_vector(entity_data.get('color', "255 0 0"))  # Type: color255
-        instance.Intensity = int(entity_data.get('intensity', 5000))  # Type: integer
-        instance.directional = entity_data.get('directional', None)  # Type: choices
-        instance.PSName = entity_data.get('psname', None)  # Type: string
-
-
-class env_sun(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.use_angles = None  # Type: choices
-        self.pitch = None  # Type: integer
-        self.rendercolor = [100, 80, 80]  # Type: color255
-        self.overlaycolor = [0, 0, 0]  # Type: color255
-        self.size = 16  # Type: integer
-        self.overlaysize = -1  # Type: integer
-        self.material = "sprites/light_glow02_add_noz"  # Type: sprite
-        self.overlaymaterial = "sprites/light_glow02_add_noz"  # Type: sprite
-        self.HDRColorScale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.use_angles = entity_data.get('use_angles', None)  # Type: choices
-        instance.pitch = int(entity_data.get('pitch', 0))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "100 80 80"))  # Type: color255
-        instance.overlaycolor = parse_int_vector(entity_data.get('overlaycolor', "0 0 0"))  # Type: color255
-        instance.size = int(entity_data.get('size', 16))  # Type: integer
-        instance.overlaysize = int(entity_data.get('overlaysize', -1))  # Type: integer
-        instance.material = entity_data.get('material', "sprites/light_glow02_add_noz")  # Type: sprite
-        instance.overlaymaterial = entity_data.get('overlaymaterial', "sprites/light_glow02_add_noz")  # Type: sprite
-        instance.HDRColorScale = float(entity_data.get('hdrcolorscale', 1.0))  # Type: float
-
-
-class game_ragdoll_manager(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.MaxRagdollCount = -1  # Type: integer
-        self.MaxRagdollCountDX8 = -1  # Type: integer
-        self.SaveImportant = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.MaxRagdollCount = int(entity_data.get('maxragdollcount', -1))  # Type: integer
-        instance.MaxRagdollCountDX8 = int(entity_data.get('maxragdollcountdx8', -1))  # Type: integer
-        instance.SaveImportant = entity_data.get('saveimportant', None)  # Type: choices
-
-
-class game_gib_manager(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.maxpieces = -1  # Type: integer
-        self.maxpiecesdx8 = -1  # Type: integer
-        self.allownewgibs = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.maxpieces = int(entity_data.get('maxpieces', -1))  # Type: integer
-        instance.maxpiecesdx8 = int(entity_data.get('maxpiecesdx8', -1))  # Type: integer
-        instance.allownewgibs = entity_data.get('allownewgibs', None)  # Type: choices
-
-
-class env_lightglow(Parentname, Targetname, Angles):
-    model = "models/editor/axis_helper_thick.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.VerticalGlowSize = 30  # Type: integer
-        self.HorizontalGlowSize = 30  # Type: integer
-        self.MinDist = 500  # Type: integer
-        self.MaxDist = 2000  # Type: integer
-        self.OuterMaxDist = None  # Type: integer
-        self.GlowProxySize = 2.0  # Type: float
-        self.HDRColorScale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.VerticalGlowSize = int(entity_data.get('verticalglowsize', 30))  # Type: integer
-        instance.HorizontalGlowSize = int(entity_data.get('horizontalglowsize', 30))  # Type: integer
-        instance.MinDist = int(entity_data.get('mindist', 500))  # Type: integer
-        instance.MaxDist = int(entity_data.get('maxdist', 2000))  # Type: integer
-        instance.OuterMaxDist = int(entity_data.get('outermaxdist', 0))  # Type: integer
-        instance.GlowProxySize = float(entity_data.get('glowproxysize', 2.0))  # Type: float
-        instance.HDRColorScale = float(entity_data.get('hdrcolorscale', 1.0))  # Type: float
-
-
-class env_smokestack(Parentname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.targetname = None  # Type: target_source
-        self.InitialState = None  # Type: choices
-        self.BaseSpread = 20  # Type: integer
-        self.SpreadSpeed = 15  # Type: integer
-        self.Speed = 30  # Type: integer
-        self.StartSize = 20  # Type: integer
-        self.EndSize = 30  # Type: integer
-        self.Rate = 20  # Type: integer
-        self.JetLength = 180  # Type: integer
-        self.WindAngle = None  # Type: integer
-        self.WindSpeed = None  # Type: integer
-        self.SmokeMaterial = "particle/SmokeStack.vmt"  # Type: string
-        self.twist = None  # Type: integer
-        self.roll = None  # Type: float
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.renderamt = 255  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.targetname = entity_data.get('targetname', None)  # Type: target_source
-        instance.InitialState = entity_data.get('initialstate', None)  # Type: choices
-        instance.BaseSpread = int(entity_data.get('basespread', 20))  # Type: integer
-        instance.SpreadSpeed = int(entity_data.get('spreadspeed', 15))  # Type: integer
-        instance.Speed = int(entity_data.get('speed', 30))  # Type: integer
-        instance.StartSize = int(entity_data.get('startsize', 20))  # Type: integer
-        instance.EndSize = int(entity_data.get('endsize', 30))  # Type: integer
-        instance.Rate = int(entity_data.get('rate', 20))  # Type: integer
-        instance.JetLength = int(entity_data.get('jetlength', 180))  # Type: integer
-        instance.WindAngle = int(entity_data.get('windangle', 0))  # Type: integer
-        instance.WindSpeed = int(entity_data.get('windspeed', 0))  # Type: integer
-        instance.SmokeMaterial = entity_data.get('smokematerial', "particle/SmokeStack.vmt")  # Type: string
-        instance.twist = int(entity_data.get('twist', 0))  # Type: integer
-        instance.roll = float(entity_data.get('roll', 0))  # Type: float
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.renderamt = int(entity_data.get('renderamt', 255))  # Type: integer
-
-
-class env_fade(Targetname):
-    icon_sprite = "editor/env_fade"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.duration = "2"  # Type: string
-        self.holdtime = "0"  # Type: string
-        self.renderamt = 255  # Type: integer
-        self.rendercolor = [0, 0, 0]  # Type: color255
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.duration = entity_data.get('duration', "2")  # Type: string
-        instance.holdtime = entity_data.get('holdtime', "0")  # Type: string
-        instance.renderamt = int(entity_data.get('renderamt', 255))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "0 0 0"))  # Type: color255
-
-
-class env_player_surface_trigger(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.gamematerial = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.gamematerial = entity_data.get('gamematerial', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class env_tonemap_controller(Targetname):
-    icon_sprite = "editor/env_tonemap_controller.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class func_useableladder(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.point0 = None  # Type: vector
-        self.point1 = None  # Type: vector
-        self.StartDisabled = None  # Type: choices
-        self.ladderSurfaceProperties = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.point0 = parse_float_vector(entity_data.get('point0', "0 0 0"))  # Type: vector
-        instance.point1 = parse_float_vector(entity_data.get('point1', "0 0 0"))  # Type: vector
-        instance.StartDisabled = entity_data.get('startdisabled', None)  # Type: choices
-        instance.ladderSurfaceProperties = entity_data.get('laddersurfaceproperties', None)  # Type: string
-
-
-class func_ladderendpoint(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class info_ladder_dismount(Parentname):
-    def __init__(self):
-        super(Parentname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class func_areaportalwindow(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.target = None  # Type: target_destination
-        self.FadeStartDist = 128  # Type: integer
-        self.FadeDist = 512  # Type: integer
-        self.TranslucencyLimit = "0.2"  # Type: string
-        self.BackgroundBModel = None  # Type: string
-        self.PortalVersion = 1  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.FadeStartDist = int(entity_data.get('fadestartdist', 128))  # Type: integer
-        instance.FadeDist = int(entity_data.get('fadedist', 512))  # Type: integer
-        instance.TranslucencyLimit = entity_data.get('translucencylimit', "0.2")  # Type: string
-        instance.BackgroundBModel = entity_data.get('backgroundbmodel', None)  # Type: string
-        instance.PortalVersion = int(entity_data.get('portalversion', 1))  # Type: integer
-
-
-class func_wall(RenderFields, Shadow, Global, Targetname):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Shadow).__init__()
-        super(Global).__init__()
-        super(Targetname).__init__()
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        RenderFields.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_clip_vphysics(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.filtername = None  # Type: filterclass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.filtername = entity_data.get('filtername', None)  # Type: filterclass
-
-
-class func_brush(Parentname, Global, Origin, RenderFields, EnableDisable, Targetname, Inputfilter, Shadow):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Origin).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Inputfilter).__init__()
-        super(Shadow).__init__()
-        self._minlight = None  # Type: string
-        self.Solidity = None  # Type: choices
-        self.excludednpc = None  # Type: string
-        self.invert_exclusion = None  # Type: choices
-        self.solidbsp = None  # Type: choices
-        self.vrad_brush_cast_shadows = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Inputfilter.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.Solidity = entity_data.get('solidity', None)  # Type: choices
-        instance.excludednpc = entity_data.get('excludednpc', None)  # Type: string
-        instance.invert_exclusion = entity_data.get('invert_exclusion', None)  # Type: choices
-        instance.solidbsp = entity_data.get('solidbsp', None)  # Type: choices
-        instance.vrad_brush_cast_shadows = entity_data.get('vrad_brush_cast_shadows', None)  # Type: choices
-
-
-class vgui_screen_base(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.panelname = None  # Type: string
-        self.overlaymaterial = None  # Type: string
-        self.width = 32  # Type: integer
-        self.height = 32  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.panelname = entity_data.get('panelname', None)  # Type: string
-        instance.overlaymaterial = entity_data.get('overlaymaterial', None)  # Type: string
-        instance.width = int(entity_data.get('width', 32))  # Type: integer
-        instance.height = int(entity_data.get('height', 32))  # Type: integer
-
-
-class vgui_screen(vgui_screen_base):
-    def __init__(self):
-        super(vgui_screen_base).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        vgui_screen_base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class vgui_slideshow_display(Parentname, Targetname, Angles):
-    model = "models/editor/axis_helper_thick.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.displaytext = None  # Type: string
-        self.directory = "slideshow"  # Type: string
-        self.minslidetime = 0.5  # Type: float
-        self.maxslidetime = 0.5  # Type: float
-        self.cycletype = None  # Type: choices
-        self.nolistrepeat = None  # Type: choices
-        self.width = 256  # Type: integer
-        self.height = 128  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.displaytext = entity_data.get('displaytext', None)  # Type: string
-        instance.directory = entity_data.get('directory', "slideshow")  # Type: string
-        instance.minslidetime = float(entity_data.get('minslidetime', 0.5))  # Type: float
-        instance.maxslidetime = float(entity_data.get('maxslidetime', 0.5))  # Type: float
-        instance.cycletype = entity_data.get('cycletype', None)  # Type: choices
-        instance.nolistrepeat = entity_data.get('nolistrepeat', None)  # Type: choices
-        instance.width = int(entity_data.get('width', 256))  # Type: integer
-        instance.height = int(entity_data.get('height', 128))  # Type: integer
-
-
-class cycler(Parentname, RenderFields, Targetname, Angles):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(RenderFxChoices).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.model = None  # Type: studio
-        self.skin = None  # Type: integer
-        self.sequence = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        RenderFxChoices.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.model = entity_data.get('model', None)  # Type: studio
-        instance.skin = int(entity_data.get('skin', 0))  # Type: integer
-        instance.sequence = int(entity_data.get('sequence', 0))  # Type: integer
-
-
-class gibshooterbase(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.angles = "0 0 0"  # Type: string
-        self.m_iGibs = 3  # Type: integer
-        self.delay = "0"  # Type: string
-        self.gibangles = "0 0 0"  # Type: string
-        self.gibanglevelocity = "0"  # Type: string
-        self.m_flVelocity = 200  # Type: integer
-        self.m_flVariance = "0.15"  # Type: string
-        self.m_flGibLife = "4"  # Type: string
-        self.lightingorigin = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.angles = entity_data.get('angles', "0 0 0")  # Type: string
-        instance.m_iGibs = int(entity_data.get('m_igibs', 3))  # Type: integer
-        instance.delay = entity_data.get('delay', "0")  # Type: string
-        instance.gibangles = entity_data.get('gibangles', "0 0 0")  # Type: string
-        instance.gibanglevelocity = entity_data.get('gibanglevelocity', "0")  # Type: string
-        instance.m_flVelocity = int(entity_data.get('m_flvelocity', 200))  # Type: integer
-        instance.m_flVariance = entity_data.get('m_flvariance', "0.15")  # Type: string
-        instance.m_flGibLife = entity_data.get('m_flgiblife', "4")  # Type: string
-        instance.lightingorigin = entity_data.get('lightingorigin', None)  # Type: target_destination
-
-
-class env_beam(Parentname, Targetname, RenderFxChoices):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(RenderFxChoices).__init__()
-        self.origin = [0, 0, 0]
-        self.renderamt = 100  # Type: integer
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.Radius = 256  # Type: integer
-        self.life = "1"  # Type: string
-        self.BoltWidth = 2  # Type: float
-        self.NoiseAmplitude = None  # Type: float
-        self.texture = "sprites/laserbeam.spr"  # Type: sprite
-        self.TextureScroll = 35  # Type: integer
-        self.framerate = None  # Type: integer
-        self.framestart = None  # Type: integer
-        self.StrikeTime = "1"  # Type: string
-        self.damage = "0"  # Type: string
-        self.LightningStart = None  # Type: target_destination
-        self.LightningEnd = None  # Type: target_destination
-        self.decalname = "Bigshot"  # Type: string
-        self.HDRColorScale = 1.0  # Type: float
-        self.TouchType = None  # Type: choices
-        self.filtername = None  # Type: filterclass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RenderFxChoices.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.renderamt = int(entity_data.get('renderamt', 100))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.Radius = int(entity_data.get('radius', 256))  # Type: integer
-        instance.life = entity_data.get('life', "1")  # Type: string
-        instance.BoltWidth = float(entity_data.get('boltwidth', 2))  # Type: float
-        instance.NoiseAmplitude = float(entity_data.get('noiseamplitude', 0))  # Type: float
-        instance.texture = entity_data.get('texture', "sprites/laserbeam.spr")  # Type: sprite
-        instance.TextureScroll = int(entity_data.get('texturescroll', 35))  # Type: integer
-        instance.framerate = int(entity_data.get('framerate', 0))  # Type: integer
-        instance.framestart = int(entity_data.get('framestart', 0))  # Type: integer
-        instance.StrikeTime = entity_data.get('striketime', "1")  # Type: string
-        instance.damage = entity_data.get('damage', "0")  # Type: string
-        instance.LightningStart = entity_data.get('lightningstart', None)  # Type: target_destination
-        instance.LightningEnd = entity_data.get('lightningend', None)  # Type: target_destination
-        instance.decalname = entity_data.get('decalname', "Bigshot")  # Type: string
-        instance.HDRColorScale = float(entity_data.get('hdrcolorscale', 1.0))  # Type: float
-        instance.TouchType = entity_data.get('touchtype', None)  # Type: choices
-        instance.filtername = entity_data.get('filtername', None)  # Type: filterclass
-
-
-class env_beverage(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.health = 10  # Type: integer
-        self.beveragetype = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.health = int(entity_data.get('health', 10))  # Type: integer
-        instance.beveragetype = entity_data.get('beveragetype', None)  # Type: choices
-
-
-class env_embers(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.particletype = None  # Type: choices
-        self.density = 50  # Type: integer
-        self.lifetime = 4  # Type: integer
-        self.speed = 32  # Type: integer
-        self.rendercolor = [255, 255, 255]  # Type: color255
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.particletype = entity_data.get('particletype', None)  # Type: choices
-        instance.density = int(entity_data.get('density', 50))  # Type: integer
-        instance.lifetime = int(entity_data.get('lifetime', 4))  # Type: integer
-        instance.speed = int(entity_data.get('speed', 32))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-
-
-class env_funnel(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class env_blood(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.spraydir = [0.0, 0.0, 0.0]  # Type: angle
-        self.color = None  # Type: choices
-        self.amount = "100"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.spraydir = parse_float_vector(entity_data.get('spraydir', "0 0 0"))  # Type: angle
-        instance.color = entity_data.get('color', None)  # Type: choices
-        instance.amount = entity_data.get('amount', "100")  # Type: string
-
-
-class env_bubbles(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.density = 2  # Type: integer
-        self.frequency = 2  # Type: integer
-        self.current = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.density = int(entity_data.get('density', 2))  # Type: integer
-        instance.frequency = int(entity_data.get('frequency', 2))  # Type: integer
-        instance.current = int(entity_data.get('current', 0))  # Type: integer
-
-
-class env_explosion(Parentname, Targetname):
-    icon_sprite = "editor/env_explosion.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.iMagnitude = 100  # Type: integer
-        self.iRadiusOverride = None  # Type: integer
-        self.fireballsprite = "sprites/zerogxplode.spr"  # Type: sprite
-        self.rendermode = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.ignoredEntity = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.iMagnitude = int(entity_data.get('imagnitude', 100))  # Type: integer
-        instance.iRadiusOverride = int(entity_data.get('iradiusoverride', 0))  # Type: integer
-        instance.fireballsprite = entity_data.get('fireballsprite', "sprites/zerogxplode.spr")  # Type: sprite
-        instance.rendermode = entity_data.get('rendermode', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.ignoredEntity = entity_data.get('ignoredentity', None)  # Type: target_destination
-
-
-class env_smoketrail(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.opacity = 0.75  # Type: float
-        self.spawnrate = 20  # Type: float
-        self.lifetime = 5.0  # Type: float
-        self.startcolor = [192, 192, 192]  # Type: color255
-        self.endcolor = [160, 160, 160]  # Type: color255
-        self.emittime = 0  # Type: float
-        self.minspeed = 10  # Type: float
-        self.maxspeed = 20  # Type: float
-        self.mindirectedspeed = 0  # Type: float
-        self.maxdirectedspeed = 0  # Type: float
-        self.startsize = 15  # Type: float
-        self.endsize = 50  # Type: float
-        self.spawnradius = 15  # Type: float
-        self.firesprite = "sprites/firetrail.spr"  # Type: sprite
-        self.smokesprite = "sprites/whitepuff.spr"  # Type: sprite
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.opacity = float(entity_data.get('opacity', 0.75))  # Type: float
-        instance.spawnrate = float(entity_data.get('spawnrate', 20))  # Type: float
-        instance.lifetime = float(entity_data.get('lifetime', 5.0))  # Type: float
-        instance.startcolor = parse_int_vector(entity_data.get('startcolor', "192 192 192"))  # Type: color255
-        instance.endcolor = parse_int_vector(entity_data.get('endcolor', "160 160 160"))  # Type: color255
-        instance.emittime = float(entity_data.get('emittime', 0))  # Type: float
-        instance.minspeed = float(entity_data.get('minspeed', 10))  # Type: float
-        instance.maxspeed = float(entity_data.get('maxspeed', 20))  # Type: float
-        instance.mindirectedspeed = float(entity_data.get('mindirectedspeed', 0))  # Type: float
-        instance.maxdirectedspeed = float(entity_data.get('maxdirectedspeed', 0))  # Type: float
-        instance.startsize = float(entity_data.get('startsize', 15))  # Type: float
-        instance.endsize = float(entity_data.get('endsize', 50))  # Type: float
-        instance.spawnradius = float(entity_data.get('spawnradius', 15))  # Type: float
-        instance.firesprite = entity_data.get('firesprite', "sprites/firetrail.spr")  # Type: sprite
-        instance.smokesprite = entity_data.get('smokesprite', "sprites/whitepuff.spr")  # Type: sprite
-
-
-class env_physexplosion(Parentname, Targetname):
-    icon_sprite = "editor/env_physexplosion.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.magnitude = "100"  # Type: string
-        self.radius = "0"  # Type: string
-        self.targetentityname = None  # Type: target_destination
-        self.inner_radius = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.magnitude = entity_data.get('magnitude', "100")  # Type: string
-        instance.radius = entity_data.get('radius', "0")  # Type: string
-        instance.targetentityname = entity_data.get('targetentityname', None)  # Type: target_destination
-        instance.inner_radius = float(entity_data.get('inner_radius', 0))  # Type: float
-
-
-class env_physimpact(Parentname, Targetname):
-    icon_sprite = "editor/env_physexplosion.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.angles = "0 0 0"  # Type: string
-        self.magnitude = 100  # Type: integer
-        self.distance = None  # Type: integer
-        self.directionentityname = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.angles = entity_data.get('angles', "0 0 0")  # Type: string
-        instance.magnitude = int(entity_data.get('magnitude', 100))  # Type: integer
-        instance.distance = int(entity_data.get('distance', 0))  # Type: integer
-        instance.directionentityname = entity_data.get('directionentityname', None)  # Type: target_destination
-
-
-class env_fire(Parentname, EnableDisable, Targetname):
-    icon_sprite = "editor/env_fire"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.health = 30  # Type: integer
-        self.firesize = 64  # Type: integer
-        self.fireattack = 4  # Type: integer
-        self.firetype = None  # Type: choices
-        self.ignitionpoint = 32  # Type: float
-        self.damagescale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.health = int(entity_data.get('health', 30))  # Type: integer
-        instance.firesize = int(entity_data.get('firesize', 64))  # Type: integer
-        instance.fireattack = int(entity_data.get('fireattack', 4))  # Type: integer
-        instance.firetype = entity_data.get('firetype', None)  # Type: choices
-        instance.ignitionpoint = float(entity_data.get('ignitionpoint', 32))  # Type: float
-        instance.damagescale = float(entity_data.get('damagescale', 1.0))  # Type: float
-
-
-class env_firesource(Parentname, Targetname):
-    icon_sprite = "editor/env_firesource"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.fireradius = 128  # Type: float
-        self.firedamage = 10  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.fireradius = float(entity_data.get('fireradius', 128))  # Type: float
-        instance.firedamage = float(entity_data.get('firedamage', 10))  # Type: float
-
-
-class env_firesensor(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.fireradius = 128  # Type: float
-        self.heatlevel = 32  # Type: float
-        self.heattime = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.fireradius = float(entity_data.get('fireradius', 128))  # Type: float
-        instance.heatlevel = float(entity_data.get('heatlevel', 32))  # Type: float
-        instance.heattime = float(entity_data.get('heattime', 0))  # Type: float
-
-
-class env_entity_igniter(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.lifetime = 10  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.lifetime = float(entity_data.get('lifetime', 10))  # Type: float
-
-
-class env_fog_controller(DXLevelChoice, Targetname, Angles):
-    icon_sprite = "editor/fog_controller.vmt"
-    def __init__(self):
-        super(DXLevelChoice).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.fogenable = None  # Type: choices
-        self.fogblend = None  # Type: choices
-        self.use_angles = None  # Type: choices
-        self.fogcolor = [255, 255, 255]  # Type: color255
-        self.fogcolor2 = [255, 255, 255]  # Type: color255
-        self.fogdir = "1 0 0"  # Type: string
-        self.fogstart = "500.0"  # Type: string
-        self.fogend = "2000.0"  # Type: string
-        self.fogmaxdensity = 1  # Type: float
-        self.foglerptime = 0  # Type: float
-        self.farz = "-1"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        DXLevelChoice.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.fogenable = entity_data.get('fogenable', None)  # Type: choices
-        instance.fogblend = entity_data.get('fogblend', None)  # Type: choices
-        instance.use_angles = entity_data.get('use_angles', None)  # Type: choices
-        instance.fogcolor = parse_int_vector(entity_data.get('fogcolor', "255 255 255"))  # Type: color255
-        instance.fogcolor2 = parse_int_vector(entity_data.get('fogcolor2', "255 255 255"))  # Type: color255
-        instance.fogdir = entity_data.get('fogdir', "1 0 0")  # Type: string
-        instance.fogstart = entity_data.get('fogstart', "500.0")  # Type: string
-        instance.fogend = entity_data.get('fogend', "2000.0")  # Type: string
-        instance.fogmaxdensity = float(entity_data.get('fogmaxdensity', 1))  # Type: float
-        instance.foglerptime = float(entity_data.get('foglerptime', 0))  # Type: float
-        instance.farz = entity_data.get('farz', "-1")  # Type: string
-
-
-class env_steam(Parentname, Targetname, Angles):
-    viewport_model = "models/editor/spot_cone.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.InitialState = None  # Type: choices
-        self.type = None  # Type: choices
-        self.SpreadSpeed = 15  # Type: integer
-        self.Speed = 120  # Type: integer
-        self.StartSize = 10  # Type: integer
-        self.EndSize = 25  # Type: integer
-        self.Rate = 26  # Type: integer
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.JetLength = 80  # Type: integer
-        self.renderamt = 255  # Type: integer
-        self.rollspeed = 8  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.InitialState = entity_data.get('initialstate', None)  # Type: choices
-        instance.type = entity_data.get('type', None)  # Type: choices
-        instance.SpreadSpeed = int(entity_data.get('spreadspeed', 15))  # Type: integer
-        instance.Speed = int(entity_data.get('speed', 120))  # Type: integer
-        instance.StartSize = int(entity_data.get('startsize', 10))  # Type: integer
-        instance.EndSize = int(entity_data.get('endsize', 25))  # Type: integer
-        instance.Rate = int(entity_data.get('rate', 26))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.JetLength = int(entity_data.get('jetlength', 80))  # Type: integer
-        instance.renderamt = int(entity_data.get('renderamt', 255))  # Type: integer
-        instance.rollspeed = float(entity_data.get('rollspeed', 8))  # Type: float
-
-
-class env_laser(Parentname, Targetname, RenderFxChoices):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(RenderFxChoices).__init__()
-        self.origin = [0, 0, 0]
-        self.LaserTarget = None  # Type: target_destination
-        self.renderamt = 100  # Type: integer
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.width = 2  # Type: float
-        self.NoiseAmplitude = None  # Type: integer
-        self.texture = "sprites/laserbeam.spr"  # Type: sprite
-        self.EndSprite = None  # Type: sprite
-        self.TextureScroll = 35  # Type: integer
-        self.framestart = None  # Type: integer
-        self.damage = "100"  # Type: string
-        self.dissolvetype = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RenderFxChoices.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.LaserTarget = entity_data.get('lasertarget', None)  # Type: target_destination
-        instance.renderamt = int(entity_data.get('renderamt', 100))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.width = float(entity_data.get('width', 2))  # Type: float
-        instance.NoiseAmplitude = int(entity_data.get('noiseamplitude', 0))  # Type: integer
-        instance.texture = entity_data.get('texture', "sprites/laserbeam.spr")  # Type: sprite
-        instance.EndSprite = entity_data.get('endsprite', None)  # Type: sprite
-        instance.TextureScroll = int(entity_data.get('texturescroll', 35))  # Type: integer
-        instance.framestart = int(entity_data.get('framestart', 0))  # Type: integer
-        instance.damage = entity_data.get('damage', "100")  # Type: string
-        instance.dissolvetype = entity_data.get('dissolvetype', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class env_message(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.message = None  # Type: string
-        self.messagesound = None  # Type: sound
-        self.messagevolume = "10"  # Type: string
-        self.messageattenuation = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.message = entity_data.get('message', None)  # Type: string
-        instance.messagesound = entity_data.get('messagesound', None)  # Type: sound
-        instance.messagevolume = entity_data.get('messagevolume', "10")  # Type: string
-        instance.messageattenuation = entity_data.get('messageattenuation', None)  # Type: choices
-
-
-class env_hudhint(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.message = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.message = entity_data.get('message', None)  # Type: string
-
-
-class env_shake(Parentname, Targetname):
-    icon_sprite = "editor/env_shake.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.amplitude = 4  # Type: float
-        self.radius = 500  # Type: float
-        self.duration = 1  # Type: float
-        self.frequency = 2.5  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.amplitude = float(entity_data.get('amplitude', 4))  # Type: float
-        instance.radius = float(entity_data.get('radius', 500))  # Type: float
-        instance.duration = float(entity_data.get('duration', 1))  # Type: float
-        instance.frequency = float(entity_data.get('frequency', 2.5))  # Type: float
-
-
-class env_viewpunch(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.punchangle = [0.0, 0.0, 90.0]  # Type: angle
-        self.radius = 500  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.punchangle = parse_float_vector(entity_data.get('punchangle', "0 0 90"))  # Type: angle
-        instance.radius = float(entity_data.get('radius', 500))  # Type: float
-
-
-class env_rotorwash_emitter(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.altitude = 1024  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.altitude = float(entity_data.get('altitude', 1024))  # Type: float
-
-
-class gibshooter(gibshooterbase):
-    icon_sprite = "editor/gibshooter.vmt"
-    def __init__(self):
-        super(gibshooterbase).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        gibshooterbase.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class env_shooter(gibshooterbase, RenderFields):
-    icon_sprite = "editor/env_shooter.vmt"
-    def __init__(self):
-        super(gibshooterbase).__init__()
-        super(RenderFields).__init__()
-        self.origin = [0, 0, 0]
-        self.shootmodel = None  # Type: studio
-        self.shootsounds = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.simulation = None  # Type: choices
-        self.skin = None  # Type: integer
-        self.nogibshadows = None  # Type: choices
-        self.gibgravityscale = 1  # Type: float
-        self.massoverride = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        gibshooterbase.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.shootmodel = entity_data.get('shootmodel', None)  # Type: studio
-        instance.shootsounds = entity_data.get('shootsounds', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.simulation = entity_data.get('simulation', None)  # Type: choices
-        instance.skin = int(entity_data.get('skin', 0))  # Type: integer
-        instance.nogibshadows = entity_data.get('nogibshadows', None)  # Type: choices
-        instance.gibgravityscale = float(entity_data.get('gibgravityscale', 1))  # Type: float
-        instance.massoverride = float(entity_data.get('massoverride', 0))  # Type: float
-
-
-class env_rotorshooter(gibshooterbase, RenderFields):
-    icon_sprite = "editor/env_shooter.vmt"
-    def __init__(self):
-        super(gibshooterbase).__init__()
-        super(RenderFields).__init__()
-        self.origin = [0, 0, 0]
-        self.shootmodel = None  # Type: studio
-        self.shootsounds = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.simulation = None  # Type: choices
-        self.skin = None  # Type: integer
-        self.rotortime = 1  # Type: float
-        self.rotortimevariance = 0.3  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        gibshooterbase.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.shootmodel = entity_data.get('shootmodel', None)  # Type: studio
-        instance.shootsounds = entity_data.get('shootsounds', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.simulation = entity_data.get('simulation', None)  # Type: choices
-        instance.skin = int(entity_data.get('skin', 0))  # Type: integer
-        instance.rotortime = float(entity_data.get('rotortime', 1))  # Type: float
-        instance.rotortimevariance = float(entity_data.get('rotortimevariance', 0.3))  # Type: float
-
-
-class env_soundscape_proxy(Parentname, Targetname):
-    icon_sprite = "editor/env_soundscape.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.MainSoundscapeName = None  # Type: target_destination
-        self.radius = 128  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.MainSoundscapeName = entity_data.get('mainsoundscapename', None)  # Type: target_destination
-        instance.radius = int(entity_data.get('radius', 128))  # Type: integer
-
-
-class env_soundscape(Parentname, EnableDisable, Targetname):
-    icon_sprite = "editor/env_soundscape.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.radius = 128  # Type: integer
-        self.soundscape = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.position0 = None  # Type: target_destination
-        self.position1 = None  # Type: target_destination
-        self.position2 = None  # Type: target_destination
-        self.position3 = None  # Type: target_destination
-        self.position4 = None  # Type: target_destination
-        self.position5 = None  # Type: target_destination
-        self.position6 = None  # Type: target_destination
-        self.position7 = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.radius = int(entity_data.get('radius', 128))  # Type: integer
-        instance.soundscape = entity_data.get('soundscape', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.position0 = entity_data.get('position0', None)  # Type: target_destination
-        instance.position1 = entity_data.get('position1', None)  # Type: target_destination
-        instance.position2 = entity_data.get('position2', None)  # Type: target_destination
-        instance.position3 = entity_data.get('position3', None)  # Type: target_destination
-        instance.position4 = entity_data.get('position4', None)  # Type: target_destination
-        instance.position5 = entity_data.get('position5', None)  # Type: target_destination
-        instance.position6 = entity_data.get('position6', None)  # Type: target_destination
-        instance.position7 = entity_data.get('position7', None)  # Type: target_destination
-
-
-class env_soundscape_triggerable(env_soundscape):
-    icon_sprite = "editor/env_soundscape.vmt"
-    def __init__(self):
-        super(env_soundscape).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        env_soundscape.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class env_spark(Parentname, Targetname, Angles):
-    icon_sprite = "editor/env_spark.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.MaxDelay = "0"  # Type: string
-        self.Magnitude = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.TrailLength = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.MaxDelay = entity_data.get('maxdelay', "0")  # Type: string
-        instance.Magnitude = entity_data.get('magnitude', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.TrailLength = entity_data.get('traillength', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class env_sprite(Parentname, Targetname, DXLevelChoice, RenderFields):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(DXLevelChoice).__init__()
-        self.origin = [0, 0, 0]
-        self.framerate = "10.0"  # Type: string
-        self.model = "sprites/glow01.spr"  # Type: sprite
-        self.scale = None  # Type: string
-        self.GlowProxySize = 2.0  # Type: float
-        self.HDRColorScale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        DXLevelChoice.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.framerate = entity_data.get('framerate', "10.0")  # Type: string
-        instance.model = entity_data.get('model', "sprites/glow01.spr")  # Type: sprite
-        instance.scale = entity_data.get('scale', None)  # Type: string
-        instance.GlowProxySize = float(entity_data.get('glowproxysize', 2.0))  # Type: float
-        instance.HDRColorScale = float(entity_data.get('hdrcolorscale', 1.0))  # Type: float
-
-
-class env_sprite_oriented(env_sprite, Angles):
-    def __init__(self):
-        super(env_sprite).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        env_sprite.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class env_wind(Targetname, Angles):
-    icon_sprite = "editor/env_wind.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.minwind = 20  # Type: integer
-        self.maxwind = 50  # Type: integer
-        self.mingust = 100  # Type: integer
-        self.maxgust = 250  # Type: integer
-        self.mingustdelay = 10  # Type: integer
-        self.maxgustdelay = 20  # Type: integer
-        self.gustduration = 5  # Type: integer
-        self.gustdirchange = 20  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.minwind = int(entity_data.get('minwind', 20))  # Type: integer
-        instance.maxwind = int(entity_data.get('maxwind', 50))  # Type: integer
-        instance.mingust = int(entity_data.get('mingust', 100))  # Type: integer
-        instance.maxgust = int(entity_data.get('maxgust', 250))  # Type: integer
-        instance.mingustdelay = int(entity_data.get('mingustdelay', 10))  # Type: integer
-        instance.maxgustdelay = int(entity_data.get('maxgustdelay', 20))  # Type: integer
-        instance.gustduration = int(entity_data.get('gustduration', 5))  # Type: integer
-        instance.gustdirchange = int(entity_data.get('gustdirchange', 20))  # Type: integer
-
-
-class sky_camera(Angles):
-    def __init__(self):
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.scale = 16  # Type: integer
-        self.fogenable = None  # Type: choices
-        self.fogblend = None  # Type: choices
-        self.use_angles = None  # Type: choices
-        self.fogcolor = [255, 255, 255]  # Type: color255
-        self.fogcolor2 = [255, 255, 255]  # Type: color255
-        self.fogdir = "1 0 0"  # Type: string
-        self.fogstart = "500.0"  # Type: string
-        self.fogend = "2000.0"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.scale = int(entity_data.get('scale', 16))  # Type: integer
-        instance.fogenable = entity_data.get('fogenable', None)  # Type: choices
-        instance.fogblend = entity_data.get('fogblend', None)  # Type: choices
-        instance.use_angles = entity_data.get('use_angles', None)  # Type: choices
-        instance.fogcolor = parse_int_vector(entity_data.get('fogcolor', "255 255 255"))  # Type: color255
-        instance.fogcolor2 = parse_int_vector(entity_data.get('fogcolor2', "255 255 255"))  # Type: color255
-        instance.fogdir = entity_data.get('fogdir', "1 0 0")  # Type: string
-        instance.fogstart = entity_data.get('fogstart', "500.0")  # Type: string
-        instance.fogend = entity_data.get('fogend', "2000.0")  # Type: string
-
-
-class BaseSpeaker(ResponseContext, Targetname):
-    def __init__(self):
-        super(ResponseContext).__init__()
-        super(Targetname).__init__()
-        self.delaymin = "15"  # Type: string
-        self.delaymax = "135"  # Type: string
-        self.rulescript = None  # Type: string
-        self.concept = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        ResponseContext.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.delaymin = entity_data.get('delaymin', "15")  # Type: string
-        instance.delaymax = entity_data.get('delaymax', "135")  # Type: string
-        instance.rulescript = entity_data.get('rulescript', None)  # Type: string
-        instance.concept = entity_data.get('concept', None)  # Type: string
-
-
-class game_weapon_manager(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.weaponname = None  # Type: string
-        self.maxpieces = None  # Type: integer
-        self.ammomod = 1  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.weaponname = entity_data.get('weaponname', None)  # Type: string
-        instance.maxpieces = int(entity_data.get('maxpieces', 0))  # Type: integer
-        instance.ammomod = float(entity_data.get('ammomod', 1))  # Type: float
-
-
-class game_end(Targetname):
-    icon_sprite = "editor/game_end.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.master = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.master = entity_data.get('master', None)  # Type: string
-
-
-class game_player_equip(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.master = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.master = entity_data.get('master', None)  # Type: string
-
-
-class game_player_team(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: string
-        self.master = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: string
-        instance.master = entity_data.get('master', None)  # Type: string
-
-
-class game_score(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.points = 1  # Type: integer
-        self.master = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.points = int(entity_data.get('points', 1))  # Type: integer
-        instance.master = entity_data.get('master', None)  # Type: string
-
-
-class game_text(Targetname):
-    icon_sprite = "editor/game_text.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.message = None  # Type: string
-        self.x = "-1"  # Type: string
-        self.y = "-1"  # Type: string
-        self.effect = None  # Type: choices
-        self.color = [100, 100, 100]  # Type: color255
-        self.color2 = [240, 110, 0]  # Type: color255
-        self.fadein = "1.5"  # Type: string
-        self.fadeout = "0.5"  # Type: string
-        self.holdtime = "1.2"  # Type: string
-        self.fxtime = "0.25"  # Type: string
-        self.channel = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.master = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.message = entity_data.get('message', None)  # Type: string
-        instance.x = entity_data.get('x', "-1")  # Type: string
-        instance.y = entity_data.get('y', "-1")  # Type: string
-        instance.effect = entity_data.get('effect', None)  # Type: choices
-        instance.color = parse_int_vector(entity_data.get('color', "100 100 100"))  # Type: color255
-        instance.color2 = parse_int_vector(entity_data.get('color2', "240 110 0"))  # Type: color255
-        instance.fadein = entity_data.get('fadein', "1.5")  # Type: string
-        instance.fadeout = entity_data.get('fadeout', "0.5")  # Type: string
-        instance.holdtime = entity_data.get('holdtime', "1.2")  # Type: string
-        instance.fxtime = entity_data.get('fxtime', "0.25")  # Type: string
-        instance.channel = entity_data.get('channel', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.master = entity_data.get('master', None)  # Type: string
-
-
-class point_enable_motion_fixup(Parentname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class point_message(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.message = None  # Type: string
-        self.radius = 128  # Type: integer
-        self.developeronly = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.message = entity_data.get('message', None)  # Type: string
-        instance.radius = int(entity_data.get('radius', 128))  # Type: integer
-        instance.developeronly = entity_data.get('developeronly', None)  # Type: choices
-
-
-class point_spotlight(Parentname, RenderFields, Targetname, DXLevelChoice, Angles):
-    model = "models/editor/cone_helper.mdl"
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(DXLevelChoice).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.IgnoreSolid = None  # Type: choices
-        self.spotlightlength = 500  # Type: integer
-        self.spotlightwidth = 50  # Type: integer
-        self.HDRColorScale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        DXLevelChoice.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.IgnoreSolid = entity_data.get('ignoresolid', None)  # Type: choices
-        instance.spotlightlength = int(entity_data.get('spotlightlength', 500))  # Type: integer
-        instance.spotlightwidth = int(entity_data.get('spotlightwidth', 50))  # Type: integer
-        instance.HDRColorScale = float(entity_data.get('hdrcolorscale', 1.0))  # Type: float
-
-
-class point_tesla(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.m_SourceEntityName = None  # Type: string
-        self.m_SoundName = "DoSpark"  # Type: string
-        self.texture = "sprites/physbeam.vmt"  # Type: sprite
-        self.m_Color = [255, 255, 255]  # Type: color255
-        self.m_flRadius = 200  # Type: integer
-        self.beamcount_min = 6  # Type: integer
-        self.beamcount_max = 8  # Type: integer
-        self.thick_min = "4"  # Type: string
-        self.thick_max = "5"  # Type: string
-        self.lifetime_min = "0.3"  # Type: string
-        self.lifetime_max = "0.3"  # Type: string
-        self.interval_min = "0.5"  # Type: string
-        self.interval_max = "2"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.m_SourceEntityName = entity_data.get('m_sourceentityname', None)  # Type: string
-        instance.m_SoundName = entity_data.get('m_soundname', "DoSpark")  # Type: string
-        instance.texture = entity_data.get('texture', "sprites/physbeam.vmt")  # Type: sprite
-        instance.m_Color = parse_int_vector(entity_data.get('m_color', "255 255 255"))  # Type: color255
-        instance.m_flRadius = int(entity_data.get('m_flradius', 200))  # Type: integer
-        instance.beamcount_min = int(entity_data.get('beamcount_min', 6))  # Type: integer
-        instance.beamcount_max = int(entity_data.get('beamcount_max', 8))  # Type: integer
-        instance.thick_min = entity_data.get('thick_min', "4")  # Type: string
-        instance.thick_max = entity_data.get('thick_max', "5")  # Type: string
-        instance.lifetime_min = entity_data.get('lifetime_min', "0.3")  # Type: string
-        instance.lifetime_max = entity_data.get('lifetime_max', "0.3")  # Type: string
-        instance.interval_min = entity_data.get('interval_min', "0.5")  # Type: string
-        instance.interval_max = entity_data.get('interval_max', "2")  # Type: string
-
-
-class point_clientcommand(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class point_servercommand(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class point_bonusmaps_accessor(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.filename = None  # Type: string
-        self.mapname = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.filename = entity_data.get('filename', None)  # Type: string
-        instance.mapname = entity_data.get('mapname', None)  # Type: string
-
-
-class game_ui(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.FieldOfView = -1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.FieldOfView = float(entity_data.get('fieldofview', -1.0))  # Type: float
-
-
-class game_zone_player(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class infodecal(Targetname):
-    model = "models/editor/axis_helper_thick.mdl"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.texture = None  # Type: decal
-        self.LowPriority = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.texture = entity_data.get('texture', None)  # Type: decal
-        instance.LowPriority = entity_data.get('lowpriority', None)  # Type: choices
-
-
-class info_projecteddecal(Targetname, Angles):
-    model = "models/editor/axis_helper_thick.mdl"
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.texture = None  # Type: decal
-        self.Distance = 64  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.texture = entity_data.get('texture', None)  # Type: decal
-        instance.Distance = float(entity_data.get('distance', 64))  # Type: float
-
-
-class info_no_dynamic_shadow(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.sides = None  # Type: sidelist
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.sides = entity_data.get('sides', None)  # Type: sidelist
-
-
-class info_player_start(PlayerClass, Angles):
-    model = "models/editor/playerstart.mdl"
-    def __init__(self):
-        super(PlayerClass).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        PlayerClass.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_overlay(Targetname):
-    model = "models/editor/overlay_helper.mdl"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.material = None  # Type: material
-        self.sides = None  # Type: sidelist
-        self.RenderOrder = None  # Type: integer
-        self.StartU = 0.0  # Type: float
-        self.EndU = 1.0  # Type: float
-        self.StartV = 0.0  # Type: float
-        self.EndV = 1.0  # Type: float
-        self.BasisOrigin = None  # Type: vector
-        self.BasisU = None  # Type: vector
-        self.BasisV = None  # Type: vector
-        self.BasisNormal = None  # Type: vector
-        self.uv0 = None  # Type: vector
-        self.uv1 = None  # Type: vector
-        self.uv2 = None  # Type: vector
-        self.uv3 = None  # Type: vector
-        self.fademindist = -1  # Type: float
-        self.fademaxdist = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.material = entity_data.get('material', None)  # Type: material
-        instance.sides = entity_data.get('sides', None)  # Type: sidelist
-        instance.RenderOrder = int(entity_data.get('renderorder', 0))  # Type: integer
-        instance.StartU = float(entity_data.get('startu', 0.0))  # Type: float
-        instance.EndU = float(entity_data.get('endu', 1.0))  # Type: float
-        instance.StartV = float(entity_data.get('startv', 0.0))  # Type: float
-        instance.EndV = float(entity_data.get('endv', 1.0))  # Type: float
-        instance.BasisOrigin = parse_float_vector(entity_data.get('basisorigin', "0 0 0"))  # Type: vector
-        instance.BasisU = parse_float_vector(entity_data.get('basisu', "0 0 0"))  # Type: vector
-        instance.BasisV = parse_float_vector(entity_data.get('basisv', "0 0 0"))  # Type: vector
-        instance.BasisNormal = parse_float_vector(entity_data.get('basisnormal', "0 0 0"))  # Type: vector
-        instance.uv0 = parse_float_vector(entity_data.get('uv0', "0 0 0"))  # Type: vector
-        instance.uv1 = parse_float_vector(entity_data.get('uv1', "0 0 0"))  # Type: vector
-        instance.uv2 = parse_float_vector(entity_data.get('uv2', "0 0 0"))  # Type: vector
-        instance.uv3 = parse_float_vector(entity_data.get('uv3', "0 0 0"))  # Type: vector
-        instance.fademindist = float(entity_data.get('fademindist', -1))  # Type: float
-        instance.fademaxdist = float(entity_data.get('fademaxdist', 0))  # Type: float
-
-
-class info_overlay_transition(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.material = None  # Type: material
-        self.sides = None  # Type: sidelist
-        self.sides2 = None  # Type: sidelist
-        self.LengthTexcoordStart = 0.0  # Type: float
-        self.LengthTexcoordEnd = 1.0  # Type: float
-        self.WidthTexcoordStart = 0.0  # Type: float
-        self.WidthTexcoordEnd = 1.0  # Type: float
-        self.Width1 = 25.0  # Type: float
-        self.Width2 = 25.0  # Type: float
-        self.DebugDraw = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.material = entity_data.get('material', None)  # Type: material
-        instance.sides = entity_data.get('sides', None)  # Type: sidelist
-        instance.sides2 = entity_data.get('sides2', None)  # Type: sidelist
-        instance.LengthTexcoordStart = float(entity_data.get('lengthtexcoordstart', 0.0))  # Type: float
-        instance.LengthTexcoordEnd = float(entity_data.get('lengthtexcoordend', 1.0))  # Type: float
-        instance.WidthTexcoordStart = float(entity_data.get('widthtexcoordstart', 0.0))  # Type: float
-        instance.WidthTexcoordEnd = float(entity_data.get('widthtexcoordend', 1.0))  # Type: float
-        instance.Width1 = float(entity_data.get('width1', 25.0))  # Type: float
-        instance.Width2 = float(entity_data.get('width2', 25.0))  # Type: float
-        instance.DebugDraw = int(entity_data.get('debugdraw', 0))  # Type: integer
-
-
-class info_intermission(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class info_landmark(Targetname):
-    icon_sprite = "editor/info_landmark"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_null(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_target(Parentname, Targetname, Angles):
-    icon_sprite = "editor/info_target.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_particle_system(Parentname, Targetname, Angles):
-    model = "models/editor/cone_helper.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.effect_name = None  # Type: string
-        self.start_active = None  # Type: choices
-        self.flag_as_weather = None  # Type: choices
-        self.cpoint1 = None  # Type: target_destination
-        self.cpoint2 = None  # Type: target_destination
-        self.cpoint3 = None  # Type: target_destination
-        self.cpoint4 = None  # Type: target_destination
-        self.cpoint5 = None  # Type: target_destination
-        self.cpoint6 = None  # Type: target_destination
-        self.cpoint7 = None  # Type: target_destination
-        self.cpoint8 = None  # Type: target_destination
-        self.cpoint9 = None  # Type: target_destination
-        self.cpoint10 = None  # Type: target_destination
-        self.cpoint11 = None  # Type: target_destination
-        self.cpoint12 = None  # Type: target_destination
-        self.cpoint13 = None  # Type: target_destination
-        self.cpoint14 = None  # Type: target_destination
-        self.cpoint15 = None  # Type: target_destination
-        self.cpoint16 = None  # Type: target_destination
-        self.cpoint17 = None  # Type: target_destination
-        self.cpoint18 = None  # Type: target_destination
-        self.cpoint19 = None  # Type: target_destination
-        self.cpoint20 = None  # Type: target_destination
-        self.cpoint21 = None  # Type: target_destination
-        self.cpoint22 = None  # Type: target_destination
-        self.cpoint23 = None  # Type: target_destination
-        self.cpoint24 = None  # Type: target_destination
-        self.cpoint25 = None  # Type: target_destination
-        self.cpoint26 = None  # Type: target_destination
-        self.cpoint27 = None  # Type: target_destination
-        self.cpoint28 = None  # Type: target_destination
-        self.cpoint29 = None  # Type: target_destination
-        self.cpoint30 = None  # Type: target_destination
-        self.cpoint31 = None  # Type: target_destination
-        self.cpoint32 = None  # Type: target_destination
-        self.cpoint33 = None  # Type: target_destination
-        self.cpoint34 = None  # Type: target_destination
-        self.cpoint35 = None  # Type: target_destination
-        self.cpoint36 = None  # Type: target_destination
-        self.cpoint37 = None  # Type: target_destination
-        self.cpoint38 = None  # Type: target_destination
-        self.cpoint39 = None  # Type: target_destination
-        self.cpoint40 = None  # Type: target_destination
-        self.cpoint41 = None  # Type: target_destination
-        self.cpoint42 = None  # Type: target_destination
-        self.cpoint43 = None  # Type: target_destination
-        self.cpoint44 = None  # Type: target_destination
-        self.cpoint45 = None  # Type: target_destination
-        self.cpoint46 = None  # Type: target_destination
-        self.cpoint47 = None  # Type: target_destination
-        self.cpoint48 = None  # Type: target_destination
-        self.cpoint49 = None  # Type: target_destination
-        self.cpoint50 = None  # Type: target_destination
-        self.cpoint51 = None  # Type: target_destination
-        self.cpoint52 = None  # Type: target_destination
-        self.cpoint53 = None  # Type: target_destination
-        self.cpoint54 = None  # Type: target_destination
-        self.cpoint55 = None  # Type: target_destination
-        self.cpoint56 = None  # Type: target_destination
-        self.cpoint57 = None  # Type: target_destination
-        self.cpoint58 = None  # Type: target_destination
-        self.cpoint59 = None  # Type: target_destination
-        self.cpoint60 = None  # Type: target_destination
-        self.cpoint61 = None  # Type: target_destination
-        self.cpoint62 = None  # Type: target_destination
-        self.cpoint63 = None  # Type: target_destination
-        self.cpoint1_parent = None  # Type: integer
-        self.cpoint2_parent = None  # Type: integer
-        self.cpoint3_parent = None  # Type: integer
-        self.cpoint4_parent = None  # Type: integer
-        self.cpoint5_parent = None  # Type: integer
-        self.cpoint6_parent = None  # Type: integer
-        self.cpoint7_parent = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.effect_name = entity_data.get('effect_name', None)  # Type: string
-        instance.start_active = entity_data.get('start_active', None)  # Type: choices
-        instance.flag_as_weather = entity_data.get('flag_as_weather', None)  # Type: choices
-        instance.cpoint1 = entity_data.get('cpoint1', None)  # Type: target_destination
-        instance.cpoint2 = entity_data.get('cpoint2', None)  # Type: target_destination
-        instance.cpoint3 = entity_data.get('cpoint3', None)  # Type: target_destination
-        instance.cpoint4 = entity_data.get('cpoint4', None)  # Type: target_destination
-        instance.cpoint5 = entity_data.get('cpoint5', None)  # Type: target_destination
-        instance.cpoint6 = entity_data.get('cpoint6', None)  # Type: target_destination
-        instance.cpoint7 = entity_data.get('cpoint7', None)  # Type: target_destination
-        instance.cpoint8 = entity_data.get('cpoint8', None)  # Type: target_destination
-        instance.cpoint9 = entity_data.get('cpoint9', None)  # Type: target_destination
-        instance.cpoint10 = entity_data.get('cpoint10', None)  # Type: target_destination
-        instance.cpoint11 = entity_data.get('cpoint11', None)  # Type: target_destination
-        instance.cpoint12 = entity_data.get('cpoint12', None)  # Type: target_destination
-        instance.cpoint13 = entity_data.get('cpoint13', None)  # Type: target_destination
-        instance.cpoint14 = entity_data.get('cpoint14', None)  # Type: target_destination
-        instance.cpoint15 = entity_data.get('cpoint15', None)  # Type: target_destination
-        instance.cpoint16 = entity_data.get('cpoint16', None)  # Type: target_destination
-        instance.cpoint17 = entity_data.get('cpoint17', None)  # Type: target_destination
-        instance.cpoint18 = entity_data.get('cpoint18', None)  # Type: target_destination
-        instance.cpoint19 = entity_data.get('cpoint19', None)  # Type: target_destination
-        instance.cpoint20 = entity_data.get('cpoint20', None)  # Type: target_destination
-        instance.cpoint21 = entity_data.get('cpoint21', None)  # Type: target_destination
-        instance.cpoint22 = entity_data.get('cpoint22', None)  # Type: target_destination
-        instance.cpoint23 = entity_data.get('cpoint23', None)  # Type: target_destination
-        instance.cpoint24 = entity_data.get('cpoint24', None)  # Type: target_destination
-        instance.cpoint25 = entity_data.get('cpoint25', None)  # Type: target_destination
-        instance.cpoint26 = entity_data.get('cpoint26', None)  # Type: target_destination
-        instance.cpoint27 = entity_data.get('cpoint27', None)  # Type: target_destination
-        instance.cpoint28 = entity_data.get('cpoint28', None)  # Type: target_destination
-        instance.cpoint29 = entity_data.get('cpoint29', None)  # Type: target_destination
-        instance.cpoint30 = entity_data.get('cpoint30', None)  # Type: target_destination
-        instance.cpoint31 = entity_data.get('cpoint31', None)  # Type: target_destination
-        instance.cpoint32 = entity_data.get('cpoint32', None)  # Type: target_destination
-        instance.cpoint33 = entity_data.get('cpoint33', None)  # Type: target_destination
-        instance.cpoint34 = entity_data.get('cpoint34', None)  # Type: target_destination
-        instance.cpoint35 = entity_data.get('cpoint35', None)  # Type: target_destination
-        instance.cpoint36 = entity_data.get('cpoint36', None)  # Type: target_destination
-        instance.cpoint37 = entity_data.get('cpoint37', None)  # Type: target_destination
-        instance.cpoint38 = entity_data.get('cpoint38', None)  # Type: target_destination
-        instance.cpoint39 = entity_data.get('cpoint39', None)  # Type: target_destination
-        instance.cpoint40 = entity_data.get('cpoint40', None)  # Type: target_destination
-        instance.cpoint41 = entity_data.get('cpoint41', None)  # Type: target_destination
-        instance.cpoint42 = entity_data.get('cpoint42', None)  # Type: target_destination
-        instance.cpoint43 = entity_data.get('cpoint43', None)  # Type: target_destination
-        instance.cpoint44 = entity_data.get('cpoint44', None)  # Type: target_destination
-        instance.cpoint45 = entity_data.get('cpoint45', None)  # Type: target_destination
-        instance.cpoint46 = entity_data.get('cpoint46', None)  # Type: target_destination
-        instance.cpoint47 = entity_data.get('cpoint47', None)  # Type: target_destination
-        instance.cpoint48 = entity_data.get('cpoint48', None)  # Type: target_destination
-        instance.cpoint49 = entity_data.get('cpoint49', None)  # Type: target_destination
-        instance.cpoint50 = entity_data.get('cpoint50', None)  # Type: target_destination
-        instance.cpoint51 = entity_data.get('cpoint51', None)  # Type: target_destination
-        instance.cpoint52 = entity_data.get('cpoint52', None)  # Type: target_destination
-        instance.cpoint53 = entity_data.get('cpoint53', None)  # Type: target_destination
-        instance.cpoint54 = entity_data.get('cpoint54', None)  # Type: target_destination
-        instance.cpoint55 = entity_data.get('cpoint55', None)  # Type: target_destination
-        instance.cpoint56 = entity_data.get('cpoint56', None)  # Type: target_destination
-        instance.cpoint57 = entity_data.get('cpoint57', None)  # Type: target_destination
-        instance.cpoint58 = entity_data.get('cpoint58', None)  # Type: target_destination
-        instance.cpoint59 = entity_data.get('cpoint59', None)  # Type: target_destination
-        instance.cpoint60 = entity_data.get('cpoint60', None)  # Type: target_destination
-        instance.cpoint61 = entity_data.get('cpoint61', None)  # Type: target_destination
-        instance.cpoint62 = entity_data.get('cpoint62', None)  # Type: target_destination
-        instance.cpoint63 = entity_data.get('cpoint63', None)  # Type: target_destination
-        instance.cpoint1_parent = int(entity_data.get('cpoint1_parent', 0))  # Type: integer
-        instance.cpoint2_parent = int(entity_data.get('cpoint2_parent', 0))  # Type: integer
-        instance.cpoint3_parent = int(entity_data.get('cpoint3_parent', 0))  # Type: integer
-        instance.cpoint4_parent = int(entity_data.get('cpoint4_parent', 0))  # Type: integer
-        instance.cpoint5_parent = int(entity_data.get('cpoint5_parent', 0))  # Type: integer
-        instance.cpoint6_parent = int(entity_data.get('cpoint6_parent', 0))  # Type: integer
-        instance.cpoint7_parent = int(entity_data.get('cpoint7_parent', 0))  # Type: integer
-
-
-class phys_ragdollmagnet(EnableDisable, Targetname, Parentname, Angles):
-    icon_sprite = "editor/info_target.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Parentname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.axis = None  # Type: vecline
-        self.radius = 512  # Type: float
-        self.force = 5000  # Type: float
-        self.target = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Parentname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.axis = entity_data.get('axis', None)  # Type: vecline
-        instance.radius = float(entity_data.get('radius', 512))  # Type: float
-        instance.force = float(entity_data.get('force', 5000))  # Type: float
-        instance.target = entity_data.get('target', None)  # Type: string
-
-
-class info_lighting(Targetname):
-    icon_sprite = "editor/info_lighting.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_teleport_destination(Parentname, PlayerClass, Targetname, Angles):
-    model = "models/editor/playerstart.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(PlayerClass).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        PlayerClass.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_node(Node):
-    model = "models/editor/ground_node.mdl"
-    def __init__(self):
-        super(Node).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Node.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_node_hint(Targetname, Angles, HintNode):
-    model = "models/editor/ground_node_hint.mdl"
-    def __init__(self):
-        super(HintNode).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        HintNode.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_node_air(Node):
-    model = "models/editor/air_node.mdl"
-    def __init__(self):
-        super(Node).__init__()
-        self.origin = [0, 0, 0]
-        self.nodeheight = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Node.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.nodeheight = int(entity_data.get('nodeheight', 0))  # Type: integer
-
-
-class info_node_air_hint(Targetname, Angles, HintNode):
-    model = "models/editor/air_node_hint.mdl"
-    def __init__(self):
-        super(HintNode).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.nodeheight = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        HintNode.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.nodeheight = int(entity_data.get('nodeheight', 0))  # Type: integer
-
-
-class info_hint(Targetname, Angles, HintNode):
-    model = "models/editor/node_hint.mdl"
-    def __init__(self):
-        super(HintNode).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        HintNode.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_node_link(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.StartNode = None  # Type: node_dest
-        self.EndNode = None  # Type: node_dest
-        self.initialstate = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.linktype = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.AllowUse = None  # Type: string
-        self.InvertAllow = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.StartNode = int(entity_data.get('startnode', 0))  # Type: node_dest
-        instance.EndNode = int(entity_data.get('endnode', 0))  # Type: node_dest
-        instance.initialstate = entity_data.get('initialstate', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.linktype = entity_data.get('linktype', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.AllowUse = entity_data.get('allowuse', None)  # Type: string
-        instance.InvertAllow = entity_data.get('invertallow', None)  # Type: choices
-
-
-class info_node_link_controller(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.mins = [-8.0, -32.0, -36.0]  # Type: vector
-        self.maxs = [8.0, 32.0, 36.0]  # Type: vector
-        self.initialstate = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.useairlinkradius = None  # Type: choices
-        self.AllowUse = None  # Type: string
-        self.InvertAllow = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.mins = parse_float_vector(entity_data.get('mins', "-8 -32 -36"))  # Type: vector
-        instance.maxs = parse_float_vector(entity_data.get('maxs', "8 32 36"))  # Type: vector
-        instance.initialstate = entity_data.get('initialstate', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.useairlinkradius = entity_data.get('useairlinkradius', None)  # Type: choices
-        instance.AllowUse = entity_data.get('allowuse', None)  # Type: string
-        instance.InvertAllow = entity_data.get('invertallow', None)  # Type: choices
-
-
-class info_radial_link_controller(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.radius = 120  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.radius = float(entity_data.get('radius', 120))  # Type: float
-
-
-class info_node_climb(Targetname, Angles, HintNode):
-    model = "models/editor/climb_node.mdl"
-    def __init__(self):
-        super(HintNode).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        HintNode.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class light(Light, Targetname):
-    icon_sprite = "editor/light.vmt"
-    def __init__(self):
-        super(Light).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self._distance = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Light.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance._distance = int(entity_data.get('_distance', 0))  # Type: integer
-
-
-class light_environment(Angles):
-    icon_sprite = "editor/light_env.vmt"
-    def __init__(self):
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.pitch = None  # Type: integer
-        self._light = [255, 255, 255, 200]  # Type: color255
-        self._ambient = [255, 255, 255, 20]  # Type: color255
-        self._lightHDR = [-1, -1, -1, 1]  # Type: color255
-        self._lightscaleHDR = 1  # Type: float
-        self._ambientHDR = [-1, -1, -1, 1]  # Type: color255
-        self._AmbientScaleHDR = 1  # Type: float
-        self.SunSpreadAngle = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.pitch = int(entity_data.get('pitch', 0))  # Type: integer
-        instance._light = parse_int_vector(entity_data.get('_light', "255 255 255 200"))  # Type: color255
-        instance._ambient = parse_int_vector(entity_data.get('_ambient', "255 255 255 20"))  # Type: color255
-        instance._lightHDR = parse_int_vector(entity_data.get('_lighthdr', "-1 -1 -1 1"))  # Type: color255
-        instance._lightscaleHDR = float(entity_data.get('_lightscalehdr', 1))  # Type: float
-        instance._ambientHDR = parse_int_vector(entity_data.get('_ambienthdr', "-1 -1 -1 1"))  # Type: color255
-        instance._AmbientScaleHDR = float(entity_data.get('_ambientscalehdr', 1))  # Type: float
-        instance.SunSpreadAngle = float(entity_data.get('sunspreadangle', 0))  # Type: float
-
-
-class light_spot(Light, Targetname, Angles):
-    def __init__(self):
-        super(Light).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self._inner_cone = 30  # Type: integer
-        self._cone = 45  # Type: integer
-        self._exponent = 1  # Type: integer
-        self._distance = None  # Type: integer
-        self.pitch = -90  # Type: angle_negative_pitch
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Light.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance._inner_cone = int(entity_data.get('_inner_cone', 30))  # Type: integer
-        instance._cone = int(entity_data.get('_cone', 45))  # Type: integer
-        instance._exponent = int(entity_data.get('_exponent', 1))  # Type: integer
-        instance._distance = int(entity_data.get('_distance', 0))  # Type: integer
-        instance.pitch = float(entity_data.get('pitch', -90))  # Type: angle_negative_pitch
-
-
-class light_dynamic(Parentname, Targetname, Angles):
-    icon_sprite = "editor/light.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self._light = [255, 255, 255, 200]  # Type: color255
-        self.brightness = None  # Type: integer
-        self._inner_cone = 30  # Type: integer
-        self._cone = 45  # Type: integer
-        self.pitch = -90  # Type: integer
-        self.distance = 120  # Type: float
-        self.spotlight_radius = 80  # Type: float
-        self.style = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance._light = parse_int_vector(entity_data.get('_light', "255 255 255 200"))  # Type: color255
-        instance.brightness = int(entity_data.get('brightness', 0))  # Type: integer
-        instance._inner_cone = int(entity_data.get('_inner_cone', 30))  # Type: integer
-        instance._cone = int(entity_data.get('_cone', 45))  # Type: integer
-        instance.pitch = int(entity_data.get('pitch', -90))  # Type: integer
-        instance.distance = float(entity_data.get('distance', 120))  # Type: float
-        instance.spotlight_radius = float(entity_data.get('spotlight_radius', 80))  # Type: float
-        instance.style = entity_data.get('style', None)  # Type: choices
-
-
-class shadow_control(Targetname):
-    icon_sprite = "editor/shadow_control.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.angles = "80 30 0"  # Type: string
-        self.color = [128, 128, 128]  # Type: color255
-        self.distance = 75  # Type: float
-        self.disableallshadows = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.angles = entity_data.get('angles', "80 30 0")  # Type: string
-        instance.color = parse_int_vector(entity_data.get('color', "128 128 128"))  # Type: color255
-        instance.distance = float(entity_data.get('distance', 75))  # Type: float
-        instance.disableallshadows = entity_data.get('disableallshadows', None)  # Type: choices
-
-
-class color_correction(EnableDisable, Targetname):
-    icon_sprite = "editor/color_correction.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.minfalloff = 0.0  # Type: float
-        self.maxfalloff = 200.0  # Type: float
-        self.maxweight = 1.0  # Type: float
-        self.filename = None  # Type: string
-        self.fadeInDuration = 0.0  # Type: float
-        self.fadeOutDuration = 0.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.minfalloff = float(entity_data.get('minfalloff', 0.0))  # Type: float
-        instance.maxfalloff = float(entity_data.get('maxfalloff', 200.0))  # Type: float
-        instance.maxweight = float(entity_data.get('maxweight', 1.0))  # Type: float
-        instance.filename = entity_data.get('filename', None)  # Type: string
-        instance.fadeInDuration = float(entity_data.get('fadeinduration', 0.0))  # Type: float
-        instance.fadeOutDuration = float(entity_data.get('fadeoutduration', 0.0))  # Type: float
-
-
-class color_correction_volume(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.fadeDuration = 10.0  # Type: float
-        self.maxweight = 1.0  # Type: float
-        self.filename = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.fadeDuration = float(entity_data.get('fadeduration', 10.0))  # Type: float
-        instance.maxweight = float(entity_data.get('maxweight', 1.0))  # Type: float
-        instance.filename = entity_data.get('filename', None)  # Type: string
-
-
-class KeyFrame(Base):
-    def __init__(self):
-        super().__init__()
-        self.NextKey = None  # Type: target_destination
-        self.MoveSpeed = 64  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.NextKey = entity_data.get('nextkey', None)  # Type: target_destination
-        instance.MoveSpeed = int(entity_data.get('movespeed', 64))  # Type: integer
-
-
-class Mover(Base):
-    def __init__(self):
-        super().__init__()
-        self.PositionInterpolator = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.PositionInterpolator = entity_data.get('positioninterpolator', None)  # Type: choices
-
-
-class func_movelinear(Parentname, Targetname, RenderFields, Origin):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Origin).__init__()
-        self.movedir = [0.0, 0.0, 0.0]  # Type: angle
-        self.startposition = None  # Type: float
-        self.speed = 100  # Type: integer
-        self.movedistance = 100  # Type: float
-        self.blockdamage = None  # Type: float
-        self.startsound = None  # Type: sound
-        self.stopsound = None  # Type: sound
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.movedir = parse_float_vector(entity_data.get('movedir', "0 0 0"))  # Type: angle
-        instance.startposition = float(entity_data.get('startposition', 0))  # Type: float
-        instance.speed = int(entity_data.get('speed', 100))  # Type: integer
-        instance.movedistance = float(entity_data.get('movedistance', 100))  # Type: float
-        instance.blockdamage = float(entity_data.get('blockdamage', 0))  # Type: float
-        instance.startsound = entity_data.get('startsound', None)  # Type: sound
-        instance.stopsound = entity_data.get('stopsound', None)  # Type: sound
-
-
-class func_water_analog(Parentname, Targetname, Origin):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Origin).__init__()
-        self.movedir = [0.0, 0.0, 0.0]  # Type: angle
-        self.startposition = None  # Type: float
-        self.speed = 100  # Type: integer
-        self.movedistance = 100  # Type: float
-        self.startsound = None  # Type: sound
-        self.stopsound = None  # Type: sound
-        self.WaveHeight = "3.0"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.movedir = parse_float_vector(entity_data.get('movedir', "0 0 0"))  # Type: angle
-        instance.startposition = float(entity_data.get('startposition', 0))  # Type: float
-        instance.speed = int(entity_data.get('speed', 100))  # Type: integer
-        instance.movedistance = float(entity_data.get('movedistance', 100))  # Type: float
-        instance.startsound = entity_data.get('startsound', None)  # Type: sound
-        instance.stopsound = entity_data.get('stopsound', None)  # Type: sound
-        instance.WaveHeight = entity_data.get('waveheight', "3.0")  # Type: string
-
-
-class func_rotating(Parentname, Origin, RenderFields, Targetname, Shadow, Angles):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-        super(Targetname).__init__()
-        super(Shadow).__init__()
-        super(Angles).__init__()
-        self.maxspeed = 100  # Type: integer
-        self.fanfriction = 20  # Type: integer
-        self.message = None  # Type: sound
-        self.volume = 10  # Type: integer
-        self._minlight = None  # Type: string
-        self.dmg = None  # Type: integer
-        self.solidbsp = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.maxspeed = int(entity_data.get('maxspeed', 100))  # Type: integer
-        instance.fanfriction = int(entity_data.get('fanfriction', 20))  # Type: integer
-        instance.message = entity_data.get('message', None)  # Type: sound
-        instance.volume = int(entity_data.get('volume', 10))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.dmg = int(entity_data.get('dmg', 0))  # Type: integer
-        instance.solidbsp = entity_data.get('solidbsp', None)  # Type: choices
-
-
-class func_platrot(Parentname, Origin, RenderFields, BasePlat, Targetname, Shadow, Angles):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-        super(BasePlat).__init__()
-        super(Targetname).__init__()
-        super(Shadow).__init__()
-        super(Angles).__init__()
-        self.noise1 = None  # Type: sound
-        self.noise2 = None  # Type: sound
-        self.speed = 50  # Type: integer
-        self.height = None  # Type: integer
-        self.rotation = None  # Type: integer
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        BasePlat.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.noise1 = entity_data.get('noise1', None)  # Type: sound
-        instance.noise2 = entity_data.get('noise2', None)  # Type: sound
-        instance.speed = int(entity_data.get('speed', 50))  # Type: integer
-        instance.height = int(entity_data.get('height', 0))  # Type: integer
-        instance.rotation = int(entity_data.get('rotation', 0))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class keyframe_track(Parentname, Targetname, Angles, KeyFrame):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(KeyFrame).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        KeyFrame.from_dict(instance, entity_data)
-
-
-class move_keyframed(Parentname, Mover, Targetname, KeyFrame):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Mover).__init__()
-        super(Targetname).__init__()
-        super(KeyFrame).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Mover.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        KeyFrame.from_dict(instance, entity_data)
-
-
-class move_track(Parentname, Mover, Targetname, KeyFrame):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Mover).__init__()
-        super(Targetname).__init__()
-        super(KeyFrame).__init__()
-        self.WheelBaseLength = 50  # Type: integer
-        self.Damage = None  # Type: integer
-        self.NoRotate = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Mover.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        KeyFrame.from_dict(instance, entity_data)
-        instance.WheelBaseLength = int(entity_data.get('wheelbaselength', 50))  # Type: integer
-        instance.Damage = int(entity_data.get('damage', 0))  # Type: integer
-        instance.NoRotate = entity_data.get('norotate', None)  # Type: choices
-
-
-class RopeKeyFrame(DXLevelChoice):
-    def __init__(self):
-        super(DXLevelChoice).__init__()
-        self.Slack = 25  # Type: integer
-        self.Type = None  # Type: choices
-        self.Subdiv = 2  # Type: integer
-        self.Barbed = None  # Type: choices
-        self.Width = "2"  # Type: string
-        self.TextureScale = "1"  # Type: string
-        self.Collide = None  # Type: choices
-        self.Dangling = None  # Type: choices
-        self.Breakable = None  # Type: choices
-        self.RopeMaterial = "cable/cable.vmt"  # Type: material
-        self.NoWind = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        DXLevelChoice.from_dict(instance, entity_data)
-        instance.Slack = int(entity_data.get('slack', 25))  # Type: integer
-        instance.Type = entity_data.get('type', None)  # Type: choices
-        instance.Subdiv = int(entity_data.get('subdiv', 2))  # Type: integer
-        instance.Barbed = entity_data.get('barbed', None)  # Type: choices
-        instance.Width = entity_data.get('width', "2")  # Type: string
-        instance.TextureScale = entity_data.get('texturescale', "1")  # Type: string
-        instance.Collide = entity_data.get('collide', None)  # Type: choices
-        instance.Dangling = entity_data.get('dangling', None)  # Type: choices
-        instance.Breakable = entity_data.get('breakable', None)  # Type: choices
-        instance.RopeMaterial = entity_data.get('ropematerial', "cable/cable.vmt")  # Type: material
-        instance.NoWind = entity_data.get('nowind', None)  # Type: choices
-
-
-class keyframe_rope(Parentname, Targetname, RopeKeyFrame, KeyFrame):
-    model = "models/editor/axis_helper_thick.mdl"
-    def __init__(self):
-        super(RopeKeyFrame).__init__()
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(KeyFrame).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RopeKeyFrame.from_dict(instance, entity_data)
-        KeyFrame.from_dict(instance, entity_data)
-
-
-class move_rope(Parentname, Targetname, RopeKeyFrame, KeyFrame):
-    model = "models/editor/axis_helper.mdl"
-    def __init__(self):
-        super(RopeKeyFrame).__init__()
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(KeyFrame).__init__()
-        self.PositionInterpolator = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RopeKeyFrame.from_dict(instance, entity_data)
-        KeyFrame.from_dict(instance, entity_data)
-        instance.PositionInterpolator = entity_data.get('positioninterpolator', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class Button(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class func_button(Parentname, Origin, Button, RenderFields, DamageFilter, Targetname):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-        super(Button).__init__()
-        super(DamageFilter).__init__()
-        super(Targetname).__init__()
-        self.movedir = [0.0, 0.0, 0.0]  # Type: angle
-        self.speed = 5  # Type: integer
-        self.health = None  # Type: integer
-        self.lip = None  # Type: integer
-        self.master = None  # Type: string
-        self.sounds = None  # Type: choices
-        self.wait = 3  # Type: integer
-        self.locked_sound = None  # Type: choices
-        self.unlocked_sound = None  # Type: choices
-        self.locked_sentence = None  # Type: choices
-        self.unlocked_sentence = None  # Type: choices
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        Button.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        DamageFilter.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.movedir = parse_float_vector(entity_data.get('movedir', "0 0 0"))  # Type: angle
-        instance.speed = int(entity_data.get('speed', 5))  # Type: integer
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-        instance.lip = int(entity_data.get('lip', 0))  # Type: integer
-        instance.master = entity_data.get('master', None)  # Type: string
-        instance.sounds = entity_data.get('sounds', None)  # Type: choices
-        instance.wait = int(entity_data.get('wait', 3))  # Type: integer
-        instance.locked_sound = entity_data.get('locked_sound', None)  # Type: choices
-        instance.unlocked_sound = entity_data.get('unlocked_sound', None)  # Type: choices
-        instance.locked_sentence = entity_data.get('locked_sentence', None)  # Type: choices
-        instance.unlocked_sentence = entity_data.get('unlocked_sentence', None)  # Type: choices
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_rot_button(Parentname, Global, Origin, Button, EnableDisable, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Origin).__init__()
-        super(Button).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.master = None  # Type: string
-        self.speed = 50  # Type: integer
-        self.health = None  # Type: integer
-        self.sounds = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.wait = 3  # Type: integer
-        self.distance = 90  # Type: integer
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        Button.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.master = entity_data.get('master', None)  # Type: string
-        instance.speed = int(entity_data.get('speed', 50))  # Type: integer
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-        instance.sounds = entity_data.get('sounds', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.wait = int(entity_data.get('wait', 3))  # Type: integer
-        instance.distance = int(entity_data.get('distance', 90))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class momentary_rot_button(Parentname, Origin, RenderFields, Targetname, Angles):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.speed = 50  # Type: integer
-        self.master = None  # Type: string
-        self.sounds = None  # Type: choices
-        self.distance = 90  # Type: integer
-        self.returnspeed = None  # Type: integer
-        self._minlight = None  # Type: string
-        self.startposition = None  # Type: float
-        self.startdirection = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.solidbsp = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.speed = int(entity_data.get('speed', 50))  # Type: integer
-        instance.master = entity_data.get('master', None)  # Type: string
-        instance.sounds = entity_data.get('sounds', None)  # Type: choices
-        instance.distance = int(entity_data.get('distance', 90))  # Type: integer
-        instance.returnspeed = int(entity_data.get('returnspeed', 0))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.startposition = float(entity_data.get('startposition', 0))  # Type: float
-        instance.startdirection = entity_data.get('startdirection', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.solidbsp = entity_data.get('solidbsp', None)  # Type: choices
-
-
-class Door(Parentname, Global, RenderFields, Shadow, Targetname):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Shadow).__init__()
-        super(Targetname).__init__()
-        self.speed = 100  # Type: integer
-        self.master = None  # Type: string
-        self.noise1 = None  # Type: sound
-        self.noise2 = None  # Type: sound
-        self.startclosesound = None  # Type: sound
-        self.closesound = None  # Type: sound
-        self.wait = 4  # Type: integer
-        self.lip = None  # Type: integer
-        self.dmg = None  # Type: integer
-        self.forceclosed = None  # Type: choices
-        self.ignoredebris = None  # Type: choices
-        self.message = None  # Type: string
-        self.health = None  # Type: integer
-        self.locked_sound = None  # Type: sound
-        self.unlocked_sound = None  # Type: sound
-        self.spawnpos = None  # Type: choices
-        self.locked_sentence = None  # Type: choices
-        self.unlocked_sentence = None  # Type: choices
-        self._minlight = None  # Type: string
-        self.loopmovesound = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.speed = int(entity_data.get('speed', 100))  # Type: integer
-        instance.master = entity_data.get('master', None)  # Type: string
-        instance.noise1 = entity_data.get('noise1', None)  # Type: sound
-        instance.noise2 = entity_data.get('noise2', None)  # Type: sound
-        instance.startclosesound = entity_data.get('startclosesound', None)  # Type: sound
-        instance.closesound = entity_data.get('closesound', None)  # Type: sound
-        instance.wait = int(entity_data.get('wait', 4))  # Type: integer
-        instance.lip = int(entity_data.get('lip', 0))  # Type: integer
-        instance.dmg = int(entity_data.get('dmg', 0))  # Type: integer
-        instance.forceclosed = entity_data.get('forceclosed', None)  # Type: choices
-        instance.ignoredebris = entity_data.get('ignoredebris', None)  # Type: choices
-        instance.message = entity_data.get('message', None)  # Type: string
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-        instance.locked_sound = entity_data.get('locked_sound', None)  # Type: sound
-        instance.unlocked_sound = entity_data.get('unlocked_sound', None)  # Type: sound
-        instance.spawnpos = entity_data.get('spawnpos', None)  # Type: choices
-        instance.locked_sentence = entity_data.get('locked_sentence', None)  # Type: choices
-        instance.unlocked_sentence = entity_data.get('unlocked_sentence', None)  # Type: choices
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.loopmovesound = entity_data.get('loopmovesound', None)  # Type: choices
-
-
-class func_door(Door, Origin):
-    def __init__(self):
-        super(Door).__init__()
-        super(Origin).__init__()
-        self.movedir = [0.0, 0.0, 0.0]  # Type: angle
-        self.filtername = None  # Type: filterclass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Door.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.movedir = parse_float_vector(entity_data.get('movedir', "0 0 0"))  # Type: angle
-        instance.filtername = entity_data.get('filtername', None)  # Type: filterclass
-
-
-class func_door_rotating(Door, Angles, Origin):
-    def __init__(self):
-        super(Door).__init__()
-        super(Angles).__init__()
-        super(Origin).__init__()
-        self.distance = 90  # Type: integer
-        self.solidbsp = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Door.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.distance = int(entity_data.get('distance', 90))  # Type: integer
-        instance.solidbsp = entity_data.get('solidbsp', None)  # Type: choices
-
-
-class prop_door_rotating(Parentname, Global, Studiomodel, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Studiomodel).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.slavename = None  # Type: target_destination
-        self.hardware = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.ajarangles = [0.0, 0.0, 0.0]  # Type: angle
-        self.spawnpos = None  # Type: choices
-        self.axis = None  # Type: axis
-        self.distance = 90  # Type: float
-        self.speed = 100  # Type: integer
-        self.soundopenoverride = None  # Type: sound
-        self.soundcloseoverride = None  # Type: sound
-        self.soundmoveoverride = None  # Type: sound
-        self.returndelay = -1  # Type: integer
-        self.dmg = None  # Type: integer
-        self.health = None  # Type: integer
-        self.soundlockedoverride = None  # Type: sound
-        self.soundunlockedoverride = None  # Type: sound
-        self.forceclosed = None  # Type: choices
-        self.opendir = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Studiomodel.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.slavename = entity_data.get('slavename', None)  # Type: target_destination
-        instance.hardware = entity_data.get('hardware', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.ajarangles = parse_float_vector(entity_data.get('ajarangles', "0 0 0"))  # Type: angle
-        instance.spawnpos = entity_data.get('spawnpos', None)  # Type: choices
-        instance.axis = entity_data.get('axis', None)  # Type: axis
-        instance.distance = float(entity_data.get('distance', 90))  # Type: float
-        instance.speed = int(entity_data.get('speed', 100))  # Type: integer
-        instance.soundopenoverride = entity_data.get('soundopenoverride', None)  # Type: sound
-        instance.soundcloseoverride = entity_data.get('soundcloseoverride', None)  # Type: sound
-        instance.soundmoveoverride = entity_data.get('soundmoveoverride', None)  # Type: sound
-        instance.returndelay = int(entity_data.get('returndelay', -1))  # Type: integer
-        instance.dmg = int(entity_data.get('dmg', 0))  # Type: integer
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-        instance.soundlockedoverride = entity_data.get('soundlockedoverride', None)  # Type: sound
-        instance.soundunlockedoverride = entity_data.get('soundunlockedoverride', None)  # Type: sound
-        instance.forceclosed = entity_data.get('forceclosed', None)  # Type: choices
-        instance.opendir = entity_data.get('opendir', None)  # Type: choices
-
-
-class env_cubemap(Base):
-    icon_sprite = "editor/env_cubemap.vmt"
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.cubemapsize = None  # Type: choices
-        self.sides = None  # Type: sidelist
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.cubemapsize = entity_data.get('cubemapsize', None)  # Type: choices
-        instance.sides = entity_data.get('sides', None)  # Type: sidelist
-
-
-class BModelParticleSpawner(Base):
-    def __init__(self):
-        super().__init__()
-        self.StartDisabled = None  # Type: choices
-        self.Color = [255, 255, 255]  # Type: color255
-        self.SpawnRate = 40  # Type: integer
-        self.SpeedMax = "13"  # Type: string
-        self.LifetimeMin = "3"  # Type: string
-        self.LifetimeMax = "5"  # Type: string
-        self.DistMax = 1024  # Type: integer
-        self.Frozen = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.StartDisabled = entity_data.get('startdisabled', None)  # Type: choices
-        instance.Color = parse_int_vector(entity_data.get('color', "255 255 255"))  # Type: color255
-        instance.SpawnRate = int(entity_data.get('spawnrate', 40))  # Type: integer
-        instance.SpeedMax = entity_data.get('speedmax', "13")  # Type: string
-        instance.LifetimeMin = entity_data.get('lifetimemin', "3")  # Type: string
-        instance.LifetimeMax = entity_data.get('lifetimemax', "5")  # Type: string
-        instance.DistMax = int(entity_data.get('distmax', 1024))  # Type: integer
-        instance.Frozen = entity_data.get('frozen', None)  # Type: choices
-
-
-class func_dustmotes(BModelParticleSpawner, Targetname):
-    def __init__(self):
-        super(BModelParticleSpawner).__init__()
-        super(Targetname).__init__()
-        self.SizeMin = "10"  # Type: string
-        self.SizeMax = "20"  # Type: string
-        self.Alpha = 255  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BModelParticleSpawner.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.SizeMin = entity_data.get('sizemin', "10")  # Type: string
-        instance.SizeMax = entity_data.get('sizemax', "20")  # Type: string
-        instance.Alpha = int(entity_data.get('alpha', 255))  # Type: integer
-
-
-class func_smokevolume(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.Color1 = [255, 255, 255]  # Type: color255
-        self.Color2 = [255, 255, 255]  # Type: color255
-        self.material = "particle/particle_smokegrenade"  # Type: material
-        self.ParticleDrawWidth = 120  # Type: float
-        self.ParticleSpacingDistance = 80  # Type: float
-        self.DensityRampSpeed = 1  # Type: float
-        self.RotationSpeed = 10  # Type: float
-        self.MovementSpeed = 10  # Type: float
-        self.Density = 1  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.Color1 = parse_int_vector(entity_data.get('color1', "255 255 255"))  # Type: color255
-        instance.Color2 = parse_int_vector(entity_data.get('color2', "255 255 255"))  # Type: color255
-        instance.material = entity_data.get('material', "particle/particle_smokegrenade")  # Type: material
-        instance.ParticleDrawWidth = float(entity_data.get('particledrawwidth', 120))  # Type: float
-        instance.ParticleSpacingDistance = float(entity_data.get('particlespacingdistance', 80))  # Type: float
-        instance.DensityRampSpeed = float(entity_data.get('densityrampspeed', 1))  # Type: float
-        instance.RotationSpeed = float(entity_data.get('rotationspeed', 10))  # Type: float
-        instance.MovementSpeed = float(entity_data.get('movementspeed', 10))  # Type: float
-        instance.Density = float(entity_data.get('density', 1))  # Type: float
-
-
-class func_dustcloud(BModelParticleSpawner, Targetname):
-    def __init__(self):
-        super(BModelParticleSpawner).__init__()
-        super(Targetname).__init__()
-        self.Alpha = 30  # Type: integer
-        self.SizeMin = "100"  # Type: string
-        self.SizeMax = "200"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BModelParticleSpawner.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.Alpha = int(entity_data.get('alpha', 30))  # Type: integer
-        instance.SizeMin = entity_data.get('sizemin', "100")  # Type: string
-        instance.SizeMax = entity_data.get('sizemax', "200")  # Type: string
-
-
-class env_dustpuff(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.scale = 8  # Type: float
-        self.speed = 16  # Type: float
-        self.color = [128, 128, 128]  # Type: color255
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.scale = float(entity_data.get('scale', 8))  # Type: float
-        instance.speed = float(entity_data.get('speed', 16))  # Type: float
-        instance.color = parse_int_vector(entity_data.get('color', "128 128 128"))  # Type: color255
-
-
-class env_particlescript(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.model = "models/Ambient_citadel_paths.mdl"  # Type: studio
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.model = entity_data.get('model', "models/Ambient_citadel_paths.mdl")  # Type: studio
-
-
-class env_effectscript(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.model = "models/Effects/teleporttrail.mdl"  # Type: studio
-        self.scriptfile = "scripts/effects/testeffect.txt"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.model = entity_data.get('model', "models/Effects/teleporttrail.mdl")  # Type: studio
-        instance.scriptfile = entity_data.get('scriptfile', "scripts/effects/testeffect.txt")  # Type: string
-
-
-class logic_auto(Base):
-    icon_sprite = "editor/logic_auto.vmt"
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.globalstate = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.globalstate = entity_data.get('globalstate', None)  # Type: choices
-
-
-class point_viewcontrol(Parentname, Targetname, Angles):
-    viewport_model = "models/editor/camera.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.targetattachment = None  # Type: string
-        self.wait = 10  # Type: integer
-        self.moveto = None  # Type: target_destination
-        self.interpolatepositiontoplayer = None  # Type: choices
-        self.speed = "0"  # Type: string
-        self.acceleration = "500"  # Type: string
-        self.deceleration = "500"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.targetattachment = entity_data.get('targetattachment', None)  # Type: string
-        instance.wait = int(entity_data.get('wait', 10))  # Type: integer
-        instance.moveto = entity_data.get('moveto', None)  # Type: target_destination
-        instance.interpolatepositiontoplayer = entity_data.get('interpolatepositiontoplayer', None)  # Type: choices
-        instance.speed = entity_data.get('speed', "0")  # Type: string
-        instance.acceleration = entity_data.get('acceleration', "500")  # Type: string
-        instance.deceleration = entity_data.get('deceleration', "500")  # Type: string
-
-
-class point_posecontroller(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.PropName = None  # Type: string
-        self.PoseParameterName = None  # Type: string
-        self.PoseValue = 0.0  # Type: float
-        self.InterpolationTime = 0.0  # Type: float
-        self.InterpolationWrap = None  # Type: choices
-        self.CycleFrequency = 0.0  # Type: float
-        self.FModulationType = None  # Type: choices
-        self.FModTimeOffset = 0.0  # Type: float
-        self.FModRate = 0.0  # Type: float
-        self.FModAmplitude = 0.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.PropName = entity_data.get('propname', None)  # Type: string
-        instance.PoseParameterName = entity_data.get('poseparametername', None)  # Type: string
-        instance.PoseValue = float(entity_data.get('posevalue', 0.0))  # Type: float
-        instance.InterpolationTime = float(entity_data.get('interpolationtime', 0.0))  # Type: float
-        instance.InterpolationWrap = entity_data.get('interpolationwrap', None)  # Type: choices
-        instance.CycleFrequency = float(entity_data.get('cyclefrequency', 0.0))  # Type: float
-        instance.FModulationType = entity_data.get('fmodulationtype', None)  # Type: choices
-        instance.FModTimeOffset = float(entity_data.get('fmodtimeoffset', 0.0))  # Type: float
-        instance.FModRate = float(entity_data.get('fmodrate', 0.0))  # Type: float
-        instance.FModAmplitude = float(entity_data.get('fmodamplitude', 0.0))  # Type: float
-
-
-class logic_compare(Targetname):
-    icon_sprite = "editor/logic_compare.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.InitialValue = None  # Type: integer
-        self.CompareValue = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.InitialValue = int(entity_data.get('initialvalue', 0))  # Type: integer
-        instance.CompareValue = int(entity_data.get('comparevalue', 0))  # Type: integer
-
-
-class logic_branch(Targetname):
-    icon_sprite = "editor/logic_branch.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.InitialValue = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.InitialValue = int(entity_data.get('initialvalue', 0))  # Type: integer
-
-
-class logic_branch_listener(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.Branch01 = None  # Type: target_destination
-        self.Branch02 = None  # Type: target_destination
-        self.Branch03 = None  # Type: target_destination
-        self.Branch04 = None  # Type: target_destination
-        self.Branch05 = None  # Type: target_destination
-        self.Branch06 = None  # Type: target_destination
-        self.Branch07 = None  # Type: target_destination
-        self.Branch08 = None  # Type: target_destination
-        self.Branch09 = None  # Type: target_destination
-        self.Branch10 = None  # Type: target_destination
-        self.Branch11 = None  # Type: target_destination
-        self.Branch12 = None  # Type: target_destination
-        self.Branch13 = None  # Type: target_destination
-        self.Branch14 = None  # Type: target_destination
-        self.Branch15 = None  # Type: target_destination
-        self.Branch16 = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.Branch01 = entity_data.get('branch01', None)  # Type: target_destination
-        instance.Branch02 = entity_data.get('branch02', None)  # Type: target_destination
-        instance.Branch03 = entity_data.get('branch03', None)  # Type: target_destination
-        instance.Branch04 = entity_data.get('branch04', None)  # Type: target_destination
-        instance.Branch05 = entity_data.get('branch05', None)  # Type: target_destination
-        instance.Branch06 = entity_data.get('branch06', None)  # Type: target_destination
-        instance.Branch07 = entity_data.get('branch07', None)  # Type: target_destination
-        instance.Branch08 = entity_data.get('branch08', None)  # Type: target_destination
-        instance.Branch09 = entity_data.get('branch09', None)  # Type: target_destination
-        instance.Branch10 = entity_data.get('branch10', None)  # Type: target_destination
-        instance.Branch11 = entity_data.get('branch11', None)  # Type: target_destination
-        instance.Branch12 = entity_data.get('branch12', None)  # Type: target_destination
-        instance.Branch13 = entity_data.get('branch13', None)  # Type: target_destination
-        instance.Branch14 = entity_data.get('branch14', None)  # Type: target_destination
-        instance.Branch15 = entity_data.get('branch15', None)  # Type: target_destination
-        instance.Branch16 = entity_data.get('branch16', None)  # Type: target_destination
-
-
-class logic_case(Targetname):
-    icon_sprite = "editor/logic_case.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.Case01 = None  # Type: string
-        self.Case02 = None  # Type: string
-        self.Case03 = None  # Type: string
-        self.Case04 = None  # Type: string
-        self.Case05 = None  # Type: string
-        self.Case06 = None  # Type: string
-        self.Case07 = None  # Type: string
-        self.Case08 = None  # Type: string
-        self.Case09 = None  # Type: string
-        self.Case10 = None  # Type: string
-        self.Case11 = None  # Type: string
-        self.Case12 = None  # Type: string
-        self.Case13 = None  # Type: string
-        self.Case14 = None  # Type: string
-        self.Case15 = None  # Type: string
-        self.Case16 = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.Case01 = entity_data.get('case01', None)  # Type: string
-        instance.Case02 = entity_data.get('case02', None)  # Type: string
-        instance.Case03 = entity_data.get('case03', None)  # Type: string
-        instance.Case04 = entity_data.get('case04', None)  # Type: string
-        instance.Case05 = entity_data.get('case05', None)  # Type: string
-        instance.Case06 = entity_data.get('case06', None)  # Type: string
-        instance.Case07 = entity_data.get('case07', None)  # Type: string
-        instance.Case08 = entity_data.get('case08', None)  # Type: string
-        instance.Case09 = entity_data.get('case09', None)  # Type: string
-        instance.Case10 = entity_data.get('case10', None)  # Type: string
-        instance.Case11 = entity_data.get('case11', None)  # Type: string
-        instance.Case12 = entity_data.get('case12', None)  # Type: string
-        instance.Case13 = entity_data.get('case13', None)  # Type: string
-        instance.Case14 = entity_data.get('case14', None)  # Type: string
-        instance.Case15 = entity_data.get('case15', None)  # Type: string
-        instance.Case16 = entity_data.get('case16', None)  # Type: string
-
-
-class logic_multicompare(Targetname):
-    icon_sprite = "editor/logic_multicompare.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.IntegerValue = None  # Type: integer
-        self.ShouldComparetoValue = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.IntegerValue = int(entity_data.get('integervalue', 0))  # Type: integer
-        instance.ShouldComparetoValue = entity_data.get('shouldcomparetovalue', None)  # Type: choices
-
-
-class logic_relay(EnableDisable, Targetname):
-    icon_sprite = "editor/logic_relay.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class logic_timer(EnableDisable, Targetname):
-    icon_sprite = "editor/logic_timer.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.UseRandomTime = None  # Type: choices
-        self.LowerRandomBound = None  # Type: string
-        self.UpperRandomBound = None  # Type: string
-        self.RefireTime = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.UseRandomTime = entity_data.get('userandomtime', None)  # Type: choices
-        instance.LowerRandomBound = entity_data.get('lowerrandombound', None)  # Type: string
-        instance.UpperRandomBound = entity_data.get('upperrandombound', None)  # Type: string
-        instance.RefireTime = entity_data.get('refiretime', None)  # Type: string
-
-
-class hammer_updateignorelist(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.IgnoredName01 = None  # Type: target_destination
-        self.IgnoredName02 = None  # Type: target_destination
-        self.IgnoredName03 = None  # Type: target_destination
-        self.IgnoredName04 = None  # Type: target_destination
-        self.IgnoredName05 = None  # Type: target_destination
-        self.IgnoredName06 = None  # Type: target_destination
-        self.IgnoredName07 = None  # Type: target_destination
-        self.IgnoredName08 = None  # Type: target_destination
-        self.IgnoredName09 = None  # Type: target_destination
-        self.IgnoredName10 = None  # Type: target_destination
-        self.IgnoredName11 = None  # Type: target_destination
-        self.IgnoredName12 = None  # Type: target_destination
-        self.IgnoredName13 = None  # Type: target_destination
-        self.IgnoredName14 = None  # Type: target_destination
-        self.IgnoredName15 = None  # Type: target_destination
-        self.IgnoredName16 = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.IgnoredName01 = entity_data.get('ignoredname01', None)  # Type: target_destination
-        instance.IgnoredName02 = entity_data.get('ignoredname02', None)  # Type: target_destination
-        instance.IgnoredName03 = entity_data.get('ignoredname03', None)  # Type: target_destination
-        instance.IgnoredName04 = entity_data.get('ignoredname04', None)  # Type: target_destination
-        instance.IgnoredName05 = entity_data.get('ignoredname05', None)  # Type: target_destination
-        instance.IgnoredName06 = entity_data.get('ignoredname06', None)  # Type: target_destination
-        instance.IgnoredName07 = entity_data.get('ignoredname07', None)  # Type: target_destination
-        instance.IgnoredName08 = entity_data.get('ignoredname08', None)  # Type: target_destination
-        instance.IgnoredName09 = entity_data.get('ignoredname09', None)  # Type: target_destination
-        instance.IgnoredName10 = entity_data.get('ignoredname10', None)  # Type: target_destination
-        instance.IgnoredName11 = entity_data.get('ignoredname11', None)  # Type: target_destination
-        instance.IgnoredName12 = entity_data.get('ignoredname12', None)  # Type: target_destination
-        instance.IgnoredName13 = entity_data.get('ignoredname13', None)  # Type: target_destination
-        instance.IgnoredName14 = entity_data.get('ignoredname14', None)  # Type: target_destination
-        instance.IgnoredName15 = entity_data.get('ignoredname15', None)  # Type: target_destination
-        instance.IgnoredName16 = entity_data.get('ignoredname16', None)  # Type: target_destination
-
-
-class logic_collision_pair(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.attach1 = None  # Type: target_destination
-        self.attach2 = None  # Type: target_destination
-        self.startdisabled = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.attach1 = entity_data.get('attach1', None)  # Type: target_destination
-        instance.attach2 = entity_data.get('attach2', None)  # Type: target_destination
-        instance.startdisabled = entity_data.get('startdisabled', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class env_microphone(Parentname, EnableDisable, Targetname):
-    icon_sprite = "editor/env_microphone.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.SpeakerName = None  # Type: target_destination
-        self.ListenFilter = None  # Type: filterclass
-        self.speaker_dsp_preset = None  # Type: choices
-        self.Sensitivity = 1  # Type: float
-        self.SmoothFactor = None  # Type: float
-        self.MaxRange = 240  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.SpeakerName = entity_data.get('speakername', None)  # Type: target_destination
-        instance.ListenFilter = entity_data.get('listenfilter', None)  # Type: filterclass
-        instance.speaker_dsp_preset = entity_data.get('speaker_dsp_preset', None)  # Type: choices
-        instance.Sensitivity = float(entity_data.get('sensitivity', 1))  # Type: float
-        instance.SmoothFactor = float(entity_data.get('smoothfactor', 0))  # Type: float
-        instance.MaxRange = float(entity_data.get('maxrange', 240))  # Type: float
-
-
-class math_remap(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.in1 = None  # Type: integer
-        self.in2 = 1  # Type: integer
-        self.out1 = None  # Type: integer
-        self.out2 = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.in1 = int(entity_data.get('in1', 0))  # Type: integer
-        instance.in2 = int(entity_data.get('in2', 1))  # Type: integer
-        instance.out1 = int(entity_data.get('out1', 0))  # Type: integer
-        instance.out2 = int(entity_data.get('out2', 0))  # Type: integer
-
-
-class math_colorblend(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.inmin = None  # Type: integer
-        self.inmax = 1  # Type: integer
-        self.colormin = [0, 0, 0]  # Type: color255
-        self.colormax = [255, 255, 255]  # Type: color255
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.inmin = int(entity_data.get('inmin', 0))  # Type: integer
-        instance.inmax = int(entity_data.get('inmax', 1))  # Type: integer
-        instance.colormin = parse_int_vector(entity_data.get('colormin', "0 0 0"))  # Type: color255
-        instance.colormax = parse_int_vector(entity_data.get('colormax', "255 255 255"))  # Type: color255
-
-
-class math_counter(EnableDisable, Targetname):
-    icon_sprite = "editor/math_counter.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.startvalue = None  # Type: integer
-        self.min = None  # Type: integer
-        self.max = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.startvalue = int(entity_data.get('startvalue', 0))  # Type: integer
-        instance.min = int(entity_data.get('min', 0))  # Type: integer
-        instance.max = int(entity_data.get('max', 0))  # Type: integer
-
-
-class logic_lineto(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.source = None  # Type: target_destination
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.source = entity_data.get('source', None)  # Type: target_destination
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class logic_navigation(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Set to none due to bug in BlackMesa base.fgd file  # Type: target_destination
-        self.navprop = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Set to none due to bug in BlackMesa base.fgd file  # Type: target_destination
-        instance.navprop = entity_data.get('navprop', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class logic_autosave(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.NewLevelUnit = None  # Type: choices
-        self.MinimumHitPoints = None  # Type: integer
-        self.MinHitPointsToCommit = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.NewLevelUnit = entity_data.get('newlevelunit', None)  # Type: choices
-        instance.MinimumHitPoints = int(entity_data.get('minimumhitpoints', 0))  # Type: integer
-        instance.MinHitPointsToCommit = int(entity_data.get('minhitpointstocommit', 0))  # Type: integer
-
-
-class logic_active_autosave(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.MinimumHitPoints = 30  # Type: integer
-        self.TriggerHitPoints = 75  # Type: integer
-        self.TimeToTrigget = None  # Type: float
-        self.DangerousTime = 10  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.MinimumHitPoints = int(entity_data.get('minimumhitpoints', 30))  # Type: integer
-        instance.TriggerHitPoints = int(entity_data.get('triggerhitpoints', 75))  # Type: integer
-        instance.TimeToTrigget = float(entity_data.get('timetotrigget', 0))  # Type: float
-        instance.DangerousTime = float(entity_data.get('dangeroustime', 10))  # Type: float
-
-
-class point_template(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.Template01 = None  # Type: target_destination
-        self.Template02 = None  # Type: target_destination
-        self.Template03 = None  # Type: target_destination
-        self.Template04 = None  # Type: target_destination
-        self.Template05 = None  # Type: target_destination
-        self.Template06 = None  # Type: target_destination
-        self.Template07 = None  # Type: target_destination
-        self.Template08 = None  # Type: target_destination
-        self.Template09 = None  # Type: target_destination
-        self.Template10 = None  # Type: target_destination
-        self.Template11 = None  # Type: target_destination
-        self.Template12 = None  # Type: target_destination
-        self.Template13 = None  # Type: target_destination
-        self.Template14 = None  # Type: target_destination
-        self.Template15 = None  # Type: target_destination
-        self.Template16 = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.Template01 = entity_data.get('template01', None)  # Type: target_destination
-        instance.Template02 = entity_data.get('template02', None)  # Type: target_destination
-        instance.Template03 = entity_data.get('template03', None)  # Type: target_destination
-        instance.Template04 = entity_data.get('template04', None)  # Type: target_destination
-        instance.Template05 = entity_data.get('template05', None)  # Type: target_destination
-        instance.Template06 = entity_data.get('template06', None)  # Type: target_destination
-        instance.Template07 = entity_data.get('template07', None)  # Type: target_destination
-        instance.Template08 = entity_data.get('template08', None)  # Type: target_destination
-        instance.Template09 = entity_data.get('template09', None)  # Type: target_destination
-        instance.Template10 = entity_data.get('template10', None)  # Type: target_destination
-        instance.Template11 = entity_data.get('template11', None)  # Type: target_destination
-        instance.Template12 = entity_data.get('template12', None)  # Type: target_destination
-        instance.Template13 = entity_data.get('template13', None)  # Type: target_destination
-        instance.Template14 = entity_data.get('template14', None)  # Type: target_destination
-        instance.Template15 = entity_data.get('template15', None)  # Type: target_destination
-        instance.Template16 = entity_data.get('template16', None)  # Type: target_destination
-
-
-class env_entity_maker(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.EntityTemplate = None  # Type: target_destination
-        self.PostSpawnSpeed = 0  # Type: float
-        self.PostSpawnDirection = [0.0, 0.0, 0.0]  # Type: angle
-        self.PostSpawnDirectionVariance = 0.15  # Type: float
-        self.PostSpawnInheritAngles = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.EntityTemplate = entity_data.get('entitytemplate', None)  # Type: target_destination
-        instance.PostSpawnSpeed = float(entity_data.get('postspawnspeed', 0))  # Type: float
-        instance.PostSpawnDirection = parse_float_vector(entity_data.get('postspawndirection', "0 0 0"))  # Type: angle
-        instance.PostSpawnDirectionVariance = float(entity_data.get('postspawndirectionvariance', 0.15))  # Type: float
-        instance.PostSpawnInheritAngles = entity_data.get('postspawninheritangles', None)  # Type: choices
-
-
-class BaseFilter(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.Negated = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.Negated = entity_data.get('negated', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class filter_multi(BaseFilter):
-    icon_sprite = "editor/filter_multiple.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.filtertype = None  # Type: choices
-        self.Filter01 = None  # Type: filterclass
-        self.Filter02 = None  # Type: filterclass
-        self.Filter03 = None  # Type: filterclass
-        self.Filter04 = None  # Type: filterclass
-        self.Filter05 = None  # Type: filterclass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.filtertype = entity_data.get('filtertype', None)  # Type: choices
-        instance.Filter01 = entity_data.get('filter01', None)  # Type: filterclass
-        instance.Filter02 = entity_data.get('filter02', None)  # Type: filterclass
-        instance.Filter03 = entity_data.get('filter03', None)  # Type: filterclass
-        instance.Filter04 = entity_data.get('filter04', None)  # Type: filterclass
-        instance.Filter05 = entity_data.get('filter05', None)  # Type: filterclass
-
-
-class filter_activator_name(BaseFilter):
-    icon_sprite = "editor/filter_name.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.filtername = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.filtername = entity_data.get('filtername', None)  # Type: target_destination
-
-
-class filter_activator_class(BaseFilter):
-    icon_sprite = "editor/filter_class.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.filterclass = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.filterclass = entity_data.get('filterclass', None)  # Type: string
-
-
-class filter_activator_mass_greater(BaseFilter):
-    icon_sprite = "editor/filter_class.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.filtermass = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.filtermass = float(entity_data.get('filtermass', 0))  # Type: float
-
-
-class filter_damage_type(BaseFilter):
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.damagetype = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.damagetype = entity_data.get('damagetype', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class filter_enemy(BaseFilter):
-    icon_sprite = "editor/filter_class.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.filtername = None  # Type: string
-        self.filter_radius = None  # Type: float
-        self.filter_outer_radius = None  # Type: float
-        self.filter_max_per_enemy = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.filtername = entity_data.get('filtername', None)  # Type: string
-        instance.filter_radius = float(entity_data.get('filter_radius', 0))  # Type: float
-        instance.filter_outer_radius = float(entity_data.get('filter_outer_radius', 0))  # Type: float
-        instance.filter_max_per_enemy = int(entity_data.get('filter_max_per_enemy', 0))  # Type: integer
-
-
-class point_anglesensor(Parentname, EnableDisable, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.lookatname = None  # Type: target_destination
-        self.duration = None  # Type: float
-        self.tolerance = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.lookatname = entity_data.get('lookatname', None)  # Type: target_destination
-        instance.duration = float(entity_data.get('duration', 0))  # Type: float
-        instance.tolerance = int(entity_data.get('tolerance', 0))  # Type: integer
-
-
-class point_angularvelocitysensor(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.threshold = None  # Type: float
-        self.fireinterval = 0.2  # Type: float
-        self.axis = None  # Type: vecline
-        self.usehelper = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.threshold = float(entity_data.get('threshold', 0))  # Type: float
-        instance.fireinterval = float(entity_data.get('fireinterval', 0.2))  # Type: float
-        instance.axis = entity_data.get('axis', None)  # Type: vecline
-        instance.usehelper = entity_data.get('usehelper', None)  # Type: choices
-
-
-class point_velocitysensor(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.axis = None  # Type: vecline
-        self.enabled = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.axis = entity_data.get('axis', None)  # Type: vecline
-        instance.enabled = entity_data.get('enabled', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class point_proximity_sensor(Parentname, EnableDisable, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class point_teleport(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class point_hurt(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.DamageTarget = None  # Type: string
-        self.DamageRadius = 256  # Type: float
-        self.Damage = 5  # Type: integer
-        self.DamageDelay = 1  # Type: float
-        self.DamageType = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.DamageTarget = entity_data.get('damagetarget', None)  # Type: string
-        instance.DamageRadius = float(entity_data.get('damageradius', 256))  # Type: float
-        instance.Damage = int(entity_data.get('damage', 5))  # Type: integer
-        instance.DamageDelay = float(entity_data.get('damagedelay', 1))  # Type: float
-        instance.DamageType = entity_data.get('damagetype', None)  # Type: choices
-
-
-class point_playermoveconstraint(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.radius = 256  # Type: float
-        self.width = 75.0  # Type: float
-        self.speedfactor = 0.15  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.radius = float(entity_data.get('radius', 256))  # Type: float
-        instance.width = float(entity_data.get('width', 75.0))  # Type: float
-        instance.speedfactor = float(entity_data.get('speedfactor', 0.15))  # Type: float
-
-
-class func_physbox(BreakableBrush, Origin, RenderFields):
-    def __init__(self):
-        super(BreakableBrush).__init__()
-        super(RenderFields).__init__()
-        super(Origin).__init__()
-        super(Shadow).__init__()
-        super(Targetname).__init__()
-        self._minlight = None  # Type: string
-        self.Damagetype = None  # Type: choices
-        self.massScale = 0  # Type: float
-        self.overridescript = None  # Type: string
-        self.damagetoenablemotion = None  # Type: integer
-        self.forcetoenablemotion = None  # Type: float
-        self.preferredcarryangles = [0.0, 0.0, 0.0]  # Type: vector
-        self.notsolid = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BreakableBrush.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.Damagetype = entity_data.get('damagetype', None)  # Type: choices
-        instance.massScale = float(entity_data.get('massscale', 0))  # Type: float
-        instance.overridescript = entity_data.get('overridescript', None)  # Type: string
-        instance.damagetoenablemotion = int(entity_data.get('damagetoenablemotion', 0))  # Type: integer
-        instance.forcetoenablemotion = float(entity_data.get('forcetoenablemotion', 0))  # Type: float
-        instance.preferredcarryangles = parse_float_vector(entity_data.get('preferredcarryangles', "0 0 0"))  # Type: vector
-        instance.notsolid = entity_data.get('notsolid', None)  # Type: choices
-
-
-class TwoObjectPhysics(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.attach1 = None  # Type: target_destination
-        self.attach2 = None  # Type: target_destination
-        self.constraintsystem = None  # Type: target_destination
-        self.forcelimit = 0  # Type: float
-        self.torquelimit = 0  # Type: float
-        self.breaksound = None  # Type: sound
-        self.teleportfollowdistance = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.attach1 = entity_data.get('attach1', None)  # Type: target_destination
-        instance.attach2 = entity_data.get('attach2', None)  # Type: target_destination
-        instance.constraintsystem = entity_data.get('constraintsystem', None)  # Type: target_destination
-        instance.forcelimit = float(entity_data.get('forcelimit', 0))  # Type: float
-        instance.torquelimit = float(entity_data.get('torquelimit', 0))  # Type: float
-        instance.breaksound = entity_data.get('breaksound', None)  # Type: sound
-        instance.teleportfollowdistance = float(entity_data.get('teleportfollowdistance', 0))  # Type: float
-
-
-class phys_constraintsystem(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.additionaliterations = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.additionaliterations = int(entity_data.get('additionaliterations', 0))  # Type: integer
-
-
-class phys_keepupright(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.attach1 = None  # Type: target_destination
-        self.angularlimit = 15  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.attach1 = entity_data.get('attach1', None)  # Type: target_destination
-        instance.angularlimit = float(entity_data.get('angularlimit', 15))  # Type: float
-
-
-class physics_cannister(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.model = "models/fire_equipment/w_weldtank.mdl"  # Type: studio
-        self.expdamage = "200.0"  # Type: string
-        self.expradius = "250.0"  # Type: string
-        self.health = 25  # Type: integer
-        self.thrust = "3000.0"  # Type: string
-        self.fuel = "12.0"  # Type: string
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.renderamt = 128  # Type: integer
-        self.gassound = "ambient/objects/cannister_loop.wav"  # Type: sound
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.model = entity_data.get('model', "models/fire_equipment/w_weldtank.mdl")  # Type: studio
-        instance.expdamage = entity_data.get('expdamage', "200.0")  # Type: string
-        instance.expradius = entity_data.get('expradius', "250.0")  # Type: string
-        instance.health = int(entity_data.get('health', 25))  # Type: integer
-        instance.thrust = entity_data.get('thrust', "3000.0")  # Type: string
-        instance.fuel = entity_data.get('fuel', "12.0")  # Type: string
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.renderamt = int(entity_data.get('renderamt', 128))  # Type: integer
-        instance.gassound = entity_data.get('gassound', "ambient/objects/cannister_loop.wav")  # Type: sound
-
-
-class info_constraint_anchor(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.massScale = 1  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.massScale = float(entity_data.get('massscale', 1))  # Type: float
-
-
-class info_mass_center(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class phys_spring(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.attach1 = None  # Type: target_destination
-        self.attach2 = None  # Type: target_destination
-        self.springaxis = None  # Type: vecline
-        self.length = "0"  # Type: string
-        self.constant = "50"  # Type: string
-        self.damping = "2.0"  # Type: string
-        self.relativedamping = "0.1"  # Type: string
-        self.breaklength = "0"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.attach1 = entity_data.get('attach1', None)  # Type: target_destination
-        instance.attach2 = entity_data.get('attach2', None)  # Type: target_destination
-        instance.springaxis = entity_data.get('springaxis', None)  # Type: vecline
-        instance.length = entity_data.get('length', "0")  # Type: string
-        instance.constant = entity_data.get('constant', "50")  # Type: string
-        instance.damping = entity_data.get('damping', "2.0")  # Type: string
-        instance.relativedamping = entity_data.get('relativedamping', "0.1")  # Type: string
-        instance.breaklength = entity_data.get('breaklength', "0")  # Type: string
-
-
-class phys_hinge(TwoObjectPhysics):
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-        self.hingefriction = 0  # Type: float
-        self.hingeaxis = None  # Type: vecline
-        self.SystemLoadScale = 1  # Type: float
-        self.minSoundThreshold = 6  # Type: float
-        self.maxSoundThreshold = 80  # Type: float
-        self.slidesoundfwd = None  # Type: sound
-        self.slidesoundback = None  # Type: sound
-        self.reversalsoundthresholdSmall = 0  # Type: float
-        self.reversalsoundthresholdMedium = 0  # Type: float
-        self.reversalsoundthresholdLarge = 0  # Type: float
-        self.reversalsoundSmall = None  # Type: sound
-        self.reversalsoundMedium = None  # Type: sound
-        self.reversalsoundLarge = None  # Type: sound
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.hingefriction = float(entity_data.get('hingefriction', 0))  # Type: float
-        instance.hingeaxis = entity_data.get('hingeaxis', None)  # Type: vecline
-        instance.SystemLoadScale = float(entity_data.get('systemloadscale', 1))  # Type: float
-        instance.minSoundThreshold = float(entity_data.get('minsoundthreshold', 6))  # Type: float
-        instance.maxSoundThreshold = float(entity_data.get('maxsoundthreshold', 80))  # Type: float
-        instance.slidesoundfwd = entity_data.get('slidesoundfwd', None)  # Type: sound
-        instance.slidesoundback = entity_data.get('slidesoundback', None)  # Type: sound
-        instance.reversalsoundthresholdSmall = float(entity_data.get('reversalsoundthresholdsmall', 0))  # Type: float
-        instance.reversalsoundthresholdMedium = float(entity_data.get('reversalsoundthresholdmedium', 0))  # Type: float
-        instance.reversalsoundthresholdLarge = float(entity_data.get('reversalsoundthresholdlarge', 0))  # Type: float
-        instance.reversalsoundSmall = entity_data.get('reversalsoundsmall', None)  # Type: sound
-        instance.reversalsoundMedium = entity_data.get('reversalsoundmedium', None)  # Type: sound
-        instance.reversalsoundLarge = entity_data.get('reversalsoundlarge', None)  # Type: sound
-
-
-class phys_ballsocket(TwoObjectPhysics):
-    icon_sprite = "editor/phys_ballsocket.vmt"
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class phys_constraint(TwoObjectPhysics):
-    model = "models/editor/axis_helper.mdl"
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class phys_pulleyconstraint(TwoObjectPhysics):
-    model = "models/editor/axis_helper.mdl"
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-        self.addlength = 0  # Type: float
-        self.gearratio = 1  # Type: float
-        self.position2 = None  # Type: vecline
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.addlength = float(entity_data.get('addlength', 0))  # Type: float
-        instance.gearratio = float(entity_data.get('gearratio', 1))  # Type: float
-        instance.position2 = entity_data.get('position2', None)  # Type: vecline
-
-
-class phys_slideconstraint(TwoObjectPhysics):
-    model = "models/editor/axis_helper.mdl"
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-        self.slideaxis = None  # Type: vecline
-        self.slidefriction = 0  # Type: float
-        self.SystemLoadScale = 1  # Type: float
-        self.minSoundThreshold = 6  # Type: float
-        self.maxSoundThreshold = 80  # Type: float
-        self.slidesoundfwd = None  # Type: sound
-        self.slidesoundback = None  # Type: sound
-        self.reversalsoundthresholdSmall = 0  # Type: float
-        self.reversalsoundthresholdMedium = 0  # Type: float
-        self.reversalsoundthresholdLarge = 0  # Type: float
-        self.reversalsoundSmall = None  # Type: sound
-        self.reversalsoundMedium = None  # Type: sound
-        self.reversalsoundLarge = None  # Type: sound
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.slideaxis = entity_data.get('slideaxis', None)  # Type: vecline
-        instance.slidefriction = float(entity_data.get('slidefriction', 0))  # Type: float
-        instance.SystemLoadScale = float(entity_data.get('systemloadscale', 1))  # Type: float
-        instance.minSoundThreshold = float(entity_data.get('minsoundthreshold', 6))  # Type: float
-        instance.maxSoundThreshold = float(entity_data.get('maxsoundthreshold', 80))  # Type: float
-        instance.slidesoundfwd = entity_data.get('slidesoundfwd', None)  # Type: sound
-        instance.slidesoundback = entity_data.get('slidesoundback', None)  # Type: sound
-        instance.reversalsoundthresholdSmall = float(entity_data.get('reversalsoundthresholdsmall', 0))  # Type: float
-        instance.reversalsoundthresholdMedium = float(entity_data.get('reversalsoundthresholdmedium', 0))  # Type: float
-        instance.reversalsoundthresholdLarge = float(entity_data.get('reversalsoundthresholdlarge', 0))  # Type: float
-        instance.reversalsoundSmall = entity_data.get('reversalsoundsmall', None)  # Type: sound
-        instance.reversalsoundMedium = entity_data.get('reversalsoundmedium', None)  # Type: sound
-        instance.reversalsoundLarge = entity_data.get('reversalsoundlarge', None)  # Type: sound
-
-
-class phys_lengthconstraint(TwoObjectPhysics):
-    model = "models/editor/axis_helper.mdl"
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-        self.addlength = 0  # Type: float
-        self.minlength = 0  # Type: float
-        self.attachpoint = None  # Set to none due to bug in BlackMesa base.fgd file  # Type: vecline
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.addlength = float(entity_data.get('addlength', 0))  # Type: float
-        instance.minlength = float(entity_data.get('minlength', 0))  # Type: float
-        instance.attachpoint = entity_data.get('attachpoint', None)  # Set to none due to bug in BlackMesa base.fgd file  # Type: vecline
-
-
-class phys_ragdollconstraint(TwoObjectPhysics):
-    model = "models/editor/axis_helper.mdl"
-    def __init__(self):
-        super(TwoObjectPhysics).__init__()
-        self.origin = [0, 0, 0]
-        self.xmin = -90  # Type: float
-        self.xmax = 90  # Type: float
-        self.ymin = 0  # Type: float
-        self.ymax = 0  # Type: float
-        self.zmin = 0  # Type: float
-        self.zmax = 0  # Type: float
-        self.xfriction = 0  # Type: float
-        self.yfriction = 0  # Type: float
-        self.zfriction = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TwoObjectPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.xmin = float(entity_data.get('xmin', -90))  # Type: float
-        instance.xmax = float(entity_data.get('xmax', 90))  # Type: float
-        instance.ymin = float(entity_data.get('ymin', 0))  # Type: float
-        instance.ymax = float(entity_data.get('ymax', 0))  # Type: float
-        instance.zmin = float(entity_data.get('zmin', 0))  # Type: float
-        instance.zmax = float(entity_data.get('zmax', 0))  # Type: float
-        instance.xfriction = float(entity_data.get('xfriction', 0))  # Type: float
-        instance.yfriction = float(entity_data.get('yfriction', 0))  # Type: float
-        instance.zfriction = float(entity_data.get('zfriction', 0))  # Type: float
-
-
-class phys_convert(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.swapmodel = None  # Type: string
-        self.massoverride = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.swapmodel = entity_data.get('swapmodel', None)  # Type: string
-        instance.massoverride = float(entity_data.get('massoverride', 0))  # Type: float
-
-
-class ForceController(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.attach1 = None  # Type: target_destination
-        self.forcetime = "0"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.attach1 = entity_data.get('attach1', None)  # Type: target_destination
-        instance.forcetime = entity_data.get('forcetime', "0")  # Type: string
-
-
-class phys_thruster(Angles, ForceController):
-    def __init__(self):
-        super(ForceController).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.force = "0"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        ForceController.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.force = entity_data.get('force', "0")  # Type: string
-
-
-class phys_torque(ForceController):
-    def __init__(self):
-        super(ForceController).__init__()
-        self.origin = [0, 0, 0]
-        self.force = "0"  # Type: string
-        self.axis = None  # Type: vecline
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        ForceController.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.force = entity_data.get('force', "0")  # Type: string
-        instance.axis = entity_data.get('axis', None)  # Type: vecline
-
-
-class phys_motor(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.speed = "0"  # Type: string
-        self.spinup = "1"  # Type: string
-        self.inertiafactor = 1.0  # Type: float
-        self.axis = None  # Type: vecline
-        self.attach1 = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.speed = entity_data.get('speed', "0")  # Type: string
-        instance.spinup = entity_data.get('spinup', "1")  # Type: string
-        instance.inertiafactor = float(entity_data.get('inertiafactor', 1.0))  # Type: float
-        instance.axis = entity_data.get('axis', None)  # Type: vecline
-        instance.attach1 = entity_data.get('attach1', None)  # Type: target_destination
-
-
-class phys_magnet(Parentname, Studiomodel, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Studiomodel).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.forcelimit = 0  # Type: float
-        self.torquelimit = 0  # Type: float
-        self.massScale = 0  # Type: float
-        self.overridescript = None  # Type: string
-        self.maxobjects = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Studiomodel.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.forcelimit = float(entity_data.get('forcelimit', 0))  # Type: float
-        instance.torquelimit = float(entity_data.get('torquelimit', 0))  # Type: float
-        instance.massScale = float(entity_data.get('massscale', 0))  # Type: float
-        instance.overridescript = entity_data.get('overridescript', None)  # Type: string
-        instance.maxobjects = int(entity_data.get('maxobjects', 0))  # Type: integer
-
-
-class prop_detail_base(Base):
-    def __init__(self):
-        super().__init__()
-        self.model = None  # Type: studio
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.model = entity_data.get('model', None)  # Type: studio
-
-
-class prop_static_base(DXLevelChoice, Angles):
-    def __init__(self):
-        super(DXLevelChoice).__init__()
-        super(Angles).__init__()
-        self.model = None  # Type: studio
-        self.skin = None  # Type: integer
-        self.solid = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.disableshadows = None  # Type: choices
-        self.screenspacefade = None  # Type: choices
-        self.fademindist = -1  # Type: float
-        self.fademaxdist = None  # Type: float
-        self.fadescale = 1  # Type: float
-        self.lightingorigin = None  # Type: target_destination
-        self.disablevertexlighting = None  # Type: choices
-        self.disableselfshadowing = None  # Type: choices
-        self.ignorenormals = None  # Type: choices
-        self.generatelightmaps = None  # Type: choices
-        self.lightmapresolutionx = 32  # Type: integer
-        self.lightmapresolutiony = 32  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        DXLevelChoice.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.model = entity_data.get('model', None)  # Type: studio
-        instance.skin = int(entity_data.get('skin', 0))  # Type: integer
-        instance.solid = entity_data.get('solid', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.disableshadows = entity_data.get('disableshadows', None)  # Type: choices
-        instance.screenspacefade = entity_data.get('screenspacefade', None)  # Type: choices
-        instance.fademindist = float(entity_data.get('fademindist', -1))  # Type: float
-        instance.fademaxdist = float(entity_data.get('fademaxdist', 0))  # Type: float
-        instance.fadescale = float(entity_data.get('fadescale', 1))  # Type: float
-        instance.lightingorigin = entity_data.get('lightingorigin', None)  # Type: target_destination
-        instance.disablevertexlighting = entity_data.get('disablevertexlighting', None)  # Type: choices
-        instance.disableselfshadowing = entity_data.get('disableselfshadowing', None)  # Type: choices
-        instance.ignorenormals = entity_data.get('ignorenormals', None)  # Type: choices
-        instance.generatelightmaps = entity_data.get('generatelightmaps', None)  # Type: choices
-        instance.lightmapresolutionx = int(entity_data.get('lightmapresolutionx', 32))  # Type: integer
-        instance.lightmapresolutiony = int(entity_data.get('lightmapresolutiony', 32))  # Type: integer
-
-
-class BaseFadeProp(Base):
-    def __init__(self):
-        super().__init__()
-        self.fademindist = -1  # Type: float
-        self.fademaxdist = None  # Type: float
-        self.fadescale = 1  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.fademindist = float(entity_data.get('fademindist', -1))  # Type: float
-        instance.fademaxdist = float(entity_data.get('fademaxdist', 0))  # Type: float
-        instance.fadescale = float(entity_data.get('fadescale', 1))  # Type: float
-
-
-class prop_dynamic_base(Parentname, Global, Studiomodel, RenderFields, DXLevelChoice, BreakableProp, Angles, BaseFadeProp):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(BreakableProp).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Studiomodel).__init__()
-        super(DXLevelChoice).__init__()
-        super(Angles).__init__()
-        super(BaseFadeProp).__init__()
-        self.solid = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.DefaultAnim = None  # Type: string
-        self.RandomAnimation = None  # Type: choices
-        self.MinAnimTime = 5  # Type: float
-        self.MaxAnimTime = 10  # Type: float
-        self.SetBodyGroup = None  # Type: integer
-        self.DisableBoneFollowers = None  # Type: choices
-        self.lightingorigin = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Studiomodel.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        DXLevelChoice.from_dict(instance, entity_data)
-        BreakableProp.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        BaseFadeProp.from_dict(instance, entity_data)
-        instance.solid = entity_data.get('solid', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.DefaultAnim = entity_data.get('defaultanim', None)  # Type: string
-        instance.RandomAnimation = entity_data.get('randomanimation', None)  # Type: choices
-        instance.MinAnimTime = float(entity_data.get('minanimtime', 5))  # Type: float
-        instance.MaxAnimTime = float(entity_data.get('maxanimtime', 10))  # Type: float
-        instance.SetBodyGroup = int(entity_data.get('setbodygroup', 0))  # Type: integer
-        instance.DisableBoneFollowers = entity_data.get('disablebonefollowers', None)  # Type: choices
-        instance.lightingorigin = entity_data.get('lightingorigin', None)  # Type: target_destination
-
-
-class prop_detail(prop_detail_base):
-    def __init__(self):
-        super(prop_detail_base).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        prop_detail_base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class prop_static(prop_static_base):
-    def __init__(self):
-        super(prop_static_base).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        prop_static_base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class prop_dynamic(EnableDisable, prop_dynamic_base):
-    def __init__(self):
-        super(prop_dynamic_base).__init__()
-        super(EnableDisable).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        prop_dynamic_base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class prop_dynamic_override(prop_dynamic_base):
-    def __init__(self):
-        super(prop_dynamic_base).__init__()
-        self.origin = [0, 0, 0]
-        self.health = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        prop_dynamic_base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-
-
-class BasePropPhysics(Global, Studiomodel, DXLevelChoice, BreakableProp, Angles, BaseFadeProp):
-    def __init__(self):
-        super(BreakableProp).__init__()
-        super(Global).__init__()
-        super(Studiomodel).__init__()
-        super(Targetname).__init__()
-        super(DXLevelChoice).__init__()
-        super(Angles).__init__()
-        super(BaseFadeProp).__init__()
-        self.minhealthdmg = None  # Type: integer
-        self.shadowcastdist = None  # Type: integer
-        self.physdamagescale = 0.1  # Type: float
-        self.Damagetype = None  # Type: choices
-        self.nodamageforces = None  # Type: choices
-        self.inertiaScale = 1.0  # Type: float
-        self.massScale = 0  # Type: float
-        self.overridescript = None  # Type: string
-        self.damagetoenablemotion = None  # Type: integer
-        self.forcetoenablemotion = None  # Type: float
-        self.puntsound = None  # Type: sound
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Global.from_dict(instance, entity_data)
-        Studiomodel.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        DXLevelChoice.from_dict(instance, entity_data)
-        BreakableProp.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        BaseFadeProp.from_dict(instance, entity_data)
-        instance.minhealthdmg = int(entity_data.get('minhealthdmg', 0))  # Type: integer
-        instance.shadowcastdist = int(entity_data.get('shadowcastdist', 0))  # Type: integer
-        instance.physdamagescale = float(entity_data.get('physdamagescale', 0.1))  # Type: float
-        instance.Damagetype = entity_data.get('damagetype', None)  # Type: choices
-        instance.nodamageforces = entity_data.get('nodamageforces', None)  # Type: choices
-        instance.inertiaScale = float(entity_data.get('inertiascale', 1.0))  # Type: float
-        instance.massScale = float(entity_data.get('massscale', 0))  # Type: float
-        instance.overridescript = entity_data.get('overridescript', None)  # Type: string
-        instance.damagetoenablemotion = int(entity_data.get('damagetoenablemotion', 0))  # Type: integer
-        instance.forcetoenablemotion = float(entity_data.get('forcetoenablemotion', 0))  # Type: float
-        instance.puntsound = entity_data.get('puntsound', None)  # Type: sound
-
-
-class prop_physics_override(BasePropPhysics):
-    def __init__(self):
-        super(BasePropPhysics).__init__()
-        self.origin = [0, 0, 0]
-        self.health = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BasePropPhysics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-
-
-class prop_physics(BasePropPhysics, RenderFields):
-    def __init__(self):
-        super(BasePropPhysics).__init__()
-        super(RenderFields).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BasePropPhysics.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class prop_physics_multiplayer(prop_physics):
-    def __init__(self):
-        super(prop_physics).__init__()
-        self.origin = [0, 0, 0]
-        self.physicsmode = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        prop_physics.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.physicsmode = entity_data.get('physicsmode', None)  # Type: choices
-
-
-class prop_ragdoll(Studiomodel, EnableDisable, Targetname, DXLevelChoice, Angles, BaseFadeProp):
-    def __init__(self):
-        super(Studiomodel).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(DXLevelChoice).__init__()
-        super(Angles).__init__()
-        super(BaseFadeProp).__init__()
-        self.origin = [0, 0, 0]
-        self.angleOverride = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Studiomodel.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        DXLevelChoice.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        BaseFadeProp.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.angleOverride = entity_data.get('angleoverride', None)  # Type: string
-
-
-class prop_dynamic_ornament(prop_dynamic_base):
-    def __init__(self):
-        super(prop_dynamic_base).__init__()
-        self.origin = [0, 0, 0]
-        self.InitialOwner = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        prop_dynamic_base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.InitialOwner = entity_data.get('initialowner', None)  # Type: string
-
-
-class func_areaportal(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.target = None  # Type: target_destination
-        self.StartOpen = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.PortalVersion = 1  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.StartOpen = entity_data.get('startopen', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.PortalVersion = int(entity_data.get('portalversion', 1))  # Type: integer
-
-
-class func_occluder(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.StartActive = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.StartActive = entity_data.get('startactive', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class func_breakable(RenderFields, BreakableBrush, Origin):
-    def __init__(self):
-        super(BreakableBrush).__init__()
-        super(RenderFields).__init__()
-        super(Shadow).__init__()
-        super(Origin).__init__()
-        self.minhealthdmg = None  # Type: integer
-        self._minlight = None  # Type: string
-        self.physdamagescale = 1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        RenderFields.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        BreakableBrush.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.minhealthdmg = int(entity_data.get('minhealthdmg', 0))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.physdamagescale = float(entity_data.get('physdamagescale', 1.0))  # Type: float
-
-
-class func_breakable_surf(RenderFields, BreakableBrush):
-    def __init__(self):
-        super(BreakableBrush).__init__()
-        super(RenderFields).__init__()
-        super(Shadow).__init__()
-        self.fragility = 100  # Type: integer
-        self.surfacetype = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        RenderFields.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        BreakableBrush.from_dict(instance, entity_data)
-        instance.fragility = int(entity_data.get('fragility', 100))  # Type: integer
-        instance.surfacetype = entity_data.get('surfacetype', None)  # Type: choices
-
-
-class func_conveyor(Parentname, Shadow, Targetname, RenderFields):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Shadow).__init__()
-        super(Targetname).__init__()
-        self.movedir = [0.0, 0.0, 0.0]  # Type: angle
-        self.speed = "100"  # Type: string
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        instance.movedir = parse_float_vector(entity_data.get('movedir', "0 0 0"))  # Type: angle
-        instance.speed = entity_data.get('speed', "100")  # Type: string
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_detail(DXLevelChoice):
-    def __init__(self):
-        super(DXLevelChoice).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        DXLevelChoice.from_dict(instance, entity_data)
-
-
-class func_viscluster(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class func_illusionary(Parentname, Origin, RenderFields, Shadow, Targetname):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-        super(Shadow).__init__()
-        super(Targetname).__init__()
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_precipitation(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.renderamt = 5  # Type: integer
-        self.rendercolor = [100, 100, 100]  # Type: color255
-        self.preciptype = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.renderamt = int(entity_data.get('renderamt', 5))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "100 100 100"))  # Type: color255
-        instance.preciptype = entity_data.get('preciptype', None)  # Type: choices
-
-
-class func_wall_toggle(func_wall):
-    def __init__(self):
-        super(func_wall).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        func_wall.from_dict(instance, entity_data)
-
-
-class func_guntarget(Parentname, Global, Targetname, RenderFields):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Targetname).__init__()
-        self.speed = 100  # Type: integer
-        self.target = None  # Type: target_destination
-        self.health = None  # Type: integer
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        instance.speed = int(entity_data.get('speed', 100))  # Type: integer
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.health = int(entity_data.get('health', 0))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_fish_pool(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.model = "models/Junkola.mdl"  # Type: studio
-        self.fish_count = 10  # Type: integer
-        self.max_range = 150  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.model = entity_data.get('model', "models/Junkola.mdl")  # Type: studio
-        instance.fish_count = int(entity_data.get('fish_count', 10))  # Type: integer
-        instance.max_range = float(entity_data.get('max_range', 150))  # Type: float
-
-
-class PlatSounds(Base):
-    def __init__(self):
-        super().__init__()
-        self.movesnd = None  # Type: choices
-        self.stopsnd = None  # Type: choices
-        self.volume = "0.85"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.movesnd = entity_data.get('movesnd', None)  # Type: choices
-        instance.stopsnd = entity_data.get('stopsnd', None)  # Type: choices
-        instance.volume = entity_data.get('volume', "0.85")  # Type: string
-
-
-class Trackchange(Parentname, Global, PlatSounds, RenderFields, Targetname):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(PlatSounds).__init__()
-        super(Targetname).__init__()
-        self.height = None  # Type: integer
-        self.rotation = None  # Type: integer
-        self.train = None  # Type: target_destination
-        self.toptrack = None  # Type: target_destination
-        self.bottomtrack = None  # Type: target_destination
-        self.speed = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        PlatSounds.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.height = int(entity_data.get('height', 0))  # Type: integer
-        instance.rotation = int(entity_data.get('rotation', 0))  # Type: integer
-        instance.train = entity_data.get('train', None)  # Type: target_destination
-        instance.toptrack = entity_data.get('toptrack', None)  # Type: target_destination
-        instance.bottomtrack = entity_data.get('bottomtrack', None)  # Type: target_destination
-        instance.speed = int(entity_data.get('speed', 0))  # Type: integer
-
-
-class BaseTrain(Parentname, Global, Origin, RenderFields, Targetname, Shadow):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Origin).__init__()
-        super(Targetname).__init__()
-        super(Shadow).__init__()
-        self.target = None  # Type: target_destination
-        self.startspeed = 100  # Type: integer
-        self.speed = None  # Type: integer
-        self.velocitytype = None  # Type: choices
-        self.orientationtype = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.wheels = 50  # Type: integer
-        self.height = 4  # Type: integer
-        self.bank = "0"  # Type: string
-        self.dmg = None  # Type: integer
-        self._minlight = None  # Type: string
-        self.MoveSound = None  # Type: sound
-        self.MovePingSound = None  # Type: sound
-        self.StartSound = None  # Type: sound
-        self.StopSound = None  # Type: sound
-        self.volume = 10  # Type: integer
-        self.MoveSoundMinPitch = 60  # Type: integer
-        self.MoveSoundMaxPitch = 200  # Type: integer
-        self.MoveSoundMinTime = None  # Type: float
-        self.MoveSoundMaxTime = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.startspeed = int(entity_data.get('startspeed', 100))  # Type: integer
-        instance.speed = int(entity_data.get('speed', 0))  # Type: integer
-        instance.velocitytype = entity_data.get('velocitytype', None)  # Type: choices
-        instance.orientationtype = entity_data.get('orientationtype', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.wheels = int(entity_data.get('wheels', 50))  # Type: integer
-        instance.height = int(entity_data.get('height', 4))  # Type: integer
-        instance.bank = entity_data.get('bank', "0")  # Type: string
-        instance.dmg = int(entity_data.get('dmg', 0))  # Type: integer
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-        instance.MoveSound = entity_data.get('movesound', None)  # Type: sound
-        instance.MovePingSound = entity_data.get('movepingsound', None)  # Type: sound
-        instance.StartSound = entity_data.get('startsound', None)  # Type: sound
-        instance.StopSound = entity_data.get('stopsound', None)  # Type: sound
-        instance.volume = int(entity_data.get('volume', 10))  # Type: integer
-        instance.MoveSoundMinPitch = int(entity_data.get('movesoundminpitch', 60))  # Type: integer
-        instance.MoveSoundMaxPitch = int(entity_data.get('movesoundmaxpitch', 200))  # Type: integer
-        instance.MoveSoundMinTime = float(entity_data.get('movesoundmintime', 0))  # Type: float
-        instance.MoveSoundMaxTime = float(entity_data.get('movesoundmaxtime', 0))  # Type: float
-
-
-class func_trackautochange(Trackchange):
-    def __init__(self):
-        super(Trackchange).__init__()
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trackchange.from_dict(instance, entity_data)
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_trackchange(Trackchange):
-    def __init__(self):
-        super(Trackchange).__init__()
-        self._minlight = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trackchange.from_dict(instance, entity_data)
-        instance._minlight = entity_data.get('_minlight', None)  # Type: string
-
-
-class func_tracktrain(BaseTrain):
-    def __init__(self):
-        super(BaseTrain).__init__()
-        self.ManualSpeedChanges = None  # Type: choices
-        self.ManualAccelSpeed = None  # Type: float
-        self.ManualDecelSpeed = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseTrain.from_dict(instance, entity_data)
-        instance.ManualSpeedChanges = entity_data.get('manualspeedchanges', None)  # Type: choices
-        instance.ManualAccelSpeed = float(entity_data.get('manualaccelspeed', 0))  # Type: float
-        instance.ManualDecelSpeed = float(entity_data.get('manualdecelspeed', 0))  # Type: float
-
-
-class func_tanktrain(BaseTrain):
-    def __init__(self):
-        super(BaseTrain).__init__()
-        self.health = 100  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseTrain.from_dict(instance, entity_data)
-        instance.health = int(entity_data.get('health', 100))  # Type: integer
-
-
-class func_traincontrols(Parentname, Global):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Global).__init__()
-        self.target = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-
-
-class tanktrain_aitarget(Targetname):
-    icon_sprite = "editor/tanktrain_aitarget.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.newtarget = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.newtarget = entity_data.get('newtarget', None)  # Type: target_destination
-
-
-class tanktrain_ai(Targetname):
-    icon_sprite = "editor/tanktrain_ai.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.startsound = "vehicles/diesel_start1.wav"  # Type: sound
-        self.enginesound = "vehicles/diesel_turbo_loop1.wav"  # Type: sound
-        self.movementsound = "vehicles/tank_treads_loop1.wav"  # Type: sound
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.startsound = entity_data.get('startsound', "vehicles/diesel_start1.wav")  # Type: sound
-        instance.enginesound = entity_data.get('enginesound', "vehicles/diesel_turbo_loop1.wav")  # Type: sound
-        instance.movementsound = entity_data.get('movementsound', "vehicles/tank_treads_loop1.wav")  # Type: sound
-
-
-class path_track(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.altpath = None  # Type: target_destination
-        self.speed = None  # Type: float
-        self.radius = None  # Type: float
-        self.orientationtype = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.altpath = entity_data.get('altpath', None)  # Type: target_destination
-        instance.speed = float(entity_data.get('speed', 0))  # Type: float
-        instance.radius = float(entity_data.get('radius', 0))  # Type: float
-        instance.orientationtype = entity_data.get('orientationtype', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class test_traceline(Angles):
-    def __init__(self):
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class trigger_autosave(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.master = None  # Type: string
-        self.NewLevelUnit = None  # Type: choices
-        self.DangerousTimer = None  # Type: float
-        self.MinimumHitPoints = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.master = entity_data.get('master', None)  # Type: string
-        instance.NewLevelUnit = entity_data.get('newlevelunit', None)  # Type: choices
-        instance.DangerousTimer = float(entity_data.get('dangeroustimer', 0))  # Type: float
-        instance.MinimumHitPoints = int(entity_data.get('minimumhitpoints', 0))  # Type: integer
-
-
-class trigger_changelevel(EnableDisable):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        self.targetname = None  # Type: target_source
-        self.map = None  # Type: string
-        self.landmark = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        instance.targetname = entity_data.get('targetname', None)  # Type: target_source
-        instance.map = entity_data.get('map', None)  # Type: string
-        instance.landmark = entity_data.get('landmark', None)  # Type: target_destination
-
-
-class trigger_gravity(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.gravity = 1  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.gravity = int(entity_data.get('gravity', 1))  # Type: integer
-
-
-class trigger_playermovement(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-
-
-class trigger_soundscape(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.soundscape = None  # Type: target_source
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.soundscape = entity_data.get('soundscape', None)  # Type: target_source
-
-
-class trigger_hurt(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Targetname).__init__()
-        self.master = None  # Type: string
-        self.damage = 10  # Type: integer
-        self.damagecap = 20  # Type: integer
-        self.damagetype = None  # Type: choices
-        self.damagemodel = None  # Type: choices
-        self.nodmgforce = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.master = entity_data.get('master', None)  # Type: string
-        instance.damage = int(entity_data.get('damage', 10))  # Type: integer
-        instance.damagecap = int(entity_data.get('damagecap', 20))  # Type: integer
-        instance.damagetype = entity_data.get('damagetype', None)  # Type: choices
-        instance.damagemodel = entity_data.get('damagemodel', None)  # Type: choices
-        instance.nodmgforce = entity_data.get('nodmgforce', None)  # Type: choices
-
-
-class trigger_remove(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class trigger_multiple(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.wait = 1  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.wait = int(entity_data.get('wait', 1))  # Type: integer
-
-
-class trigger_once(TriggerOnce):
-    def __init__(self):
-        super(TriggerOnce).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TriggerOnce.from_dict(instance, entity_data)
-
-
-class trigger_look(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.target = None  # Type: target_destination
-        self.LookTime = "0.5"  # Type: string
-        self.FieldOfView = "0.9"  # Type: string
-        self.Timeout = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.LookTime = entity_data.get('looktime', "0.5")  # Type: string
-        instance.FieldOfView = entity_data.get('fieldofview', "0.9")  # Type: string
-        instance.Timeout = float(entity_data.get('timeout', 0))  # Type: float
-
-
-class trigger_push(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.pushdir = [0.0, 0.0, 0.0]  # Type: angle
-        self.speed = 40  # Type: integer
-        self.alternateticksfix = 0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.pushdir = parse_float_vector(entity_data.get('pushdir', "0 0 0"))  # Type: angle
-        instance.speed = int(entity_data.get('speed', 40))  # Type: integer
-        instance.alternateticksfix = float(entity_data.get('alternateticksfix', 0))  # Type: float
-
-
-class trigger_wind(Trigger, Angles):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Angles).__init__()
-        self.Speed = 200  # Type: integer
-        self.SpeedNoise = None  # Type: integer
-        self.DirectionNoise = 10  # Type: integer
-        self.HoldTime = None  # Type: integer
-        self.HoldNoise = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.Speed = int(entity_data.get('speed', 200))  # Type: integer
-        instance.SpeedNoise = int(entity_data.get('speednoise', 0))  # Type: integer
-        instance.DirectionNoise = int(entity_data.get('directionnoise', 10))  # Type: integer
-        instance.HoldTime = int(entity_data.get('holdtime', 0))  # Type: integer
-        instance.HoldNoise = int(entity_data.get('holdnoise', 0))  # Type: integer
-
-
-class trigger_impact(Targetname, Angles, Origin):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(Origin).__init__()
-        self.Magnitude = 200  # Type: float
-        self.noise = 0.1  # Type: float
-        self.viewkick = 0.05  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.Magnitude = float(entity_data.get('magnitude', 200))  # Type: float
-        instance.noise = float(entity_data.get('noise', 0.1))  # Type: float
-        instance.viewkick = float(entity_data.get('viewkick', 0.05))  # Type: float
-
-
-class trigger_proximity(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.measuretarget = None  # Type: target_destination
-        self.radius = "256"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.measuretarget = entity_data.get('measuretarget', None)  # Type: target_destination
-        instance.radius = entity_data.get('radius', "256")  # Type: string
-
-
-class trigger_teleport(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.target = None  # Type: target_destination
-        self.landmark = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.landmark = entity_data.get('landmark', None)  # Type: target_destination
-
-
-class trigger_teleport_relative(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.teleportoffset = [0.0, 0.0, 0.0]  # Type: vector
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.teleportoffset = parse_float_vector(entity_data.get('teleportoffset', "0 0 0"))  # Type: vector
-
-
-class trigger_transition(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-
-
-class trigger_serverragdoll(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-
-
-class ai_speechfilter(ResponseContext, EnableDisable, Targetname):
-    def __init__(self):
-        super(ResponseContext).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.subject = None  # Type: target_destination
-        self.IdleModifier = 1.0  # Type: float
-        self.NeverSayHello = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        ResponseContext.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.subject = entity_data.get('subject', None)  # Type: target_destination
-        instance.IdleModifier = float(entity_data.get('idlemodifier', 1.0))  # Type: float
-        instance.NeverSayHello = entity_data.get('neversayhello', None)  # Type: choices
-
-
-class water_lod_control(Targetname):
-    icon_sprite = "editor/waterlodcontrol.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.cheapwaterstartdistance = 1000  # Type: float
-        self.cheapwaterenddistance = 2000  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.cheapwaterstartdistance = float(entity_data.get('cheapwaterstartdistance', 1000))  # Type: float
-        instance.cheapwaterenddistance = float(entity_data.get('cheapwaterenddistance', 2000))  # Type: float
-
-
-class info_camera_link(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.PointCamera = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.PointCamera = entity_data.get('pointcamera', None)  # Type: target_destination
-
-
-class logic_measure_movement(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.MeasureTarget = None  # Type: target_destination
-        self.MeasureReference = None  # Type: target_destination
-        self.Target = None  # Type: target_destination
-        self.TargetReference = None  # Type: target_destination
-        self.TargetScale = 1  # Type: float
-        self.MeasureType = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.MeasureTarget = entity_data.get('measuretarget', None)  # Type: target_destination
-        instance.MeasureReference = entity_data.get('measurereference', None)  # Type: target_destination
-        instance.Target = entity_data.get('target', None)  # Type: target_destination
-        instance.TargetReference = entity_data.get('targetreference', None)  # Type: target_destination
-        instance.TargetScale = float(entity_data.get('targetscale', 1))  # Type: float
-        instance.MeasureType = entity_data.get('measuretype', None)  # Type: choices
-
-
-class npc_furniture(Parentname, BaseNPC):
-    def __init__(self):
-        super(BaseNPC).__init__()
-        super(Parentname).__init__()
-        self.origin = [0, 0, 0]
-        self.model = None  # Type: studio
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseNPC.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.model = entity_data.get('model', None)  # Type: studio
-
-
-class env_credits(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class material_modify_control(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.materialName = None  # Type: string
-        self.materialVar = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.materialName = entity_data.get('materialname', None)  # Type: string
-        instance.materialVar = entity_data.get('materialvar', None)  # Type: string
-
-
-class point_devshot_camera(Angles):
-    viewport_model = "models/editor/camera.mdl"
-    def __init__(self):
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.cameraname = None  # Type: string
-        self.FOV = 75  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.cameraname = entity_data.get('cameraname', None)  # Type: string
-        instance.FOV = int(entity_data.get('fov', 75))  # Type: integer
-
-
-class logic_playerproxy(DamageFilter, Targetname):
-    def __init__(self):
-        super(DamageFilter).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        DamageFilter.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class env_spritetrail(Parentname, Targetname):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.lifetime = 0.5  # Type: float
-        self.startwidth = 8.0  # Type: float
-        self.endwidth = 1.0  # Type: float
-        self.spritename = "sprites/bluelaser1.vmt"  # Type: string
-        self.renderamt = 255  # Type: integer
-        self.rendercolor = [255, 255, 255]  # Type: color255
-        self.rendermode = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.lifetime = float(entity_data.get('lifetime', 0.5))  # Type: float
-        instance.startwidth = float(entity_data.get('startwidth', 8.0))  # Type: float
-        instance.endwidth = float(entity_data.get('endwidth', 1.0))  # Type: float
-        instance.spritename = entity_data.get('spritename', "sprites/bluelaser1.vmt")  # Type: string
-        instance.renderamt = int(entity_data.get('renderamt', 255))  # Type: integer
-        instance.rendercolor = parse_int_vector(entity_data.get('rendercolor', "255 255 255"))  # Type: color255
-        instance.rendermode = entity_data.get('rendermode', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class env_projectedtexture(Parentname, Targetname, Angles):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.target = None  # Type: target_destination
-        self.lightfov = 90.0  # Type: float
-        self.nearz = 4.0  # Type: float
-        self.farz = 750.0  # Type: float
-        self.enableshadows = None  # Type: choices
-        self.shadowquality = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.lightonlytarget = None  # Type: choices
-        self.lightworld = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.lightcolor = [255, 255, 255, 200]  # Type: color255
-        self.cameraspace = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.lightfov = float(entity_data.get('lightfov', 90.0))  # Type: float
-        instance.nearz = float(entity_data.get('nearz', 4.0))  # Type: float
-        instance.farz = float(entity_data.get('farz', 750.0))  # Type: float
-        instance.enableshadows = entity_data.get('enableshadows', None)  # Type: choices
-        instance.shadowquality = entity_data.get('shadowquality', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.lightonlytarget = entity_data.get('lightonlytarget', None)  # Type: choices
-        instance.lightworld = entity_data.get('lightworld', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.lightcolor = parse_int_vector(entity_data.get('lightcolor', "255 255 255 200"))  # Type: color255
-        instance.cameraspace = int(entity_data.get('cameraspace', 0))  # Type: integer
-
-
-class func_reflective_glass(func_brush):
-    def __init__(self):
-        super(func_brush).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        func_brush.from_dict(instance, entity_data)
-
-
-class env_particle_performance_monitor(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class npc_puppet(Parentname, Studiomodel, BaseNPC):
-    def __init__(self):
-        super(BaseNPC).__init__()
-        super(Parentname).__init__()
-        super(Studiomodel).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.animationtarget = None  # Type: target_source
-        self.attachmentname = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Studiomodel.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        BaseNPC.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.animationtarget = entity_data.get('animationtarget', None)  # Type: target_source
-        instance.attachmentname = entity_data.get('attachmentname', None)  # Type: string
-
-
-class point_gamestats_counter(EnableDisable, Targetname, Origin):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Origin).__init__()
-        self.origin = [0, 0, 0]
-        self.Name = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.Name = entity_data.get('name', None)  # Type: string
-
-
-class func_instance(Angles):
-    def __init__(self):
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.targetname = None  # Type: target_source
-        self.file = None  # Type: instance_file
-        self.fixup_style = None  # Type: choices
-        self.replace01 = None  # Type: instance_variable
-        self.replace02 = None  # Type: instance_variable
-        self.replace03 = None  # Type: instance_variable
-        self.replace04 = None  # Type: instance_variable
-        self.replace05 = None  # Type: instance_variable
-        self.replace06 = None  # Type: instance_variable
-        self.replace07 = None  # Type: instance_variable
-        self.replace08 = None  # Type: instance_variable
-        self.replace09 = None  # Type: instance_variable
-        self.replace10 = None  # Type: instance_variable
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.targetname = entity_data.get('targetname', None)  # Type: target_source
-        instance.file = entity_data.get('file', None)  # Type: instance_file
-        instance.fixup_style = entity_data.get('fixup_style', None)  # Type: choices
-        instance.replace01 = entity_data.get('replace01', None)  # Type: instance_variable
-        instance.replace02 = entity_data.get('replace02', None)  # Type: instance_variable
-        instance.replace03 = entity_data.get('replace03', None)  # Type: instance_variable
-        instance.replace04 = entity_data.get('replace04', None)  # Type: instance_variable
-        instance.replace05 = entity_data.get('replace05', None)  # Type: instance_variable
-        instance.replace06 = entity_data.get('replace06', None)  # Type: instance_variable
-        instance.replace07 = entity_data.get('replace07', None)  # Type: instance_variable
-        instance.replace08 = entity_data.get('replace08', None)  # Type: instance_variable
-        instance.replace09 = entity_data.get('replace09', None)  # Type: instance_variable
-        instance.replace10 = entity_data.get('replace10', None)  # Type: instance_variable
-
-
-class func_instance_parms(Base):
-    def __init__(self):
-        super().__init__()
-        self.origin = [0, 0, 0]
-        self.parm1 = None  # Type: instance_parm
-        self.parm2 = None  # Type: instance_parm
-        self.parm3 = None  # Type: instance_parm
-        self.parm4 = None  # Type: instance_parm
-        self.parm5 = None  # Type: instance_parm
-        self.parm6 = None  # Type: instance_parm
-        self.parm7 = None  # Type: instance_parm
-        self.parm8 = None  # Type: instance_parm
-        self.parm9 = None  # Type: instance_parm
-        self.parm10 = None  # Type: instance_parm
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.parm1 = entity_data.get('parm1', None)  # Type: instance_parm
-        instance.parm2 = entity_data.get('parm2', None)  # Type: instance_parm
-        instance.parm3 = entity_data.get('parm3', None)  # Type: instance_parm
-        instance.parm4 = entity_data.get('parm4', None)  # Type: instance_parm
-        instance.parm5 = entity_data.get('parm5', None)  # Type: instance_parm
-        instance.parm6 = entity_data.get('parm6', None)  # Type: instance_parm
-        instance.parm7 = entity_data.get('parm7', None)  # Type: instance_parm
-        instance.parm8 = entity_data.get('parm8', None)  # Type: instance_parm
-        instance.parm9 = entity_data.get('parm9', None)  # Type: instance_parm
-        instance.parm10 = entity_data.get('parm10', None)  # Type: instance_parm
-
-
-class trigger_apply_impulse(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.impulse_dir = [0.0, 0.0, 0.0]  # Type: angle
-        self.force = 300  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.impulse_dir = parse_float_vector(entity_data.get('impulse_dir', "0 0 0"))  # Type: angle
-        instance.force = float(entity_data.get('force', 300))  # Type: float
-
-
-class TeamNum(Base):
-    def __init__(self):
-        super().__init__()
-        self.TeamNum = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.TeamNum = entity_data.get('teamnum', None)  # Type: choices
-
-
-class MatchSummary(Base):
-    def __init__(self):
-        super().__init__()
-        self.MatchSummary = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.MatchSummary = entity_data.get('matchsummary', None)  # Type: choices
-
-
-class FadeDistance(Base):
-    def __init__(self):
-        super().__init__()
-        self.fademindist = -1  # Type: float
-        self.fademaxdist = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.fademindist = float(entity_data.get('fademindist', -1))  # Type: float
-        instance.fademaxdist = float(entity_data.get('fademaxdist', 0))  # Type: float
-
-
-class GameType(Base):
-    def __init__(self):
-        super().__init__()
-        self.GameType = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.GameType = entity_data.get('gametype', None)  # Type: choices
-
-
-class Condition(Base):
-    def __init__(self):
-        super().__init__()
-        self.condition = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.condition = entity_data.get('condition', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class PlayerTouch(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class Toggle(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class tf_gamerules(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.hud_type = None  # Type: choices
-        self.ctf_overtime = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.hud_type = entity_data.get('hud_type', None)  # Type: choices
-        instance.ctf_overtime = entity_data.get('ctf_overtime', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class info_player_teamspawn(TeamNum, MatchSummary, EnableDisable, Targetname, Angles):
-    model = "models/editor/playerstart.mdl"
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(MatchSummary).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.controlpoint = None  # Type: target_destination
-        self.SpawnMode = None  # Type: choices
-        self.round_bluespawn = None  # Type: target_destination
-        self.round_redspawn = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        MatchSummary.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.controlpoint = entity_data.get('controlpoint', None)  # Type: target_destination
-        instance.SpawnMode = entity_data.get('spawnmode', None)  # Type: choices
-        instance.round_bluespawn = entity_data.get('round_bluespawn', None)  # Type: target_destination
-        instance.round_redspawn = entity_data.get('round_redspawn', None)  # Type: target_destination
-
-
-class game_forcerespawn(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_teamflag(Parentname, GameType, TeamNum, EnableDisable, Targetname, Angles):
-    model = "models/flag/briefcase.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(GameType).__init__()
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.ReturnTime = 60  # Type: integer
-        self.NeutralType = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.ScoringType = None  # Type: choices
-        self.flag_model = "models/flag/briefcase.mdl"  # Type: string
-        self.flag_icon = "../hud/objectives_flagpanel_carried"  # Type: string
-        self.flag_paper = "player_intel_papertrail"  # Type: string
-        self.flag_trail = "flagtrail"  # Type: string
-        self.trail_effect = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.VisibleWhenDisabled = None  # Type: choices
-        self.ShotClockMode = None  # Type: choices
-        self.PointValue = None  # Type: integer
-        self.ReturnBetweenWaves = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.tags = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        GameType.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.ReturnTime = int(entity_data.get('returntime', 60))  # Type: integer
-        instance.NeutralType = entity_data.get('neutraltype', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.ScoringType = entity_data.get('scoringtype', None)  # Type: choices
-        instance.flag_model = entity_data.get('flag_model', "models/flag/briefcase.mdl")  # Type: string
-        instance.flag_icon = entity_data.get('flag_icon', "../hud/objectives_flagpanel_carried")  # Type: string
-        instance.flag_paper = entity_data.get('flag_paper', "player_intel_papertrail")  # Type: string
-        instance.flag_trail = entity_data.get('flag_trail', "flagtrail")  # Type: string
-        instance.trail_effect = entity_data.get('trail_effect', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.VisibleWhenDisabled = entity_data.get('visiblewhendisabled', None)  # Type: choices
-        instance.ShotClockMode = entity_data.get('shotclockmode', None)  # Type: choices
-        instance.PointValue = int(entity_data.get('pointvalue', 0))  # Type: integer
-        instance.ReturnBetweenWaves = entity_data.get('returnbetweenwaves', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.tags = entity_data.get('tags', None)  # Type: string
-
-
-class point_intermission(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class info_observer_point(Parentname, TeamNum, EnableDisable, Targetname, Angles):
-    viewport_model = "models/editor/camera.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.associated_team_entity = None  # Type: target_destination
-        self.defaultwelcome = None  # Type: choices
-        self.fov = None  # Type: float
-        self.match_summary = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.associated_team_entity = entity_data.get('associated_team_entity', None)  # Type: target_destination
-        instance.defaultwelcome = entity_data.get('defaultwelcome', None)  # Type: choices
-        instance.fov = float(entity_data.get('fov', 0))  # Type: float
-        instance.match_summary = entity_data.get('match_summary', None)  # Type: choices
-
-
-class game_round_win(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.TeamNum = None  # Type: choices
-        self.force_map_reset = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.switch_teams = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.TeamNum = entity_data.get('teamnum', None)  # Type: choices
-        instance.force_map_reset = entity_data.get('force_map_reset', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.switch_teams = entity_data.get('switch_teams', None)  # Type: choices
-
-
-class team_round_timer(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.timer_length = 600  # Type: integer
-        self.max_length = None  # Type: integer
-        self.start_paused = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.show_time_remaining = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.setup_length = None  # Type: integer
-        self.reset_time = None  # Type: choices
-        self.auto_countdown = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.show_in_hud = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.timer_length = int(entity_data.get('timer_length', 600))  # Type: integer
-        instance.max_length = int(entity_data.get('max_length', 0))  # Type: integer
-        instance.start_paused = entity_data.get('start_paused', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.show_time_remaining = entity_data.get('show_time_remaining', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.setup_length = int(entity_data.get('setup_length', 0))  # Type: integer
-        instance.reset_time = entity_data.get('reset_time', None)  # Type: choices
-        instance.auto_countdown = entity_data.get('auto_countdown', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.show_in_hud = entity_data.get('show_in_hud', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class Item(Toggle, PlayerTouch, FadeDistance, TeamNum, EnableDisable, Targetname, Angles):
-    def __init__(self):
-        super(Toggle).__init__()
-        super(PlayerTouch).__init__()
-        super(FadeDistance).__init__()
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.powerup_model = None  # Type: string
-        self.AutoMaterialize = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Toggle.from_dict(instance, entity_data)
-        PlayerTouch.from_dict(instance, entity_data)
-        FadeDistance.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.powerup_model = entity_data.get('powerup_model', None)  # Type: string
-        instance.AutoMaterialize = entity_data.get('automaterialize', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class item_healthkit_full(Item):
-    model = "models/items/medkit_large.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_healthkit_small(Item):
-    model = "models/items/medkit_small.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_healthkit_medium(Item):
-    model = "models/items/medkit_medium.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_ammopack_full(Item):
-    model = "models/items/ammopack_large.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_ammopack_small(Item):
-    model = "models/items/ammopack_small.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_ammopack_medium(Item):
-    model = "models/items/ammopack_medium.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_spell_pickup(Item):
-    model = "models/props_halloween/hwn_spellbook_flying.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-        self.tier = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.tier = entity_data.get('tier', None)  # Type: choices
-
-
-class item_bonuspack(Toggle, PlayerTouch, FadeDistance, TeamNum, EnableDisable, Targetname, Angles):
-    model = "models/crafting/moustachium.mdl"
-    def __init__(self):
-        super(Toggle).__init__()
-        super(PlayerTouch).__init__()
-        super(FadeDistance).__init__()
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.powerup_model = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Toggle.from_dict(instance, entity_data)
-        PlayerTouch.from_dict(instance, entity_data)
-        FadeDistance.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.powerup_model = entity_data.get('powerup_model', None)  # Type: string
-
-
-class tf_halloween_pickup(Parentname, Item):
-    model = "models/items/target_duck.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        super(Parentname).__init__()
-        self.origin = [0, 0, 0]
-        self.pickup_sound = None  # Type: string
-        self.pickup_particle = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.pickup_sound = entity_data.get('pickup_sound', None)  # Type: string
-        instance.pickup_particle = entity_data.get('pickup_particle', None)  # Type: string
-
-
-class info_powerup_spawn(EnableDisable, Targetname):
-    model = "models/pickups/pickup_powerup_regen.mdl"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class item_powerup_crit(EnableDisable, Targetname):
-    model = "models/pickups/pickup_powerup_crit.mdl"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class item_powerup_uber(EnableDisable, Targetname):
-    model = "models/pickups/pickup_powerup_uber.mdl"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class filter_activator_tfteam(BaseFilter, TeamNum):
-    icon_sprite = "editor/filter_team.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        super(TeamNum).__init__()
-        self.controlpoint = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        instance.controlpoint = entity_data.get('controlpoint', None)  # Type: target_destination
-
-
-class filter_tf_player_can_cap(BaseFilter, TeamNum):
-    icon_sprite = "editor/filter_team.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        super(TeamNum).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-
-
-class filter_tf_damaged_by_weapon_in_slot(BaseFilter):
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.weaponSlot = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.weaponSlot = entity_data.get('weaponslot', None)  # Type: choices
-
-
-class filter_tf_condition(BaseFilter, Condition):
-    def __init__(self):
-        super(BaseFilter).__init__()
-        super(Condition).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        Condition.from_dict(instance, entity_data)
-
-
-class filter_tf_class(BaseFilter):
-    icon_sprite = "editor/filter_class.vmt"
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.tfclass = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.tfclass = entity_data.get('tfclass', None)  # Type: choices
-
-
-class func_capturezone(EnableDisable, Targetname, TeamNum):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(TeamNum).__init__()
-        self.capturepoint = 1  # Type: integer
-        self.capture_delay = 1.1  # Type: float
-        self.capture_delay_offset = 0.025  # Type: float
-        self.shouldBlock = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        instance.capturepoint = int(entity_data.get('capturepoint', 1))  # Type: integer
-        instance.capture_delay = float(entity_data.get('capture_delay', 1.1))  # Type: float
-        instance.capture_delay_offset = float(entity_data.get('capture_delay_offset', 0.025))  # Type: float
-        instance.shouldBlock = entity_data.get('shouldblock', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class func_flagdetectionzone(Parentname, EnableDisable, Targetname, TeamNum):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(TeamNum).__init__()
-        self.alarm = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        instance.alarm = entity_data.get('alarm', None)  # Type: choices
-
-
-class func_nogrenades(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class func_achievement(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-        self.zone_id = None  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.zone_id = int(entity_data.get('zone_id', 0))  # Type: integer
-
-
-class func_nobuild(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-        self.AllowSentry = None  # Type: choices
-        self.AllowDispenser = None  # Type: choices
-        self.AllowTeleporters = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.AllowSentry = entity_data.get('allowsentry', None)  # Type: choices
-        instance.AllowDispenser = entity_data.get('allowdispenser', None)  # Type: choices
-        instance.AllowTeleporters = entity_data.get('allowteleporters', None)  # Type: choices
-
-
-class func_croc(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-        self.filtername = None  # Type: filterclass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.filtername = entity_data.get('filtername', None)  # Type: filterclass
-
-
-class func_suggested_build(Toggle, TeamNum, Origin, EnableDisable, Targetname):
-    def __init__(self):
-        super(Toggle).__init__()
-        super(TeamNum).__init__()
-        super(Origin).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.object_type = None  # Type: choices
-        self.face_entity = None  # Type: target_destination
-        self.face_entity_fov = 90  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Toggle.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.object_type = entity_data.get('object_type', None)  # Type: choices
-        instance.face_entity = entity_data.get('face_entity', None)  # Type: target_destination
-        instance.face_entity_fov = float(entity_data.get('face_entity_fov', 90))  # Type: float
-
-
-class func_regenerate(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-        self.associatedmodel = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.associatedmodel = entity_data.get('associatedmodel', None)  # Type: target_destination
-
-
-class func_powerupvolume(Toggle, TeamNum, Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Toggle).__init__()
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Toggle.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        Trigger.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class func_respawnflag(EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class func_respawnroom(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class func_flag_alert(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-        self.playsound = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.alert_delay = 10  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.playsound = entity_data.get('playsound', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.alert_delay = int(entity_data.get('alert_delay', 10))  # Type: integer
-
-
-class func_respawnroomvisualizer(Parentname, Global, Origin, RenderFields, EnableDisable, Targetname, Inputfilter, Shadow):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(Global).__init__()
-        super(Origin).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Inputfilter).__init__()
-        super(Shadow).__init__()
-        self.respawnroomname = None  # Type: target_destination
-        self.Solidity = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.vrad_brush_cast_shadows = None  # Type: choices
-        self.solid_to_enemies = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Global.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Inputfilter.from_dict(instance, entity_data)
-        Shadow.from_dict(instance, entity_data)
-        instance.respawnroomname = entity_data.get('respawnroomname', None)  # Type: target_destination
-        instance.Solidity = entity_data.get('solidity', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.vrad_brush_cast_shadows = entity_data.get('vrad_brush_cast_shadows', None)  # Type: choices
-        instance.solid_to_enemies = entity_data.get('solid_to_enemies', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class func_forcefield(Parentname, TeamNum, Origin, RenderFields, EnableDisable, Targetname):
-    def __init__(self):
-        super(RenderFields).__init__()
-        super(Parentname).__init__()
-        super(TeamNum).__init__()
-        super(Origin).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        RenderFields.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class func_changeclass(TeamNum, EnableDisable, Toggle, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class game_intro_viewpoint(Angles):
-    viewport_model = "models/editor/camera.mdl"
-    def __init__(self):
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.TeamNum = None  # Type: choices
-        self.step_number = 1  # Type: integer
-        self.time_delay = 12  # Type: float
-        self.hint_message = None  # Type: string
-        self.event_to_fire = None  # Type: string
-        self.event_delay = 3  # Type: float
-        self.event_data_int = None  # Type: integer
-        self.fov = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.TeamNum = entity_data.get('teamnum', None)  # Type: choices
-        instance.step_number = int(entity_data.get('step_number', 1))  # Type: integer
-        instance.time_delay = float(entity_data.get('time_delay', 12))  # Type: float
-        instance.hint_message = entity_data.get('hint_message', None)  # Type: string
-        instance.event_to_fire = entity_data.get('event_to_fire', None)  # Type: string
-        instance.event_delay = float(entity_data.get('event_delay', 3))  # Type: float
-        instance.event_data_int = int(entity_data.get('event_data_int', 0))  # Type: integer
-        instance.fov = float(entity_data.get('fov', 0))  # Type: float
-
-
-class func_proprrespawnzone(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-
-
-class team_control_point(EnableDisable, Targetname, Angles, Parentname):
-    model = "models/effects/cappoint_hologram.mdl"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(Parentname).__init__()
-        self.origin = [0, 0, 0]
-        self.point_start_locked = None  # Type: choices
-        self.point_printname = "TODO: Set Name"  # Type: string
-        self.point_group = None  # Type: integer
-        self.point_default_owner = None  # Type: choices
-        self.point_index = None  # Type: integer
-        self.point_warn_on_cap = None  # Type: choices
-        self.point_warn_sound = "ControlPoint.CaptureWarn"  # Type: string
-        self.random_owner_on_restart = None  # Type: choices
-        self.team_timedpoints_2 = None  # Type: integer
-        self.team_timedpoints_3 = None  # Type: integer
-        self.team_capsound_0 = None  # Type: sound
-        self.team_capsound_2 = None  # Type: sound
-        self.team_capsound_3 = None  # Type: sound
-        self.team_model_0 = "models/effects/cappoint_hologram.mdl"  # Type: studio
-        self.team_model_2 = "models/effects/cappoint_hologram.mdl"  # Type: studio
-        self.team_model_3 = "models/effects/cappoint_hologram.mdl"  # Type: studio
-        self.team_bodygroup_0 = 3  # Type: integer
-        self.team_bodygroup_2 = 1  # Type: integer
-        self.team_bodygroup_3 = 1  # Type: integer
-        self.team_icon_0 = "sprites/obj_icons/icon_obj_neutral"  # Type: material
-        self.team_icon_2 = "sprites/obj_icons/icon_obj_red"  # Type: material
-        self.team_icon_3 = "sprites/obj_icons/icon_obj_blu"  # Type: material
-        self.team_overlay_0 = None  # Type: material
-        self.team_overlay_2 = None  # Type: material
-        self.team_overlay_3 = None  # Type: material
-        self.team_previouspoint_2_0 = None  # Type: target_source
-        self.team_previouspoint_2_1 = None  # Type: target_source
-        self.team_previouspoint_2_2 = None  # Type: target_source
-        self.team_previouspoint_3_0 = None  # Type: target_source
-        self.team_previouspoint_3_1 = None  # Type: target_source
-        self.team_previouspoint_3_2 = None  # Type: target_source
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Parentname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.point_start_locked = entity_data.get('point_start_locked', None)  # Type: choices
-        instance.point_printname = entity_data.get('point_printname', "TODO: Set Name")  # Type: string
-        instance.point_group = int(entity_data.get('point_group', 0))  # Type: integer
-        instance.point_default_owner = entity_data.get('point_default_owner', None)  # Type: choices
-        instance.point_index = int(entity_data.get('point_index', 0))  # Type: integer
-        instance.point_warn_on_cap = entity_data.get('point_warn_on_cap', None)  # Type: choices
-        instance.point_warn_sound = entity_data.get('point_warn_sound', "ControlPoint.CaptureWarn")  # Type: string
-        instance.random_owner_on_restart = entity_data.get('random_owner_on_restart', None)  # Type: choices
-        instance.team_timedpoints_2 = int(entity_data.get('team_timedpoints_2', 0))  # Type: integer
-        instance.team_timedpoints_3 = int(entity_data.get('team_timedpoints_3', 0))  # Type: integer
-        instance.team_capsound_0 = entity_data.get('team_capsound_0', None)  # Type: sound
-        instance.team_capsound_2 = entity_data.get('team_capsound_2', None)  # Type: sound
-        instance.team_capsound_3 = entity_data.get('team_capsound_3', None)  # Type: sound
-        instance.team_model_0 = entity_data.get('team_model_0', "models/effects/cappoint_hologram.mdl")  # Type: studio
-        instance.team_model_2 = entity_data.get('team_model_2', "models/effects/cappoint_hologram.mdl")  # Type: studio
-        instance.team_model_3 = entity_data.get('team_model_3', "models/effects/cappoint_hologram.mdl")  # Type: studio
-        instance.team_bodygroup_0 = int(entity_data.get('team_bodygroup_0', 3))  # Type: integer
-        instance.team_bodygroup_2 = int(entity_data.get('team_bodygroup_2', 1))  # Type: integer
-        instance.team_bodygroup_3 = int(entity_data.get('team_bodygroup_3', 1))  # Type: integer
-        instance.team_icon_0 = entity_data.get('team_icon_0', "sprites/obj_icons/icon_obj_neutral")  # Type: material
-        instance.team_icon_2 = entity_data.get('team_icon_2', "sprites/obj_icons/icon_obj_red")  # Type: material
-        instance.team_icon_3 = entity_data.get('team_icon_3', "sprites/obj_icons/icon_obj_blu")  # Type: material
-        instance.team_overlay_0 = entity_data.get('team_overlay_0', None)  # Type: material
-        instance.team_overlay_2 = entity_data.get('team_overlay_2', None)  # Type: material
-        instance.team_overlay_3 = entity_data.get('team_overlay_3', None)  # Type: material
-        instance.team_previouspoint_2_0 = entity_data.get('team_previouspoint_2_0', None)  # Type: target_source
-        instance.team_previouspoint_2_1 = entity_data.get('team_previouspoint_2_1', None)  # Type: target_source
-        instance.team_previouspoint_2_2 = entity_data.get('team_previouspoint_2_2', None)  # Type: target_source
-        instance.team_previouspoint_3_0 = entity_data.get('team_previouspoint_3_0', None)  # Type: target_source
-        instance.team_previouspoint_3_1 = entity_data.get('team_previouspoint_3_1', None)  # Type: target_source
-        instance.team_previouspoint_3_2 = entity_data.get('team_previouspoint_3_2', None)  # Type: target_source
-
-
-class team_control_point_round(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.cpr_printname = None  # Type: string
-        self.cpr_priority = None  # Type: integer
-        self.cpr_cp_names = None  # Type: string
-        self.cpr_restrict_team_cap_win = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.cpr_printname = entity_data.get('cpr_printname', None)  # Type: string
-        instance.cpr_priority = int(entity_data.get('cpr_priority', 0))  # Type: integer
-        instance.cpr_cp_names = entity_data.get('cpr_cp_names', None)  # Type: string
-        instance.cpr_restrict_team_cap_win = entity_data.get('cpr_restrict_team_cap_win', None)  # Type: choices
-
-
-class team_control_point_master(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.team_base_icon_2 = "sprites/obj_icons/icon_base_red"  # Type: material
-        self.team_base_icon_3 = "sprites/obj_icons/icon_base_blu"  # Type: material
-        self.caplayout = None  # Type: string
-        self.custom_position_x = -1  # Type: float
-        self.custom_position_y = -1  # Type: float
-        self.cpm_restrict_team_cap_win = None  # Type: choices
-        self.switch_teams = None  # Type: choices
-        self.score_style = None  # Type: choices
-        self.play_all_rounds = None  # Type: choices
-        self.partial_cap_points_rate = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.team_base_icon_2 = entity_data.get('team_base_icon_2', "sprites/obj_icons/icon_base_red")  # Type: material
-        instance.team_base_icon_3 = entity_data.get('team_base_icon_3', "sprites/obj_icons/icon_base_blu")  # Type: material
-        instance.caplayout = entity_data.get('caplayout', None)  # Type: string
-        instance.custom_position_x = float(entity_data.get('custom_position_x', -1))  # Type: float
-        instance.custom_position_y = float(entity_data.get('custom_position_y', -1))  # Type: float
-        instance.cpm_restrict_team_cap_win = entity_data.get('cpm_restrict_team_cap_win', None)  # Type: choices
-        instance.switch_teams = entity_data.get('switch_teams', None)  # Type: choices
-        instance.score_style = entity_data.get('score_style', None)  # Type: choices
-        instance.play_all_rounds = entity_data.get('play_all_rounds', None)  # Type: choices
-        instance.partial_cap_points_rate = float(entity_data.get('partial_cap_points_rate', 0))  # Type: float
-
-
-class trigger_capture_area(EnableDisable, Targetname, Parentname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Parentname).__init__()
-        self.area_cap_point = None  # Type: target_source
-        self.team_cancap_2 = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.team_cancap_3 = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.team_startcap_2 = 1  # Type: integer
-        self.team_startcap_3 = 1  # Type: integer
-        self.team_numcap_2 = 1  # Type: integer
-        self.team_numcap_3 = 1  # Type: integer
-        self.team_spawn_2 = None  # Type: integer
-        self.team_spawn_3 = None  # Type: integer
-        self.area_time_to_cap = 5  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Parentname.from_dict(instance, entity_data)
-        instance.area_cap_point = entity_data.get('area_cap_point', None)  # Type: target_source
-        instance.team_cancap_2 = entity_data.get('team_cancap_2', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.team_cancap_3 = entity_data.get('team_cancap_3', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.team_startcap_2 = int(entity_data.get('team_startcap_2', 1))  # Type: integer
-        instance.team_startcap_3 = int(entity_data.get('team_startcap_3', 1))  # Type: integer
-        instance.team_numcap_2 = int(entity_data.get('team_numcap_2', 1))  # Type: integer
-        instance.team_numcap_3 = int(entity_data.get('team_numcap_3', 1))  # Type: integer
-        instance.team_spawn_2 = int(entity_data.get('team_spawn_2', 0))  # Type: integer
-        instance.team_spawn_3 = int(entity_data.get('team_spawn_3', 0))  # Type: integer
-        instance.area_time_to_cap = int(entity_data.get('area_time_to_cap', 5))  # Type: integer
-
-
-class team_train_watcher(TeamNum, EnableDisable, Targetname):
-    def __init__(self):
-        super(TeamNum).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.train_can_recede = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.train_recede_time = None  # Type: integer
-        self.handle_train_movement = None  # Type: choices
-        self.speed_forward_modifier = 1  # Type: float
-        self.env_spark_name = None  # Type: string
-        self.train = None  # Type: target_destination
-        self.start_node = None  # Type: target_destination
-        self.goal_node = None  # Type: target_destination
-        self.linked_pathtrack_1 = None  # Type: target_destination
-        self.linked_cp_1 = None  # Type: target_destination
-        self.linked_pathtrack_2 = None  # Type: target_destination
-        self.linked_cp_2 = None  # Type: target_destination
-        self.linked_pathtrack_3 = None  # Type: target_destination
-        self.linked_cp_3 = None  # Type: target_destination
-        self.linked_pathtrack_4 = None  # Type: target_destination
-        self.linked_cp_4 = None  # Type: target_destination
-        self.linked_pathtrack_5 = None  # Type: target_destination
-        self.linked_cp_5 = None  # Type: target_destination
-        self.linked_pathtrack_6 = None  # Type: target_destination
-        self.linked_cp_6 = None  # Type: target_destination
-        self.linked_pathtrack_7 = None  # Type: target_destination
-        self.linked_cp_7 = None  # Type: target_destination
-        self.linked_pathtrack_8 = None  # Type: target_destination
-        self.linked_cp_8 = None  # Type: target_destination
-        self.hud_min_speed_level_1 = 30  # Type: float
-        self.hud_min_speed_level_2 = 60  # Type: float
-        self.hud_min_speed_level_3 = 90  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        TeamNum.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.train_can_recede = entity_data.get('train_can_recede', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.train_recede_time = int(entity_data.get('train_recede_time', 0))  # Type: integer
-        instance.handle_train_movement = entity_data.get('handle_train_movement', None)  # Type: choices
-        instance.speed_forward_modifier = float(entity_data.get('speed_forward_modifier', 1))  # Type: float
-        instance.env_spark_name = entity_data.get('env_spark_name', None)  # Type: string
-        instance.train = entity_data.get('train', None)  # Type: target_destination
-        instance.start_node = entity_data.get('start_node', None)  # Type: target_destination
-        instance.goal_node = entity_data.get('goal_node', None)  # Type: target_destination
-        instance.linked_pathtrack_1 = entity_data.get('linked_pathtrack_1', None)  # Type: target_destination
-        instance.linked_cp_1 = entity_data.get('linked_cp_1', None)  # Type: target_destination
-        instance.linked_pathtrack_2 = entity_data.get('linked_pathtrack_2', None)  # Type: target_destination
-        instance.linked_cp_2 = entity_data.get('linked_cp_2', None)  # Type: target_destination
-        instance.linked_pathtrack_3 = entity_data.get('linked_pathtrack_3', None)  # Type: target_destination
-        instance.linked_cp_3 = entity_data.get('linked_cp_3', None)  # Type: target_destination
-        instance.linked_pathtrack_4 = entity_data.get('linked_pathtrack_4', None)  # Type: target_destination
-        instance.linked_cp_4 = entity_data.get('linked_cp_4', None)  # Type: target_destination
-        instance.linked_pathtrack_5 = entity_data.get('linked_pathtrack_5', None)  # Type: target_destination
-        instance.linked_cp_5 = entity_data.get('linked_cp_5', None)  # Type: target_destination
-        instance.linked_pathtrack_6 = entity_data.get('linked_pathtrack_6', None)  # Type: target_destination
-        instance.linked_cp_6 = entity_data.get('linked_cp_6', None)  # Type: target_destination
-        instance.linked_pathtrack_7 = entity_data.get('linked_pathtrack_7', None)  # Type: target_destination
-        instance.linked_cp_7 = entity_data.get('linked_cp_7', None)  # Type: target_destination
-        instance.linked_pathtrack_8 = entity_data.get('linked_pathtrack_8', None)  # Type: target_destination
-        instance.linked_cp_8 = entity_data.get('linked_cp_8', None)  # Type: target_destination
-        instance.hud_min_speed_level_1 = float(entity_data.get('hud_min_speed_level_1', 30))  # Type: float
-        instance.hud_min_speed_level_2 = float(entity_data.get('hud_min_speed_level_2', 60))  # Type: float
-        instance.hud_min_speed_level_3 = float(entity_data.get('hud_min_speed_level_3', 90))  # Type: float
-
-
-class game_text_tf(Targetname):
-    icon_sprite = "editor/game_text.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.message = None  # Type: string
-        self.icon = None  # Type: string
-        self.display_to_team = None  # Type: choices
-        self.background = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.message = entity_data.get('message', None)  # Type: string
-        instance.icon = entity_data.get('icon', None)  # Type: string
-        instance.display_to_team = entity_data.get('display_to_team', None)  # Type: choices
-        instance.background = entity_data.get('background', None)  # Type: choices
-
-
-class BaseObject(Base):
-    def __init__(self):
-        super().__init__()
-        self.TeamNum = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-        instance.TeamNum = entity_data.get('teamnum', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class obj_dispenser(Parentname, BaseObject, Targetname, Angles):
-    model = "models/buildables/dispenser_light.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.defaultupgrade = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.defaultupgrade = entity_data.get('defaultupgrade', None)  # Type: choices
-
-
-class obj_sentrygun(Parentname, BaseObject, Targetname, Angles):
-    model = "models/buildables/sentry3.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.defaultupgrade = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.defaultupgrade = entity_data.get('defaultupgrade', None)  # Type: choices
-
-
-class obj_teleporter(Parentname, BaseObject, Targetname, Angles):
-    model = "models/buildables/teleporter_light.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.defaultupgrade = None  # Type: choices
-        self.teleporterType = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.matchingTeleporter = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.defaultupgrade = entity_data.get('defaultupgrade', None)  # Type: choices
-        instance.teleporterType = entity_data.get('teleportertype', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.matchingTeleporter = entity_data.get('matchingteleporter', None)  # Type: target_destination
-
-
-class bot_hint_sentrygun(Parentname, BaseObject, EnableDisable, Targetname, Angles):
-    model = "models/buildables/sentry3.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.sequence = 5  # Type: integer
-        self.sticky = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.sequence = int(entity_data.get('sequence', 5))  # Type: integer
-        instance.sticky = entity_data.get('sticky', None)  # Type: choices
-
-
-class bot_hint_teleporter_exit(Parentname, BaseObject, EnableDisable, Targetname, Angles):
-    model = "models/buildables/teleporter_blueprint_exit.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class bot_hint_engineer_nest(Parentname, BaseObject, EnableDisable, Targetname, Angles):
-    model = "models/bots/engineer/bot_engineer.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class bot_hint_sniper_spot(Parentname, BaseObject, Targetname, Angles):
-    model = "models/player/sniper.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.radius = 100  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.radius = float(entity_data.get('radius', 100))  # Type: float
-
-
-class mapobj_cart_dispenser(Parentname, BaseObject, Targetname):
-    icon_sprite = "editor/bullseye.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(BaseObject).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.touch_trigger = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        BaseObject.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.touch_trigger = entity_data.get('touch_trigger', None)  # Type: target_destination
-
-
-class dispenser_touch_trigger(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class tf_logic_arena(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.CapEnableDelay = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.CapEnableDelay = float(entity_data.get('capenabledelay', 0))  # Type: float
-
-
-class tf_logic_competitive(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_mannpower(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class bot_controller(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.TeamNum = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.bot_class = None  # Type: choices
-        self.bot_name = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.TeamNum = entity_data.get('teamnum', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.bot_class = entity_data.get('bot_class', None)  # Type: choices
-        instance.bot_name = entity_data.get('bot_name', None)  # Type: string
-
-
-class tf_logic_training_mode(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.nextMap = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.nextMap = entity_data.get('nextmap', None)  # Type: choices
-
-
-class boss_alpha(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class base_boss(Parentname, Targetname, Angles, TeamNum):
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(TeamNum).__init__()
-        self.origin = [0, 0, 0]
-        self.health = 1000  # Type: integer
-        self.model = "models/bots/boss_bot/boss_tank.mdl"  # Type: string
-        self.speed = 75  # Type: float
-        self.start_disabled = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.health = int(entity_data.get('health', 1000))  # Type: integer
-        instance.model = entity_data.get('model', "models/bots/boss_bot/boss_tank.mdl")  # Type: string
-        instance.speed = float(entity_data.get('speed', 75))  # Type: float
-        instance.start_disabled = entity_data.get('start_disabled', None)  # Type: choices
-
-
-class tank_boss(base_boss):
-    def __init__(self):
-        super(base_boss).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        base_boss.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_multiple_escort(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_koth(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.timer_length = 180  # Type: integer
-        self.unlock_point = 30  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.timer_length = int(entity_data.get('timer_length', 180))  # Type: integer
-        instance.unlock_point = int(entity_data.get('unlock_point', 30))  # Type: integer
-
-
-class tf_robot_destruction_robot_spawn(Parentname, Targetname, Angles):
-    model = "models/bots/bot_worker/bot_worker_a.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.health = 500  # Type: integer
-        self.gibs = None  # Type: integer
-        self.type = None  # Type: choices
-        self.spawngroup = None  # Type: target_source
-        self.startpath = None  # Type: target_source
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.health = int(entity_data.get('health', 500))  # Type: integer
-        instance.gibs = int(entity_data.get('gibs', 0))  # Type: integer
-        instance.type = entity_data.get('type', None)  # Type: choices
-        instance.spawngroup = entity_data.get('spawngroup', None)  # Type: target_source
-        instance.startpath = entity_data.get('startpath', None)  # Type: target_source
-
-
-class tf_robot_destruction_spawn_group(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.respawn_time = None  # Type: float
-        self.group_number = None  # Type: integer
-        self.team_number = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.hud_icon = "../HUD/hud_bot_worker_outline_blue"  # Type: string
-        self.respawn_reduction_scale = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.respawn_time = float(entity_data.get('respawn_time', 0))  # Type: float
-        instance.group_number = int(entity_data.get('group_number', 0))  # Type: integer
-        instance.team_number = entity_data.get('team_number', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.hud_icon = entity_data.get('hud_icon', "../HUD/hud_bot_worker_outline_blue")  # Type: string
-        instance.respawn_reduction_scale = float(entity_data.get('respawn_reduction_scale', 0))  # Type: float
-
-
-class RobotDestruction(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class tf_logic_robot_destruction(Targetname, RobotDestruction):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(RobotDestruction).__init__()
-        self.origin = [0, 0, 0]
-        self.score_interval = 1  # Type: float
-        self.loser_respawn_bonus_per_bot = None  # Type: float
-        self.red_respawn_time = 10  # Type: float
-        self.blue_respawn_time = 10  # Type: float
-        self.max_points = 200  # Type: integer
-        self.finale_length = 30  # Type: float
-        self.res_file = "resource/UI/HudObjectiveRobotDestruction.res"  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        RobotDestruction.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.score_interval = float(entity_data.get('score_interval', 1))  # Type: float
-        instance.loser_respawn_bonus_per_bot = float(entity_data.get('loser_respawn_bonus_per_bot', 0))  # Type: float
-        instance.red_respawn_time = float(entity_data.get('red_respawn_time', 10))  # Type: float
-        instance.blue_respawn_time = float(entity_data.get('blue_respawn_time', 10))  # Type: float
-        instance.max_points = int(entity_data.get('max_points', 200))  # Type: integer
-        instance.finale_length = float(entity_data.get('finale_length', 30))  # Type: float
-        instance.res_file = entity_data.get('res_file', "resource/UI/HudObjectiveRobotDestruction.res")  # Type: string
-
-
-class tf_logic_player_destruction(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.prop_model_name = "models/flag/flag.mdl"  # Type: studio
-        self.prop_drop_sound = None  # Type: sound
-        self.prop_pickup_sound = None  # Type: sound
-        self.red_respawn_time = 10  # Type: float
-        self.blue_respawn_time = 10  # Type: float
-        self.min_points = 10  # Type: integer
-        self.points_per_player = 5  # Type: integer
-        self.finale_length = 30  # Type: float
-        self.res_file = "resource/UI/HudObjectivePlayerDestruction.res"  # Type: string
-        self.flag_reset_delay = 60  # Type: integer
-        self.heal_distance = 450  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.prop_model_name = entity_data.get('prop_model_name', "models/flag/flag.mdl")  # Type: studio
-        instance.prop_drop_sound = entity_data.get('prop_drop_sound', None)  # Type: sound
-        instance.prop_pickup_sound = entity_data.get('prop_pickup_sound', None)  # Type: sound
-        instance.red_respawn_time = float(entity_data.get('red_respawn_time', 10))  # Type: float
-        instance.blue_respawn_time = float(entity_data.get('blue_respawn_time', 10))  # Type: float
-        instance.min_points = int(entity_data.get('min_points', 10))  # Type: integer
-        instance.points_per_player = int(entity_data.get('points_per_player', 5))  # Type: integer
-        instance.finale_length = float(entity_data.get('finale_length', 30))  # Type: float
-        instance.res_file = entity_data.get('res_file', "resource/UI/HudObjectivePlayerDestruction.res")  # Type: string
-        instance.flag_reset_delay = int(entity_data.get('flag_reset_delay', 60))  # Type: integer
-        instance.heal_distance = int(entity_data.get('heal_distance', 450))  # Type: integer
-
-
-class trigger_rd_vault_trigger(Trigger, TeamNum):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Targetname).__init__()
-        super(TeamNum).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-
-
-class tf_logic_medieval(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_cp_timer(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.controlpoint = None  # Type: target_destination
-        self.timer_length = 60  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.controlpoint = entity_data.get('controlpoint', None)  # Type: target_destination
-        instance.timer_length = int(entity_data.get('timer_length', 60))  # Type: integer
-
-
-class tf_logic_hybrid_ctf_cp(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_raid(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_boss_battle(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_mann_vs_machine(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_holiday(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.holiday_type = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.tauntInHell = None  # Type: choices
-        self.allowHaunting = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.holiday_type = entity_data.get('holiday_type', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.tauntInHell = entity_data.get('tauntinhell', None)  # Type: choices
-        instance.allowHaunting = entity_data.get('allowhaunting', None)  # Type: choices
-
-
-class func_upgradestation(EnableDisable, Targetname):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-
-
-class bot_generator(Targetname, Angles):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.class_ = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.count = 1  # Type: integer
-        self.maxActive = 1  # Type: integer
-        self.interval = None  # Type: float
-        self.action_point = None  # Type: target_destination
-        self.initial_command = None  # Type: choices
-        self.suppressFire = None  # Type: choices
-        self.disableDodge = None  # Type: choices
-        self.actionOnDeath = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.spectateOnDeath = None  # Type: choices
-        self.useTeamSpawnPoint = None  # Type: choices
-        self.retainBuildings = None  # Type: choices
-        self.difficulty = None  # Type: choices
-        self.spawnOnlyWhenTriggered = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.class_ = entity_data.get('class', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.count = int(entity_data.get('count', 1))  # Type: integer
-        instance.maxActive = int(entity_data.get('maxactive', 1))  # Type: integer
-        instance.interval = float(entity_data.get('interval', 0))  # Type: float
-        instance.action_point = entity_data.get('action_point', None)  # Type: target_destination
-        instance.initial_command = entity_data.get('initial_command', None)  # Type: choices
-        instance.suppressFire = entity_data.get('suppressfire', None)  # Type: choices
-        instance.disableDodge = entity_data.get('disabledodge', None)  # Type: choices
-        instance.actionOnDeath = entity_data.get('actionondeath', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.spectateOnDeath = entity_data.get('spectateondeath', None)  # Type: choices
-        instance.useTeamSpawnPoint = entity_data.get('useteamspawnpoint', None)  # Type: choices
-        instance.retainBuildings = entity_data.get('retainbuildings', None)  # Type: choices
-        instance.difficulty = entity_data.get('difficulty', None)  # Type: choices
-        instance.spawnOnlyWhenTriggered = entity_data.get('spawnonlywhentriggered', None)  # Type: choices
-
-
-class bot_roster(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowClassChanges = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowScout = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowSniper = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowSoldier = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowDemoman = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowMedic = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowHeavy = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowPyro = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowSpy = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.allowEngineer = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowClassChanges = entity_data.get('allowclasschanges', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowScout = entity_data.get('allowscout', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowSniper = entity_data.get('allowsniper', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowSoldier = entity_data.get('allowsoldier', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowDemoman = entity_data.get('allowdemoman', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowMedic = entity_data.get('allowmedic', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowHeavy = entity_data.get('allowheavy', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowPyro = entity_data.get('allowpyro', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowSpy = entity_data.get('allowspy', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.allowEngineer = entity_data.get('allowengineer', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class bot_action_point(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.next_action_point = None  # Type: target_destination
-        self.desired_distance = 5  # Type: float
-        self.stay_time = None  # Type: float
-        self.command = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.next_action_point = entity_data.get('next_action_point', None)  # Type: target_destination
-        instance.desired_distance = float(entity_data.get('desired_distance', 5))  # Type: float
-        instance.stay_time = float(entity_data.get('stay_time', 0))  # Type: float
-        instance.command = entity_data.get('command', None)  # Type: choices
-
-
-class bot_proxy(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.bot_name = "TFBot"  # Type: string
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.class_ = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.spawn_on_start = None  # Type: choices
-        self.respawn_interval = None  # Type: float
-        self.action_point = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.bot_name = entity_data.get('bot_name', "TFBot")  # Type: string
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.class_ = entity_data.get('class', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.spawn_on_start = entity_data.get('spawn_on_start', None)  # Type: choices
-        instance.respawn_interval = float(entity_data.get('respawn_interval', 0))  # Type: float
-        instance.action_point = entity_data.get('action_point', None)  # Type: target_destination
-
-
-class tf_spawner(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.count = 1  # Type: integer
-        self.maxActive = 1  # Type: integer
-        self.interval = None  # Type: float
-        self.template = None  # Type: target_destination
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.count = int(entity_data.get('count', 1))  # Type: integer
-        instance.maxActive = int(entity_data.get('maxactive', 1))  # Type: integer
-        instance.interval = float(entity_data.get('interval', 0))  # Type: float
-        instance.template = entity_data.get('template', None)  # Type: target_destination
-
-
-class tf_template_stun_drone(EnableDisable, Targetname, Angles):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class func_nav_blocker(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.teamToBlock = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.affectsFlow = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.teamToBlock = entity_data.get('teamtoblock', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.affectsFlow = entity_data.get('affectsflow', None)  # Type: choices
-
-
-class func_nav_avoid(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.tags = None  # Type: string
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.start_disabled = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.tags = entity_data.get('tags', None)  # Type: string
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.start_disabled = entity_data.get('start_disabled', None)  # Type: choices
-
-
-class func_nav_prefer(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.tags = None  # Type: string
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.start_disabled = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.tags = entity_data.get('tags', None)  # Type: string
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.start_disabled = entity_data.get('start_disabled', None)  # Type: choices
-
-
-class func_nav_prerequisite(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Targetname).__init__()
-        self.Task = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.Entity = None  # Type: target_destination
-        self.Value = None  # Type: float
-        self.start_disabled = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.Task = entity_data.get('task', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.Entity = entity_data.get('entity', None)  # Type: target_destination
-        instance.Value = float(entity_data.get('value', 0))  # Type: float
-        instance.start_disabled = entity_data.get('start_disabled', None)  # Type: choices
-
-
-class func_tfbot_hint(EnableDisable, Targetname, Origin):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(Origin).__init__()
-        self.team = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.hint = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.team = entity_data.get('team', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.hint = entity_data.get('hint', None)  # Type: choices
-
-
-class trigger_stun(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Targetname).__init__()
-        self.trigger_delay = None  # Type: float
-        self.stun_duration = None  # Type: float
-        self.move_speed_reduction = None  # Type: float
-        self.stun_type = None  # Type: choices
-        self.stun_effects = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.trigger_delay = float(entity_data.get('trigger_delay', 0))  # Type: float
-        instance.stun_duration = float(entity_data.get('stun_duration', 0))  # Type: float
-        instance.move_speed_reduction = float(entity_data.get('move_speed_reduction', 0))  # Type: float
-        instance.stun_type = entity_data.get('stun_type', None)  # Type: choices
-        instance.stun_effects = entity_data.get('stun_effects', None)  # Type: choices
-
-
-class entity_spawn_point(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.spawn_manager_name = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.spawn_manager_name = entity_data.get('spawn_manager_name', None)  # Type: string
-
-
-class entity_spawn_manager(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.entity_name = None  # Type: string
-        self.entity_count = None  # Type: integer
-        self.respawn_time = None  # Type: integer
-        self.drop_to_ground = None  # Type: choices
-        self.random_rotation = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.entity_name = entity_data.get('entity_name', None)  # Type: string
-        instance.entity_count = int(entity_data.get('entity_count', 0))  # Type: integer
-        instance.respawn_time = int(entity_data.get('respawn_time', 0))  # Type: integer
-        instance.drop_to_ground = entity_data.get('drop_to_ground', None)  # Type: choices
-        instance.random_rotation = entity_data.get('random_rotation', None)  # Type: choices
-
-
-class tf_pumpkin_bomb(Item):
-    model = "models/props_halloween/pumpkin_explode.mdl"
-    def __init__(self):
-        super(Item).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Item.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_generic_bomb(Studiomodel, Targetname, Angles, Origin):
-    def __init__(self):
-        super(Studiomodel).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(Origin).__init__()
-        self.origin = [0, 0, 0]
-        self.damage = 50  # Type: float
-        self.radius = 100  # Type: float
-        self.health = 1  # Type: integer
-        self.explode_particle = None  # Type: string
-        self.sound = None  # Type: sound
-        self.friendlyfire = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Studiomodel.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.damage = float(entity_data.get('damage', 50))  # Type: float
-        instance.radius = float(entity_data.get('radius', 100))  # Type: float
-        instance.health = int(entity_data.get('health', 1))  # Type: integer
-        instance.explode_particle = entity_data.get('explode_particle', None)  # Type: string
-        instance.sound = entity_data.get('sound', None)  # Type: sound
-        instance.friendlyfire = entity_data.get('friendlyfire', None)  # Type: choices
-
-
-class training_annotation(Targetname):
-    model = "models/extras/info_speech.mdl"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.display_text = "<Add Text Here>"  # Type: string
-        self.lifetime = None  # Type: float
-        self.offset = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.display_text = entity_data.get('display_text', "<Add Text Here>")  # Type: string
-        instance.lifetime = float(entity_data.get('lifetime', 0))  # Type: float
-        instance.offset = float(entity_data.get('offset', 0))  # Type: float
-
-
-class training_prop_dynamic(prop_dynamic):
-    def __init__(self):
-        super(prop_dynamic).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        prop_dynamic.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class trigger_ignite_arrows(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Targetname).__init__()
-        super(Parentname).__init__()
-        super(Origin).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Parentname.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-
-
-class wheel_of_doom(Parentname, Targetname, Angles):
-    model = "models/editor/cone_helper.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.effect_duration = 30  # Type: float
-        self.has_spiral = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.effect_duration = float(entity_data.get('effect_duration', 30))  # Type: float
-        instance.has_spiral = entity_data.get('has_spiral', None)  # Type: choices
-
-
-class point_populator_interface(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_point_weapon_mimic(Parentname, Targetname, Angles):
-    model = "models/editor/cone_helper.mdl"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        self.origin = [0, 0, 0]
-        self.WeaponType = None  # Type: choices
-        self.FireSound = None  # Type: string
-        self.ParticleEffect = None  # Type: string
-        self.ModelOverride = None  # Type: string
-        self.ModelScale = 1  # Type: float
-        self.SpeedMin = 1000  # Type: float
-        self.SpeedMax = 1000  # Type: float
-        self.Damage = 75  # Type: float
-        self.SplashRadius = 50  # Type: float
-        self.SpreadAngle = 0  # Type: float
-        self.Crits = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.WeaponType = entity_data.get('weapontype', None)  # Type: choices
-        instance.FireSound = entity_data.get('firesound', None)  # Type: string
-        instance.ParticleEffect = entity_data.get('particleeffect', None)  # Type: string
-        instance.ModelOverride = entity_data.get('modeloverride', None)  # Type: string
-        instance.ModelScale = float(entity_data.get('modelscale', 1))  # Type: float
-        instance.SpeedMin = float(entity_data.get('speedmin', 1000))  # Type: float
-        instance.SpeedMax = float(entity_data.get('speedmax', 1000))  # Type: float
-        instance.Damage = float(entity_data.get('damage', 75))  # Type: float
-        instance.SplashRadius = float(entity_data.get('splashradius', 50))  # Type: float
-        instance.SpreadAngle = float(entity_data.get('spreadangle', 0))  # Type: float
-        instance.Crits = entity_data.get('crits', None)  # Type: choices
-
-
-class tf_point_nav_interface(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class trigger_timer_door(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.door_name = None  # Type: string
-        self.area_cap_point = None  # Type: target_source
-        self.team_cancap_2 = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.team_cancap_3 = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.team_startcap_2 = 1  # Type: integer
-        self.team_startcap_3 = 1  # Type: integer
-        self.team_numcap_2 = 1  # Type: integer
-        self.team_numcap_3 = 1  # Type: integer
-        self.team_spawn_2 = None  # Type: integer
-        self.team_spawn_3 = None  # Type: integer
-        self.area_time_to_cap = 5  # Type: integer
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.door_name = entity_data.get('door_name', None)  # Type: string
-        instance.area_cap_point = entity_data.get('area_cap_point', None)  # Type: target_source
-        instance.team_cancap_2 = entity_data.get('team_cancap_2', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.team_cancap_3 = entity_data.get('team_cancap_3', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.team_startcap_2 = int(entity_data.get('team_startcap_2', 1))  # Type: integer
-        instance.team_startcap_3 = int(entity_data.get('team_startcap_3', 1))  # Type: integer
-        instance.team_numcap_2 = int(entity_data.get('team_numcap_2', 1))  # Type: integer
-        instance.team_numcap_3 = int(entity_data.get('team_numcap_3', 1))  # Type: integer
-        instance.team_spawn_2 = int(entity_data.get('team_spawn_2', 0))  # Type: integer
-        instance.team_spawn_3 = int(entity_data.get('team_spawn_3', 0))  # Type: integer
-        instance.area_time_to_cap = int(entity_data.get('area_time_to_cap', 5))  # Type: integer
-
-
-class trigger_bot_tag(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.tags = None  # Type: string
-        self.add = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.tags = entity_data.get('tags', None)  # Type: string
-        instance.add = entity_data.get('add', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class filter_tf_bot_has_tag(BaseFilter):
-    def __init__(self):
-        super(BaseFilter).__init__()
-        self.tags = None  # Type: string
-        self.require_all_tags = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        BaseFilter.from_dict(instance, entity_data)
-        instance.tags = entity_data.get('tags', None)  # Type: string
-        instance.require_all_tags = entity_data.get('require_all_tags', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class trigger_add_tf_player_condition(Trigger, Condition):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Condition).__init__()
-        self.duration = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Condition.from_dict(instance, entity_data)
-        instance.duration = float(entity_data.get('duration', 0))  # Type: float
-
-
-class trigger_remove_tf_player_condition(Trigger, Condition):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(Condition).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        Condition.from_dict(instance, entity_data)
-
-
-class hightower_teleport_vortex(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.target_base_name = None  # Type: string
-        self.lifetime = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.target_base_name = entity_data.get('target_base_name', None)  # Type: string
-        instance.lifetime = float(entity_data.get('lifetime', 0))  # Type: float
-
-
-class tf_zombie_spawner(Targetname):
-    model = "models/bots/skeleton_sniper/skeleton_sniper.mdl"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.zombie_lifetime = None  # Type: float
-        self.max_zombies = 1  # Type: integer
-        self.infinite_zombies = None  # Type: choices
-        self.zombie_type = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.zombie_lifetime = float(entity_data.get('zombie_lifetime', 0))  # Type: float
-        instance.max_zombies = int(entity_data.get('max_zombies', 1))  # Type: integer
-        instance.infinite_zombies = entity_data.get('infinite_zombies', None)  # Type: choices
-        instance.zombie_type = entity_data.get('zombie_type', None)  # Type: choices
-
-
-class halloween_zapper(Parentname, Targetname):
-    icon_sprite = "editor/bullseye.vmt"
-    def __init__(self):
-        super(Parentname).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.touch_trigger = None  # Type: target_destination
-        self.ParticleEffect = None  # Type: string
-        self.ZapperType = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Parentname.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.touch_trigger = entity_data.get('touch_trigger', None)  # Type: target_destination
-        instance.ParticleEffect = entity_data.get('particleeffect', None)  # Type: string
-        instance.ZapperType = entity_data.get('zappertype', None)  # Type: choices
-
-
-class trigger_player_respawn_override(Trigger, Toggle):
-    def __init__(self):
-        super(Trigger).__init__()
-        super(EnableDisable).__init__()
-        super(Toggle).__init__()
-        super(Targetname).__init__()
-        self.RespawnTime = -1  # Type: float
-        self.RespawnName = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        EnableDisable.from_dict(instance, entity_data)
-        Toggle.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.RespawnTime = float(entity_data.get('respawntime', -1))  # Type: float
-        instance.RespawnName = entity_data.get('respawnname', None)  # Type: string
-
-
-class prop_soccer_ball(Studiomodel, Targetname):
-    def __init__(self):
-        super(Studiomodel).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.trigger_name = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Studiomodel.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.trigger_name = entity_data.get('trigger_name', None)  # Type: string
-
-
-class MiniGame(Base):
-    def __init__(self):
-        super().__init__()
-        pass
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Base.from_dict(instance, entity_data)
-
-
-class tf_logic_minigames(MiniGame, Targetname):
-    def __init__(self):
-        super(MiniGame).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        MiniGame.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_base_minigame(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.RedSpawn = None  # Type: target_source
-        self.BlueSpawn = None  # Type: target_source
-        self.InRandomPool = "CHOICES NOT SUPPORTED"  # Type: choices
-        self.MaxScore = 5  # Type: integer
-        self.hud_res_file = None  # Type: string
-        self.your_team_score_sound = None  # Type: string
-        self.enemy_team_score_sound = None  # Type: string
-        self.ScoreType = None  # Type: choices
-        self.SuddenDeathTime = -1  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.RedSpawn = entity_data.get('redspawn', None)  # Type: target_source
-        instance.BlueSpawn = entity_data.get('bluespawn', None)  # Type: target_source
-        instance.InRandomPool = entity_data.get('inrandompool', "CHOICES NOT SUPPORTED")  # Type: choices
-        instance.MaxScore = int(entity_data.get('maxscore', 5))  # Type: integer
-        instance.hud_res_file = entity_data.get('hud_res_file', None)  # Type: string
-        instance.your_team_score_sound = entity_data.get('your_team_score_sound', None)  # Type: string
-        instance.enemy_team_score_sound = entity_data.get('enemy_team_score_sound', None)  # Type: string
-        instance.ScoreType = entity_data.get('scoretype', None)  # Type: choices
-        instance.SuddenDeathTime = float(entity_data.get('suddendeathtime', -1))  # Type: float
-
-
-class tf_halloween_minigame(tf_base_minigame):
-    def __init__(self):
-        super(tf_base_minigame).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.MinigameType = "CHOICES NOT SUPPORTED"  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        tf_base_minigame.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.MinigameType = entity_data.get('minigametype', "CHOICES NOT SUPPORTED")  # Type: choices
-
-
-class tf_halloween_minigame_falling_platforms(tf_halloween_minigame):
-    def __init__(self):
-        super(tf_halloween_minigame).__init__()
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        tf_halloween_minigame.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class halloween_fortune_teller(Targetname, Angles, Origin):
-    model = "models/bots/merasmus/merasmas_misfortune_teller.mdl"
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(Origin).__init__()
-        self.origin = [0, 0, 0]
-        self.red_teleport = None  # Type: string
-        self.blue_teleport = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.red_teleport = entity_data.get('red_teleport', None)  # Type: string
-        instance.blue_teleport = entity_data.get('blue_teleport', None)  # Type: string
-
-
-class tf_teleport_location(Targetname, Angles, Origin):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(Origin).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class func_passtime_goal(EnableDisable, Targetname, TeamNum, Origin):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(TeamNum).__init__()
-        super(Origin).__init__()
-        self.points = 1  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.points = float(entity_data.get('points', 1))  # Type: float
-
-
-class info_passtime_ball_spawn(EnableDisable, Targetname, TeamNum):
-    icon_sprite = "editor/passtime_ball_spawner.vmt"
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(TeamNum).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class passtime_logic(Targetname):
-    icon_sprite = "editor/passtime_master.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-        self.num_sections = None  # Type: integer
-        self.ball_spawn_countdown = 15  # Type: integer
-        self.max_pass_range = None  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.num_sections = int(entity_data.get('num_sections', 0))  # Type: integer
-        instance.ball_spawn_countdown = int(entity_data.get('ball_spawn_countdown', 15))  # Type: integer
-        instance.max_pass_range = float(entity_data.get('max_pass_range', 0))  # Type: float
-
-
-class func_passtime_goalie_zone(EnableDisable, Targetname, TeamNum):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        super(Targetname).__init__()
-        super(TeamNum).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        Targetname.from_dict(instance, entity_data)
-        TeamNum.from_dict(instance, entity_data)
-
-
-class func_passtime_no_ball_zone(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-
-
-class trigger_passtime_ball(Targetname):
-    def __init__(self):
-        super(Targetname).__init__()
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-
-
-class trigger_catapult(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.playerSpeed = 450  # Type: float
-        self.physicsSpeed = 450  # Type: float
-        self.useThresholdCheck = None  # Type: integer
-        self.entryAngleTolerance = 0.0  # Type: float
-        self.useExactVelocity = None  # Type: integer
-        self.exactVelocityChoiceType = None  # Type: choices
-        self.lowerThreshold = 0.15  # Type: float
-        self.upperThreshold = 0.30  # Type: float
-        self.launchDirection = [0.0, 0.0, 0.0]  # Type: angle
-        self.launchTarget = None  # Type: target_destination
-        self.onlyVelocityCheck = None  # Type: integer
-        self.applyAngularImpulse = 1  # Type: integer
-        self.AirCtrlSupressionTime = -1.0  # Type: float
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.playerSpeed = float(entity_data.get('playerspeed', 450))  # Type: float
-        instance.physicsSpeed = float(entity_data.get('physicsspeed', 450))  # Type: float
-        instance.useThresholdCheck = int(entity_data.get('usethresholdcheck', 0))  # Type: integer
-        instance.entryAngleTolerance = float(entity_data.get('entryangletolerance', 0.0))  # Type: float
-        instance.useExactVelocity = int(entity_data.get('useexactvelocity', 0))  # Type: integer
-        instance.exactVelocityChoiceType = entity_data.get('exactvelocitychoicetype', None)  # Type: choices
-        instance.lowerThreshold = float(entity_data.get('lowerthreshold', 0.15))  # Type: float
-        instance.upperThreshold = float(entity_data.get('upperthreshold', 0.30))  # Type: float
-        instance.launchDirection = parse_float_vector(entity_data.get('launchdirection', "0 0 0"))  # Type: angle
-        instance.launchTarget = entity_data.get('launchtarget', None)  # Type: target_destination
-        instance.onlyVelocityCheck = int(entity_data.get('onlyvelocitycheck', 0))  # Type: integer
-        instance.applyAngularImpulse = int(entity_data.get('applyangularimpulse', 1))  # Type: integer
-        instance.AirCtrlSupressionTime = float(entity_data.get('airctrlsupressiontime', -1.0))  # Type: float
-
-
-class trigger_ignite(Trigger):
-    def __init__(self):
-        super(Trigger).__init__()
-        self.burn_duration = 5  # Type: float
-        self.damage_percent_per_second = 10  # Type: float
-        self.ignite_particle_name = None  # Type: string
-        self.ignite_sound_name = None  # Type: string
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Trigger.from_dict(instance, entity_data)
-        instance.burn_duration = float(entity_data.get('burn_duration', 5))  # Type: float
-        instance.damage_percent_per_second = float(entity_data.get('damage_percent_per_second', 10))  # Type: float
-        instance.ignite_particle_name = entity_data.get('ignite_particle_name', None)  # Type: string
-        instance.ignite_sound_name = entity_data.get('ignite_sound_name', None)  # Type: string
-
-
-class tf_halloween_gift_spawn_location(Targetname, Angles, Origin):
-    def __init__(self):
-        super(Targetname).__init__()
-        super(Angles).__init__()
-        super(Origin).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        Angles.from_dict(instance, entity_data)
-        Origin.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_logic_on_holiday(Targetname):
-    icon_sprite = "editor/logic_auto.vmt"
-    def __init__(self):
-        super(Targetname).__init__()
-        self.origin = [0, 0, 0]
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        Targetname.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-
-
-class tf_glow(EnableDisable):
-    def __init__(self):
-        super(EnableDisable).__init__()
-        self.origin = [0, 0, 0]
-        self.targetname = None  # Type: target_source
-        self.target = None  # Type: target_destination
-        self.GlowColor = [255, 0, 0, 255]  # Type: color255
-        self.Mode = None  # Type: choices
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        EnableDisable.from_dict(instance, entity_data)
-        instance.origin = parse_float_vector(entity_data.get('origin', "0 0 0"))
-        instance.targetname = entity_data.get('targetname', None)  # Type: target_source
-        instance.target = entity_data.get('target', None)  # Type: target_destination
-        instance.GlowColor = parse_int_vector(entity_data.get('glowcolor', "255 0 0 255"))  # Type: color255
-        instance.Mode = entity_data.get('mode', None)  # Type: choices
-
-
-
-entity_class_handle = {
-    'Angles': Angles,
-    'Origin': Origin,
-    'Studiomodel': Studiomodel,
-    'BasePlat': BasePlat,
-    'Targetname': Targetname,
-    'Parentname': Parentname,
-    'BaseBrush': BaseBrush,
-    'EnableDisable': EnableDisable,
-    'RenderFxChoices': RenderFxChoices,
-    'Shadow': Shadow,
-    'RenderFields': RenderFields,
-    'DXLevelChoice': DXLevelChoice,
-    'Inputfilter': Inputfilter,
-    'Global': Global,
-    'EnvGlobal': EnvGlobal,
-    'DamageFilter': DamageFilter,
-    'ResponseContext': ResponseContext,
-    'Breakable': Breakable,
-    'BreakableBrush': BreakableBrush,
-    'BreakableProp': BreakableProp,
-    'BaseNPC': BaseNPC,
-    'info_npc_spawn_destination': info_npc_spawn_destination,
-    'BaseNPCMaker': BaseNPCMaker,
-    'npc_template_maker': npc_template_maker,
-    'BaseHelicopter': BaseHelicopter,
-    'PlayerClass': PlayerClass,
-    'Light': Light,
-    'Node': Node,
-    'HintNode': HintNode,
-    'TriggerOnce': TriggerOnce,
-    'Trigger': Trigger,
-    'worldbase': worldbase,
-    'worldspawn': worldspawn,
-    'ambient_generic': ambient_generic,
-    'func_lod': func_lod,
-    'env_zoom': env_zoom,
-    'env_screenoverlay': env_screenoverlay,
-    'env_screeneffect': env_screeneffect,
-    'env_texturetoggle': env_texturetoggle,
-    'env_splash': env_splash,
-    'env_particlelight': env_particlelight,
-    'env_sun': env_sun,
-    'game_ragdoll_manager': game_ragdoll_manager,
-    'game_gib_manager': game_gib_manager,
-    'env_lightglow': env_lightglow,
-    'env_smokestack': env_smokestack,
-    'env_fade': env_fade,
-    'env_player_surface_trigger': env_player_surface_trigger,
-    'env_tonemap_controller': env_tonemap_controller,
-    'func_useableladder': func_useableladder,
-    'func_ladderendpoint': func_ladderendpoint,
-    'info_ladder_dismount': info_ladder_dismount,
-    'func_areaportalwindow': func_areaportalwindow,
-    'func_wall': func_wall,
-    'func_clip_vphysics': func_clip_vphysics,
-    'func_brush': func_brush,
-    'vgui_screen_base': vgui_screen_base,
-    'vgui_screen': vgui_screen,
-    'vgui_slideshow_display': vgui_slideshow_display,
-    'cycler': cycler,
-    'gibshooterbase': gibshooterbase,
-    'env_beam': env_beam,
-    'env_beverage': env_beverage,
-    'env_embers': env_embers,
-    'env_funnel': env_funnel,
-    'env_blood': env_blood,
-    'env_bubbles': env_bubbles,
-    'env_explosion': env_explosion,
-    'env_smoketrail': env_smoketrail,
-    'env_physexplosion': env_physexplosion,
-    'env_physimpact': env_physimpact,
-    'env_fire': env_fire,
-    'env_firesource': env_firesource,
-    'env_firesensor': env_firesensor,
-    'env_entity_igniter': env_entity_igniter,
-    'env_fog_controller': env_fog_controller,
-    'env_steam': env_steam,
-    'env_laser': env_laser,
-    'env_message': env_message,
-    'env_hudhint': env_hudhint,
-    'env_shake': env_shake,
-    'env_viewpunch': env_viewpunch,
-    'env_rotorwash_emitter': env_rotorwash_emitter,
-    'gibshooter': gibshooter,
-    'env_shooter': env_shooter,
-    'env_rotorshooter': env_rotorshooter,
-    'env_soundscape_proxy': env_soundscape_proxy,
-    'env_soundscape': env_soundscape,
-    'env_soundscape_triggerable': env_soundscape_triggerable,
-    'env_spark': env_spark,
-    'env_sprite': env_sprite,
-    'env_sprite_oriented': env_sprite_oriented,
-    'env_wind': env_wind,
-    'sky_camera': sky_camera,
-    'BaseSpeaker': BaseSpeaker,
-    'game_weapon_manager': game_weapon_manager,
-    'game_end': game_end,
-    'game_player_equip': game_player_equip,
-    'game_player_team': game_player_team,
-    'game_score': game_score,
-    'game_text': game_text,
-    'point_enable_motion_fixup': point_enable_motion_fixup,
-    'point_message': point_message,
-    'point_spotlight': point_spotlight,
-    'point_tesla': point_tesla,
-    'point_clientcommand': point_clientcommand,
-    'point_servercommand': point_servercommand,
-    'point_bonusmaps_accessor': point_bonusmaps_accessor,
-    'game_ui': game_ui,
-    'game_zone_player': game_zone_player,
-    'infodecal': infodecal,
-    'info_projecteddecal': info_projecteddecal,
-    'info_no_dynamic_shadow': info_no_dynamic_shadow,
-    'info_player_start': info_player_start,
-    'info_overlay': info_overlay,
-    'info_overlay_transition': info_overlay_transition,
-    'info_intermission': info_intermission,
-    'info_landmark': info_landmark,
-    'info_null': info_null,
-    'info_target': info_target,
-    'info_particle_system': info_particle_system,
-    'phys_ragdollmagnet': phys_ragdollmagnet,
-    'info_lighting': info_lighting,
-    'info_teleport_destination': info_teleport_destination,
-    'info_node': info_node,
-    'info_node_hint': info_node_hint,
-    'info_node_air': info_node_air,
-    'info_node_air_hint': info_node_air_hint,
-    'info_hint': info_hint,
-    'info_node_link': info_node_link,
-    'info_node_link_controller': info_node_link_controller,
-    'info_radial_link_controller': info_radial_link_controller,
-    'info_node_climb': info_node_climb,
-    'light': light,
-    'light_environment': light_environment,
-    'light_spot': light_spot,
-    'light_dynamic': light_dynamic,
-    'shadow_control': shadow_control,
-    'color_correction': color_correction,
-    'color_correction_volume': color_correction_volume,
-    'KeyFrame': KeyFrame,
-    'Mover': Mover,
-    'func_movelinear': func_movelinear,
-    'func_water_analog': func_water_analog,
-    'func_rotating': func_rotating,
-    'func_platrot': func_platrot,
-    'keyframe_track': keyframe_track,
-    'move_keyframed': move_keyframed,
-    'move_track': move_track,
-    'RopeKeyFrame': RopeKeyFrame,
-    'keyframe_rope': keyframe_rope,
-    'move_rope': move_rope,
-    'Button': Button,
-    'func_button': func_button,
-    'func_rot_button': func_rot_button,
-    'momentary_rot_button': momentary_rot_button,
-    'Door': Door,
-    'func_door': func_door,
-    'func_door_rotating': func_door_rotating,
-    'prop_door_rotating': prop_door_rotating,
-    'env_cubemap': env_cubemap,
-    'BModelParticleSpawner': BModelParticleSpawner,
-    'func_dustmotes': func_dustmotes,
-    'func_smokevolume': func_smokevolume,
-    'func_dustcloud': func_dustcloud,
-    'env_dustpuff': env_dustpuff,
-    'env_particlescript': env_particlescript,
-    'env_effectscript': env_effectscript,
-    'logic_auto': logic_auto,
-    'point_viewcontrol': point_viewcontrol,
-    'point_posecontroller': point_posecontroller,
-    'logic_compare': logic_compare,
-    'logic_branch': logic_branch,
-    'logic_branch_listener': logic_branch_listener,
-    'logic_case': logic_case,
-    'logic_multicompare': logic_multicompare,
-    'logic_relay': logic_relay,
-    'logic_timer': logic_timer,
-    'hammer_updateignorelist': hammer_updateignorelist,
-    'logic_collision_pair': logic_collision_pair,
-    'env_microphone': env_microphone,
-    'math_remap': math_remap,
-    'math_colorblend': math_colorblend,
-    'math_counter': math_counter,
-    'logic_lineto': logic_lineto,
-    'logic_navigation': logic_navigation,
-    'logic_autosave': logic_autosave,
-    'logic_active_autosave': logic_active_autosave,
-    'point_template': point_template,
-    'env_entity_maker': env_entity_maker,
-    'BaseFilter': BaseFilter,
-    'filter_multi': filter_multi,
-    'filter_activator_name': filter_activator_name,
-    'filter_activator_class': filter_activator_class,
-    'filter_activator_mass_greater': filter_activator_mass_greater,
-    'filter_damage_type': filter_damage_type,
-    'filter_enemy': filter_enemy,
-    'point_anglesensor': point_anglesensor,
-    'point_angularvelocitysensor': point_angularvelocitysensor,
-    'point_velocitysensor': point_velocitysensor,
-    'point_proximity_sensor': point_proximity_sensor,
-    'point_teleport': point_teleport,
-    'point_hurt': point_hurt,
-    'point_playermoveconstraint': point_playermoveconstraint,
-    'func_physbox': func_physbox,
-    'TwoObjectPhysics': TwoObjectPhysics,
-    'phys_constraintsystem': phys_constraintsystem,
-    'phys_keepupright': phys_keepupright,
-    'physics_cannister': physics_cannister,
-    'info_constraint_anchor': info_constraint_anchor,
-    'info_mass_center': info_mass_center,
-    'phys_spring': phys_spring,
-    'phys_hinge': phys_hinge,
-    'phys_ballsocket': phys_ballsocket,
-    'phys_constraint': phys_constraint,
-    'phys_pulleyconstraint': phys_pulleyconstraint,
-    'phys_slideconstraint': phys_slideconstraint,
-    'phys_lengthconstraint': phys_lengthconstraint,
-    'phys_ragdollconstraint': phys_ragdollconstraint,
-    'phys_convert': phys_convert,
-    'ForceController': ForceController,
-    'phys_thruster': phys_thruster,
-    'phys_torque': phys_torque,
-    'phys_motor': phys_motor,
-    'phys_magnet': phys_magnet,
-    'prop_detail_base': prop_detail_base,
-    'prop_static_base': prop_static_base,
-    'BaseFadeProp': BaseFadeProp,
-    'prop_dynamic_base': prop_dynamic_base,
-    'prop_detail': prop_detail,
-    'prop_static': prop_static,
-    'prop_dynamic': prop_dynamic,
-    'prop_dynamic_override': prop_dynamic_override,
-    'BasePropPhysics': BasePropPhysics,
-    'prop_physics_override': prop_physics_override,
-    'prop_physics': prop_physics,
-    'prop_physics_multiplayer': prop_physics_multiplayer,
-    'prop_ragdoll': prop_ragdoll,
-    'prop_dynamic_ornament': prop_dynamic_ornament,
-    'func_areaportal': func_areaportal,
-    'func_occluder': func_occluder,
-    'func_breakable': func_breakable,
-    'func_breakable_surf': func_breakable_surf,
-    'func_conveyor': func_conveyor,
-    'func_detail': func_detail,
-    'func_viscluster': func_viscluster,
-    'func_illusionary': func_illusionary,
-    'func_precipitation': func_precipitation,
-    'func_wall_toggle': func_wall_toggle,
-    'func_guntarget': func_guntarget,
-    'func_fish_pool': func_fish_pool,
-    'PlatSounds': PlatSounds,
-    'Trackchange': Trackchange,
-    'BaseTrain': BaseTrain,
-    'func_trackautochange': func_trackautochange,
-    'func_trackchange': func_trackchange,
-    'func_tracktrain': func_tracktrain,
-    'func_tanktrain': func_tanktrain,
-    'func_traincontrols': func_traincontrols,
-    'tanktrain_aitarget': tanktrain_aitarget,
-    'tanktrain_ai': tanktrain_ai,
-    'path_track': path_track,
-    'test_traceline': test_traceline,
-    'trigger_autosave': trigger_autosave,
-    'trigger_changelevel': trigger_changelevel,
-    'trigger_gravity': trigger_gravity,
-    'trigger_playermovement': trigger_playermovement,
-    'trigger_soundscape': trigger_soundscape,
-    'trigger_hurt': trigger_hurt,
-    'trigger_remove': trigger_remove,
-    'trigger_multiple': trigger_multiple,
-    'trigger_once': trigger_once,
-    'trigger_look': trigger_look,
-    'trigger_push': trigger_push,
-    'trigger_wind': trigger_wind,
-    'trigger_impact': trigger_impact,
-    'trigger_proximity': trigger_proximity,
-    'trigger_teleport': trigger_teleport,
-    'trigger_teleport_relative': trigger_teleport_relative,
-    'trigger_transition': trigger_transition,
-    'trigger_serverragdoll': trigger_serverragdoll,
-    'ai_speechfilter': ai_speechfilter,
-    'water_lod_control': water_lod_control,
-    'info_camera_link': info_camera_link,
-    'logic_measure_movement': logic_measure_movement,
-    'npc_furniture': npc_furniture,
-    'env_credits': env_credits,
-    'material_modify_control': material_modify_control,
-    'point_devshot_camera': point_devshot_camera,
-    'logic_playerproxy': logic_playerproxy,
-    'env_spritetrail': env_spritetrail,
-    'env_projectedtexture': env_projectedtexture,
-    'func_reflective_glass': func_reflective_glass,
-    'env_particle_performance_monitor': env_particle_performance_monitor,
-    'npc_puppet': npc_puppet,
-    'point_gamestats_counter': point_gamestats_counter,
-    'func_instance': func_instance,
-    'func_instance_parms': func_instance_parms,
-    'trigger_apply_impulse': trigger_apply_impulse,
-    'TeamNum': TeamNum,
-    'MatchSummary': MatchSummary,
-    'FadeDistance': FadeDistance,
-    'GameType': GameType,
-    'Condition': Condition,
-    'PlayerTouch': PlayerTouch,
-    'Toggle': Toggle,
-    'tf_gamerules': tf_gamerules,
-    'info_player_teamspawn': info_player_teamspawn,
-    'game_forcerespawn': game_forcerespawn,
-    'item_teamflag': item_teamflag,
-    'point_intermission': point_intermission,
-    'info_observer_point': info_observer_point,
-    'game_round_win': game_round_win,
-    'team_round_timer': team_round_timer,
-    'Item': Item,
-    'item_healthkit_full': item_healthkit_full,
-    'item_healthkit_small': item_healthkit_small,
-    'item_healthkit_medium': item_healthkit_medium,
-    'item_ammopack_full': item_ammopack_full,
-    'item_ammopack_small': item_ammopack_small,
-    'item_ammopack_medium': item_ammopack_medium,
-    'tf_spell_pickup': tf_spell_pickup,
-    'item_bonuspack': item_bonuspack,
-    'tf_halloween_pickup': tf_halloween_pickup,
-    'info_powerup_spawn': info_powerup_spawn,
-    'item_powerup_crit': item_powerup_crit,
-    'item_powerup_uber': item_powerup_uber,
-    'filter_activator_tfteam': filter_activator_tfteam,
-    'filter_tf_player_can_cap': filter_tf_player_can_cap,
-    'filter_tf_damaged_by_weapon_in_slot': filter_tf_damaged_by_weapon_in_slot,
-    'filter_tf_condition': filter_tf_condition,
-    'filter_tf_class': filter_tf_class,
-    'func_capturezone': func_capturezone,
-    'func_flagdetectionzone': func_flagdetectionzone,
-    'func_nogrenades': func_nogrenades,
-    'func_achievement': func_achievement,
-    'func_nobuild': func_nobuild,
-    'func_croc': func_croc,
-    'func_suggested_build': func_suggested_build,
-    'func_regenerate': func_regenerate,
-    'func_powerupvolume': func_powerupvolume,
-    'func_respawnflag': func_respawnflag,
-    'func_respawnroom': func_respawnroom,
-    'func_flag_alert': func_flag_alert,
-    'func_respawnroomvisualizer': func_respawnroomvisualizer,
-    'func_forcefield': func_forcefield,
-    'func_changeclass': func_changeclass,
-    'game_intro_viewpoint': game_intro_viewpoint,
-    'func_proprrespawnzone': func_proprrespawnzone,
-    'team_control_point': team_control_point,
-    'team_control_point_round': team_control_point_round,
-    'team_control_point_master': team_control_point_master,
-    'trigger_capture_area': trigger_capture_area,
-    'team_train_watcher': team_train_watcher,
-    'game_text_tf': game_text_tf,
-    'BaseObject': BaseObject,
-    'obj_dispenser': obj_dispenser,
-    'obj_sentrygun': obj_sentrygun,
-    'obj_teleporter': obj_teleporter,
-    'bot_hint_sentrygun': bot_hint_sentrygun,
-    'bot_hint_teleporter_exit': bot_hint_teleporter_exit,
-    'bot_hint_engineer_nest': bot_hint_engineer_nest,
-    'bot_hint_sniper_spot': bot_hint_sniper_spot,
-    'mapobj_cart_dispenser': mapobj_cart_dispenser,
-    'dispenser_touch_trigger': dispenser_touch_trigger,
-    'tf_logic_arena': tf_logic_arena,
-    'tf_logic_competitive': tf_logic_competitive,
-    'tf_logic_mannpower': tf_logic_mannpower,
-    'bot_controller': bot_controller,
-    'tf_logic_training_mode': tf_logic_training_mode,
-    'boss_alpha': boss_alpha,
-    'base_boss': base_boss,
-    'tank_boss': tank_boss,
-    'tf_logic_multiple_escort': tf_logic_multiple_escort,
-    'tf_logic_koth': tf_logic_koth,
-    'tf_robot_destruction_robot_spawn': tf_robot_destruction_robot_spawn,
-    'tf_robot_destruction_spawn_group': tf_robot_destruction_spawn_group,
-    'RobotDestruction': RobotDestruction,
-    'tf_logic_robot_destruction': tf_logic_robot_destruction,
-    'tf_logic_player_destruction': tf_logic_player_destruction,
-    'trigger_rd_vault_trigger': trigger_rd_vault_trigger,
-    'tf_logic_medieval': tf_logic_medieval,
-    'tf_logic_cp_timer': tf_logic_cp_timer,
-    'tf_logic_hybrid_ctf_cp': tf_logic_hybrid_ctf_cp,
-    'tf_logic_raid': tf_logic_raid,
-    'tf_logic_boss_battle': tf_logic_boss_battle,
-    'tf_logic_mann_vs_machine': tf_logic_mann_vs_machine,
-    'tf_logic_holiday': tf_logic_holiday,
-    'func_upgradestation': func_upgradestation,
-    'bot_generator': bot_generator,
-    'bot_roster': bot_roster,
-    'bot_action_point': bot_action_point,
-    'bot_proxy': bot_proxy,
-    'tf_spawner': tf_spawner,
-    'tf_template_stun_drone': tf_template_stun_drone,
-    'func_nav_blocker': func_nav_blocker,
-    'func_nav_avoid': func_nav_avoid,
-    'func_nav_prefer': func_nav_prefer,
-    'func_nav_prerequisite': func_nav_prerequisite,
-    'func_tfbot_hint': func_tfbot_hint,
-    'trigger_stun': trigger_stun,
-    'entity_spawn_point': entity_spawn_point,
-    'entity_spawn_manager': entity_spawn_manager,
-    'tf_pumpkin_bomb': tf_pumpkin_bomb,
-    'tf_generic_bomb': tf_generic_bomb,
-    'training_annotation': training_annotation,
-    'training_prop_dynamic': training_prop_dynamic,
-    'trigger_ignite_arrows': trigger_ignite_arrows,
-    'wheel_of_doom': wheel_of_doom,
-    'point_populator_interface': point_populator_interface,
-    'tf_point_weapon_mimic': tf_point_weapon_mimic,
-    'tf_point_nav_interface': tf_point_nav_interface,
-    'trigger_timer_door': trigger_timer_door,
-    'trigger_bot_tag': trigger_bot_tag,
-    'filter_tf_bot_has_tag': filter_tf_bot_has_tag,
-    'trigger_add_tf_player_condition': trigger_add_tf_player_condition,
-    'trigger_remove_tf_player_condition': trigger_remove_tf_player_condition,
-    'hightower_teleport_vortex': hightower_teleport_vortex,
-    'tf_zombie_spawner': tf_zombie_spawner,
-    'halloween_zapper': halloween_zapper,
-    'trigger_player_respawn_override': trigger_player_respawn_override,
-    'prop_soccer_ball': prop_soccer_ball,
-    'MiniGame': MiniGame,
-    'tf_logic_minigames': tf_logic_minigames,
-    'tf_base_minigame': tf_base_minigame,
-    'tf_halloween_minigame': tf_halloween_minigame,
-    'tf_halloween_minigame_falling_platforms': tf_halloween_minigame_falling_platforms,
-    'halloween_fortune_teller': halloween_fortune_teller,
-    'tf_teleport_location': tf_teleport_location,
-    'func_passtime_goal': func_passtime_goal,
-    'info_passtime_ball_spawn': info_passtime_ball_spawn,
-    'passtime_logic': passtime_logic,
-    'func_passtime_goalie_zone': func_passtime_goalie_zone,
-    'func_passtime_no_ball_zone': func_passtime_no_ball_zone,
-    'trigger_passtime_ball': trigger_passtime_ball,
-    'trigger_catapult': trigger_catapult,
-    'trigger_ignite': trigger_ignite,
-    'tf_halloween_gift_spawn_location': tf_halloween_gift_spawn_location,
-    'tf_logic_on_holiday': tf_logic_on_holiday,
-    'tf_glow': tf_glow,
-}
\ No newline at end of file
+# Generated by source1/fgd/generate_entity_classes.py from tf.fgd, do not edit
+from .entity_schema import Base, EntityClassRegistry, parse_int_vector, parse_float_vector
+
+# class name: (parent class names, class attributes, (attribute name, entity key, property kind, default value))
+SCHEMA = {
+    'Angles': ((), {}, (
+        ('angles', 'angles', 'float_vector', "0 0 0"),
+    )),
+    'Origin': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'Studiomodel': ((), {}, (
+        ('model', 'model', 'raw', None),
+        ('skin', 'skin', 'int', 0),
+        ('modelscale', 'modelscale', 'float', 1.0),
+        ('disableshadows', 'disableshadows', 'raw', None),
+    )),
+    'BasePlat': ((), {}, (
+    )),
+    'Targetname': ((), {}, (
+        ('targetname', 'targetname', 'raw', None),
+    )),
+    'Parentname': ((), {}, (
+        ('parentname', 'parentname', 'raw', None),
+    )),
+    'BaseBrush': ((), {}, (
+    )),
+    'EnableDisable': ((), {}, (
+        ('StartDisabled', 'startdisabled', 'raw', None),
+    )),
+    'RenderFxChoices': ((), {}, (
+        ('renderfx', 'renderfx', 'raw', None),
+    )),
+    'Shadow': ((), {}, (
+        ('disableshadows', 'disableshadows', 'raw', None),
+    )),
+    'RenderFields': (('RenderFxChoices',), {}, (
+        ('rendermode', 'rendermode', 'raw', None),
+        ('renderamt', 'renderamt', 'int', 255),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('disablereceiveshadows', 'disablereceiveshadows', 'raw', None),
+    )),
+    'DXLevelChoice': ((), {}, (
+        ('mindxlevel', 'mindxlevel', 'raw', None),
+        ('maxdxlevel', 'maxdxlevel', 'raw', None),
+    )),
+    'Inputfilter': ((), {}, (
+        ('InputFilter', 'inputfilter', 'raw', None),
+    )),
+    'Global': ((), {}, (
+        ('globalname', 'globalname', 'raw', None),
+    )),
+    'EnvGlobal': (('Targetname',), {}, (
+        ('initialstate', 'initialstate', 'raw', None),
+        ('counter', 'counter', 'int', 0),
+    )),
+    'DamageFilter': ((), {}, (
+        ('damagefilter', 'damagefilter', 'raw', None),
+    )),
+    'ResponseContext': ((), {}, (
+        ('ResponseContext', 'responsecontext', 'raw', None),
+    )),
+    'Breakable': (('DamageFilter', 'Shadow', 'Targetname'), {}, (
+        ('ExplodeDamage', 'explodedamage', 'float', 0),
+        ('ExplodeRadius', 'exploderadius', 'float', 0),
+        ('PerformanceMode', 'performancemode', 'raw', None),
+        ('BreakModelMessage', 'breakmodelmessage', 'raw', None),
+    )),
+    'BreakableBrush': (('Parentname', 'Global', 'Breakable'), {}, (
+        ('propdata', 'propdata', 'raw', None),
+        ('health', 'health', 'int', 1),
+        ('material', 'material', 'raw', None),
+        ('explosion', 'explosion', 'raw', None),
+        ('gibdir', 'gibdir', 'float_vector', "0 0 0"),
+        ('nodamageforces', 'nodamageforces', 'raw', None),
+        ('gibmodel', 'gibmodel', 'raw', None),
+        ('spawnobject', 'spawnobject', 'raw', None),
+        ('explodemagnitude', 'explodemagnitude', 'int', 0),
+        ('pressuredelay', 'pressuredelay', 'float', 0),
+    )),
+    'BreakableProp': (('Breakable',), {}, (
+        ('pressuredelay', 'pressuredelay', 'float', 0),
+    )),
+    'BaseNPC': (('RenderFields', 'ResponseContext', 'DamageFilter', 'Targetname', 'Shadow', 'Angles'), {}, (
+        ('target', 'target', 'raw', None),
+        ('squadname', 'squadname', 'raw', None),
+        ('hintgroup', 'hintgroup', 'raw', None),
+        ('hintlimiting', 'hintlimiting', 'raw', None),
+        ('sleepstate', 'sleepstate', 'raw', None),
+        ('wakeradius', 'wakeradius', 'float', 0),
+        ('wakesquad', 'wakesquad', 'raw', None),
+        ('enemyfilter', 'enemyfilter', 'raw', None),
+        ('ignoreunseenenemies', 'ignoreunseenenemies', 'raw', None),
+        ('physdamagescale', 'physdamagescale', 'float', 1.0),
+    )),
+    'info_npc_spawn_destination': (('Parentname', 'Targetname', 'Angles'), {'icon_sprite': "editor/info_target.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('ReuseDelay', 'reusedelay', 'float', 1),
+        ('RenameNPC', 'renamenpc', 'raw', None),
+    )),
+    'BaseNPCMaker': (('EnableDisable', 'Targetname', 'Angles'), {'icon_sprite': "editor/npc_maker.vmt"}, (
+        ('MaxNPCCount', 'maxnpccount', 'int', 1),
+        ('SpawnFrequency', 'spawnfrequency', 'raw', "5"),
+        ('MaxLiveChildren', 'maxlivechildren', 'int', 5),
+    )),
+    'npc_template_maker': (('BaseNPCMaker',), {'icon_sprite': "editor/npc_maker.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('TemplateName', 'templatename', 'raw', None),
+        ('Radius', 'radius', 'float', 256),
+        ('DestinationGroup', 'destinationgroup', 'raw', None),
+        ('CriterionVisibility', 'criterionvisibility', 'raw', "CHOICES NOT SUPPORTED"),
+        ('CriterionDistance', 'criteriondistance', 'raw', "CHOICES NOT SUPPORTED"),
+        ('MinSpawnDistance', 'minspawndistance', 'int', 0),
+    )),
+    'BaseHelicopter': (('BaseNPC',), {}, (
+        ('InitialSpeed', 'initialspeed', 'raw', "0"),
+    )),
+    'PlayerClass': ((), {}, (
+    )),
+    'Light': ((), {}, (
+        ('_light', '_light', 'int_vector', "255 255 255 200"),
+        ('_lightHDR', '_lighthdr', 'int_vector', "-1 -1 -1 1"),
+        ('_lightscaleHDR', '_lightscalehdr', 'float', 1),
+        ('style', 'style', 'raw', None),
+        ('pattern', 'pattern', 'raw', None),
+        ('_constant_attn', '_constant_attn', 'raw', "0"),
+        ('_linear_attn', '_linear_attn', 'raw', "0"),
+        ('_quadratic_attn', '_quadratic_attn', 'raw', "1"),
+        ('_fifty_percent_distance', '_fifty_percent_distance', 'raw', "0"),
+        ('_zero_percent_distance', '_zero_percent_distance', 'raw', "0"),
+        ('_hardfalloff', '_hardfalloff', 'int', 0),
+    )),
+    'Node': ((), {}, (
+        ('nodeid', 'nodeid', 'int', 0),
+    )),
+    'HintNode': (('Node',), {}, (
+        ('hinttype', 'hinttype', 'raw', None),
+        ('hintactivity', 'hintactivity', 'raw', None),
+        ('nodeFOV', 'nodefov', 'raw', "CHOICES NOT SUPPORTED"),
+        ('StartHintDisabled', 'starthintdisabled', 'raw', None),
+        ('Group', 'group', 'raw', None),
+        ('TargetNode', 'targetnode', 'int', -1),
+        ('IgnoreFacing', 'ignorefacing', 'raw', "CHOICES NOT SUPPORTED"),
+        ('MinimumState', 'minimumstate', 'raw', "CHOICES NOT SUPPORTED"),
+        ('MaximumState', 'maximumstate', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'TriggerOnce': (('Parentname', 'Global', 'Origin', 'EnableDisable', 'Targetname'), {}, (
+        ('filtername', 'filtername', 'raw', None),
+    )),
+    'Trigger': (('TriggerOnce',), {}, (
+    )),
+    'worldbase': ((), {}, (
+        ('message', 'message', 'raw', None),
+        ('skyname', 'skyname', 'raw', "sky_day01_01"),
+        ('chaptertitle', 'chaptertitle', 'raw', None),
+        ('startdark', 'startdark', 'raw', None),
+        ('gametitle', 'gametitle', 'raw', None),
+        ('newunit', 'newunit', 'raw', None),
+        ('maxoccludeearea', 'maxoccludeearea', 'float', 0),
+        ('minoccluderarea', 'minoccluderarea', 'float', 0),
+        ('maxoccludeearea_x360', 'maxoccludeearea_x360', 'float', 0),
+        ('minoccluderarea_x360', 'minoccluderarea_x360', 'float', 0),
+        ('maxpropscreenwidth', 'maxpropscreenwidth', 'float', -1),
+        ('minpropscreenwidth', 'minpropscreenwidth', 'float', 0),
+        ('detailvbsp', 'detailvbsp', 'raw', "detail.vbsp"),
+        ('detailmaterial', 'detailmaterial', 'raw', "detail/detailsprites"),
+        ('coldworld', 'coldworld', 'raw', None),
+    )),
+    'worldspawn': (('ResponseContext', 'worldbase', 'Targetname'), {}, (
+    )),
+    'ambient_generic': (('Targetname',), {'icon_sprite': "editor/ambient_generic.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('message', 'message', 'raw', None),
+        ('health', 'health', 'int', 10),
+        ('preset', 'preset', 'raw', None),
+        ('volstart', 'volstart', 'int', 0),
+        ('fadeinsecs', 'fadeinsecs', 'int', 0),
+        ('fadeoutsecs', 'fadeoutsecs', 'int', 0),
+        ('pitch', 'pitch', 'int', 100),
+        ('pitchstart', 'pitchstart', 'int', 100),
+        ('spinup', 'spinup', 'int', 0),
+        ('spindown', 'spindown', 'int', 0),
+        ('lfotype', 'lfotype', 'int', 0),
+        ('lforate', 'lforate', 'int', 0),
+        ('lfomodpitch', 'lfomodpitch', 'int', 0),
+        ('lfomodvol', 'lfomodvol', 'int', 0),
+        ('cspinup', 'cspinup', 'int', 0),
+        ('radius', 'radius', 'raw', "1250"),
+        ('SourceEntityName', 'sourceentityname', 'raw', None),
+    )),
+    'func_lod': (('Targetname',), {}, (
+        ('DisappearDist', 'disappeardist', 'int', 2000),
+        ('Solid', 'solid', 'raw', None),
+    )),
+    'env_zoom': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('Rate', 'rate', 'float', 1.0),
+        ('FOV', 'fov', 'int', 75),
+    )),
+    'env_screenoverlay': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('OverlayName1', 'overlayname1', 'raw', None),
+        ('OverlayTime1', 'overlaytime1', 'float', 1.0),
+        ('OverlayName2', 'overlayname2', 'raw', None),
+        ('OverlayTime2', 'overlaytime2', 'float', 1.0),
+        ('OverlayName3', 'overlayname3', 'raw', None),
+        ('OverlayTime3', 'overlaytime3', 'float', 1.0),
+        ('OverlayName4', 'overlayname4', 'raw', None),
+        ('OverlayTime4', 'overlaytime4', 'float', 1.0),
+        ('OverlayName5', 'overlayname5', 'raw', None),
+        ('OverlayTime5', 'overlaytime5', 'float', 1.0),
+        ('OverlayName6', 'overlayname6', 'raw', None),
+        ('OverlayTime6', 'overlaytime6', 'float', 1.0),
+        ('OverlayName7', 'overlayname7', 'raw', None),
+        ('OverlayTime7', 'overlaytime7', 'float', 1.0),
+        ('OverlayName8', 'overlayname8', 'raw', None),
+        ('OverlayTime8', 'overlaytime8', 'float', 1.0),
+        ('OverlayName9', 'overlayname9', 'raw', None),
+        ('OverlayTime9', 'overlaytime9', 'float', 1.0),
+        ('OverlayName10', 'overlayname10', 'raw', None),
+        ('OverlayTime10', 'overlaytime10', 'float', 1.0),
+    )),
+    'env_screeneffect': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('type', 'type', 'raw', None),
+    )),
+    'env_texturetoggle': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'env_splash': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('scale', 'scale', 'float', 8.0),
+    )),
+    'env_particlelight': (('Parentname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('Color', 'color', 'int_vector', "255 0 0"),
+        ('Intensity', 'intensity', 'int', 5000),
+        ('directional', 'directional', 'raw', None),
+        ('PSName', 'psname', 'raw', None),
+    )),
+    'env_sun': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('use_angles', 'use_angles', 'raw', None),
+        ('pitch', 'pitch', 'int', 0),
+        ('rendercolor', 'rendercolor', 'int_vector', "100 80 80"),
+        ('overlaycolor', 'overlaycolor', 'int_vector', "0 0 0"),
+        ('size', 'size', 'int', 16),
+        ('overlaysize', 'overlaysize', 'int', -1),
+        ('material', 'material', 'raw', "sprites/light_glow02_add_noz"),
+        ('overlaymaterial', 'overlaymaterial', 'raw', "sprites/light_glow02_add_noz"),
+        ('HDRColorScale', 'hdrcolorscale', 'float', 1.0),
+    )),
+    'game_ragdoll_manager': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('MaxRagdollCount', 'maxragdollcount', 'int', -1),
+        ('MaxRagdollCountDX8', 'maxragdollcountdx8', 'int', -1),
+        ('SaveImportant', 'saveimportant', 'raw', None),
+    )),
+    'game_gib_manager': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('maxpieces', 'maxpieces', 'int', -1),
+        ('maxpiecesdx8', 'maxpiecesdx8', 'int', -1),
+        ('allownewgibs', 'allownewgibs', 'raw', None),
+    )),
+    'env_lightglow': (('Parentname', 'Targetname', 'Angles'), {'model': "models/editor/axis_helper_thick.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('VerticalGlowSize', 'verticalglowsize', 'int', 30),
+        ('HorizontalGlowSize', 'horizontalglowsize', 'int', 30),
+        ('MinDist', 'mindist', 'int', 500),
+        ('MaxDist', 'maxdist', 'int', 2000),
+        ('OuterMaxDist', 'outermaxdist', 'int', 0),
+        ('GlowProxySize', 'glowproxysize', 'float', 2.0),
+        ('HDRColorScale', 'hdrcolorscale', 'float', 1.0),
+    )),
+    'env_smokestack': (('Parentname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('targetname', 'targetname', 'raw', None),
+        ('InitialState', 'initialstate', 'raw', None),
+        ('BaseSpread', 'basespread', 'int', 20),
+        ('SpreadSpeed', 'spreadspeed', 'int', 15),
+        ('Speed', 'speed', 'int', 30),
+        ('StartSize', 'startsize', 'int', 20),
+        ('EndSize', 'endsize', 'int', 30),
+        ('Rate', 'rate', 'int', 20),
+        ('JetLength', 'jetlength', 'int', 180),
+        ('WindAngle', 'windangle', 'int', 0),
+        ('WindSpeed', 'windspeed', 'int', 0),
+        ('SmokeMaterial', 'smokematerial', 'raw', "particle/SmokeStack.vmt"),
+        ('twist', 'twist', 'int', 0),
+        ('roll', 'roll', 'float', 0),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('renderamt', 'renderamt', 'int', 255),
+    )),
+    'env_fade': (('Targetname',), {'icon_sprite': "editor/env_fade"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('duration', 'duration', 'raw', "2"),
+        ('holdtime', 'holdtime', 'raw', "0"),
+        ('renderamt', 'renderamt', 'int', 255),
+        ('rendercolor', 'rendercolor', 'int_vector', "0 0 0"),
+    )),
+    'env_player_surface_trigger': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('gamematerial', 'gamematerial', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'env_tonemap_controller': (('Targetname',), {'icon_sprite': "editor/env_tonemap_controller.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'func_useableladder': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('point0', 'point0', 'float_vector', "0 0 0"),
+        ('point1', 'point1', 'float_vector', "0 0 0"),
+        ('StartDisabled', 'startdisabled', 'raw', None),
+        ('ladderSurfaceProperties', 'laddersurfaceproperties', 'raw', None),
+    )),
+    'func_ladderendpoint': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'info_ladder_dismount': (('Parentname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'func_areaportalwindow': (('Targetname',), {}, (
+        ('target', 'target', 'raw', None),
+        ('FadeStartDist', 'fadestartdist', 'int', 128),
+        ('FadeDist', 'fadedist', 'int', 512),
+        ('TranslucencyLimit', 'translucencylimit', 'raw', "0.2"),
+        ('BackgroundBModel', 'backgroundbmodel', 'raw', None),
+        ('PortalVersion', 'portalversion', 'int', 1),
+    )),
+    'func_wall': (('RenderFields', 'Shadow', 'Global', 'Targetname'), {}, (
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_clip_vphysics': (('EnableDisable', 'Targetname'), {}, (
+        ('filtername', 'filtername', 'raw', None),
+    )),
+    'func_brush': (('Parentname', 'Global', 'Origin', 'RenderFields', 'EnableDisable', 'Targetname', 'Inputfilter', 'Shadow'), {}, (
+        ('_minlight', '_minlight', 'raw', None),
+        ('Solidity', 'solidity', 'raw', None),
+        ('excludednpc', 'excludednpc', 'raw', None),
+        ('invert_exclusion', 'invert_exclusion', 'raw', None),
+        ('solidbsp', 'solidbsp', 'raw', None),
+        ('vrad_brush_cast_shadows', 'vrad_brush_cast_shadows', 'raw', None),
+    )),
+    'vgui_screen_base': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('panelname', 'panelname', 'raw', None),
+        ('overlaymaterial', 'overlaymaterial', 'raw', None),
+        ('width', 'width', 'int', 32),
+        ('height', 'height', 'int', 32),
+    )),
+    'vgui_screen': (('vgui_screen_base',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'vgui_slideshow_display': (('Parentname', 'Targetname', 'Angles'), {'model': "models/editor/axis_helper_thick.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('displaytext', 'displaytext', 'raw', None),
+        ('directory', 'directory', 'raw', "slideshow"),
+        ('minslidetime', 'minslidetime', 'float', 0.5),
+        ('maxslidetime', 'maxslidetime', 'float', 0.5),
+        ('cycletype', 'cycletype', 'raw', None),
+        ('nolistrepeat', 'nolistrepeat', 'raw', None),
+        ('width', 'width', 'int', 256),
+        ('height', 'height', 'int', 128),
+    )),
+    'cycler': (('Parentname', 'RenderFields', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('model', 'model', 'raw', None),
+        ('skin', 'skin', 'int', 0),
+        ('sequence', 'sequence', 'int', 0),
+    )),
+    'gibshooterbase': (('Parentname', 'Targetname'), {}, (
+        ('angles', 'angles', 'raw', "0 0 0"),
+        ('m_iGibs', 'm_igibs', 'int', 3),
+        ('delay', 'delay', 'raw', "0"),
+        ('gibangles', 'gibangles', 'raw', "0 0 0"),
+        ('gibanglevelocity', 'gibanglevelocity', 'raw', "0"),
+        ('m_flVelocity', 'm_flvelocity', 'int', 200),
+        ('m_flVariance', 'm_flvariance', 'raw', "0.15"),
+        ('m_flGibLife', 'm_flgiblife', 'raw', "4"),
+        ('lightingorigin', 'lightingorigin', 'raw', None),
+    )),
+    'env_beam': (('Parentname', 'Targetname', 'RenderFxChoices'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('renderamt', 'renderamt', 'int', 100),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('Radius', 'radius', 'int', 256),
+        ('life', 'life', 'raw', "1"),
+        ('BoltWidth', 'boltwidth', 'float', 2),
+        ('NoiseAmplitude', 'noiseamplitude', 'float', 0),
+        ('texture', 'texture', 'raw', "sprites/laserbeam.spr"),
+        ('TextureScroll', 'texturescroll', 'int', 35),
+        ('framerate', 'framerate', 'int', 0),
+        ('framestart', 'framestart', 'int', 0),
+        ('StrikeTime', 'striketime', 'raw', "1"),
+        ('damage', 'damage', 'raw', "0"),
+        ('LightningStart', 'lightningstart', 'raw', None),
+        ('LightningEnd', 'lightningend', 'raw', None),
+        ('decalname', 'decalname', 'raw', "Bigshot"),
+        ('HDRColorScale', 'hdrcolorscale', 'float', 1.0),
+        ('TouchType', 'touchtype', 'raw', None),
+        ('filtername', 'filtername', 'raw', None),
+    )),
+    'env_beverage': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('health', 'health', 'int', 10),
+        ('beveragetype', 'beveragetype', 'raw', None),
+    )),
+    'env_embers': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('particletype', 'particletype', 'raw', None),
+        ('density', 'density', 'int', 50),
+        ('lifetime', 'lifetime', 'int', 4),
+        ('speed', 'speed', 'int', 32),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+    )),
+    'env_funnel': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'env_blood': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('spraydir', 'spraydir', 'float_vector', "0 0 0"),
+        ('color', 'color', 'raw', None),
+        ('amount', 'amount', 'raw', "100"),
+    )),
+    'env_bubbles': (('Parentname', 'Targetname'), {}, (
+        ('density', 'density', 'int', 2),
+        ('frequency', 'frequency', 'int', 2),
+        ('current', 'current', 'int', 0),
+    )),
+    'env_explosion': (('Parentname', 'Targetname'), {'icon_sprite': "editor/env_explosion.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('iMagnitude', 'imagnitude', 'int', 100),
+        ('iRadiusOverride', 'iradiusoverride', 'int', 0),
+        ('fireballsprite', 'fireballsprite', 'raw', "sprites/zerogxplode.spr"),
+        ('rendermode', 'rendermode', 'raw', "CHOICES NOT SUPPORTED"),
+        ('ignoredEntity', 'ignoredentity', 'raw', None),
+    )),
+    'env_smoketrail': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('opacity', 'opacity', 'float', 0.75),
+        ('spawnrate', 'spawnrate', 'float', 20),
+        ('lifetime', 'lifetime', 'float', 5.0),
+        ('startcolor', 'startcolor', 'int_vector', "192 192 192"),
+        ('endcolor', 'endcolor', 'int_vector', "160 160 160"),
+        ('emittime', 'emittime', 'float', 0),
+        ('minspeed', 'minspeed', 'float', 10),
+        ('maxspeed', 'maxspeed', 'float', 20),
+        ('mindirectedspeed', 'mindirectedspeed', 'float', 0),
+        ('maxdirectedspeed', 'maxdirectedspeed', 'float', 0),
+        ('startsize', 'startsize', 'float', 15),
+        ('endsize', 'endsize', 'float', 50),
+        ('spawnradius', 'spawnradius', 'float', 15),
+        ('firesprite', 'firesprite', 'raw', "sprites/firetrail.spr"),
+        ('smokesprite', 'smokesprite', 'raw', "sprites/whitepuff.spr"),
+    )),
+    'env_physexplosion': (('Parentname', 'Targetname'), {'icon_sprite': "editor/env_physexplosion.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('magnitude', 'magnitude', 'raw', "100"),
+        ('radius', 'radius', 'raw', "0"),
+        ('targetentityname', 'targetentityname', 'raw', None),
+        ('inner_radius', 'inner_radius', 'float', 0),
+    )),
+    'env_physimpact': (('Parentname', 'Targetname'), {'icon_sprite': "editor/env_physexplosion.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('angles', 'angles', 'raw', "0 0 0"),
+        ('magnitude', 'magnitude', 'int', 100),
+        ('distance', 'distance', 'int', 0),
+        ('directionentityname', 'directionentityname', 'raw', None),
+    )),
+    'env_fire': (('Parentname', 'EnableDisable', 'Targetname'), {'icon_sprite': "editor/env_fire"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('health', 'health', 'int', 30),
+        ('firesize', 'firesize', 'int', 64),
+        ('fireattack', 'fireattack', 'int', 4),
+        ('firetype', 'firetype', 'raw', None),
+        ('ignitionpoint', 'ignitionpoint', 'float', 32),
+        ('damagescale', 'damagescale', 'float', 1.0),
+    )),
+    'env_firesource': (('Parentname', 'Targetname'), {'icon_sprite': "editor/env_firesource"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('fireradius', 'fireradius', 'float', 128),
+        ('firedamage', 'firedamage', 'float', 10),
+    )),
+    'env_firesensor': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('fireradius', 'fireradius', 'float', 128),
+        ('heatlevel', 'heatlevel', 'float', 32),
+        ('heattime', 'heattime', 'float', 0),
+    )),
+    'env_entity_igniter': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('lifetime', 'lifetime', 'float', 10),
+    )),
+    'env_fog_controller': (('DXLevelChoice', 'Targetname', 'Angles'), {'icon_sprite': "editor/fog_controller.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('fogenable', 'fogenable', 'raw', None),
+        ('fogblend', 'fogblend', 'raw', None),
+        ('use_angles', 'use_angles', 'raw', None),
+        ('fogcolor', 'fogcolor', 'int_vector', "255 255 255"),
+        ('fogcolor2', 'fogcolor2', 'int_vector', "255 255 255"),
+        ('fogdir', 'fogdir', 'raw', "1 0 0"),
+        ('fogstart', 'fogstart', 'raw', "500.0"),
+        ('fogend', 'fogend', 'raw', "2000.0"),
+        ('fogmaxdensity', 'fogmaxdensity', 'float', 1),
+        ('foglerptime', 'foglerptime', 'float', 0),
+        ('farz', 'farz', 'raw', "-1"),
+    )),
+    'env_steam': (('Parentname', 'Targetname', 'Angles'), {'viewport_model': "models/editor/spot_cone.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('InitialState', 'initialstate', 'raw', None),
+        ('type', 'type', 'raw', None),
+        ('SpreadSpeed', 'spreadspeed', 'int', 15),
+        ('Speed', 'speed', 'int', 120),
+        ('StartSize', 'startsize', 'int', 10),
+        ('EndSize', 'endsize', 'int', 25),
+        ('Rate', 'rate', 'int', 26),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('JetLength', 'jetlength', 'int', 80),
+        ('renderamt', 'renderamt', 'int', 255),
+        ('rollspeed', 'rollspeed', 'float', 8),
+    )),
+    'env_laser': (('Parentname', 'Targetname', 'RenderFxChoices'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('LaserTarget', 'lasertarget', 'raw', None),
+        ('renderamt', 'renderamt', 'int', 100),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('width', 'width', 'float', 2),
+        ('NoiseAmplitude', 'noiseamplitude', 'int', 0),
+        ('texture', 'texture', 'raw', "sprites/laserbeam.spr"),
+        ('EndSprite', 'endsprite', 'raw', None),
+        ('TextureScroll', 'texturescroll', 'int', 35),
+        ('framestart', 'framestart', 'int', 0),
+        ('damage', 'damage', 'raw', "100"),
+        ('dissolvetype', 'dissolvetype', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'env_message': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('message', 'message', 'raw', None),
+        ('messagesound', 'messagesound', 'raw', None),
+        ('messagevolume', 'messagevolume', 'raw', "10"),
+        ('messageattenuation', 'messageattenuation', 'raw', None),
+    )),
+    'env_hudhint': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('message', 'message', 'raw', None),
+    )),
+    'env_shake': (('Parentname', 'Targetname'), {'icon_sprite': "editor/env_shake.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('amplitude', 'amplitude', 'float', 4),
+        ('radius', 'radius', 'float', 500),
+        ('duration', 'duration', 'float', 1),
+        ('frequency', 'frequency', 'float', 2.5),
+    )),
+    'env_viewpunch': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('punchangle', 'punchangle', 'float_vector', "0 0 90"),
+        ('radius', 'radius', 'float', 500),
+    )),
+    'env_rotorwash_emitter': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('altitude', 'altitude', 'float', 1024),
+    )),
+    'gibshooter': (('gibshooterbase',), {'icon_sprite': "editor/gibshooter.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'env_shooter': (('gibshooterbase', 'RenderFields'), {'icon_sprite': "editor/env_shooter.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('shootmodel', 'shootmodel', 'raw', None),
+        ('shootsounds', 'shootsounds', 'raw', "CHOICES NOT SUPPORTED"),
+        ('simulation', 'simulation', 'raw', None),
+        ('skin', 'skin', 'int', 0),
+        ('nogibshadows', 'nogibshadows', 'raw', None),
+        ('gibgravityscale', 'gibgravityscale', 'float', 1),
+        ('massoverride', 'massoverride', 'float', 0),
+    )),
+    'env_rotorshooter': (('gibshooterbase', 'RenderFields'), {'icon_sprite': "editor/env_shooter.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('shootmodel', 'shootmodel', 'raw', None),
+        ('shootsounds', 'shootsounds', 'raw', "CHOICES NOT SUPPORTED"),
+        ('simulation', 'simulation', 'raw', None),
+        ('skin', 'skin', 'int', 0),
+        ('rotortime', 'rotortime', 'float', 1),
+        ('rotortimevariance', 'rotortimevariance', 'float', 0.3),
+    )),
+    'env_soundscape_proxy': (('Parentname', 'Targetname'), {'icon_sprite': "editor/env_soundscape.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('MainSoundscapeName', 'mainsoundscapename', 'raw', None),
+        ('radius', 'radius', 'int', 128),
+    )),
+    'env_soundscape': (('Parentname', 'EnableDisable', 'Targetname'), {'icon_sprite': "editor/env_soundscape.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('radius', 'radius', 'int', 128),
+        ('soundscape', 'soundscape', 'raw', "CHOICES NOT SUPPORTED"),
+        ('position0', 'position0', 'raw', None),
+        ('position1', 'position1', 'raw', None),
+        ('position2', 'position2', 'raw', None),
+        ('position3', 'position3', 'raw', None),
+        ('position4', 'position4', 'raw', None),
+        ('position5', 'position5', 'raw', None),
+        ('position6', 'position6', 'raw', None),
+        ('position7', 'position7', 'raw', None),
+    )),
+    'env_soundscape_triggerable': (('env_soundscape',), {'icon_sprite': "editor/env_soundscape.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'env_spark': (('Parentname', 'Targetname', 'Angles'), {'icon_sprite': "editor/env_spark.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('MaxDelay', 'maxdelay', 'raw', "0"),
+        ('Magnitude', 'magnitude', 'raw', "CHOICES NOT SUPPORTED"),
+        ('TrailLength', 'traillength', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'env_sprite': (('Parentname', 'Targetname', 'DXLevelChoice', 'RenderFields'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('framerate', 'framerate', 'raw', "10.0"),
+        ('model', 'model', 'raw', "sprites/glow01.spr"),
+        ('scale', 'scale', 'raw', None),
+        ('GlowProxySize', 'glowproxysize', 'float', 2.0),
+        ('HDRColorScale', 'hdrcolorscale', 'float', 1.0),
+    )),
+    'env_sprite_oriented': (('env_sprite', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'env_wind': (('Targetname', 'Angles'), {'icon_sprite': "editor/env_wind.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('minwind', 'minwind', 'int', 20),
+        ('maxwind', 'maxwind', 'int', 50),
+        ('mingust', 'mingust', 'int', 100),
+        ('maxgust', 'maxgust', 'int', 250),
+        ('mingustdelay', 'mingustdelay', 'int', 10),
+        ('maxgustdelay', 'maxgustdelay', 'int', 20),
+        ('gustduration', 'gustduration', 'int', 5),
+        ('gustdirchange', 'gustdirchange', 'int', 20),
+    )),
+    'sky_camera': (('Angles',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('scale', 'scale', 'int', 16),
+        ('fogenable', 'fogenable', 'raw', None),
+        ('fogblend', 'fogblend', 'raw', None),
+        ('use_angles', 'use_angles', 'raw', None),
+        ('fogcolor', 'fogcolor', 'int_vector', "255 255 255"),
+        ('fogcolor2', 'fogcolor2', 'int_vector', "255 255 255"),
+        ('fogdir', 'fogdir', 'raw', "1 0 0"),
+        ('fogstart', 'fogstart', 'raw', "500.0"),
+        ('fogend', 'fogend', 'raw', "2000.0"),
+    )),
+    'BaseSpeaker': (('ResponseContext', 'Targetname'), {}, (
+        ('delaymin', 'delaymin', 'raw', "15"),
+        ('delaymax', 'delaymax', 'raw', "135"),
+        ('rulescript', 'rulescript', 'raw', None),
+        ('concept', 'concept', 'raw', None),
+    )),
+    'game_weapon_manager': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('weaponname', 'weaponname', 'raw', None),
+        ('maxpieces', 'maxpieces', 'int', 0),
+        ('ammomod', 'ammomod', 'float', 1),
+    )),
+    'game_end': (('Targetname',), {'icon_sprite': "editor/game_end.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('master', 'master', 'raw', None),
+    )),
+    'game_player_equip': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('master', 'master', 'raw', None),
+    )),
+    'game_player_team': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('master', 'master', 'raw', None),
+    )),
+    'game_score': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('points', 'points', 'int', 1),
+        ('master', 'master', 'raw', None),
+    )),
+    'game_text': (('Targetname',), {'icon_sprite': "editor/game_text.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('message', 'message', 'raw', None),
+        ('x', 'x', 'raw', "-1"),
+        ('y', 'y', 'raw', "-1"),
+        ('effect', 'effect', 'raw', None),
+        ('color', 'color', 'int_vector', "100 100 100"),
+        ('color2', 'color2', 'int_vector', "240 110 0"),
+        ('fadein', 'fadein', 'raw', "1.5"),
+        ('fadeout', 'fadeout', 'raw', "0.5"),
+        ('holdtime', 'holdtime', 'raw', "1.2"),
+        ('fxtime', 'fxtime', 'raw', "0.25"),
+        ('channel', 'channel', 'raw', "CHOICES NOT SUPPORTED"),
+        ('master', 'master', 'raw', None),
+    )),
+    'point_enable_motion_fixup': (('Parentname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'point_message': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('message', 'message', 'raw', None),
+        ('radius', 'radius', 'int', 128),
+        ('developeronly', 'developeronly', 'raw', None),
+    )),
+    'point_spotlight': (('Parentname', 'RenderFields', 'Targetname', 'DXLevelChoice', 'Angles'), {'model': "models/editor/cone_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('IgnoreSolid', 'ignoresolid', 'raw', None),
+        ('spotlightlength', 'spotlightlength', 'int', 500),
+        ('spotlightwidth', 'spotlightwidth', 'int', 50),
+        ('HDRColorScale', 'hdrcolorscale', 'float', 1.0),
+    )),
+    'point_tesla': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('m_SourceEntityName', 'm_sourceentityname', 'raw', None),
+        ('m_SoundName', 'm_soundname', 'raw', "DoSpark"),
+        ('texture', 'texture', 'raw', "sprites/physbeam.vmt"),
+        ('m_Color', 'm_color', 'int_vector', "255 255 255"),
+        ('m_flRadius', 'm_flradius', 'int', 200),
+        ('beamcount_min', 'beamcount_min', 'int', 6),
+        ('beamcount_max', 'beamcount_max', 'int', 8),
+        ('thick_min', 'thick_min', 'raw', "4"),
+        ('thick_max', 'thick_max', 'raw', "5"),
+        ('lifetime_min', 'lifetime_min', 'raw', "0.3"),
+        ('lifetime_max', 'lifetime_max', 'raw', "0.3"),
+        ('interval_min', 'interval_min', 'raw', "0.5"),
+        ('interval_max', 'interval_max', 'raw', "2"),
+    )),
+    'point_clientcommand': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'point_servercommand': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'point_bonusmaps_accessor': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('filename', 'filename', 'raw', None),
+        ('mapname', 'mapname', 'raw', None),
+    )),
+    'game_ui': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('FieldOfView', 'fieldofview', 'float', -1.0),
+    )),
+    'game_zone_player': (('Parentname', 'Targetname'), {}, (
+    )),
+    'infodecal': (('Targetname',), {'model': "models/editor/axis_helper_thick.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('texture', 'texture', 'raw', None),
+        ('LowPriority', 'lowpriority', 'raw', None),
+    )),
+    'info_projecteddecal': (('Targetname', 'Angles'), {'model': "models/editor/axis_helper_thick.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('texture', 'texture', 'raw', None),
+        ('Distance', 'distance', 'float', 64),
+    )),
+    'info_no_dynamic_shadow': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('sides', 'sides', 'raw', None),
+    )),
+    'info_player_start': (('PlayerClass', 'Angles'), {'model': "models/editor/playerstart.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_overlay': (('Targetname',), {'model': "models/editor/overlay_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('material', 'material', 'raw', None),
+        ('sides', 'sides', 'raw', None),
+        ('RenderOrder', 'renderorder', 'int', 0),
+        ('StartU', 'startu', 'float', 0.0),
+        ('EndU', 'endu', 'float', 1.0),
+        ('StartV', 'startv', 'float', 0.0),
+        ('EndV', 'endv', 'float', 1.0),
+        ('BasisOrigin', 'basisorigin', 'float_vector', "0 0 0"),
+        ('BasisU', 'basisu', 'float_vector', "0 0 0"),
+        ('BasisV', 'basisv', 'float_vector', "0 0 0"),
+        ('BasisNormal', 'basisnormal', 'float_vector', "0 0 0"),
+        ('uv0', 'uv0', 'float_vector', "0 0 0"),
+        ('uv1', 'uv1', 'float_vector', "0 0 0"),
+        ('uv2', 'uv2', 'float_vector', "0 0 0"),
+        ('uv3', 'uv3', 'float_vector', "0 0 0"),
+        ('fademindist', 'fademindist', 'float', -1),
+        ('fademaxdist', 'fademaxdist', 'float', 0),
+    )),
+    'info_overlay_transition': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('material', 'material', 'raw', None),
+        ('sides', 'sides', 'raw', None),
+        ('sides2', 'sides2', 'raw', None),
+        ('LengthTexcoordStart', 'lengthtexcoordstart', 'float', 0.0),
+        ('LengthTexcoordEnd', 'lengthtexcoordend', 'float', 1.0),
+        ('WidthTexcoordStart', 'widthtexcoordstart', 'float', 0.0),
+        ('WidthTexcoordEnd', 'widthtexcoordend', 'float', 1.0),
+        ('Width1', 'width1', 'float', 25.0),
+        ('Width2', 'width2', 'float', 25.0),
+        ('DebugDraw', 'debugdraw', 'int', 0),
+    )),
+    'info_intermission': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'info_landmark': (('Targetname',), {'icon_sprite': "editor/info_landmark"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_null': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_target': (('Parentname', 'Targetname', 'Angles'), {'icon_sprite': "editor/info_target.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_particle_system': (('Parentname', 'Targetname', 'Angles'), {'model': "models/editor/cone_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('effect_name', 'effect_name', 'raw', None),
+        ('start_active', 'start_active', 'raw', None),
+        ('flag_as_weather', 'flag_as_weather', 'raw', None),
+        ('cpoint1', 'cpoint1', 'raw', None),
+        ('cpoint2', 'cpoint2', 'raw', None),
+        ('cpoint3', 'cpoint3', 'raw', None),
+        ('cpoint4', 'cpoint4', 'raw', None),
+        ('cpoint5', 'cpoint5', 'raw', None),
+        ('cpoint6', 'cpoint6', 'raw', None),
+        ('cpoint7', 'cpoint7', 'raw', None),
+        ('cpoint8', 'cpoint8', 'raw', None),
+        ('cpoint9', 'cpoint9', 'raw', None),
+        ('cpoint10', 'cpoint10', 'raw', None),
+        ('cpoint11', 'cpoint11', 'raw', None),
+        ('cpoint12', 'cpoint12', 'raw', None),
+        ('cpoint13', 'cpoint13', 'raw', None),
+        ('cpoint14', 'cpoint14', 'raw', None),
+        ('cpoint15', 'cpoint15', 'raw', None),
+        ('cpoint16', 'cpoint16', 'raw', None),
+        ('cpoint17', 'cpoint17', 'raw', None),
+        ('cpoint18', 'cpoint18', 'raw', None),
+        ('cpoint19', 'cpoint19', 'raw', None),
+        ('cpoint20', 'cpoint20', 'raw', None),
+        ('cpoint21', 'cpoint21', 'raw', None),
+        ('cpoint22', 'cpoint22', 'raw', None),
+        ('cpoint23', 'cpoint23', 'raw', None),
+        ('cpoint24', 'cpoint24', 'raw', None),
+        ('cpoint25', 'cpoint25', 'raw', None),
+        ('cpoint26', 'cpoint26', 'raw', None),
+        ('cpoint27', 'cpoint27', 'raw', None),
+        ('cpoint28', 'cpoint28', 'raw', None),
+        ('cpoint29', 'cpoint29', 'raw', None),
+        ('cpoint30', 'cpoint30', 'raw', None),
+        ('cpoint31', 'cpoint31', 'raw', None),
+        ('cpoint32', 'cpoint32', 'raw', None),
+        ('cpoint33', 'cpoint33', 'raw', None),
+        ('cpoint34', 'cpoint34', 'raw', None),
+        ('cpoint35', 'cpoint35', 'raw', None),
+        ('cpoint36', 'cpoint36', 'raw', None),
+        ('cpoint37', 'cpoint37', 'raw', None),
+        ('cpoint38', 'cpoint38', 'raw', None),
+        ('cpoint39', 'cpoint39', 'raw', None),
+        ('cpoint40', 'cpoint40', 'raw', None),
+        ('cpoint41', 'cpoint41', 'raw', None),
+        ('cpoint42', 'cpoint42', 'raw', None),
+        ('cpoint43', 'cpoint43', 'raw', None),
+        ('cpoint44', 'cpoint44', 'raw', None),
+        ('cpoint45', 'cpoint45', 'raw', None),
+        ('cpoint46', 'cpoint46', 'raw', None),
+        ('cpoint47', 'cpoint47', 'raw', None),
+        ('cpoint48', 'cpoint48', 'raw', None),
+        ('cpoint49', 'cpoint49', 'raw', None),
+        ('cpoint50', 'cpoint50', 'raw', None),
+        ('cpoint51', 'cpoint51', 'raw', None),
+        ('cpoint52', 'cpoint52', 'raw', None),
+        ('cpoint53', 'cpoint53', 'raw', None),
+        ('cpoint54', 'cpoint54', 'raw', None),
+        ('cpoint55', 'cpoint55', 'raw', None),
+        ('cpoint56', 'cpoint56', 'raw', None),
+        ('cpoint57', 'cpoint57', 'raw', None),
+        ('cpoint58', 'cpoint58', 'raw', None),
+        ('cpoint59', 'cpoint59', 'raw', None),
+        ('cpoint60', 'cpoint60', 'raw', None),
+        ('cpoint61', 'cpoint61', 'raw', None),
+        ('cpoint62', 'cpoint62', 'raw', None),
+        ('cpoint63', 'cpoint63', 'raw', None),
+        ('cpoint1_parent', 'cpoint1_parent', 'int', 0),
+        ('cpoint2_parent', 'cpoint2_parent', 'int', 0),
+        ('cpoint3_parent', 'cpoint3_parent', 'int', 0),
+        ('cpoint4_parent', 'cpoint4_parent', 'int', 0),
+        ('cpoint5_parent', 'cpoint5_parent', 'int', 0),
+        ('cpoint6_parent', 'cpoint6_parent', 'int', 0),
+        ('cpoint7_parent', 'cpoint7_parent', 'int', 0),
+    )),
+    'phys_ragdollmagnet': (('EnableDisable', 'Targetname', 'Parentname', 'Angles'), {'icon_sprite': "editor/info_target.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('axis', 'axis', 'raw', None),
+        ('radius', 'radius', 'float', 512),
+        ('force', 'force', 'float', 5000),
+        ('target', 'target', 'raw', None),
+    )),
+    'info_lighting': (('Targetname',), {'icon_sprite': "editor/info_lighting.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_teleport_destination': (('Parentname', 'PlayerClass', 'Targetname', 'Angles'), {'model': "models/editor/playerstart.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_node': (('Node',), {'model': "models/editor/ground_node.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_node_hint': (('Targetname', 'Angles', 'HintNode'), {'model': "models/editor/ground_node_hint.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_node_air': (('Node',), {'model': "models/editor/air_node.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('nodeheight', 'nodeheight', 'int', 0),
+    )),
+    'info_node_air_hint': (('Targetname', 'Angles', 'HintNode'), {'model': "models/editor/air_node_hint.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('nodeheight', 'nodeheight', 'int', 0),
+    )),
+    'info_hint': (('Targetname', 'Angles', 'HintNode'), {'model': "models/editor/node_hint.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_node_link': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('StartNode', 'startnode', 'int', 0),
+        ('EndNode', 'endnode', 'int', 0),
+        ('initialstate', 'initialstate', 'raw', "CHOICES NOT SUPPORTED"),
+        ('linktype', 'linktype', 'raw', "CHOICES NOT SUPPORTED"),
+        ('AllowUse', 'allowuse', 'raw', None),
+        ('InvertAllow', 'invertallow', 'raw', None),
+    )),
+    'info_node_link_controller': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('mins', 'mins', 'float_vector', "-8 -32 -36"),
+        ('maxs', 'maxs', 'float_vector', "8 32 36"),
+        ('initialstate', 'initialstate', 'raw', "CHOICES NOT SUPPORTED"),
+        ('useairlinkradius', 'useairlinkradius', 'raw', None),
+        ('AllowUse', 'allowuse', 'raw', None),
+        ('InvertAllow', 'invertallow', 'raw', None),
+    )),
+    'info_radial_link_controller': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('radius', 'radius', 'float', 120),
+    )),
+    'info_node_climb': (('Targetname', 'Angles', 'HintNode'), {'model': "models/editor/climb_node.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'light': (('Light', 'Targetname'), {'icon_sprite': "editor/light.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('_distance', '_distance', 'int', 0),
+    )),
+    'light_environment': (('Angles',), {'icon_sprite': "editor/light_env.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('pitch', 'pitch', 'int', 0),
+        ('_light', '_light', 'int_vector', "255 255 255 200"),
+        ('_ambient', '_ambient', 'int_vector', "255 255 255 20"),
+        ('_lightHDR', '_lighthdr', 'int_vector', "-1 -1 -1 1"),
+        ('_lightscaleHDR', '_lightscalehdr', 'float', 1),
+        ('_ambientHDR', '_ambienthdr', 'int_vector', "-1 -1 -1 1"),
+        ('_AmbientScaleHDR', '_ambientscalehdr', 'float', 1),
+        ('SunSpreadAngle', 'sunspreadangle', 'float', 0),
+    )),
+    'light_spot': (('Light', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('_inner_cone', '_inner_cone', 'int', 30),
+        ('_cone', '_cone', 'int', 45),
+        ('_exponent', '_exponent', 'int', 1),
+        ('_distance', '_distance', 'int', 0),
+        ('pitch', 'pitch', 'float', -90),
+    )),
+    'light_dynamic': (('Parentname', 'Targetname', 'Angles'), {'icon_sprite': "editor/light.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('_light', '_light', 'int_vector', "255 255 255 200"),
+        ('brightness', 'brightness', 'int', 0),
+        ('_inner_cone', '_inner_cone', 'int', 30),
+        ('_cone', '_cone', 'int', 45),
+        ('pitch', 'pitch', 'int', -90),
+        ('distance', 'distance', 'float', 120),
+        ('spotlight_radius', 'spotlight_radius', 'float', 80),
+        ('style', 'style', 'raw', None),
+    )),
+    'shadow_control': (('Targetname',), {'icon_sprite': "editor/shadow_control.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('angles', 'angles', 'raw', "80 30 0"),
+        ('color', 'color', 'int_vector', "128 128 128"),
+        ('distance', 'distance', 'float', 75),
+        ('disableallshadows', 'disableallshadows', 'raw', None),
+    )),
+    'color_correction': (('EnableDisable', 'Targetname'), {'icon_sprite': "editor/color_correction.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('minfalloff', 'minfalloff', 'float', 0.0),
+        ('maxfalloff', 'maxfalloff', 'float', 200.0),
+        ('maxweight', 'maxweight', 'float', 1.0),
+        ('filename', 'filename', 'raw', None),
+        ('fadeInDuration', 'fadeinduration', 'float', 0.0),
+        ('fadeOutDuration', 'fadeoutduration', 'float', 0.0),
+    )),
+    'color_correction_volume': (('EnableDisable', 'Targetname'), {}, (
+        ('fadeDuration', 'fadeduration', 'float', 10.0),
+        ('maxweight', 'maxweight', 'float', 1.0),
+        ('filename', 'filename', 'raw', None),
+    )),
+    'KeyFrame': ((), {}, (
+        ('NextKey', 'nextkey', 'raw', None),
+        ('MoveSpeed', 'movespeed', 'int', 64),
+    )),
+    'Mover': ((), {}, (
+        ('PositionInterpolator', 'positioninterpolator', 'raw', None),
+    )),
+    'func_movelinear': (('Parentname', 'Targetname', 'RenderFields', 'Origin'), {}, (
+        ('movedir', 'movedir', 'float_vector', "0 0 0"),
+        ('startposition', 'startposition', 'float', 0),
+        ('speed', 'speed', 'int', 100),
+        ('movedistance', 'movedistance', 'float', 100),
+        ('blockdamage', 'blockdamage', 'float', 0),
+        ('startsound', 'startsound', 'raw', None),
+        ('stopsound', 'stopsound', 'raw', None),
+    )),
+    'func_water_analog': (('Parentname', 'Targetname', 'Origin'), {}, (
+        ('movedir', 'movedir', 'float_vector', "0 0 0"),
+        ('startposition', 'startposition', 'float', 0),
+        ('speed', 'speed', 'int', 100),
+        ('movedistance', 'movedistance', 'float', 100),
+        ('startsound', 'startsound', 'raw', None),
+        ('stopsound', 'stopsound', 'raw', None),
+        ('WaveHeight', 'waveheight', 'raw', "3.0"),
+    )),
+    'func_rotating': (('Parentname', 'Origin', 'RenderFields', 'Targetname', 'Shadow', 'Angles'), {}, (
+        ('maxspeed', 'maxspeed', 'int', 100),
+        ('fanfriction', 'fanfriction', 'int', 20),
+        ('message', 'message', 'raw', None),
+        ('volume', 'volume', 'int', 10),
+        ('_minlight', '_minlight', 'raw', None),
+        ('dmg', 'dmg', 'int', 0),
+        ('solidbsp', 'solidbsp', 'raw', None),
+    )),
+    'func_platrot': (('Parentname', 'Origin', 'RenderFields', 'BasePlat', 'Targetname', 'Shadow', 'Angles'), {}, (
+        ('noise1', 'noise1', 'raw', None),
+        ('noise2', 'noise2', 'raw', None),
+        ('speed', 'speed', 'int', 50),
+        ('height', 'height', 'int', 0),
+        ('rotation', 'rotation', 'int', 0),
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'keyframe_track': (('Parentname', 'Targetname', 'Angles', 'KeyFrame'), {}, (
+    )),
+    'move_keyframed': (('Parentname', 'Mover', 'Targetname', 'KeyFrame'), {}, (
+    )),
+    'move_track': (('Parentname', 'Mover', 'Targetname', 'KeyFrame'), {}, (
+        ('WheelBaseLength', 'wheelbaselength', 'int', 50),
+        ('Damage', 'damage', 'int', 0),
+        ('NoRotate', 'norotate', 'raw', None),
+    )),
+    'RopeKeyFrame': (('DXLevelChoice',), {}, (
+        ('Slack', 'slack', 'int', 25),
+        ('Type', 'type', 'raw', None),
+        ('Subdiv', 'subdiv', 'int', 2),
+        ('Barbed', 'barbed', 'raw', None),
+        ('Width', 'width', 'raw', "2"),
+        ('TextureScale', 'texturescale', 'raw', "1"),
+        ('Collide', 'collide', 'raw', None),
+        ('Dangling', 'dangling', 'raw', None),
+        ('Breakable', 'breakable', 'raw', None),
+        ('RopeMaterial', 'ropematerial', 'raw', "cable/cable.vmt"),
+        ('NoWind', 'nowind', 'raw', None),
+    )),
+    'keyframe_rope': (('Parentname', 'Targetname', 'RopeKeyFrame', 'KeyFrame'), {'model': "models/editor/axis_helper_thick.mdl"}, (
+    )),
+    'move_rope': (('Parentname', 'Targetname', 'RopeKeyFrame', 'KeyFrame'), {'model': "models/editor/axis_helper.mdl"}, (
+        ('PositionInterpolator', 'positioninterpolator', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'Button': ((), {}, (
+    )),
+    'func_button': (('Parentname', 'Origin', 'Button', 'RenderFields', 'DamageFilter', 'Targetname'), {}, (
+        ('movedir', 'movedir', 'float_vector', "0 0 0"),
+        ('speed', 'speed', 'int', 5),
+        ('health', 'health', 'int', 0),
+        ('lip', 'lip', 'int', 0),
+        ('master', 'master', 'raw', None),
+        ('sounds', 'sounds', 'raw', None),
+        ('wait', 'wait', 'int', 3),
+        ('locked_sound', 'locked_sound', 'raw', None),
+        ('unlocked_sound', 'unlocked_sound', 'raw', None),
+        ('locked_sentence', 'locked_sentence', 'raw', None),
+        ('unlocked_sentence', 'unlocked_sentence', 'raw', None),
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_rot_button': (('Parentname', 'Global', 'Origin', 'Button', 'EnableDisable', 'Targetname', 'Angles'), {}, (
+        ('master', 'master', 'raw', None),
+        ('speed', 'speed', 'int', 50),
+        ('health', 'health', 'int', 0),
+        ('sounds', 'sounds', 'raw', "CHOICES NOT SUPPORTED"),
+        ('wait', 'wait', 'int', 3),
+        ('distance', 'distance', 'int', 90),
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'momentary_rot_button': (('Parentname', 'Origin', 'RenderFields', 'Targetname', 'Angles'), {}, (
+        ('speed', 'speed', 'int', 50),
+        ('master', 'master', 'raw', None),
+        ('sounds', 'sounds', 'raw', None),
+        ('distance', 'distance', 'int', 90),
+        ('returnspeed', 'returnspeed', 'int', 0),
+        ('_minlight', '_minlight', 'raw', None),
+        ('startposition', 'startposition', 'float', 0),
+        ('startdirection', 'startdirection', 'raw', "CHOICES NOT SUPPORTED"),
+        ('solidbsp', 'solidbsp', 'raw', None),
+    )),
+    'Door': (('Parentname', 'Global', 'RenderFields', 'Shadow', 'Targetname'), {}, (
+        ('speed', 'speed', 'int', 100),
+        ('master', 'master', 'raw', None),
+        ('noise1', 'noise1', 'raw', None),
+        ('noise2', 'noise2', 'raw', None),
+        ('startclosesound', 'startclosesound', 'raw', None),
+        ('closesound', 'closesound', 'raw', None),
+        ('wait', 'wait', 'int', 4),
+        ('lip', 'lip', 'int', 0),
+        ('dmg', 'dmg', 'int', 0),
+        ('forceclosed', 'forceclosed', 'raw', None),
+        ('ignoredebris', 'ignoredebris', 'raw', None),
+        ('message', 'message', 'raw', None),
+        ('health', 'health', 'int', 0),
+        ('locked_sound', 'locked_sound', 'raw', None),
+        ('unlocked_sound', 'unlocked_sound', 'raw', None),
+        ('spawnpos', 'spawnpos', 'raw', None),
+        ('locked_sentence', 'locked_sentence', 'raw', None),
+        ('unlocked_sentence', 'unlocked_sentence', 'raw', None),
+        ('_minlight', '_minlight', 'raw', None),
+        ('loopmovesound', 'loopmovesound', 'raw', None),
+    )),
+    'func_door': (('Door', 'Origin'), {}, (
+        ('movedir', 'movedir', 'float_vector', "0 0 0"),
+        ('filtername', 'filtername', 'raw', None),
+    )),
+    'func_door_rotating': (('Door', 'Angles', 'Origin'), {}, (
+        ('distance', 'distance', 'int', 90),
+        ('solidbsp', 'solidbsp', 'raw', None),
+    )),
+    'prop_door_rotating': (('Parentname', 'Global', 'Studiomodel', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('slavename', 'slavename', 'raw', None),
+        ('hardware', 'hardware', 'raw', "CHOICES NOT SUPPORTED"),
+        ('ajarangles', 'ajarangles', 'float_vector', "0 0 0"),
+        ('spawnpos', 'spawnpos', 'raw', None),
+        ('axis', 'axis', 'raw', None),
+        ('distance', 'distance', 'float', 90),
+        ('speed', 'speed', 'int', 100),
+        ('soundopenoverride', 'soundopenoverride', 'raw', None),
+        ('soundcloseoverride', 'soundcloseoverride', 'raw', None),
+        ('soundmoveoverride', 'soundmoveoverride', 'raw', None),
+        ('returndelay', 'returndelay', 'int', -1),
+        ('dmg', 'dmg', 'int', 0),
+        ('health', 'health', 'int', 0),
+        ('soundlockedoverride', 'soundlockedoverride', 'raw', None),
+        ('soundunlockedoverride', 'soundunlockedoverride', 'raw', None),
+        ('forceclosed', 'forceclosed', 'raw', None),
+        ('opendir', 'opendir', 'raw', None),
+    )),
+    'env_cubemap': ((), {'icon_sprite': "editor/env_cubemap.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('cubemapsize', 'cubemapsize', 'raw', None),
+        ('sides', 'sides', 'raw', None),
+    )),
+    'BModelParticleSpawner': ((), {}, (
+        ('StartDisabled', 'startdisabled', 'raw', None),
+        ('Color', 'color', 'int_vector', "255 255 255"),
+        ('SpawnRate', 'spawnrate', 'int', 40),
+        ('SpeedMax', 'speedmax', 'raw', "13"),
+        ('LifetimeMin', 'lifetimemin', 'raw', "3"),
+        ('LifetimeMax', 'lifetimemax', 'raw', "5"),
+        ('DistMax', 'distmax', 'int', 1024),
+        ('Frozen', 'frozen', 'raw', None),
+    )),
+    'func_dustmotes': (('BModelParticleSpawner', 'Targetname'), {}, (
+        ('SizeMin', 'sizemin', 'raw', "10"),
+        ('SizeMax', 'sizemax', 'raw', "20"),
+        ('Alpha', 'alpha', 'int', 255),
+    )),
+    'func_smokevolume': (('Targetname',), {}, (
+        ('Color1', 'color1', 'int_vector', "255 255 255"),
+        ('Color2', 'color2', 'int_vector', "255 255 255"),
+        ('material', 'material', 'raw', "particle/particle_smokegrenade"),
+        ('ParticleDrawWidth', 'particledrawwidth', 'float', 120),
+        ('ParticleSpacingDistance', 'particlespacingdistance', 'float', 80),
+        ('DensityRampSpeed', 'densityrampspeed', 'float', 1),
+        ('RotationSpeed', 'rotationspeed', 'float', 10),
+        ('MovementSpeed', 'movementspeed', 'float', 10),
+        ('Density', 'density', 'float', 1),
+    )),
+    'func_dustcloud': (('BModelParticleSpawner', 'Targetname'), {}, (
+        ('Alpha', 'alpha', 'int', 30),
+        ('SizeMin', 'sizemin', 'raw', "100"),
+        ('SizeMax', 'sizemax', 'raw', "200"),
+    )),
+    'env_dustpuff': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('scale', 'scale', 'float', 8),
+        ('speed', 'speed', 'float', 16),
+        ('color', 'color', 'int_vector', "128 128 128"),
+    )),
+    'env_particlescript': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('model', 'model', 'raw', "models/Ambient_citadel_paths.mdl"),
+    )),
+    'env_effectscript': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('model', 'model', 'raw', "models/Effects/teleporttrail.mdl"),
+        ('scriptfile', 'scriptfile', 'raw', "scripts/effects/testeffect.txt"),
+    )),
+    'logic_auto': ((), {'icon_sprite': "editor/logic_auto.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('globalstate', 'globalstate', 'raw', None),
+    )),
+    'point_viewcontrol': (('Parentname', 'Targetname', 'Angles'), {'viewport_model': "models/editor/camera.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('targetattachment', 'targetattachment', 'raw', None),
+        ('wait', 'wait', 'int', 10),
+        ('moveto', 'moveto', 'raw', None),
+        ('interpolatepositiontoplayer', 'interpolatepositiontoplayer', 'raw', None),
+        ('speed', 'speed', 'raw', "0"),
+        ('acceleration', 'acceleration', 'raw', "500"),
+        ('deceleration', 'deceleration', 'raw', "500"),
+    )),
+    'point_posecontroller': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('PropName', 'propname', 'raw', None),
+        ('PoseParameterName', 'poseparametername', 'raw', None),
+        ('PoseValue', 'posevalue', 'float', 0.0),
+        ('InterpolationTime', 'interpolationtime', 'float', 0.0),
+        ('InterpolationWrap', 'interpolationwrap', 'raw', None),
+        ('CycleFrequency', 'cyclefrequency', 'float', 0.0),
+        ('FModulationType', 'fmodulationtype', 'raw', None),
+        ('FModTimeOffset', 'fmodtimeoffset', 'float', 0.0),
+        ('FModRate', 'fmodrate', 'float', 0.0),
+        ('FModAmplitude', 'fmodamplitude', 'float', 0.0),
+    )),
+    'logic_compare': (('Targetname',), {'icon_sprite': "editor/logic_compare.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('InitialValue', 'initialvalue', 'int', 0),
+        ('CompareValue', 'comparevalue', 'int', 0),
+    )),
+    'logic_branch': (('Targetname',), {'icon_sprite': "editor/logic_branch.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('InitialValue', 'initialvalue', 'int', 0),
+    )),
+    'logic_branch_listener': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('Branch01', 'branch01', 'raw', None),
+        ('Branch02', 'branch02', 'raw', None),
+        ('Branch03', 'branch03', 'raw', None),
+        ('Branch04', 'branch04', 'raw', None),
+        ('Branch05', 'branch05', 'raw', None),
+        ('Branch06', 'branch06', 'raw', None),
+        ('Branch07', 'branch07', 'raw', None),
+        ('Branch08', 'branch08', 'raw', None),
+        ('Branch09', 'branch09', 'raw', None),
+        ('Branch10', 'branch10', 'raw', None),
+        ('Branch11', 'branch11', 'raw', None),
+        ('Branch12', 'branch12', 'raw', None),
+        ('Branch13', 'branch13', 'raw', None),
+        ('Branch14', 'branch14', 'raw', None),
+        ('Branch15', 'branch15', 'raw', None),
+        ('Branch16', 'branch16', 'raw', None),
+    )),
+    'logic_case': (('Targetname',), {'icon_sprite': "editor/logic_case.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('Case01', 'case01', 'raw', None),
+        ('Case02', 'case02', 'raw', None),
+        ('Case03', 'case03', 'raw', None),
+        ('Case04', 'case04', 'raw', None),
+        ('Case05', 'case05', 'raw', None),
+        ('Case06', 'case06', 'raw', None),
+        ('Case07', 'case07', 'raw', None),
+        ('Case08', 'case08', 'raw', None),
+        ('Case09', 'case09', 'raw', None),
+        ('Case10', 'case10', 'raw', None),
+        ('Case11', 'case11', 'raw', None),
+        ('Case12', 'case12', 'raw', None),
+        ('Case13', 'case13', 'raw', None),
+        ('Case14', 'case14', 'raw', None),
+        ('Case15', 'case15', 'raw', None),
+        ('Case16', 'case16', 'raw', None),
+    )),
+    'logic_multicompare': (('Targetname',), {'icon_sprite': "editor/logic_multicompare.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('IntegerValue', 'integervalue', 'int', 0),
+        ('ShouldComparetoValue', 'shouldcomparetovalue', 'raw', None),
+    )),
+    'logic_relay': (('EnableDisable', 'Targetname'), {'icon_sprite': "editor/logic_relay.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'logic_timer': (('EnableDisable', 'Targetname'), {'icon_sprite': "editor/logic_timer.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('UseRandomTime', 'userandomtime', 'raw', None),
+        ('LowerRandomBound', 'lowerrandombound', 'raw', None),
+        ('UpperRandomBound', 'upperrandombound', 'raw', None),
+        ('RefireTime', 'refiretime', 'raw', None),
+    )),
+    'hammer_updateignorelist': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('IgnoredName01', 'ignoredname01', 'raw', None),
+        ('IgnoredName02', 'ignoredname02', 'raw', None),
+        ('IgnoredName03', 'ignoredname03', 'raw', None),
+        ('IgnoredName04', 'ignoredname04', 'raw', None),
+        ('IgnoredName05', 'ignoredname05', 'raw', None),
+        ('IgnoredName06', 'ignoredname06', 'raw', None),
+        ('IgnoredName07', 'ignoredname07', 'raw', None),
+        ('IgnoredName08', 'ignoredname08', 'raw', None),
+        ('IgnoredName09', 'ignoredname09', 'raw', None),
+        ('IgnoredName10', 'ignoredname10', 'raw', None),
+        ('IgnoredName11', 'ignoredname11', 'raw', None),
+        ('IgnoredName12', 'ignoredname12', 'raw', None),
+        ('IgnoredName13', 'ignoredname13', 'raw', None),
+        ('IgnoredName14', 'ignoredname14', 'raw', None),
+        ('IgnoredName15', 'ignoredname15', 'raw', None),
+        ('IgnoredName16', 'ignoredname16', 'raw', None),
+    )),
+    'logic_collision_pair': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('attach1', 'attach1', 'raw', None),
+        ('attach2', 'attach2', 'raw', None),
+        ('startdisabled', 'startdisabled', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'env_microphone': (('Parentname', 'EnableDisable', 'Targetname'), {'icon_sprite': "editor/env_microphone.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('SpeakerName', 'speakername', 'raw', None),
+        ('ListenFilter', 'listenfilter', 'raw', None),
+        ('speaker_dsp_preset', 'speaker_dsp_preset', 'raw', None),
+        ('Sensitivity', 'sensitivity', 'float', 1),
+        ('SmoothFactor', 'smoothfactor', 'float', 0),
+        ('MaxRange', 'maxrange', 'float', 240),
+    )),
+    'math_remap': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('in1', 'in1', 'int', 0),
+        ('in2', 'in2', 'int', 1),
+        ('out1', 'out1', 'int', 0),
+        ('out2', 'out2', 'int', 0),
+    )),
+    'math_colorblend': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('inmin', 'inmin', 'int', 0),
+        ('inmax', 'inmax', 'int', 1),
+        ('colormin', 'colormin', 'int_vector', "0 0 0"),
+        ('colormax', 'colormax', 'int_vector', "255 255 255"),
+    )),
+    'math_counter': (('EnableDisable', 'Targetname'), {'icon_sprite': "editor/math_counter.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('startvalue', 'startvalue', 'int', 0),
+        ('min', 'min', 'int', 0),
+        ('max', 'max', 'int', 0),
+    )),
+    'logic_lineto': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('source', 'source', 'raw', None),
+        ('target', 'target', 'raw', None),
+    )),
+    'logic_navigation': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('navprop', 'navprop', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'logic_autosave': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('NewLevelUnit', 'newlevelunit', 'raw', None),
+        ('MinimumHitPoints', 'minimumhitpoints', 'int', 0),
+        ('MinHitPointsToCommit', 'minhitpointstocommit', 'int', 0),
+    )),
+    'logic_active_autosave': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('MinimumHitPoints', 'minimumhitpoints', 'int', 30),
+        ('TriggerHitPoints', 'triggerhitpoints', 'int', 75),
+        ('TimeToTrigget', 'timetotrigget', 'float', 0),
+        ('DangerousTime', 'dangeroustime', 'float', 10),
+    )),
+    'point_template': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('Template01', 'template01', 'raw', None),
+        ('Template02', 'template02', 'raw', None),
+        ('Template03', 'template03', 'raw', None),
+        ('Template04', 'template04', 'raw', None),
+        ('Template05', 'template05', 'raw', None),
+        ('Template06', 'template06', 'raw', None),
+        ('Template07', 'template07', 'raw', None),
+        ('Template08', 'template08', 'raw', None),
+        ('Template09', 'template09', 'raw', None),
+        ('Template10', 'template10', 'raw', None),
+        ('Template11', 'template11', 'raw', None),
+        ('Template12', 'template12', 'raw', None),
+        ('Template13', 'template13', 'raw', None),
+        ('Template14', 'template14', 'raw', None),
+        ('Template15', 'template15', 'raw', None),
+        ('Template16', 'template16', 'raw', None),
+    )),
+    'env_entity_maker': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('EntityTemplate', 'entitytemplate', 'raw', None),
+        ('PostSpawnSpeed', 'postspawnspeed', 'float', 0),
+        ('PostSpawnDirection', 'postspawndirection', 'float_vector', "0 0 0"),
+        ('PostSpawnDirectionVariance', 'postspawndirectionvariance', 'float', 0.15),
+        ('PostSpawnInheritAngles', 'postspawninheritangles', 'raw', None),
+    )),
+    'BaseFilter': (('Targetname',), {}, (
+        ('Negated', 'negated', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'filter_multi': (('BaseFilter',), {'icon_sprite': "editor/filter_multiple.vmt"}, (
+        ('filtertype', 'filtertype', 'raw', None),
+        ('Filter01', 'filter01', 'raw', None),
+        ('Filter02', 'filter02', 'raw', None),
+        ('Filter03', 'filter03', 'raw', None),
+        ('Filter04', 'filter04', 'raw', None),
+        ('Filter05', 'filter05', 'raw', None),
+    )),
+    'filter_activator_name': (('BaseFilter',), {'icon_sprite': "editor/filter_name.vmt"}, (
+        ('filtername', 'filtername', 'raw', None),
+    )),
+    'filter_activator_class': (('BaseFilter',), {'icon_sprite': "editor/filter_class.vmt"}, (
+        ('filterclass', 'filterclass', 'raw', None),
+    )),
+    'filter_activator_mass_greater': (('BaseFilter',), {'icon_sprite': "editor/filter_class.vmt"}, (
+        ('filtermass', 'filtermass', 'float', 0),
+    )),
+    'filter_damage_type': (('BaseFilter',), {}, (
+        ('damagetype', 'damagetype', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'filter_enemy': (('BaseFilter',), {'icon_sprite': "editor/filter_class.vmt"}, (
+        ('filtername', 'filtername', 'raw', None),
+        ('filter_radius', 'filter_radius', 'float', 0),
+        ('filter_outer_radius', 'filter_outer_radius', 'float', 0),
+        ('filter_max_per_enemy', 'filter_max_per_enemy', 'int', 0),
+    )),
+    'point_anglesensor': (('Parentname', 'EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('lookatname', 'lookatname', 'raw', None),
+        ('duration', 'duration', 'float', 0),
+        ('tolerance', 'tolerance', 'int', 0),
+    )),
+    'point_angularvelocitysensor': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('threshold', 'threshold', 'float', 0),
+        ('fireinterval', 'fireinterval', 'float', 0.2),
+        ('axis', 'axis', 'raw', None),
+        ('usehelper', 'usehelper', 'raw', None),
+    )),
+    'point_velocitysensor': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('axis', 'axis', 'raw', None),
+        ('enabled', 'enabled', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'point_proximity_sensor': (('Parentname', 'EnableDisable', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'point_teleport': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'point_hurt': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('DamageTarget', 'damagetarget', 'raw', None),
+        ('DamageRadius', 'damageradius', 'float', 256),
+        ('Damage', 'damage', 'int', 5),
+        ('DamageDelay', 'damagedelay', 'float', 1),
+        ('DamageType', 'damagetype', 'raw', None),
+    )),
+    'point_playermoveconstraint': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('radius', 'radius', 'float', 256),
+        ('width', 'width', 'float', 75.0),
+        ('speedfactor', 'speedfactor', 'float', 0.15),
+    )),
+    'func_physbox': (('BreakableBrush', 'Origin', 'RenderFields'), {}, (
+        ('_minlight', '_minlight', 'raw', None),
+        ('Damagetype', 'damagetype', 'raw', None),
+        ('massScale', 'massscale', 'float', 0),
+        ('overridescript', 'overridescript', 'raw', None),
+        ('damagetoenablemotion', 'damagetoenablemotion', 'int', 0),
+        ('forcetoenablemotion', 'forcetoenablemotion', 'float', 0),
+        ('preferredcarryangles', 'preferredcarryangles', 'float_vector', "0 0 0"),
+        ('notsolid', 'notsolid', 'raw', None),
+    )),
+    'TwoObjectPhysics': (('Targetname',), {}, (
+        ('attach1', 'attach1', 'raw', None),
+        ('attach2', 'attach2', 'raw', None),
+        ('constraintsystem', 'constraintsystem', 'raw', None),
+        ('forcelimit', 'forcelimit', 'float', 0),
+        ('torquelimit', 'torquelimit', 'float', 0),
+        ('breaksound', 'breaksound', 'raw', None),
+        ('teleportfollowdistance', 'teleportfollowdistance', 'float', 0),
+    )),
+    'phys_constraintsystem': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('additionaliterations', 'additionaliterations', 'int', 0),
+    )),
+    'phys_keepupright': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('attach1', 'attach1', 'raw', None),
+        ('angularlimit', 'angularlimit', 'float', 15),
+    )),
+    'physics_cannister': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('model', 'model', 'raw', "models/fire_equipment/w_weldtank.mdl"),
+        ('expdamage', 'expdamage', 'raw', "200.0"),
+        ('expradius', 'expradius', 'raw', "250.0"),
+        ('health', 'health', 'int', 25),
+        ('thrust', 'thrust', 'raw', "3000.0"),
+        ('fuel', 'fuel', 'raw', "12.0"),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('renderamt', 'renderamt', 'int', 128),
+        ('gassound', 'gassound', 'raw', "ambient/objects/cannister_loop.wav"),
+    )),
+    'info_constraint_anchor': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('massScale', 'massscale', 'float', 1),
+    )),
+    'info_mass_center': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+    )),
+    'phys_spring': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('attach1', 'attach1', 'raw', None),
+        ('attach2', 'attach2', 'raw', None),
+        ('springaxis', 'springaxis', 'raw', None),
+        ('length', 'length', 'raw', "0"),
+        ('constant', 'constant', 'raw', "50"),
+        ('damping', 'damping', 'raw', "2.0"),
+        ('relativedamping', 'relativedamping', 'raw', "0.1"),
+        ('breaklength', 'breaklength', 'raw', "0"),
+    )),
+    'phys_hinge': (('TwoObjectPhysics',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('hingefriction', 'hingefriction', 'float', 0),
+        ('hingeaxis', 'hingeaxis', 'raw', None),
+        ('SystemLoadScale', 'systemloadscale', 'float', 1),
+        ('minSoundThreshold', 'minsoundthreshold', 'float', 6),
+        ('maxSoundThreshold', 'maxsoundthreshold', 'float', 80),
+        ('slidesoundfwd', 'slidesoundfwd', 'raw', None),
+        ('slidesoundback', 'slidesoundback', 'raw', None),
+        ('reversalsoundthresholdSmall', 'reversalsoundthresholdsmall', 'float', 0),
+        ('reversalsoundthresholdMedium', 'reversalsoundthresholdmedium', 'float', 0),
+        ('reversalsoundthresholdLarge', 'reversalsoundthresholdlarge', 'float', 0),
+        ('reversalsoundSmall', 'reversalsoundsmall', 'raw', None),
+        ('reversalsoundMedium', 'reversalsoundmedium', 'raw', None),
+        ('reversalsoundLarge', 'reversalsoundlarge', 'raw', None),
+    )),
+    'phys_ballsocket': (('TwoObjectPhysics',), {'icon_sprite': "editor/phys_ballsocket.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'phys_constraint': (('TwoObjectPhysics',), {'model': "models/editor/axis_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'phys_pulleyconstraint': (('TwoObjectPhysics',), {'model': "models/editor/axis_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('addlength', 'addlength', 'float', 0),
+        ('gearratio', 'gearratio', 'float', 1),
+        ('position2', 'position2', 'raw', None),
+    )),
+    'phys_slideconstraint': (('TwoObjectPhysics',), {'model': "models/editor/axis_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('slideaxis', 'slideaxis', 'raw', None),
+        ('slidefriction', 'slidefriction', 'float', 0),
+        ('SystemLoadScale', 'systemloadscale', 'float', 1),
+        ('minSoundThreshold', 'minsoundthreshold', 'float', 6),
+        ('maxSoundThreshold', 'maxsoundthreshold', 'float', 80),
+        ('slidesoundfwd', 'slidesoundfwd', 'raw', None),
+        ('slidesoundback', 'slidesoundback', 'raw', None),
+        ('reversalsoundthresholdSmall', 'reversalsoundthresholdsmall', 'float', 0),
+        ('reversalsoundthresholdMedium', 'reversalsoundthresholdmedium', 'float', 0),
+        ('reversalsoundthresholdLarge', 'reversalsoundthresholdlarge', 'float', 0),
+        ('reversalsoundSmall', 'reversalsoundsmall', 'raw', None),
+        ('reversalsoundMedium', 'reversalsoundmedium', 'raw', None),
+        ('reversalsoundLarge', 'reversalsoundlarge', 'raw', None),
+    )),
+    'phys_lengthconstraint': (('TwoObjectPhysics',), {'model': "models/editor/axis_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('addlength', 'addlength', 'float', 0),
+        ('minlength', 'minlength', 'float', 0),
+        ('attachpoint', 'attachpoint', 'raw', None),
+    )),
+    'phys_ragdollconstraint': (('TwoObjectPhysics',), {'model': "models/editor/axis_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('xmin', 'xmin', 'float', -90),
+        ('xmax', 'xmax', 'float', 90),
+        ('ymin', 'ymin', 'float', 0),
+        ('ymax', 'ymax', 'float', 0),
+        ('zmin', 'zmin', 'float', 0),
+        ('zmax', 'zmax', 'float', 0),
+        ('xfriction', 'xfriction', 'float', 0),
+        ('yfriction', 'yfriction', 'float', 0),
+        ('zfriction', 'zfriction', 'float', 0),
+    )),
+    'phys_convert': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('swapmodel', 'swapmodel', 'raw', None),
+        ('massoverride', 'massoverride', 'float', 0),
+    )),
+    'ForceController': (('Targetname',), {}, (
+        ('attach1', 'attach1', 'raw', None),
+        ('forcetime', 'forcetime', 'raw', "0"),
+    )),
+    'phys_thruster': (('Angles', 'ForceController'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('force', 'force', 'raw', "0"),
+    )),
+    'phys_torque': (('ForceController',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('force', 'force', 'raw', "0"),
+        ('axis', 'axis', 'raw', None),
+    )),
+    'phys_motor': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('speed', 'speed', 'raw', "0"),
+        ('spinup', 'spinup', 'raw', "1"),
+        ('inertiafactor', 'inertiafactor', 'float', 1.0),
+        ('axis', 'axis', 'raw', None),
+        ('attach1', 'attach1', 'raw', None),
+    )),
+    'phys_magnet': (('Parentname', 'Studiomodel', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('forcelimit', 'forcelimit', 'float', 0),
+        ('torquelimit', 'torquelimit', 'float', 0),
+        ('massScale', 'massscale', 'float', 0),
+        ('overridescript', 'overridescript', 'raw', None),
+        ('maxobjects', 'maxobjects', 'int', 0),
+    )),
+    'prop_detail_base': ((), {}, (
+        ('model', 'model', 'raw', None),
+    )),
+    'prop_static_base': (('DXLevelChoice', 'Angles'), {}, (
+        ('model', 'model', 'raw', None),
+        ('skin', 'skin', 'int', 0),
+        ('solid', 'solid', 'raw', "CHOICES NOT SUPPORTED"),
+        ('disableshadows', 'disableshadows', 'raw', None),
+        ('screenspacefade', 'screenspacefade', 'raw', None),
+        ('fademindist', 'fademindist', 'float', -1),
+        ('fademaxdist', 'fademaxdist', 'float', 0),
+        ('fadescale', 'fadescale', 'float', 1),
+        ('lightingorigin', 'lightingorigin', 'raw', None),
+        ('disablevertexlighting', 'disablevertexlighting', 'raw', None),
+        ('disableselfshadowing', 'disableselfshadowing', 'raw', None),
+        ('ignorenormals', 'ignorenormals', 'raw', None),
+        ('generatelightmaps', 'generatelightmaps', 'raw', None),
+        ('lightmapresolutionx', 'lightmapresolutionx', 'int', 32),
+        ('lightmapresolutiony', 'lightmapresolutiony', 'int', 32),
+    )),
+    'BaseFadeProp': ((), {}, (
+        ('fademindist', 'fademindist', 'float', -1),
+        ('fademaxdist', 'fademaxdist', 'float', 0),
+        ('fadescale', 'fadescale', 'float', 1),
+    )),
+    'prop_dynamic_base': (('Parentname', 'Global', 'Studiomodel', 'RenderFields', 'DXLevelChoice', 'BreakableProp', 'Angles', 'BaseFadeProp'), {}, (
+        ('solid', 'solid', 'raw', "CHOICES NOT SUPPORTED"),
+        ('DefaultAnim', 'defaultanim', 'raw', None),
+        ('RandomAnimation', 'randomanimation', 'raw', None),
+        ('MinAnimTime', 'minanimtime', 'float', 5),
+        ('MaxAnimTime', 'maxanimtime', 'float', 10),
+        ('SetBodyGroup', 'setbodygroup', 'int', 0),
+        ('DisableBoneFollowers', 'disablebonefollowers', 'raw', None),
+        ('lightingorigin', 'lightingorigin', 'raw', None),
+    )),
+    'prop_detail': (('prop_detail_base',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'prop_static': (('prop_static_base',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'prop_dynamic': (('EnableDisable', 'prop_dynamic_base'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'prop_dynamic_override': (('prop_dynamic_base',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('health', 'health', 'int', 0),
+    )),
+    'BasePropPhysics': (('Global', 'Studiomodel', 'DXLevelChoice', 'BreakableProp', 'Angles', 'BaseFadeProp'), {}, (
+        ('minhealthdmg', 'minhealthdmg', 'int', 0),
+        ('shadowcastdist', 'shadowcastdist', 'int', 0),
+        ('physdamagescale', 'physdamagescale', 'float', 0.1),
+        ('Damagetype', 'damagetype', 'raw', None),
+        ('nodamageforces', 'nodamageforces', 'raw', None),
+        ('inertiaScale', 'inertiascale', 'float', 1.0),
+        ('massScale', 'massscale', 'float', 0),
+        ('overridescript', 'overridescript', 'raw', None),
+        ('damagetoenablemotion', 'damagetoenablemotion', 'int', 0),
+        ('forcetoenablemotion', 'forcetoenablemotion', 'float', 0),
+        ('puntsound', 'puntsound', 'raw', None),
+    )),
+    'prop_physics_override': (('BasePropPhysics',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('health', 'health', 'int', 0),
+    )),
+    'prop_physics': (('BasePropPhysics', 'RenderFields'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'prop_physics_multiplayer': (('prop_physics',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('physicsmode', 'physicsmode', 'raw', None),
+    )),
+    'prop_ragdoll': (('Studiomodel', 'EnableDisable', 'Targetname', 'DXLevelChoice', 'Angles', 'BaseFadeProp'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('angleOverride', 'angleoverride', 'raw', None),
+    )),
+    'prop_dynamic_ornament': (('prop_dynamic_base',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('InitialOwner', 'initialowner', 'raw', None),
+    )),
+    'func_areaportal': (('Targetname',), {}, (
+        ('target', 'target', 'raw', None),
+        ('StartOpen', 'startopen', 'raw', "CHOICES NOT SUPPORTED"),
+        ('PortalVersion', 'portalversion', 'int', 1),
+    )),
+    'func_occluder': (('Targetname',), {}, (
+        ('StartActive', 'startactive', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'func_breakable': (('RenderFields', 'BreakableBrush', 'Origin'), {}, (
+        ('minhealthdmg', 'minhealthdmg', 'int', 0),
+        ('_minlight', '_minlight', 'raw', None),
+        ('physdamagescale', 'physdamagescale', 'float', 1.0),
+    )),
+    'func_breakable_surf': (('RenderFields', 'BreakableBrush'), {}, (
+        ('fragility', 'fragility', 'int', 100),
+        ('surfacetype', 'surfacetype', 'raw', None),
+    )),
+    'func_conveyor': (('Parentname', 'Shadow', 'Targetname', 'RenderFields'), {}, (
+        ('movedir', 'movedir', 'float_vector', "0 0 0"),
+        ('speed', 'speed', 'raw', "100"),
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_detail': (('DXLevelChoice',), {}, (
+    )),
+    'func_viscluster': ((), {}, (
+    )),
+    'func_illusionary': (('Parentname', 'Origin', 'RenderFields', 'Shadow', 'Targetname'), {}, (
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_precipitation': (('Parentname', 'Targetname'), {}, (
+        ('renderamt', 'renderamt', 'int', 5),
+        ('rendercolor', 'rendercolor', 'int_vector', "100 100 100"),
+        ('preciptype', 'preciptype', 'raw', None),
+    )),
+    'func_wall_toggle': (('func_wall',), {}, (
+    )),
+    'func_guntarget': (('Parentname', 'Global', 'Targetname', 'RenderFields'), {}, (
+        ('speed', 'speed', 'int', 100),
+        ('target', 'target', 'raw', None),
+        ('health', 'health', 'int', 0),
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_fish_pool': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('model', 'model', 'raw', "models/Junkola.mdl"),
+        ('fish_count', 'fish_count', 'int', 10),
+        ('max_range', 'max_range', 'float', 150),
+    )),
+    'PlatSounds': ((), {}, (
+        ('movesnd', 'movesnd', 'raw', None),
+        ('stopsnd', 'stopsnd', 'raw', None),
+        ('volume', 'volume', 'raw', "0.85"),
+    )),
+    'Trackchange': (('Parentname', 'Global', 'PlatSounds', 'RenderFields', 'Targetname'), {}, (
+        ('height', 'height', 'int', 0),
+        ('rotation', 'rotation', 'int', 0),
+        ('train', 'train', 'raw', None),
+        ('toptrack', 'toptrack', 'raw', None),
+        ('bottomtrack', 'bottomtrack', 'raw', None),
+        ('speed', 'speed', 'int', 0),
+    )),
+    'BaseTrain': (('Parentname', 'Global', 'Origin', 'RenderFields', 'Targetname', 'Shadow'), {}, (
+        ('target', 'target', 'raw', None),
+        ('startspeed', 'startspeed', 'int', 100),
+        ('speed', 'speed', 'int', 0),
+        ('velocitytype', 'velocitytype', 'raw', None),
+        ('orientationtype', 'orientationtype', 'raw', "CHOICES NOT SUPPORTED"),
+        ('wheels', 'wheels', 'int', 50),
+        ('height', 'height', 'int', 4),
+        ('bank', 'bank', 'raw', "0"),
+        ('dmg', 'dmg', 'int', 0),
+        ('_minlight', '_minlight', 'raw', None),
+        ('MoveSound', 'movesound', 'raw', None),
+        ('MovePingSound', 'movepingsound', 'raw', None),
+        ('StartSound', 'startsound', 'raw', None),
+        ('StopSound', 'stopsound', 'raw', None),
+        ('volume', 'volume', 'int', 10),
+        ('MoveSoundMinPitch', 'movesoundminpitch', 'int', 60),
+        ('MoveSoundMaxPitch', 'movesoundmaxpitch', 'int', 200),
+        ('MoveSoundMinTime', 'movesoundmintime', 'float', 0),
+        ('MoveSoundMaxTime', 'movesoundmaxtime', 'float', 0),
+    )),
+    'func_trackautochange': (('Trackchange',), {}, (
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_trackchange': (('Trackchange',), {}, (
+        ('_minlight', '_minlight', 'raw', None),
+    )),
+    'func_tracktrain': (('BaseTrain',), {}, (
+        ('ManualSpeedChanges', 'manualspeedchanges', 'raw', None),
+        ('ManualAccelSpeed', 'manualaccelspeed', 'float', 0),
+        ('ManualDecelSpeed', 'manualdecelspeed', 'float', 0),
+    )),
+    'func_tanktrain': (('BaseTrain',), {}, (
+        ('health', 'health', 'int', 100),
+    )),
+    'func_traincontrols': (('Parentname', 'Global'), {}, (
+        ('target', 'target', 'raw', None),
+    )),
+    'tanktrain_aitarget': (('Targetname',), {'icon_sprite': "editor/tanktrain_aitarget.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('newtarget', 'newtarget', 'raw', None),
+    )),
+    'tanktrain_ai': (('Targetname',), {'icon_sprite': "editor/tanktrain_ai.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('startsound', 'startsound', 'raw', "vehicles/diesel_start1.wav"),
+        ('enginesound', 'enginesound', 'raw', "vehicles/diesel_turbo_loop1.wav"),
+        ('movementsound', 'movementsound', 'raw', "vehicles/tank_treads_loop1.wav"),
+    )),
+    'path_track': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('altpath', 'altpath', 'raw', None),
+        ('speed', 'speed', 'float', 0),
+        ('radius', 'radius', 'float', 0),
+        ('orientationtype', 'orientationtype', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'test_traceline': (('Angles',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'trigger_autosave': (('Targetname',), {}, (
+        ('master', 'master', 'raw', None),
+        ('NewLevelUnit', 'newlevelunit', 'raw', None),
+        ('DangerousTimer', 'dangeroustimer', 'float', 0),
+        ('MinimumHitPoints', 'minimumhitpoints', 'int', 0),
+    )),
+    'trigger_changelevel': (('EnableDisable',), {}, (
+        ('targetname', 'targetname', 'raw', None),
+        ('map', 'map', 'raw', None),
+        ('landmark', 'landmark', 'raw', None),
+    )),
+    'trigger_gravity': (('Trigger',), {}, (
+        ('gravity', 'gravity', 'int', 1),
+    )),
+    'trigger_playermovement': (('Trigger',), {}, (
+    )),
+    'trigger_soundscape': (('Trigger',), {}, (
+        ('soundscape', 'soundscape', 'raw', None),
+    )),
+    'trigger_hurt': (('Trigger',), {}, (
+        ('master', 'master', 'raw', None),
+        ('damage', 'damage', 'int', 10),
+        ('damagecap', 'damagecap', 'int', 20),
+        ('damagetype', 'damagetype', 'raw', None),
+        ('damagemodel', 'damagemodel', 'raw', None),
+        ('nodmgforce', 'nodmgforce', 'raw', None),
+    )),
+    'trigger_remove': (('Trigger',), {}, (
+    )),
+    'trigger_multiple': (('Trigger',), {}, (
+        ('wait', 'wait', 'int', 1),
+    )),
+    'trigger_once': (('TriggerOnce',), {}, (
+    )),
+    'trigger_look': (('Trigger',), {}, (
+        ('target', 'target', 'raw', None),
+        ('LookTime', 'looktime', 'raw', "0.5"),
+        ('FieldOfView', 'fieldofview', 'raw', "0.9"),
+        ('Timeout', 'timeout', 'float', 0),
+    )),
+    'trigger_push': (('Trigger',), {}, (
+        ('pushdir', 'pushdir', 'float_vector', "0 0 0"),
+        ('speed', 'speed', 'int', 40),
+        ('alternateticksfix', 'alternateticksfix', 'float', 0),
+    )),
+    'trigger_wind': (('Trigger', 'Angles'), {}, (
+        ('Speed', 'speed', 'int', 200),
+        ('SpeedNoise', 'speednoise', 'int', 0),
+        ('DirectionNoise', 'directionnoise', 'int', 10),
+        ('HoldTime', 'holdtime', 'int', 0),
+        ('HoldNoise', 'holdnoise', 'int', 0),
+    )),
+    'trigger_impact': (('Targetname', 'Angles', 'Origin'), {}, (
+        ('Magnitude', 'magnitude', 'float', 200),
+        ('noise', 'noise', 'float', 0.1),
+        ('viewkick', 'viewkick', 'float', 0.05),
+    )),
+    'trigger_proximity': (('Trigger',), {}, (
+        ('measuretarget', 'measuretarget', 'raw', None),
+        ('radius', 'radius', 'raw', "256"),
+    )),
+    'trigger_teleport': (('Trigger',), {}, (
+        ('target', 'target', 'raw', None),
+        ('landmark', 'landmark', 'raw', None),
+    )),
+    'trigger_teleport_relative': (('Trigger',), {}, (
+        ('teleportoffset', 'teleportoffset', 'float_vector', "0 0 0"),
+    )),
+    'trigger_transition': (('Targetname',), {}, (
+    )),
+    'trigger_serverragdoll': (('Targetname',), {}, (
+    )),
+    'ai_speechfilter': (('ResponseContext', 'EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('subject', 'subject', 'raw', None),
+        ('IdleModifier', 'idlemodifier', 'float', 1.0),
+        ('NeverSayHello', 'neversayhello', 'raw', None),
+    )),
+    'water_lod_control': (('Targetname',), {'icon_sprite': "editor/waterlodcontrol.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('cheapwaterstartdistance', 'cheapwaterstartdistance', 'float', 1000),
+        ('cheapwaterenddistance', 'cheapwaterenddistance', 'float', 2000),
+    )),
+    'info_camera_link': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('PointCamera', 'pointcamera', 'raw', None),
+    )),
+    'logic_measure_movement': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('MeasureTarget', 'measuretarget', 'raw', None),
+        ('MeasureReference', 'measurereference', 'raw', None),
+        ('Target', 'target', 'raw', None),
+        ('TargetReference', 'targetreference', 'raw', None),
+        ('TargetScale', 'targetscale', 'float', 1),
+        ('MeasureType', 'measuretype', 'raw', None),
+    )),
+    'npc_furniture': (('Parentname', 'BaseNPC'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('model', 'model', 'raw', None),
+    )),
+    'env_credits': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'material_modify_control': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('materialName', 'materialname', 'raw', None),
+        ('materialVar', 'materialvar', 'raw', None),
+    )),
+    'point_devshot_camera': (('Angles',), {'viewport_model': "models/editor/camera.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('cameraname', 'cameraname', 'raw', None),
+        ('FOV', 'fov', 'int', 75),
+    )),
+    'logic_playerproxy': (('DamageFilter', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'env_spritetrail': (('Parentname', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('lifetime', 'lifetime', 'float', 0.5),
+        ('startwidth', 'startwidth', 'float', 8.0),
+        ('endwidth', 'endwidth', 'float', 1.0),
+        ('spritename', 'spritename', 'raw', "sprites/bluelaser1.vmt"),
+        ('renderamt', 'renderamt', 'int', 255),
+        ('rendercolor', 'rendercolor', 'int_vector', "255 255 255"),
+        ('rendermode', 'rendermode', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'env_projectedtexture': (('Parentname', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target', 'target', 'raw', None),
+        ('lightfov', 'lightfov', 'float', 90.0),
+        ('nearz', 'nearz', 'float', 4.0),
+        ('farz', 'farz', 'float', 750.0),
+        ('enableshadows', 'enableshadows', 'raw', None),
+        ('shadowquality', 'shadowquality', 'raw', "CHOICES NOT SUPPORTED"),
+        ('lightonlytarget', 'lightonlytarget', 'raw', None),
+        ('lightworld', 'lightworld', 'raw', "CHOICES NOT SUPPORTED"),
+        ('lightcolor', 'lightcolor', 'int_vector', "255 255 255 200"),
+        ('cameraspace', 'cameraspace', 'int', 0),
+    )),
+    'func_reflective_glass': (('func_brush',), {}, (
+    )),
+    'env_particle_performance_monitor': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'npc_puppet': (('Parentname', 'Studiomodel', 'BaseNPC'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('animationtarget', 'animationtarget', 'raw', None),
+        ('attachmentname', 'attachmentname', 'raw', None),
+    )),
+    'point_gamestats_counter': (('EnableDisable', 'Targetname', 'Origin'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('Name', 'name', 'raw', None),
+    )),
+    'func_instance': (('Angles',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('targetname', 'targetname', 'raw', None),
+        ('file', 'file', 'raw', None),
+        ('fixup_style', 'fixup_style', 'raw', None),
+        ('replace01', 'replace01', 'raw', None),
+        ('replace02', 'replace02', 'raw', None),
+        ('replace03', 'replace03', 'raw', None),
+        ('replace04', 'replace04', 'raw', None),
+        ('replace05', 'replace05', 'raw', None),
+        ('replace06', 'replace06', 'raw', None),
+        ('replace07', 'replace07', 'raw', None),
+        ('replace08', 'replace08', 'raw', None),
+        ('replace09', 'replace09', 'raw', None),
+        ('replace10', 'replace10', 'raw', None),
+    )),
+    'func_instance_parms': ((), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('parm1', 'parm1', 'raw', None),
+        ('parm2', 'parm2', 'raw', None),
+        ('parm3', 'parm3', 'raw', None),
+        ('parm4', 'parm4', 'raw', None),
+        ('parm5', 'parm5', 'raw', None),
+        ('parm6', 'parm6', 'raw', None),
+        ('parm7', 'parm7', 'raw', None),
+        ('parm8', 'parm8', 'raw', None),
+        ('parm9', 'parm9', 'raw', None),
+        ('parm10', 'parm10', 'raw', None),
+    )),
+    'trigger_apply_impulse': (('Trigger',), {}, (
+        ('impulse_dir', 'impulse_dir', 'float_vector', "0 0 0"),
+        ('force', 'force', 'float', 300),
+    )),
+    'TeamNum': ((), {}, (
+        ('TeamNum', 'teamnum', 'raw', None),
+    )),
+    'MatchSummary': ((), {}, (
+        ('MatchSummary', 'matchsummary', 'raw', None),
+    )),
+    'FadeDistance': ((), {}, (
+        ('fademindist', 'fademindist', 'float', -1),
+        ('fademaxdist', 'fademaxdist', 'float', 0),
+    )),
+    'GameType': ((), {}, (
+        ('GameType', 'gametype', 'raw', None),
+    )),
+    'Condition': ((), {}, (
+        ('condition', 'condition', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'PlayerTouch': ((), {}, (
+    )),
+    'Toggle': ((), {}, (
+    )),
+    'tf_gamerules': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('hud_type', 'hud_type', 'raw', None),
+        ('ctf_overtime', 'ctf_overtime', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'info_player_teamspawn': (('TeamNum', 'MatchSummary', 'EnableDisable', 'Targetname', 'Angles'), {'model': "models/editor/playerstart.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('controlpoint', 'controlpoint', 'raw', None),
+        ('SpawnMode', 'spawnmode', 'raw', None),
+        ('round_bluespawn', 'round_bluespawn', 'raw', None),
+        ('round_redspawn', 'round_redspawn', 'raw', None),
+    )),
+    'game_forcerespawn': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_teamflag': (('Parentname', 'GameType', 'TeamNum', 'EnableDisable', 'Targetname', 'Angles'), {'model': "models/flag/briefcase.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('ReturnTime', 'returntime', 'int', 60),
+        ('NeutralType', 'neutraltype', 'raw', "CHOICES NOT SUPPORTED"),
+        ('ScoringType', 'scoringtype', 'raw', None),
+        ('flag_model', 'flag_model', 'raw', "models/flag/briefcase.mdl"),
+        ('flag_icon', 'flag_icon', 'raw', "../hud/objectives_flagpanel_carried"),
+        ('flag_paper', 'flag_paper', 'raw', "player_intel_papertrail"),
+        ('flag_trail', 'flag_trail', 'raw', "flagtrail"),
+        ('trail_effect', 'trail_effect', 'raw', "CHOICES NOT SUPPORTED"),
+        ('VisibleWhenDisabled', 'visiblewhendisabled', 'raw', None),
+        ('ShotClockMode', 'shotclockmode', 'raw', None),
+        ('PointValue', 'pointvalue', 'int', 0),
+        ('ReturnBetweenWaves', 'returnbetweenwaves', 'raw', "CHOICES NOT SUPPORTED"),
+        ('tags', 'tags', 'raw', None),
+    )),
+    'point_intermission': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'info_observer_point': (('Parentname', 'TeamNum', 'EnableDisable', 'Targetname', 'Angles'), {'viewport_model': "models/editor/camera.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('associated_team_entity', 'associated_team_entity', 'raw', None),
+        ('defaultwelcome', 'defaultwelcome', 'raw', None),
+        ('fov', 'fov', 'float', 0),
+        ('match_summary', 'match_summary', 'raw', None),
+    )),
+    'game_round_win': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('TeamNum', 'teamnum', 'raw', None),
+        ('force_map_reset', 'force_map_reset', 'raw', "CHOICES NOT SUPPORTED"),
+        ('switch_teams', 'switch_teams', 'raw', None),
+    )),
+    'team_round_timer': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('timer_length', 'timer_length', 'int', 600),
+        ('max_length', 'max_length', 'int', 0),
+        ('start_paused', 'start_paused', 'raw', "CHOICES NOT SUPPORTED"),
+        ('show_time_remaining', 'show_time_remaining', 'raw', "CHOICES NOT SUPPORTED"),
+        ('setup_length', 'setup_length', 'int', 0),
+        ('reset_time', 'reset_time', 'raw', None),
+        ('auto_countdown', 'auto_countdown', 'raw', "CHOICES NOT SUPPORTED"),
+        ('show_in_hud', 'show_in_hud', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'Item': (('Toggle', 'PlayerTouch', 'FadeDistance', 'TeamNum', 'EnableDisable', 'Targetname', 'Angles'), {}, (
+        ('powerup_model', 'powerup_model', 'raw', None),
+        ('AutoMaterialize', 'automaterialize', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'item_healthkit_full': (('Item',), {'model': "models/items/medkit_large.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_healthkit_small': (('Item',), {'model': "models/items/medkit_small.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_healthkit_medium': (('Item',), {'model': "models/items/medkit_medium.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_ammopack_full': (('Item',), {'model': "models/items/ammopack_large.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_ammopack_small': (('Item',), {'model': "models/items/ammopack_small.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_ammopack_medium': (('Item',), {'model': "models/items/ammopack_medium.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_spell_pickup': (('Item',), {'model': "models/props_halloween/hwn_spellbook_flying.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('tier', 'tier', 'raw', None),
+    )),
+    'item_bonuspack': (('Toggle', 'PlayerTouch', 'FadeDistance', 'TeamNum', 'EnableDisable', 'Targetname', 'Angles'), {'model': "models/crafting/moustachium.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('powerup_model', 'powerup_model', 'raw', None),
+    )),
+    'tf_halloween_pickup': (('Parentname', 'Item'), {'model': "models/items/target_duck.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('pickup_sound', 'pickup_sound', 'raw', None),
+        ('pickup_particle', 'pickup_particle', 'raw', None),
+    )),
+    'info_powerup_spawn': (('EnableDisable', 'Targetname'), {'model': "models/pickups/pickup_powerup_regen.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'item_powerup_crit': (('EnableDisable', 'Targetname'), {'model': "models/pickups/pickup_powerup_crit.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'item_powerup_uber': (('EnableDisable', 'Targetname'), {'model': "models/pickups/pickup_powerup_uber.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'filter_activator_tfteam': (('BaseFilter', 'TeamNum'), {'icon_sprite': "editor/filter_team.vmt"}, (
+        ('controlpoint', 'controlpoint', 'raw', None),
+    )),
+    'filter_tf_player_can_cap': (('BaseFilter', 'TeamNum'), {'icon_sprite': "editor/filter_team.vmt"}, (
+    )),
+    'filter_tf_damaged_by_weapon_in_slot': (('BaseFilter',), {}, (
+        ('weaponSlot', 'weaponslot', 'raw', None),
+    )),
+    'filter_tf_condition': (('BaseFilter', 'Condition'), {}, (
+    )),
+    'filter_tf_class': (('BaseFilter',), {'icon_sprite': "editor/filter_class.vmt"}, (
+        ('tfclass', 'tfclass', 'raw', None),
+    )),
+    'func_capturezone': (('EnableDisable', 'Targetname', 'TeamNum'), {}, (
+        ('capturepoint', 'capturepoint', 'int', 1),
+        ('capture_delay', 'capture_delay', 'float', 1.1),
+        ('capture_delay_offset', 'capture_delay_offset', 'float', 0.025),
+        ('shouldBlock', 'shouldblock', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'func_flagdetectionzone': (('Parentname', 'EnableDisable', 'Targetname', 'TeamNum'), {}, (
+        ('alarm', 'alarm', 'raw', None),
+    )),
+    'func_nogrenades': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+    )),
+    'func_achievement': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+        ('zone_id', 'zone_id', 'int', 0),
+    )),
+    'func_nobuild': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+        ('AllowSentry', 'allowsentry', 'raw', None),
+        ('AllowDispenser', 'allowdispenser', 'raw', None),
+        ('AllowTeleporters', 'allowteleporters', 'raw', None),
+    )),
+    'func_croc': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+        ('filtername', 'filtername', 'raw', None),
+    )),
+    'func_suggested_build': (('Toggle', 'TeamNum', 'Origin', 'EnableDisable', 'Targetname'), {}, (
+        ('object_type', 'object_type', 'raw', None),
+        ('face_entity', 'face_entity', 'raw', None),
+        ('face_entity_fov', 'face_entity_fov', 'float', 90),
+    )),
+    'func_regenerate': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+        ('associatedmodel', 'associatedmodel', 'raw', None),
+    )),
+    'func_powerupvolume': (('Toggle', 'TeamNum', 'Trigger'), {}, (
+    )),
+    'func_respawnflag': (('EnableDisable', 'Toggle', 'Targetname'), {}, (
+    )),
+    'func_respawnroom': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+    )),
+    'func_flag_alert': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+        ('playsound', 'playsound', 'raw', "CHOICES NOT SUPPORTED"),
+        ('alert_delay', 'alert_delay', 'int', 10),
+    )),
+    'func_respawnroomvisualizer': (('Parentname', 'Global', 'Origin', 'RenderFields', 'EnableDisable', 'Targetname', 'Inputfilter', 'Shadow'), {}, (
+        ('respawnroomname', 'respawnroomname', 'raw', None),
+        ('Solidity', 'solidity', 'raw', "CHOICES NOT SUPPORTED"),
+        ('vrad_brush_cast_shadows', 'vrad_brush_cast_shadows', 'raw', None),
+        ('solid_to_enemies', 'solid_to_enemies', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'func_forcefield': (('Parentname', 'TeamNum', 'Origin', 'RenderFields', 'EnableDisable', 'Targetname'), {}, (
+    )),
+    'func_changeclass': (('TeamNum', 'EnableDisable', 'Toggle', 'Targetname'), {}, (
+    )),
+    'game_intro_viewpoint': (('Angles',), {'viewport_model': "models/editor/camera.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('TeamNum', 'teamnum', 'raw', None),
+        ('step_number', 'step_number', 'int', 1),
+        ('time_delay', 'time_delay', 'float', 12),
+        ('hint_message', 'hint_message', 'raw', None),
+        ('event_to_fire', 'event_to_fire', 'raw', None),
+        ('event_delay', 'event_delay', 'float', 3),
+        ('event_data_int', 'event_data_int', 'int', 0),
+        ('fov', 'fov', 'float', 0),
+    )),
+    'func_proprrespawnzone': (('Targetname',), {}, (
+    )),
+    'team_control_point': (('EnableDisable', 'Targetname', 'Angles', 'Parentname'), {'model': "models/effects/cappoint_hologram.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('point_start_locked', 'point_start_locked', 'raw', None),
+        ('point_printname', 'point_printname', 'raw', "TODO: Set Name"),
+        ('point_group', 'point_group', 'int', 0),
+        ('point_default_owner', 'point_default_owner', 'raw', None),
+        ('point_index', 'point_index', 'int', 0),
+        ('point_warn_on_cap', 'point_warn_on_cap', 'raw', None),
+        ('point_warn_sound', 'point_warn_sound', 'raw', "ControlPoint.CaptureWarn"),
+        ('random_owner_on_restart', 'random_owner_on_restart', 'raw', None),
+        ('team_timedpoints_2', 'team_timedpoints_2', 'int', 0),
+        ('team_timedpoints_3', 'team_timedpoints_3', 'int', 0),
+        ('team_capsound_0', 'team_capsound_0', 'raw', None),
+        ('team_capsound_2', 'team_capsound_2', 'raw', None),
+        ('team_capsound_3', 'team_capsound_3', 'raw', None),
+        ('team_model_0', 'team_model_0', 'raw', "models/effects/cappoint_hologram.mdl"),
+        ('team_model_2', 'team_model_2', 'raw', "models/effects/cappoint_hologram.mdl"),
+        ('team_model_3', 'team_model_3', 'raw', "models/effects/cappoint_hologram.mdl"),
+        ('team_bodygroup_0', 'team_bodygroup_0', 'int', 3),
+        ('team_bodygroup_2', 'team_bodygroup_2', 'int', 1),
+        ('team_bodygroup_3', 'team_bodygroup_3', 'int', 1),
+        ('team_icon_0', 'team_icon_0', 'raw', "sprites/obj_icons/icon_obj_neutral"),
+        ('team_icon_2', 'team_icon_2', 'raw', "sprites/obj_icons/icon_obj_red"),
+        ('team_icon_3', 'team_icon_3', 'raw', "sprites/obj_icons/icon_obj_blu"),
+        ('team_overlay_0', 'team_overlay_0', 'raw', None),
+        ('team_overlay_2', 'team_overlay_2', 'raw', None),
+        ('team_overlay_3', 'team_overlay_3', 'raw', None),
+        ('team_previouspoint_2_0', 'team_previouspoint_2_0', 'raw', None),
+        ('team_previouspoint_2_1', 'team_previouspoint_2_1', 'raw', None),
+        ('team_previouspoint_2_2', 'team_previouspoint_2_2', 'raw', None),
+        ('team_previouspoint_3_0', 'team_previouspoint_3_0', 'raw', None),
+        ('team_previouspoint_3_1', 'team_previouspoint_3_1', 'raw', None),
+        ('team_previouspoint_3_2', 'team_previouspoint_3_2', 'raw', None),
+    )),
+    'team_control_point_round': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('cpr_printname', 'cpr_printname', 'raw', None),
+        ('cpr_priority', 'cpr_priority', 'int', 0),
+        ('cpr_cp_names', 'cpr_cp_names', 'raw', None),
+        ('cpr_restrict_team_cap_win', 'cpr_restrict_team_cap_win', 'raw', None),
+    )),
+    'team_control_point_master': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('team_base_icon_2', 'team_base_icon_2', 'raw', "sprites/obj_icons/icon_base_red"),
+        ('team_base_icon_3', 'team_base_icon_3', 'raw', "sprites/obj_icons/icon_base_blu"),
+        ('caplayout', 'caplayout', 'raw', None),
+        ('custom_position_x', 'custom_position_x', 'float', -1),
+        ('custom_position_y', 'custom_position_y', 'float', -1),
+        ('cpm_restrict_team_cap_win', 'cpm_restrict_team_cap_win', 'raw', None),
+        ('switch_teams', 'switch_teams', 'raw', None),
+        ('score_style', 'score_style', 'raw', None),
+        ('play_all_rounds', 'play_all_rounds', 'raw', None),
+        ('partial_cap_points_rate', 'partial_cap_points_rate', 'float', 0),
+    )),
+    'trigger_capture_area': (('EnableDisable', 'Targetname', 'Parentname'), {}, (
+        ('area_cap_point', 'area_cap_point', 'raw', None),
+        ('team_cancap_2', 'team_cancap_2', 'raw', "CHOICES NOT SUPPORTED"),
+        ('team_cancap_3', 'team_cancap_3', 'raw', "CHOICES NOT SUPPORTED"),
+        ('team_startcap_2', 'team_startcap_2', 'int', 1),
+        ('team_startcap_3', 'team_startcap_3', 'int', 1),
+        ('team_numcap_2', 'team_numcap_2', 'int', 1),
+        ('team_numcap_3', 'team_numcap_3', 'int', 1),
+        ('team_spawn_2', 'team_spawn_2', 'int', 0),
+        ('team_spawn_3', 'team_spawn_3', 'int', 0),
+        ('area_time_to_cap', 'area_time_to_cap', 'int', 5),
+    )),
+    'team_train_watcher': (('TeamNum', 'EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('train_can_recede', 'train_can_recede', 'raw', "CHOICES NOT SUPPORTED"),
+        ('train_recede_time', 'train_recede_time', 'int', 0),
+        ('handle_train_movement', 'handle_train_movement', 'raw', None),
+        ('speed_forward_modifier', 'speed_forward_modifier', 'float', 1),
+        ('env_spark_name', 'env_spark_name', 'raw', None),
+        ('train', 'train', 'raw', None),
+        ('start_node', 'start_node', 'raw', None),
+        ('goal_node', 'goal_node', 'raw', None),
+        ('linked_pathtrack_1', 'linked_pathtrack_1', 'raw', None),
+        ('linked_cp_1', 'linked_cp_1', 'raw', None),
+        ('linked_pathtrack_2', 'linked_pathtrack_2', 'raw', None),
+        ('linked_cp_2', 'linked_cp_2', 'raw', None),
+        ('linked_pathtrack_3', 'linked_pathtrack_3', 'raw', None),
+        ('linked_cp_3', 'linked_cp_3', 'raw', None),
+        ('linked_pathtrack_4', 'linked_pathtrack_4', 'raw', None),
+        ('linked_cp_4', 'linked_cp_4', 'raw', None),
+        ('linked_pathtrack_5', 'linked_pathtrack_5', 'raw', None),
+        ('linked_cp_5', 'linked_cp_5', 'raw', None),
+        ('linked_pathtrack_6', 'linked_pathtrack_6', 'raw', None),
+        ('linked_cp_6', 'linked_cp_6', 'raw', None),
+        ('linked_pathtrack_7', 'linked_pathtrack_7', 'raw', None),
+        ('linked_cp_7', 'linked_cp_7', 'raw', None),
+        ('linked_pathtrack_8', 'linked_pathtrack_8', 'raw', None),
+        ('linked_cp_8', 'linked_cp_8', 'raw', None),
+        ('hud_min_speed_level_1', 'hud_min_speed_level_1', 'float', 30),
+        ('hud_min_speed_level_2', 'hud_min_speed_level_2', 'float', 60),
+        ('hud_min_speed_level_3', 'hud_min_speed_level_3', 'float', 90),
+    )),
+    'game_text_tf': (('Targetname',), {'icon_sprite': "editor/game_text.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('message', 'message', 'raw', None),
+        ('icon', 'icon', 'raw', None),
+        ('display_to_team', 'display_to_team', 'raw', None),
+        ('background', 'background', 'raw', None),
+    )),
+    'BaseObject': ((), {}, (
+        ('TeamNum', 'teamnum', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'obj_dispenser': (('Parentname', 'BaseObject', 'Targetname', 'Angles'), {'model': "models/buildables/dispenser_light.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('defaultupgrade', 'defaultupgrade', 'raw', None),
+    )),
+    'obj_sentrygun': (('Parentname', 'BaseObject', 'Targetname', 'Angles'), {'model': "models/buildables/sentry3.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('defaultupgrade', 'defaultupgrade', 'raw', None),
+    )),
+    'obj_teleporter': (('Parentname', 'BaseObject', 'Targetname', 'Angles'), {'model': "models/buildables/teleporter_light.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('defaultupgrade', 'defaultupgrade', 'raw', None),
+        ('teleporterType', 'teleportertype', 'raw', "CHOICES NOT SUPPORTED"),
+        ('matchingTeleporter', 'matchingteleporter', 'raw', None),
+    )),
+    'bot_hint_sentrygun': (('Parentname', 'BaseObject', 'EnableDisable', 'Targetname', 'Angles'), {'model': "models/buildables/sentry3.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('sequence', 'sequence', 'int', 5),
+        ('sticky', 'sticky', 'raw', None),
+    )),
+    'bot_hint_teleporter_exit': (('Parentname', 'BaseObject', 'EnableDisable', 'Targetname', 'Angles'), {'model': "models/buildables/teleporter_blueprint_exit.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'bot_hint_engineer_nest': (('Parentname', 'BaseObject', 'EnableDisable', 'Targetname', 'Angles'), {'model': "models/bots/engineer/bot_engineer.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'bot_hint_sniper_spot': (('Parentname', 'BaseObject', 'Targetname', 'Angles'), {'model': "models/player/sniper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('radius', 'radius', 'float', 100),
+    )),
+    'mapobj_cart_dispenser': (('Parentname', 'BaseObject', 'Targetname'), {'icon_sprite': "editor/bullseye.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('touch_trigger', 'touch_trigger', 'raw', None),
+    )),
+    'dispenser_touch_trigger': (('Trigger',), {}, (
+    )),
+    'tf_logic_arena': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('CapEnableDelay', 'capenabledelay', 'float', 0),
+    )),
+    'tf_logic_competitive': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_mannpower': (('EnableDisable', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'bot_controller': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('TeamNum', 'teamnum', 'raw', "CHOICES NOT SUPPORTED"),
+        ('bot_class', 'bot_class', 'raw', None),
+        ('bot_name', 'bot_name', 'raw', None),
+    )),
+    'tf_logic_training_mode': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('nextMap', 'nextmap', 'raw', None),
+    )),
+    'boss_alpha': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'base_boss': (('Parentname', 'Targetname', 'Angles', 'TeamNum'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('health', 'health', 'int', 1000),
+        ('model', 'model', 'raw', "models/bots/boss_bot/boss_tank.mdl"),
+        ('speed', 'speed', 'float', 75),
+        ('start_disabled', 'start_disabled', 'raw', None),
+    )),
+    'tank_boss': (('base_boss',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_multiple_escort': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_koth': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('timer_length', 'timer_length', 'int', 180),
+        ('unlock_point', 'unlock_point', 'int', 30),
+    )),
+    'tf_robot_destruction_robot_spawn': (('Parentname', 'Targetname', 'Angles'), {'model': "models/bots/bot_worker/bot_worker_a.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('health', 'health', 'int', 500),
+        ('gibs', 'gibs', 'int', 0),
+        ('type', 'type', 'raw', None),
+        ('spawngroup', 'spawngroup', 'raw', None),
+        ('startpath', 'startpath', 'raw', None),
+    )),
+    'tf_robot_destruction_spawn_group': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('respawn_time', 'respawn_time', 'float', 0),
+        ('group_number', 'group_number', 'int', 0),
+        ('team_number', 'team_number', 'raw', "CHOICES NOT SUPPORTED"),
+        ('hud_icon', 'hud_icon', 'raw', "../HUD/hud_bot_worker_outline_blue"),
+        ('respawn_reduction_scale', 'respawn_reduction_scale', 'float', 0),
+    )),
+    'RobotDestruction': ((), {}, (
+    )),
+    'tf_logic_robot_destruction': (('Targetname', 'RobotDestruction'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('score_interval', 'score_interval', 'float', 1),
+        ('loser_respawn_bonus_per_bot', 'loser_respawn_bonus_per_bot', 'float', 0),
+        ('red_respawn_time', 'red_respawn_time', 'float', 10),
+        ('blue_respawn_time', 'blue_respawn_time', 'float', 10),
+        ('max_points', 'max_points', 'int', 200),
+        ('finale_length', 'finale_length', 'float', 30),
+        ('res_file', 'res_file', 'raw', "resource/UI/HudObjectiveRobotDestruction.res"),
+    )),
+    'tf_logic_player_destruction': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('prop_model_name', 'prop_model_name', 'raw', "models/flag/flag.mdl"),
+        ('prop_drop_sound', 'prop_drop_sound', 'raw', None),
+        ('prop_pickup_sound', 'prop_pickup_sound', 'raw', None),
+        ('red_respawn_time', 'red_respawn_time', 'float', 10),
+        ('blue_respawn_time', 'blue_respawn_time', 'float', 10),
+        ('min_points', 'min_points', 'int', 10),
+        ('points_per_player', 'points_per_player', 'int', 5),
+        ('finale_length', 'finale_length', 'float', 30),
+        ('res_file', 'res_file', 'raw', "resource/UI/HudObjectivePlayerDestruction.res"),
+        ('flag_reset_delay', 'flag_reset_delay', 'int', 60),
+        ('heal_distance', 'heal_distance', 'int', 450),
+    )),
+    'trigger_rd_vault_trigger': (('Trigger', 'TeamNum'), {}, (
+    )),
+    'tf_logic_medieval': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_cp_timer': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('controlpoint', 'controlpoint', 'raw', None),
+        ('timer_length', 'timer_length', 'int', 60),
+    )),
+    'tf_logic_hybrid_ctf_cp': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_raid': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_boss_battle': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_mann_vs_machine': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_holiday': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('holiday_type', 'holiday_type', 'raw', "CHOICES NOT SUPPORTED"),
+        ('tauntInHell', 'tauntinhell', 'raw', None),
+        ('allowHaunting', 'allowhaunting', 'raw', None),
+    )),
+    'func_upgradestation': (('EnableDisable', 'Targetname'), {}, (
+    )),
+    'bot_generator': (('Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+        ('class_', 'class', 'raw', "CHOICES NOT SUPPORTED"),
+        ('count', 'count', 'int', 1),
+        ('maxActive', 'maxactive', 'int', 1),
+        ('interval', 'interval', 'float', 0),
+        ('action_point', 'action_point', 'raw', None),
+        ('initial_command', 'initial_command', 'raw', None),
+        ('suppressFire', 'suppressfire', 'raw', None),
+        ('disableDodge', 'disabledodge', 'raw', None),
+        ('actionOnDeath', 'actionondeath', 'raw', "CHOICES NOT SUPPORTED"),
+        ('spectateOnDeath', 'spectateondeath', 'raw', None),
+        ('useTeamSpawnPoint', 'useteamspawnpoint', 'raw', None),
+        ('retainBuildings', 'retainbuildings', 'raw', None),
+        ('difficulty', 'difficulty', 'raw', None),
+        ('spawnOnlyWhenTriggered', 'spawnonlywhentriggered', 'raw', None),
+    )),
+    'bot_roster': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowClassChanges', 'allowclasschanges', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowScout', 'allowscout', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowSniper', 'allowsniper', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowSoldier', 'allowsoldier', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowDemoman', 'allowdemoman', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowMedic', 'allowmedic', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowHeavy', 'allowheavy', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowPyro', 'allowpyro', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowSpy', 'allowspy', 'raw', "CHOICES NOT SUPPORTED"),
+        ('allowEngineer', 'allowengineer', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'bot_action_point': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('next_action_point', 'next_action_point', 'raw', None),
+        ('desired_distance', 'desired_distance', 'float', 5),
+        ('stay_time', 'stay_time', 'float', 0),
+        ('command', 'command', 'raw', None),
+    )),
+    'bot_proxy': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('bot_name', 'bot_name', 'raw', "TFBot"),
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+        ('class_', 'class', 'raw', "CHOICES NOT SUPPORTED"),
+        ('spawn_on_start', 'spawn_on_start', 'raw', None),
+        ('respawn_interval', 'respawn_interval', 'float', 0),
+        ('action_point', 'action_point', 'raw', None),
+    )),
+    'tf_spawner': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('count', 'count', 'int', 1),
+        ('maxActive', 'maxactive', 'int', 1),
+        ('interval', 'interval', 'float', 0),
+        ('template', 'template', 'raw', None),
+    )),
+    'tf_template_stun_drone': (('EnableDisable', 'Targetname', 'Angles'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'func_nav_blocker': (('Targetname',), {}, (
+        ('teamToBlock', 'teamtoblock', 'raw', "CHOICES NOT SUPPORTED"),
+        ('affectsFlow', 'affectsflow', 'raw', None),
+    )),
+    'func_nav_avoid': (('Targetname',), {}, (
+        ('tags', 'tags', 'raw', None),
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+        ('start_disabled', 'start_disabled', 'raw', None),
+    )),
+    'func_nav_prefer': (('Targetname',), {}, (
+        ('tags', 'tags', 'raw', None),
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+        ('start_disabled', 'start_disabled', 'raw', None),
+    )),
+    'func_nav_prerequisite': (('Trigger',), {}, (
+        ('Task', 'task', 'raw', "CHOICES NOT SUPPORTED"),
+        ('Entity', 'entity', 'raw', None),
+        ('Value', 'value', 'float', 0),
+        ('start_disabled', 'start_disabled', 'raw', None),
+    )),
+    'func_tfbot_hint': (('EnableDisable', 'Targetname', 'Origin'), {}, (
+        ('team', 'team', 'raw', "CHOICES NOT SUPPORTED"),
+        ('hint', 'hint', 'raw', None),
+    )),
+    'trigger_stun': (('Trigger',), {}, (
+        ('trigger_delay', 'trigger_delay', 'float', 0),
+        ('stun_duration', 'stun_duration', 'float', 0),
+        ('move_speed_reduction', 'move_speed_reduction', 'float', 0),
+        ('stun_type', 'stun_type', 'raw', None),
+        ('stun_effects', 'stun_effects', 'raw', None),
+    )),
+    'entity_spawn_point': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('spawn_manager_name', 'spawn_manager_name', 'raw', None),
+    )),
+    'entity_spawn_manager': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('entity_name', 'entity_name', 'raw', None),
+        ('entity_count', 'entity_count', 'int', 0),
+        ('respawn_time', 'respawn_time', 'int', 0),
+        ('drop_to_ground', 'drop_to_ground', 'raw', None),
+        ('random_rotation', 'random_rotation', 'raw', None),
+    )),
+    'tf_pumpkin_bomb': (('Item',), {'model': "models/props_halloween/pumpkin_explode.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_generic_bomb': (('Studiomodel', 'Targetname', 'Angles', 'Origin'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('damage', 'damage', 'float', 50),
+        ('radius', 'radius', 'float', 100),
+        ('health', 'health', 'int', 1),
+        ('explode_particle', 'explode_particle', 'raw', None),
+        ('sound', 'sound', 'raw', None),
+        ('friendlyfire', 'friendlyfire', 'raw', None),
+    )),
+    'training_annotation': (('Targetname',), {'model': "models/extras/info_speech.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('display_text', 'display_text', 'raw', "<Add Text Here>"),
+        ('lifetime', 'lifetime', 'float', 0),
+        ('offset', 'offset', 'float', 0),
+    )),
+    'training_prop_dynamic': (('prop_dynamic',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'trigger_ignite_arrows': (('Trigger',), {}, (
+    )),
+    'wheel_of_doom': (('Parentname', 'Targetname', 'Angles'), {'model': "models/editor/cone_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('effect_duration', 'effect_duration', 'float', 30),
+        ('has_spiral', 'has_spiral', 'raw', None),
+    )),
+    'point_populator_interface': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_point_weapon_mimic': (('Parentname', 'Targetname', 'Angles'), {'model': "models/editor/cone_helper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('WeaponType', 'weapontype', 'raw', None),
+        ('FireSound', 'firesound', 'raw', None),
+        ('ParticleEffect', 'particleeffect', 'raw', None),
+        ('ModelOverride', 'modeloverride', 'raw', None),
+        ('ModelScale', 'modelscale', 'float', 1),
+        ('SpeedMin', 'speedmin', 'float', 1000),
+        ('SpeedMax', 'speedmax', 'float', 1000),
+        ('Damage', 'damage', 'float', 75),
+        ('SplashRadius', 'splashradius', 'float', 50),
+        ('SpreadAngle', 'spreadangle', 'float', 0),
+        ('Crits', 'crits', 'raw', None),
+    )),
+    'tf_point_nav_interface': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'trigger_timer_door': (('Trigger',), {}, (
+        ('door_name', 'door_name', 'raw', None),
+        ('area_cap_point', 'area_cap_point', 'raw', None),
+        ('team_cancap_2', 'team_cancap_2', 'raw', "CHOICES NOT SUPPORTED"),
+        ('team_cancap_3', 'team_cancap_3', 'raw', "CHOICES NOT SUPPORTED"),
+        ('team_startcap_2', 'team_startcap_2', 'int', 1),
+        ('team_startcap_3', 'team_startcap_3', 'int', 1),
+        ('team_numcap_2', 'team_numcap_2', 'int', 1),
+        ('team_numcap_3', 'team_numcap_3', 'int', 1),
+        ('team_spawn_2', 'team_spawn_2', 'int', 0),
+        ('team_spawn_3', 'team_spawn_3', 'int', 0),
+        ('area_time_to_cap', 'area_time_to_cap', 'int', 5),
+    )),
+    'trigger_bot_tag': (('Trigger',), {}, (
+        ('tags', 'tags', 'raw', None),
+        ('add', 'add', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'filter_tf_bot_has_tag': (('BaseFilter',), {}, (
+        ('tags', 'tags', 'raw', None),
+        ('require_all_tags', 'require_all_tags', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'trigger_add_tf_player_condition': (('Trigger', 'Condition'), {}, (
+        ('duration', 'duration', 'float', 0),
+    )),
+    'trigger_remove_tf_player_condition': (('Trigger', 'Condition'), {}, (
+    )),
+    'hightower_teleport_vortex': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('target_base_name', 'target_base_name', 'raw', None),
+        ('lifetime', 'lifetime', 'float', 0),
+    )),
+    'tf_zombie_spawner': (('Targetname',), {'model': "models/bots/skeleton_sniper/skeleton_sniper.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('zombie_lifetime', 'zombie_lifetime', 'float', 0),
+        ('max_zombies', 'max_zombies', 'int', 1),
+        ('infinite_zombies', 'infinite_zombies', 'raw', None),
+        ('zombie_type', 'zombie_type', 'raw', None),
+    )),
+    'halloween_zapper': (('Parentname', 'Targetname'), {'icon_sprite': "editor/bullseye.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('touch_trigger', 'touch_trigger', 'raw', None),
+        ('ParticleEffect', 'particleeffect', 'raw', None),
+        ('ZapperType', 'zappertype', 'raw', None),
+    )),
+    'trigger_player_respawn_override': (('Trigger', 'Toggle'), {}, (
+        ('RespawnTime', 'respawntime', 'float', -1),
+        ('RespawnName', 'respawnname', 'raw', None),
+    )),
+    'prop_soccer_ball': (('Studiomodel', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('trigger_name', 'trigger_name', 'raw', None),
+    )),
+    'MiniGame': ((), {}, (
+    )),
+    'tf_logic_minigames': (('MiniGame', 'Targetname'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_base_minigame': (('Targetname',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('RedSpawn', 'redspawn', 'raw', None),
+        ('BlueSpawn', 'bluespawn', 'raw', None),
+        ('InRandomPool', 'inrandompool', 'raw', "CHOICES NOT SUPPORTED"),
+        ('MaxScore', 'maxscore', 'int', 5),
+        ('hud_res_file', 'hud_res_file', 'raw', None),
+        ('your_team_score_sound', 'your_team_score_sound', 'raw', None),
+        ('enemy_team_score_sound', 'enemy_team_score_sound', 'raw', None),
+        ('ScoreType', 'scoretype', 'raw', None),
+        ('SuddenDeathTime', 'suddendeathtime', 'float', -1),
+    )),
+    'tf_halloween_minigame': (('tf_base_minigame',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('MinigameType', 'minigametype', 'raw', "CHOICES NOT SUPPORTED"),
+    )),
+    'tf_halloween_minigame_falling_platforms': (('tf_halloween_minigame',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'halloween_fortune_teller': (('Targetname', 'Angles', 'Origin'), {'model': "models/bots/merasmus/merasmas_misfortune_teller.mdl"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('red_teleport', 'red_teleport', 'raw', None),
+        ('blue_teleport', 'blue_teleport', 'raw', None),
+    )),
+    'tf_teleport_location': (('Targetname', 'Angles', 'Origin'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'func_passtime_goal': (('EnableDisable', 'Targetname', 'TeamNum', 'Origin'), {}, (
+        ('points', 'points', 'float', 1),
+    )),
+    'info_passtime_ball_spawn': (('EnableDisable', 'Targetname', 'TeamNum'), {'icon_sprite': "editor/passtime_ball_spawner.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'passtime_logic': (('Targetname',), {'icon_sprite': "editor/passtime_master.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('num_sections', 'num_sections', 'int', 0),
+        ('ball_spawn_countdown', 'ball_spawn_countdown', 'int', 15),
+        ('max_pass_range', 'max_pass_range', 'float', 0),
+    )),
+    'func_passtime_goalie_zone': (('EnableDisable', 'Targetname', 'TeamNum'), {}, (
+    )),
+    'func_passtime_no_ball_zone': (('Targetname',), {}, (
+    )),
+    'trigger_passtime_ball': (('Targetname',), {}, (
+    )),
+    'trigger_catapult': (('Trigger',), {}, (
+        ('playerSpeed', 'playerspeed', 'float', 450),
+        ('physicsSpeed', 'physicsspeed', 'float', 450),
+        ('useThresholdCheck', 'usethresholdcheck', 'int', 0),
+        ('entryAngleTolerance', 'entryangletolerance', 'float', 0.0),
+        ('useExactVelocity', 'useexactvelocity', 'int', 0),
+        ('exactVelocityChoiceType', 'exactvelocitychoicetype', 'raw', None),
+        ('lowerThreshold', 'lowerthreshold', 'float', 0.15),
+        ('upperThreshold', 'upperthreshold', 'float', 0.30),
+        ('launchDirection', 'launchdirection', 'float_vector', "0 0 0"),
+        ('launchTarget', 'launchtarget', 'raw', None),
+        ('onlyVelocityCheck', 'onlyvelocitycheck', 'int', 0),
+        ('applyAngularImpulse', 'applyangularimpulse', 'int', 1),
+        ('AirCtrlSupressionTime', 'airctrlsupressiontime', 'float', -1.0),
+    )),
+    'trigger_ignite': (('Trigger',), {}, (
+        ('burn_duration', 'burn_duration', 'float', 5),
+        ('damage_percent_per_second', 'damage_percent_per_second', 'float', 10),
+        ('ignite_particle_name', 'ignite_particle_name', 'raw', None),
+        ('ignite_sound_name', 'ignite_sound_name', 'raw', None),
+    )),
+    'tf_halloween_gift_spawn_location': (('Targetname', 'Angles', 'Origin'), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_logic_on_holiday': (('Targetname',), {'icon_sprite': "editor/logic_auto.vmt"}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+    )),
+    'tf_glow': (('EnableDisable',), {}, (
+        ('origin', 'origin', 'float_vector', "0 0 0"),
+        ('targetname', 'targetname', 'raw', None),
+        ('target', 'target', 'raw', None),
+        ('GlowColor', 'glowcolor', 'int_vector', "255 0 0 255"),
+        ('Mode', 'mode', 'raw', None),
+    )),
+}
+
+entity_class_handle = EntityClassRegistry(__name__, SCHEMA)
+
+
+def __getattr__(name):
+    # Entity classes are built on first access, see EntityClassRegistry
+    if name in entity_class_handle:
+        return entity_class_handle[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ import bpy
 import numpy as np
 from typing import List
 
-from ....bpy_utilities.utils import get_material
+from ....bpy_utilities.utils import get_material, fill_triangle_mesh
 from ..datatypes.material_sort import MaterialSort
 from ..datatypes.mesh import Mesh, VertexType
 from ..datatypes.model import RespawnModel
@@ -21,110 +21,102 @@ from ..entities.r1_entity_classes import entity_class_handle, worldspawn, func_w
 class TitanfallEntityHandler(BaseEntityHandler):
     entity_lookup_table = entity_class_handle
 
+    def _load_lightmap_pages(self, lightmap_id):
+        l_headers = self._bsp.get_lump('LUMP_LIGHTMAP_HEADERS').lightmap_headers
+        l_data = self._bsp.get_lump('LUMP_LIGHTMAP_DATA_SKY').lightmap_data
+        if not 0 <= lightmap_id < len(l_headers):
+            return
+        offset = sum((header.count + 1) * header.width * header.height for header in l_headers[:lightmap_id])
+        header = l_headers[lightmap_id]
+        pixel_count = header.width * header.height
+        for c in range(header.count + 1):
+            name = f'lightmap_{lightmap_id}_{c}'
+            if name not in bpy.data.images:
+                pixel_data = l_data[offset:offset + pixel_count].astype(np.float32).ravel()
+                pixel_data /= 255
+                image = bpy.data.images.new(name, width=header.width, height=header.height, alpha=True)
+                image.filepath = name + '.tga'
+                image.alpha_mode = 'CHANNEL_PACKED'
+                image.file_format = 'TARGA'
+
+                if bpy.app.version > (2, 83, 0):
+                    image.pixels.foreach_set(pixel_data)
+                else:
+                    image.pixels[:] = pixel_data
+                image.pack()
+            offset += pixel_count
+
+    @staticmethod
+    def _get_vertex_info_lump_name(mesh: Mesh):
+        if mesh.flags & 0x200 > 0:
+            return "LUMP_BUMPLITVERTEX"
+        elif mesh.flags & 0x400 > 0:
+            return "LUMP_UNLITVERTEX"
+        elif mesh.flags & 0x600 > 0:
+            return "LUMP_UNLITTSVERTEX"
+        else:
+            raise NotImplementedError(f'Unknown mesh format {mesh.flags:016b}')
+
     def _load_brush_model(self, model_id, model_name):
         objs = []
         model: RespawnModel = self._bsp.get_lump("LUMP_MODELS").models[model_id]
         tex_data: List[TextureData] = self._bsp.get_lump("LUMP_TEXDATA").texture_data
         indices: np.ndarray = self._bsp.get_lump("LUMP_INDICES").indices
         bsp_vertices: np.ndarray = self._bsp.get_lump('LUMP_VERTICES').vertices
+        meshes: List[Mesh] = self._bsp.get_lump("LUMP_MESHES").meshes
+        material_sorts: List[MaterialSort] = self._bsp.get_lump('LUMP_MATERIALSORT').materials
 
         grouped_by_lightmap = defaultdict(list)
 
         for mesh_id in range(model.first_mesh, model.first_mesh + model.mesh_count):
-            mesh: Mesh = self._bsp.get_lump("LUMP_MESHES").meshes[mesh_id]
-            material_sort: MaterialSort = self._bsp.get_lump('LUMP_MATERIALSORT').materials[mesh.material_sort]
+            material_sort = material_sorts[meshes[mesh_id].material_sort]
             grouped_by_lightmap[material_sort.lightmap_header_index].append(mesh_id)
 
-        for lightmap_id, meshes in grouped_by_lightmap.items():
-            merged_vertex_ids = np.array([], np.uint32)
-            merged_uv_data = np.array([], np.float32)
-            merged_lightmap_uv_data = np.array([], np.float32)
-            merged_materials_ids = np.array([], np.uint32)
-            material_indices = []
-
-            l_headers = self._bsp.get_lump('LUMP_LIGHTMAP_HEADERS').lightmap_headers
-            l_data = self._bsp.get_lump('LUMP_LIGHTMAP_DATA_SKY').lightmap_data
-            offset = 0
-            for n, header in enumerate(l_headers):
-                for c in range(header.count + 1):
-                    pixel_count = header.width * header.height
-                    if n == lightmap_id:
-                        name = f'lightmap_{n}_{c}'
-                        if name in bpy.data.images:
-                            continue
-                        pixel_data: np.ndarray = l_data[offset:offset + pixel_count]
-                        pixel_data = pixel_data.astype(np.float32) / 255
-                        image = bpy.data.images.get(name, None) or bpy.data.images.new(
-                            name,
-                            width=header.width,
-                            height=header.height,
-                            alpha=True,
-                        )
-                        image.filepath = name + '.tga'
-                        image.alpha_mode = 'CHANNEL_PACKED'
-                        image.file_format = 'TARGA'
-
-                        if bpy.app.version > (2, 83, 0):
-                            image.pixels.foreach_set(pixel_data.flatten().tolist())
-                        else:
-                            image.pixels[:] = pixel_data.flatten().tolist()
-                        image.pack()
-
-                    offset += pixel_count
-
-            for mesh_id in meshes:
-                print(f'Loading Mesh {mesh_id - model.first_mesh}/{model.mesh_count} from {model_name}')
-                mesh: Mesh = self._bsp.get_lump("LUMP_MESHES").meshes[mesh_id]
-                material_sort: MaterialSort = self._bsp.get_lump('LUMP_MATERIALSORT').materials[mesh.material_sort]
-                material_data = tex_data[material_sort.texdata_index]
-                if material_data.name in material_indices:
-                    mat_id = material_indices.index(material_data.name)
-                else:
-                    mat_id = len(material_indices)
-                    material_indices.append(material_data.name)
-
-                if mesh.flags & 0x200 > 0:
-                    vertex_info_lump = self._bsp.get_lump("LUMP_BUMPLITVERTEX").vertex_info
-                elif mesh.flags & 0x400 > 0:
-                    vertex_info_lump = self._bsp.get_lump("LUMP_UNLITVERTEX").vertex_info
-                elif mesh.flags & 0x600 > 0:
-                    vertex_info_lump = self._bsp.get_lump("LUMP_UNLITTSVERTEX").vertex_info
-                else:
-                    raise NotImplementedError(f'Unknown mesh format {mesh.flags:016b}')
-                mesh_indices = indices[
-                               mesh.triangle_start:mesh.triangle_start + mesh.triangle_count * 3].astype(
-                    np.uint32) + material_sort.vertex_offset
-                used_vertices_info = vertex_info_lump[mesh_indices]
-
-                vertex_indices = used_vertices_info['vpi'].flatten()
-                uvs = used_vertices_info['uv']
+        for group_id, (lightmap_id, mesh_ids) in enumerate(grouped_by_lightmap.items()):
+            self.logger.progress(f'Loading lightmap groups of {model_name}', group_id + 1, len(grouped_by_lightmap))
+            self._load_lightmap_pages(lightmap_id)
+
+            material_indices = {}
+            mesh_material_ids = np.empty(len(mesh_ids), np.int32)
+            corner_counts = np.empty(len(mesh_ids), np.int64)
+            corner_starts = np.empty(len(mesh_ids), np.int64)
+            vertex_offsets = np.empty(len(mesh_ids), np.int64)
+            # Meshes of group may use different vertex formats, corners are gathered per vertex info lump
+            meshes_by_vertex_lump = defaultdict(list)
+            for n, mesh_id in enumerate(mesh_ids):
+                mesh = meshes[mesh_id]
+                material_sort = material_sorts[mesh.material_sort]
+                material_name = tex_data[material_sort.texdata_index].name
+                mesh_material_ids[n] = material_indices.setdefault(material_name, len(material_indices))
+                corner_counts[n] = mesh.triangle_count * 3
+                corner_starts[n] = mesh.triangle_start
+                vertex_offsets[n] = material_sort.vertex_offset
+                meshes_by_vertex_lump[self._get_vertex_info_lump_name(mesh)].append(n)
+
+            # Position of every merged corner in index lump and in merged arrays
+            corner_total = int(corner_counts.sum())
+            merged_starts = np.cumsum(corner_counts) - corner_counts
+            corner_mesh = np.repeat(np.arange(len(mesh_ids)), corner_counts)
+            corner_local = np.arange(corner_total, dtype=np.int64) - merged_starts[corner_mesh]
+            corner_vertex_info = (indices[corner_starts[corner_mesh] + corner_local].astype(np.int64) +
+                                  vertex_offsets[corner_mesh])
+
+            merged_vertex_ids = np.empty(corner_total, np.uint32)
+            merged_uv_data = np.empty((corner_total, 2), np.float32)
+            merged_lightmap_uv_data = np.zeros((corner_total, 2), np.float32)
+            for lump_name, lump_mesh_ids in meshes_by_vertex_lump.items():
+                lump_mask = np.zeros(len(mesh_ids), np.bool_)
+                lump_mask[lump_mesh_ids] = True
+                corners = np.nonzero(lump_mask[corner_mesh])[0]
+                used_vertices_info = self._bsp.get_lump(lump_name).vertex_info[corner_vertex_info[corners]]
+                merged_vertex_ids[corners] = used_vertices_info['vpi'][:, 0]
+                merged_uv_data[corners] = used_vertices_info['uv']
+                if lump_name == "LUMP_BUMPLITVERTEX":
+                    merged_lightmap_uv_data[corners] = used_vertices_info['uv_lm']
+            merged_uv_data[:, 1] = 1 - merged_uv_data[:, 1]
+            merged_lightmap_uv_data[:, 1] = 1 - merged_lightmap_uv_data[:, 1]
+            merged_materials_ids = np.repeat(mesh_material_ids, corner_counts // 3)
 
-                uvs[:, 1] = 1 - uvs[:, 1]
-
-                merged_vertex_ids = np.append(merged_vertex_ids, vertex_indices, axis=0)
-                if merged_uv_data.shape[0] == 0:
-                    merged_uv_data = uvs
-                else:
-                    merged_uv_data = np.append(merged_uv_data, uvs, axis=0)
-
-                if mesh.flags & 0x200 > 0:
-                    uvs_lm = used_vertices_info['uv_lm']
-                    uvs_lm[:, 1] = 1 - uvs_lm[:, 1]
-                    if merged_lightmap_uv_data.shape[0] == 0:
-                        merged_lightmap_uv_data = uvs_lm
-                    else:
-                        merged_lightmap_uv_data = np.append(merged_lightmap_uv_data, uvs_lm, axis=0)
-                else:
-                    if merged_lightmap_uv_data.shape[0] == 0:
-                        merged_lightmap_uv_data = np.zeros_like(uvs)
-                    else:
-                        merged_lightmap_uv_data = np.append(merged_lightmap_uv_data, np.zeros_like(uvs), axis=0)
-
-                if merged_materials_ids.shape[0] == 0:
-                    merged_materials_ids = np.full((vertex_indices.shape[0] // 3,), mat_id)
-                else:
-                    merged_materials_ids = np.append(merged_materials_ids,
-                                                     np.full((vertex_indices.shape[0] // 3,), mat_id), axis=0)
             mesh_obj = bpy.data.objects.new(f'{model_name}_{lightmap_id}',
                                             bpy.data.meshes.new(f"{model_name}_{lightmap_id}_MESH"))
             objs.append(mesh_obj)
@@ -132,33 +124,15 @@ class TitanfallEntityHandler(BaseEntityHandler):
             for mat in material_indices:
                 get_material(mat, mesh_obj)
 
-            unique_vertex_ids = np.unique(merged_vertex_ids)
-
-            tmp2 = np.searchsorted(unique_vertex_ids, merged_vertex_ids)
-            remapped = dict(zip(merged_vertex_ids, tmp2))
+            unique_vertex_ids, remapped = np.unique(merged_vertex_ids, return_inverse=True)
 
-            faces = []
-            uvs_per_face = []
-            for triplet, tri_uv, tri_uv_lm in zip(merged_vertex_ids.reshape((-1, 3)),
-                                                  merged_uv_data.reshape((-1, 3, 2)),
-                                                  merged_lightmap_uv_data.reshape((-1, 3, 2))):
-                faces.append((remapped[triplet[0]], remapped[triplet[1]], remapped[triplet[2]]))
-                uvs_per_face.append(
-                    {remapped[triplet[0]]: (tri_uv[0], tri_uv_lm[0]),
-                     remapped[triplet[1]]: (tri_uv[1], tri_uv_lm[1]),
-                     remapped[triplet[2]]: (tri_uv[2], tri_uv_lm[2])})
-
-            mesh_data.from_pydata(bsp_vertices[unique_vertex_ids] * self.scale, [], faces)
+            fill_triangle_mesh(mesh_data, bsp_vertices[unique_vertex_ids] * self.scale, remapped)
             mesh_data.polygons.foreach_set('material_index', merged_materials_ids)
 
             mesh_data.uv_layers.new()
-            uv_data = mesh_data.uv_layers[0].data
-            uv_lm_data = mesh_data.uv_layers.new(name='LIGHTMAP').data
-
-            for poly in mesh_data.polygons:
-                for loop_index in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                    uv_data[loop_index].uv = uvs_per_face[poly.index][mesh_data.loops[loop_index].vertex_index][0]
-                    uv_lm_data[loop_index].uv = uvs_per_face[poly.index][mesh_data.loops[loop_index].vertex_index][1]
+            mesh_data.uv_layers[0].data.foreach_set('uv', merged_uv_data.ravel())
+            mesh_data.uv_layers.new(name='LIGHTMAP').data.foreach_set('uv', merged_lightmap_uv_data.ravel())
+            mesh_data.validate()
 
         return objs
 
@@ -75,7 +75,7 @@ class BSP:
             self.entity_handler = BaseEntityHandler(self.map_file, self.main_collection, self.scale)
 
         self.logger.debug('Adding map pack file to content manager')
-        content_manager.content_providers[Path(self.filepath).stem] = self.map_file.get_lump('LUMP_PAK')
+        content_manager.register_content_provider(Path(self.filepath).stem, self.map_file.get_lump('LUMP_PAK'))
 
     def get_string(self, string_id):
         strings_lump: Optional[StringsLump] = self.map_file.get_lump('LUMP_TEXDATA_STRING_TABLE')
@@ -119,8 +119,10 @@ class BSP:
         texture_data_lump: Optional[TextureDataLump] = self.map_file.get_lump('LUMP_TEXDATA')
         pak_lump: Optional[PakLump] = self.map_file.get_lump('LUMP_PAK')
         if pak_lump:
-            content_manager.content_providers[self.filepath.stem] = pak_lump
-        for texture_data in texture_data_lump.texture_data:
+            content_manager.register_content_provider(self.filepath.stem, pak_lump)
+        texture_count = len(texture_data_lump.texture_data)
+        for n, texture_data in enumerate(texture_data_lump.texture_data):
+            self.logger.progress('Loading materials', n + 1, texture_count)
             material_name = self.get_string(texture_data.name_id)
             tmp = strip_patch_coordinates.sub("", material_name)[-63:]
             if bpy.data.materials.get(tmp, False):
@@ -128,7 +130,7 @@ class BSP:
                     self.logger.debug(
                         f'Skipping loading of {strip_patch_coordinates.sub("", material_name)} as it already loaded')
                     continue
-            self.logger.info(f"Loading {material_name} material")
+            self.logger.debug(f"Loading {material_name} material")
             material_file = content_manager.find_material(material_name)
 
             if material_file:
@@ -156,7 +158,7 @@ class BSP:
         info_count = len(disp_info_lump.infos)
         multiblend_offset = 0
         for n, disp_info in enumerate(disp_info_lump.infos):
-            self.logger.info(f'Processing {n + 1}/{info_count} displacement face')
+            self.logger.progress('Processing displacement faces', n + 1, info_count)
             final_vertex_colors = {}
             src_face = disp_info.source_face
 
@@ -66,10 +66,13 @@ class Lump:
         from .bsp_file import BSPFile
         self._bsp: BSPFile = bsp
         self._lump: LumpInfo = bsp.lumps_info[lump_id]
-        self.reader = ByteIO()
+        self.reader = self.open_reader(lump_id)
 
-        base_path = self._bsp.filepath.parent
-        lump_path = base_path / f'{self._bsp.filepath.name}.{lump_id:04x}.bsp_lump'
+    def get_external_lump_path(self, lump_id):
+        return self._bsp.filepath.parent / f'{self._bsp.filepath.name}.{lump_id:04x}.bsp_lump'
+
+    def open_reader(self, lump_id) -> ByteIO:
+        lump_path = self.get_external_lump_path(lump_id)
         if lump_path.exists():
             reader = ByteIO(lump_path)
         else:
@@ -77,14 +80,9 @@ class Lump:
             reader = self._bsp.reader
 
         if self._lump.compressed:
-            self.reader = self.decompress_lump(reader)
+            return self.decompress_lump(reader)
         else:
-            self.reader = ByteIO(reader.read(self._lump.size))
-
-        # with self.reader.save_current_pos():
-        #     if not lump_path.exists():
-        #         with lump_path.open('wb') as f:
-        #             f.write(self.reader.read(-1))
+            return ByteIO(reader.read(self._lump.size))
 
     @staticmethod
     def decompress_lump(reader: ByteIO):
@@ -1,26 +1,78 @@
+import mmap
+import struct
 from io import BytesIO
 from pathlib import Path, PurePath
 
 from .. import Lump, lump_tag
+from ....utilities.byte_io_mdl import ByteIO, MemoryViewReader
 import zipfile
 
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_NAME_LENGTHS = struct.Struct('<2H')
+
 
 @lump_tag(40, 'LUMP_PAK')
 class PakLump(Lump):
     def __init__(self, bsp, lump_id):
+        self._buffer = None
+        self._mmap = None
         super().__init__(bsp, lump_id)
         self.filepath = self._bsp.filepath
         self.zip_file: zipfile.ZipFile = None
         self._cache = {}
 
+    def open_reader(self, lump_id) -> ByteIO:
+        # Uncompressed pak lump is used in place through memory map of bsp, without copying it
+        if not self._lump.compressed and not self.get_external_lump_path(lump_id).exists():
+            try:
+                with self._bsp.filepath.open('rb') as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                self._buffer = memoryview(self._mmap)[self._lump.offset:self._lump.offset + self._lump.size]
+                return ByteIO(MemoryViewReader(self._buffer))
+        reader = super().open_reader(lump_id)
+        self._buffer = reader.file.getbuffer()
+        return reader
+
     def parse(self):
         if self.zip_file is None:
             self.reader.seek(0)
-            zip_data = BytesIO(self.reader.read())
-            self.zip_file = zipfile.ZipFile(zip_data)
+            self.zip_file = zipfile.ZipFile(self.reader.file)
             self._cache = {a.lower(): a for a in self.zip_file.NameToInfo}
         return self
 
+    def close(self):
+        """Closes zip file and releases memory map of bsp, so file is not locked anymore"""
+        if self.zip_file is not None:
+            self.zip_file.close()
+            self.zip_file = None
+        self._cache = {}
+        self.reader.file.close()
+        try:
+            if self._buffer is not None:
+                self._buffer.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            # Member readers are still alive, map is unmapped once they are collected
+            pass
+        self._buffer = None
+        self._mmap = None
+
+    def _get_stored_member(self, info: zipfile.ZipInfo):
+        """Returns view of member data if it is stored without compression or encryption"""
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        header_offset = info.header_offset
+        if self._buffer[header_offset:header_offset + 4] != _LOCAL_HEADER_SIGNATURE:
+            return None
+        name_length, extra_length = _LOCAL_HEADER_NAME_LENGTHS.unpack_from(self._buffer, header_offset + 26)
+        data_offset = header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+        return self._buffer[data_offset:data_offset + info.file_size]
+
     def find_file(self, filepath: str, additional_dir=None, extension=None):
         filepath = Path(str(filepath).strip("\\/"))
 
@@ -32,5 +84,9 @@ class PakLump(Lump):
         new_filepath = str(new_filepath.as_posix()).lower()
         new_filepath = self._cache.get(new_filepath, None)
         if new_filepath is not None:
-            return BytesIO(self.zip_file.open(new_filepath, 'r').read())
+            info = self.zip_file.NameToInfo[new_filepath]
+            member_data = self._get_stored_member(info)
+            if member_data is not None:
+                return MemoryViewReader(member_data)
+            return BytesIO(self.zip_file.read(info))
         return None
@@ -34,7 +34,7 @@ def merge_strip_groups(vtx_mesh: VtxMesh):
     for strip_group in vtx_mesh.strip_groups:
         indices_accumulator.append(np.add(strip_group.indexes, vertex_offset))
         vertex_accumulator.append(strip_group.vertexes['original_mesh_vertex_index'].reshape(-1))
-        vertex_offset += sum(strip.vertex_count for strip in strip_group.strips)
+        vertex_offset += strip_group.strip_vertex_count
     return np.hstack(indices_accumulator), np.hstack(vertex_accumulator), vertex_offset
 
 
@@ -22,6 +22,72 @@ def collect_parents(parent: FgdEntity):
     return [parent] + parents
 
 
+def get_property_info(prop: FgdEntityProperty, default_prop_cache: dict):
+    """Returns property kind and Python source of default value used by entity_schema.Base.from_dict"""
+    if prop.value_type == 'color255':
+        return 'int_vector', f'"{prop.default_value or "0 0 0"}"'
+    elif prop.value_type in ['angle', 'vector', 'color1', 'origin']:
+        return 'float_vector', f'"{prop.default_value or "0 0 0"}"'
+    elif prop.value_type in ['integer', 'node_dest']:
+        return 'int', default_prop_cache.get(prop.name, '0')
+    elif prop.value_type in ['float', 'angle_negative_pitch']:
+        return 'float', default_prop_cache.get(prop.name, '0')
+    elif prop.value_type == 'target_destination' and prop.default_value == 'Name of the entity to set navigation properties on.':
+        return 'raw', 'None'  # Set to none due to bug in BlackMesa base.fgd file
+    elif prop.value_type == 'vecline' and prop.default_value == 'The position the rope attaches to object 2':
+        return 'raw', 'None'  # Set to none due to bug in BlackMesa base.fgd file
+    else:
+        return 'raw', default_prop_cache.get(prop.name, 'None')
+
+
+def get_default_value(prop: FgdEntityProperty):
+    """Returns Python source of property default value or None if it has no supported default"""
+    if not prop.default_value:
+        return None
+    if prop.value_type == 'color255':
+        return f'[{", ".join(map(str, parse_int_vector(prop.default_value)))}]'
+    elif prop.value_type in ['angle', 'vector', 'color1']:
+        return f'[{", ".join(map(str, parse_float_vector(prop.default_value)))}]'
+    elif prop.value_type in ['integer', 'float', 'node_dest', 'angle_negative_pitch']:
+        return f'{prop.default_value}'
+    elif prop.value_type == 'choices':
+        return '"CHOICES NOT SUPPORTED"'
+    elif prop.value_type in ['string', 'studio', 'material', 'sprite', 'sound']:
+        return f'"{prop.default_value}"'
+    return None
+
+
+def format_schema_module(fgd_name, entity_classes):
+    """Formats generated module from (name, parents, class attributes, properties) tuples.
+
+    Class attribute values and property defaults are Python sources.
+    """
+    buffer = f'''# Generated by source1/fgd/generate_entity_classes.py from {fgd_name}, do not edit
+from .entity_schema import Base, EntityClassRegistry, parse_int_vector, parse_float_vector
+
+# class name: (parent class names, class attributes, (attribute name, entity key, property kind, default value))
+SCHEMA = {{
+'''
+    for name, parents, class_attributes, properties in entity_classes:
+        attributes_source = ', '.join(f"'{key}': {value}" for key, value in class_attributes)
+        buffer += f"    '{name}': ({tuple(parents)!r}, {{{attributes_source}}}, (\n"
+        for prop_name, key, kind, default in properties:
+            buffer += f"        ('{prop_name}', '{key}', '{kind}', {default}),\n"
+        buffer += '    )),\n'
+    buffer += '''}
+
+entity_class_handle = EntityClassRegistry(__name__, SCHEMA)
+
+
+def __getattr__(name):
+    # Entity classes are built on first access, see EntityClassRegistry
+    if name in entity_class_handle:
+        return entity_class_handle[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+'''
+    return buffer
+
+
 def main():
     # fgd_path = r"F:\SteamLibrary\steamapps\common\Black Mesa\bin\bms.fgd"
     # fgd_path = r"H:\SteamLibrary\SteamApps\common\Team Fortress 2\bin\tf.fgd"
@@ -29,177 +95,59 @@ def main():
     ContentManager().scan_for_content(fgd_path)
     fgd: Fgd = FgdParse(fgd_path)
     processed_classes = []
-    buffer = ''
-
-    buffer += """def parse_int_vector(string):
-    return [int(val) for val in string.split(' ')]
-
-
-def parse_float_vector(string):
-    return [float(val) for val in string.split(' ')]
-
+    schema = []
 
-class Base:
-    hammer_id_counter = 0
-
-    def __init__(self):
-        self.hammer_id = 0
-        self.class_name = 'ANY'
-
-    @classmethod
-    def new_hammer_id(cls):
-        new_id = cls.hammer_id_counter
-        cls.hammer_id_counter += 1
-        return new_id
-
-    @staticmethod
-    def from_dict(instance, entity_data: dict):
-        if 'hammerid' in entity_data:
-            instance.hammer_id = int(entity_data.get('hammerid'))
-        else:  # Titanfall
-            instance.hammer_id = Base.new_hammer_id()
-        instance.class_name = entity_data.get('classname')
-\n\n"""
-
-    entity_classes = fgd.entities
-    include: Fgd
-    # for include in fgd.includes:
-    #     for entity in include.entities:
-    #         if entity in entity_classes:
-    #             entity_classes.pop(entity_classes.index(entity))
     entity_class: FgdEntity
-    for entity_class in entity_classes:
+    for entity_class in fgd.entities:
         print(entity_class.name)
         if entity_class.name in processed_classes:
             continue
-        buffer += f'class {entity_class.name}'
 
         all_parents = []
         for parent in entity_class.parents:
             all_parents += collect_parents(parent)
             all_parents.pop(all_parents.index(parent))
         all_parents = set(all_parents)
+        parents = []
+        for parent in entity_class.parents:
+            if parent not in all_parents and parent.name not in parents:
+                parents.append(parent.name)
 
-        if entity_class.parents:
-            buffer += '('
-            buffer += ', '.join(parent.name for parent in set(entity_class.parents) if parent not in all_parents)
-            buffer += ')'
-        else:
-            buffer += '(Base)'
-        buffer += ':\n'
+        class_attributes = []
         for definition in entity_class.definitions:
             if definition['name'] == 'iconsprite':
-                buffer += f'    icon_sprite = {definition["args"][0]}\n'
+                class_attributes.append(('icon_sprite', definition["args"][0]))
             elif definition['name'] == 'studio' and definition['args']:
-                buffer += f'    model = {definition["args"][0]}\n'
+                class_attributes.append(('model', definition["args"][0]))
             elif definition['name'] == 'studioprop' and definition['args']:
-                buffer += f'    viewport_model = {definition["args"][0]}\n'
-
-        buffer += '    def __init__(self):'
-
-        if entity_class.parents:
-            for parent in sorted(set(entity_class.parents), key=lambda a: len(a.parents), reverse=True):
-                if parent.name not in all_parents:
-                    buffer += f'\n        super({parent.name}).__init__()'
-        else:
-            buffer += '\n        super().__init__()'
+                class_attributes.append(('viewport_model', definition["args"][0]))
 
         prop_cache = []
         for parent in list(all_parents) + entity_class.parents:
             for prop in parent.properties:
                 if prop.name not in prop_cache:
                     prop_cache.append(prop.name)
-        default_prop_cache = {}
-        if entity_class.class_type == 'PointClass':
-            buffer += f'\n        self.origin = [0, 0, 0]'
-        for prop in entity_class.properties:
-            if prop.name not in prop_cache:
-                buffer += f'\n        self.{prop.name} = '
-                if prop.default_value:  # and prop.description is not None:
-                    try:
-                        if prop.value_type == 'color255':
-                            def_value = f'[{", ".join(map(str, parse_int_vector(prop.default_value)))}]'
-                            default_prop_cache[prop.name] = def_value
-                            buffer += def_value
-                        elif prop.value_type in ['angle', 'vector', 'color1']:
-                            def_value = f'[{", ".join(map(str, parse_float_vector(prop.default_value)))}]'
-                            default_prop_cache[prop.name] = def_value
-                            buffer += def_value
-                        elif prop.value_type in ['integer', 'float', 'node_dest', 'angle_negative_pitch']:
-                            def_value = f'{prop.default_value}'
-                            default_prop_cache[prop.name] = def_value
-                            buffer += def_value
-                        elif prop.value_type == 'choices':
-                            def_value = '"CHOICES NOT SUPPORTED"'
-                            default_prop_cache[prop.name] = def_value
-                            buffer += def_value
-                        elif prop.value_type in ['string', 'studio', 'material', 'sprite', 'sound']:
-                            def_value = f'"{prop.default_value}"'
-                            default_prop_cache[prop.name] = def_value
-                            buffer += def_value
-                        elif prop.value_type == 'target_destination' and prop.default_value == 'Name of the entity to set navigation properties on.':
-                            buffer += 'None  # Set to none due to bug in BlackMesa base.fgd file'
-                        elif prop.value_type == 'vecline' and prop.default_value == 'The position the rope attaches to object 2':
-                            buffer += 'None  # Set to none due to bug in BlackMesa base.fgd file'
-                        else:
-                            buffer += prop.default_value
-                    except ValueError as ex:
-                        buffer += f'None  # Failed to parse value type due to {ex}'
-                    buffer += f'  # Type: {prop.value_type}'
-                else:
-                    buffer += f'None  # Type: {prop.value_type}'
-
-        if not entity_class.properties:
-            buffer += '\n        pass'
-
-        buffer += '\n\n    @staticmethod'
-        buffer += '\n    def from_dict(instance, entity_data: dict):'
-        if entity_class.parents:
-            for parent in set(entity_class.parents):
-                if parent.name not in all_parents:
-                    buffer += f'\n        {parent.name}.from_dict(instance, entity_data)'
-        else:
-            buffer += f'\n        Base.from_dict(instance, entity_data)'
 
+        properties = []
         if entity_class.class_type == 'PointClass':
-            buffer += f'\n        instance.origin = parse_float_vector(entity_data.get(\'origin\', "0 0 0"))'
-
+            properties.append(('origin', 'origin', 'float_vector', '"0 0 0"'))
         for prop in entity_class.properties:
-            if prop.name not in prop_cache:
-                buffer += f'\n        instance.{prop.name} = '
-                try:
-                    if prop.value_type == 'color255':
-                        buffer += f'parse_int_vector(entity_data.get(\'{prop.name.lower()}\', "{prop.default_value or "0 0 0"}"))'
-                    elif prop.value_type in ['angle', 'vector', 'color1', 'origin']:
-                        buffer += f'parse_float_vector(entity_data.get(\'{prop.name.lower()}\', "{prop.default_value or "0 0 0"}"))'
-                    elif prop.value_type in ['integer', 'node_dest']:
-                        buffer += f'int(entity_data.get(\'{prop.name.lower()}\', {default_prop_cache.get(prop.name, 0)}))'
-                    elif prop.value_type in ['float', 'angle_negative_pitch']:
-                        buffer += f'float(entity_data.get(\'{prop.name.lower()}\', {default_prop_cache.get(prop.name, 0)}))'
-                    elif prop.value_type == 'choices':
-                        buffer += f'entity_data.get(\'{prop.name.lower()}\', {default_prop_cache.get(prop.name, "None")})'
-                    elif prop.value_type in ['string', 'studio', 'material', 'sprite', 'sound']:
-                        buffer += f'entity_data.get(\'{prop.name.lower()}\', {default_prop_cache.get(prop.name, "None")})'
-                    elif prop.value_type == 'target_destination' and prop.default_value == 'Name of the entity to set navigation properties on.':
-                        buffer += f'entity_data.get(\'{prop.name.lower()}\', None)  # Set to none due to bug in BlackMesa base.fgd file'
-                    elif prop.value_type == 'vecline' and prop.default_value == 'The position the rope attaches to object 2':
-                        buffer += f'entity_data.get(\'{prop.name.lower()}\', None)  # Set to none due to bug in BlackMesa base.fgd file'
-                    else:
-                        buffer += f'entity_data.get(\'{prop.name.lower()}\', {default_prop_cache.get(prop.name, "None")})'
-                except ValueError as ex:
-                    buffer += f'None  # Failed to parse value type due to {ex}'
-                buffer += f'  # Type: {prop.value_type}'
-        buffer += '\n\n\n'
-
+            if prop.name in prop_cache:
+                continue
+            try:
+                default_value = get_default_value(prop)
+            except ValueError:
+                default_value = None
+            default_prop_cache = {prop.name: default_value} if default_value is not None else {}
+            kind, default = get_property_info(prop, default_prop_cache)
+            properties.append((prop.name, prop.name.lower(), kind, default))
+
+        schema.append((entity_class.name, parents, class_attributes, properties))
         processed_classes.append(entity_class.name)
-    buffer += '\nentity_class_handle = {'
-    for entity_class in processed_classes:
-        buffer += f'\n    \'{entity_class}\': {entity_class},'
-    buffer += '\n}'
-    # print(ContentManager().get_content_provider_from_path(fgd_path))
+
     output_name = Path(fgd_path).stem
     with open(f'../bsp/entities/{output_name}_entity_classes.py', 'w') as f:
-        f.write(buffer)
+        f.write(format_schema_module(Path(fgd_path).name, schema))
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import BinaryIO, Iterable, Sized, Union
+from typing import BinaryIO, Iterable, Sized, Union, Optional, Dict, Tuple
 
 import bpy
 import numpy as np
@@ -7,6 +7,8 @@ from mathutils import Vector, Matrix, Euler
 
 from .flex_expressions import *
 from .mdl_file import Mdl
+from .structs.anim_desc import AnimDescFlags
+from .structs.animation import angles_to_quaternions, UnsupportedAnimationError
 from .structs.header import StudioHDRFlags
 from .structs.model import Model
 from .vertex_animation_cache import VertexAnimationCache
@@ -19,6 +21,7 @@ from ...bpy_utilities.material_loader.material_loader import Source1MaterialLoad
 from ...bpy_utilities.utils import get_material, get_new_unique_collection
 from ...source_shared.content_manager import ContentManager
 from ...source_shared.model_container import Source1ModelContainer
+from ...utilities.math_utilities import quat_multiply_array, quat_rotate_array
 
 log_manager = BPYLoggingManager()
 logger = log_manager.get_logger('mdl_loader')
@@ -31,7 +34,7 @@ def merge_strip_groups(vtx_mesh: VtxMesh):
     for strip_group in vtx_mesh.strip_groups:
         indices_accumulator.append(np.add(strip_group.indexes, vertex_offset))
         vertex_accumulator.append(strip_group.vertexes['original_mesh_vertex_index'].reshape(-1))
-        vertex_offset += sum(strip.vertex_count for strip in strip_group.strips)
+        vertex_offset += strip_group.strip_vertex_count
     return np.hstack(indices_accumulator), np.hstack(vertex_accumulator), vertex_offset
 
 
@@ -57,6 +60,37 @@ def merge_meshes(model: Model, vtx_model: VtxModel):
     return vtx_vertices, np.hstack(indices_array), np.hstack(mat_arrays)
 
 
+def group_vertex_weights(bone_ids: np.ndarray, weights: np.ndarray):
+    """Groups per vertex bone influences into (bone_index, weight, vertex_indices) runs.
+
+    Every run can be assigned with a single VertexGroup.add call. If vertex references same bone more than
+    once, last influence wins, same as assigning influences one by one with 'REPLACE'.
+    """
+    influence_count = bone_ids.shape[1]
+    vertex_ids = np.repeat(np.arange(bone_ids.shape[0], dtype=np.uint32), influence_count)
+    bone_ids = bone_ids.reshape(-1).astype(np.uint32)
+    weights = weights.reshape(-1)
+
+    used = weights > 0
+    if not used.any():
+        return []
+    vertex_ids, bone_ids, weights = vertex_ids[used], bone_ids[used], weights[used]
+
+    # Last influence per (vertex, bone) pair wins
+    keys = vertex_ids.astype(np.uint64) * 256 + bone_ids
+    _, last = np.unique(keys[::-1], return_index=True)
+    last = keys.shape[0] - 1 - last
+    vertex_ids, bone_ids, weights = vertex_ids[last], bone_ids[last], weights[last]
+
+    order = np.lexsort((vertex_ids, weights, bone_ids))
+    vertex_ids, bone_ids, weights = vertex_ids[order], bone_ids[order], weights[order]
+    run_starts = np.flatnonzero(np.concatenate(([True], (bone_ids[1:] != bone_ids[:-1]) |
+                                                (weights[1:] != weights[:-1]))))
+    run_ends = np.append(run_starts[1:], bone_ids.shape[0])
+    return [(int(bone_ids[start]), float(weights[start]), vertex_ids[start:end].tolist())
+            for start, end in zip(run_starts, run_ends)]
+
+
 def get_slice(data: [Iterable, Sized], start, count=None):
     if count is None:
         count = len(data) - start
@@ -100,10 +134,86 @@ def create_armature(mdl: Mdl, collection, scale=1.0):
     return armature_obj
 
 
-def import_model(mdl_file: BinaryIO, vvd_file: BinaryIO, vtx_file: BinaryIO, scale=1.0,
-                 create_drivers=False, parent_collection=None, disable_collection_sort=False, re_use_meshes=False):
-    if parent_collection is None:
-        parent_collection = bpy.context.scene.collection
+def import_animations(mdl: Mdl, armature_obj, scale=1.0):
+    """Creates action per animation, keyframes of every fcurve are written at once from decoded frame arrays"""
+    if not mdl.anim_descs:
+        return
+    if not armature_obj.animation_data:
+        armature_obj.animation_data_create()
+
+    bone_defaults = mdl.bone_defaults
+    # Rest pose of armature is built from euler rotation, see create_armature
+    inv_rest_quat = angles_to_quaternions(bone_defaults.rotation) * np.array([-1, -1, -1, 1], np.float32)
+    bone_paths = [f'pose.bones["{bone.name}"].' for bone in mdl.bones]
+
+    for anim_desc in mdl.anim_descs:
+        try:
+            frames = anim_desc.read_frames(mdl)
+        except (UnsupportedAnimationError, FileNotFoundError) as ex:
+            logger.warn(f'Skipping animation {anim_desc.name}: {ex}')
+            continue
+        if anim_desc.flags & AnimDescFlags.DELTA:
+            positions = frames[..., :3] * scale
+            rotations = frames[..., 3:]
+        else:
+            positions = quat_rotate_array(inv_rest_quat, frames[..., :3] - bone_defaults.position) * scale
+            rotations = quat_multiply_array(inv_rest_quat, frames[..., 3:])
+        # Keep quaternion hemisphere consistent between frames so interpolation takes shortest path
+        flips = np.einsum('fbi,fbi->fb', rotations[1:], rotations[:-1]) < 0
+        rotations[1:] *= np.cumprod(np.where(flips, -1, 1), axis=0)[..., None]
+
+        action = bpy.data.actions.new(anim_desc.name)
+        action.use_fake_user = True
+        keyframes = np.empty((len(frames), 2), np.float32)
+        keyframes[:, 0] = np.arange(len(frames))
+        for bone_index, bone_path in enumerate(bone_paths):
+            group = action.groups.new(name=mdl.bones[bone_index].name)
+            for data_path, values, components in ((bone_path + 'location', positions, (0, 1, 2)),
+                                                  (bone_path + 'rotation_quaternion', rotations, (3, 0, 1, 2))):
+                for index, component in enumerate(components):
+                    fcurve = action.fcurves.new(data_path=data_path, index=index)
+                    fcurve.group = group
+                    keyframes[:, 1] = values[:, bone_index, component]
+                    fcurve.keyframe_points.add(len(keyframes))
+                    fcurve.keyframe_points.foreach_set('co', keyframes.ravel())
+                    fcurve.update()
+        if armature_obj.animation_data.action is None:
+            armature_obj.animation_data.action = action
+
+
+class ModelGeometry:
+    """Mesh data of single body part model, prepared without bpy"""
+
+    def __init__(self, model_vertices: np.ndarray, vtx_vertices: np.ndarray, indices: np.ndarray,
+                 material_indices: np.ndarray):
+        vertices = model_vertices[vtx_vertices]
+        self.vtx_vertices = vtx_vertices
+        self.positions = vertices['vertex']
+        self.normals = vertices['normal']
+        self.bone_ids = vertices['bone_id']
+        self.weights = vertices['weight']
+        self.weight_groups = group_vertex_weights(self.bone_ids, self.weights)
+        self.uvs = vertices['uv']
+        self.uvs[:, 1] = 1 - self.uvs[:, 1]
+        self.faces = np.flip(indices).reshape((-1, 3))
+        self.material_indices = material_indices[::-1]
+
+
+class ParsedModel:
+    def __init__(self, mdl: Mdl, vvd: Vvd, vtx: Vtx):
+        self.mdl = mdl
+        self.vvd = vvd
+        self.vtx = vtx
+        self.vac: Optional[VertexAnimationCache] = None
+        self.geometry: Dict[Tuple[int, int], ModelGeometry] = {}
+
+
+def parse_model(mdl_file: Union[BinaryIO, Path], vvd_file: Union[BinaryIO, Path], vtx_file: Union[BinaryIO, Path],
+                desired_lod=0):
+    """Reads MDL, VVD and VTX files and prepares mesh arrays.
+
+    Does not touch bpy, so it is safe to call from worker threads.
+    """
     mdl = Mdl(mdl_file)
     mdl.read()
     vvd = Vvd(vvd_file)
@@ -111,31 +221,60 @@ def import_model(mdl_file: BinaryIO, vvd_file: BinaryIO, vtx_file: BinaryIO, sca
     vtx = Vtx(vtx_file)
     vtx.read()
 
-    container = Source1ModelContainer(mdl, vvd, vtx)
+    parsed = ParsedModel(mdl, vvd, vtx)
+    if mdl.flex_names:
+        parsed.vac = VertexAnimationCache(mdl, vvd, desired_lod)
+        parsed.vac.process_data()
 
-    desired_lod = 0
     all_vertices = vvd.lod_data[desired_lod]
+    for body_part_id, (vtx_body_part, body_part) in enumerate(zip(vtx.body_parts, mdl.body_parts)):
+        for model_id, (vtx_model, model) in enumerate(zip(vtx_body_part.models, body_part.models)):
+            if model.vertex_count == 0:
+                continue
+            model_vertices = get_slice(all_vertices, model.vertex_offset, model.vertex_count)
+            vtx_vertices, indices_array, material_indices_array = merge_meshes(model,
+                                                                               vtx_model.model_lods[desired_lod])
+            parsed.geometry[(body_part_id, model_id)] = ModelGeometry(model_vertices,
+                                                                      np.array(vtx_vertices, dtype=np.uint32),
+                                                                      np.array(indices_array, dtype=np.uint32),
+                                                                      material_indices_array)
+    return parsed
+
+
+def import_model(mdl_file: BinaryIO, vvd_file: BinaryIO, vtx_file: BinaryIO, scale=1.0,
+                 create_drivers=False, parent_collection=None, disable_collection_sort=False, re_use_meshes=False):
+    parsed = parse_model(mdl_file, vvd_file, vtx_file)
+    return build_model(parsed, scale, create_drivers, parent_collection, disable_collection_sort, re_use_meshes)
+
+
+def build_model(parsed: ParsedModel, scale=1.0,
+                create_drivers=False, parent_collection=None, disable_collection_sort=False, re_use_meshes=False):
+    if parent_collection is None:
+        parent_collection = bpy.context.scene.collection
+    mdl = parsed.mdl
+    vtx = parsed.vtx
+    vac = parsed.vac
+
+    container = Source1ModelContainer(mdl, parsed.vvd, vtx)
+
     model_name = Path(mdl.header.name).stem + '_MODEL'
 
     master_collection = get_new_unique_collection(model_name, parent_collection)
     container.collection = master_collection
     static_prop = mdl.header.flags & StudioHDRFlags.STATIC_PROP != 0
     armature = None
-    if mdl.flex_names:
-        vac = VertexAnimationCache(mdl, vvd)
-        vac.process_data()
 
     if not static_prop:
         armature = create_armature(mdl, master_collection, scale)
         container.armature = armature
 
-    for vtx_body_part, body_part in zip(vtx.body_parts, mdl.body_parts):
+    for body_part_id, (vtx_body_part, body_part) in enumerate(zip(vtx.body_parts, mdl.body_parts)):
         if disable_collection_sort:
             body_part_collection = master_collection
         else:
             body_part_collection = get_new_unique_collection(body_part.name, master_collection)
 
-        for vtx_model, model in zip(vtx_body_part.models, body_part.models):
+        for model_id, (vtx_model, model) in enumerate(zip(vtx_body_part.models, body_part.models)):
 
             if model.vertex_count == 0:
                 continue
@@ -145,7 +284,8 @@ def import_model(mdl_file: BinaryIO, vvd_file: BinaryIO, vtx_file: BinaryIO, sca
                 mesh_obj_original = bpy.data.objects.get(mesh_name, None)
                 mesh_data_original = bpy.data.meshes.get(f'{mesh_name}_MESH', False)
                 if mesh_obj_original and mesh_data_original:
-                    mesh_data = mesh_data_original.copy()
+                    # Linked duplicate, mesh data is shared with the original object
+                    mesh_data = mesh_data_original
                     mesh_obj = mesh_obj_original.copy()
                     mesh_obj['skin_groups'] = mesh_obj_original['skin_groups']
                     mesh_obj['active_skin'] = mesh_obj_original['active_skin']
@@ -176,42 +316,34 @@ def import_model(mdl_file: BinaryIO, vvd_file: BinaryIO, vtx_file: BinaryIO, sca
             if used_copy:
                 continue
 
-            model_vertices = get_slice(all_vertices, model.vertex_offset, model.vertex_count)
-            vtx_vertices, indices_array, material_indices_array = merge_meshes(model, vtx_model.model_lods[desired_lod])
-
-            indices_array = np.array(indices_array, dtype=np.uint32)
-            vertices = model_vertices[vtx_vertices]
+            geometry = parsed.geometry[(body_part_id, model_id)]
 
-            mesh_data.from_pydata(vertices['vertex'] * scale, [], np.flip(indices_array).reshape((-1, 3)).tolist())
+            mesh_data.from_pydata(geometry.positions * scale, [], geometry.faces.tolist())
             mesh_data.update()
 
             mesh_data.polygons.foreach_set("use_smooth", np.ones(len(mesh_data.polygons)))
-            mesh_data.normals_split_custom_set_from_vertices(vertices['normal'])
+            mesh_data.normals_split_custom_set_from_vertices(geometry.normals)
             mesh_data.use_auto_smooth = True
 
-            for mat_id in np.unique(material_indices_array):
+            for mat_id in np.unique(geometry.material_indices):
                 mat_name = mdl.materials[mat_id].name
                 get_material(mat_name[-63:], mesh_obj)
 
-            mesh_data.polygons.foreach_set('material_index', material_indices_array[::-1].tolist())
+            mesh_data.polygons.foreach_set('material_index', geometry.material_indices.tolist())
 
             mesh_data.uv_layers.new()
             uv_data = mesh_data.uv_layers[0].data
 
             vertex_indices = np.zeros((len(mesh_data.loops, )), dtype=np.uint32)
             mesh_data.loops.foreach_get('vertex_index', vertex_indices)
-            uvs = vertices['uv']
-            uvs[:, 1] = 1 - uvs[:, 1]
-            uv_data.foreach_set('uv', uvs[vertex_indices].flatten())
+            uv_data.foreach_set('uv', geometry.uvs[vertex_indices].flatten())
 
             if not static_prop:
                 weight_groups = {bone.name: mesh_obj.vertex_groups.new(name=bone.name) for bone in mdl.bones}
 
-                for n, (bone_indices, bone_weights) in enumerate(zip(vertices['bone_id'], vertices['weight'])):
-                    for bone_index, weight in zip(bone_indices, bone_weights):
-                        if weight > 0:
-                            bone_name = mdl.bones[bone_index].name
-                            weight_groups[bone_name].add([n], weight, 'REPLACE')
+                for bone_index, weight, vertex_indices in geometry.weight_groups:
+                    bone_name = mdl.bones[bone_index].name
+                    weight_groups[bone_name].add(vertex_indices, weight, 'REPLACE')
                 flex_names = []
                 for mesh in model.meshes:
                     if mesh.flexes:
@@ -221,10 +353,8 @@ def import_model(mdl_file: BinaryIO, vvd_file: BinaryIO, vtx_file: BinaryIO, sca
                 for flex_name in flex_names:
                     shape_key = mesh_data.shape_keys.key_blocks.get(flex_name, None) or mesh_obj.shape_key_add(
                         name=flex_name)
-                    vertex_animation = vac.vertex_cache[flex_name]
-
-                    model_vertices = get_slice(vertex_animation, model.vertex_offset, model.vertex_count)
-                    flex_vertices = model_vertices[vtx_vertices] * scale
+                    model_vertices = vac.get_flex_vertices(flex_name, model.vertex_offset, model.vertex_count)
+                    flex_vertices = model_vertices[geometry.vtx_vertices] * scale
 
                     shape_key.data.foreach_set("co", flex_vertices.reshape(-1))
 
@@ -302,11 +432,8 @@ def import_materials(mdl):
             if bpy.data.materials[material.name[-63:]].get('source1_loaded',False):
                 logger.info(f'Skipping loading of {material.name[-63:]} as it already loaded')
                 continue
-        material_path = None
-        for mat_path in mdl.materials_paths:
-            material_path = content_manager.find_material(Path(mat_path) / material.name)
-            if material_path:
-                break
+        material_path = content_manager.find_first([Path(mat_path) / material.name for mat_path in mdl.materials_paths],
+                                                   'materials', extension='.vmt')
         if material_path:
             new_material = Source1MaterialLoader(material_path, material.name[-63:])
             new_material.create_material()
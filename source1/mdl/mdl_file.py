@@ -1,8 +1,11 @@
 import traceback
-from typing import List
+from typing import List, Tuple
 
-from ...utilities.byte_io_mdl import ByteIO
+import numpy as np
+
+from ...utilities.byte_io_mdl import ByteIO, read_source1_strings
 from ...source_shared.base import Base
+from ...source_shared.content_manager import ContentManager
 
 from .flex_expressions import *
 from .structs.header import Header
@@ -10,6 +13,7 @@ from .structs.bone import Bone
 from .structs.texture import Material
 from .structs.flex import FlexController, FlexRule, FlexControllerUI, FlexOpType
 from .structs.anim_desc import AnimDesc
+from .structs.animation import BoneDefaults
 from .structs.sequence import Sequence
 from .structs.attachment import Attachment
 from .structs.bodygroup import BodyPart
@@ -18,7 +22,7 @@ from .structs.bodygroup import BodyPart
 class _AnimBlocks:
     def __init__(self):
         self.name = ''
-        self.blocks = []
+        self.blocks = []  # type:List[Tuple[int,int]]
 
 
 class Mdl(Base):
@@ -27,111 +31,167 @@ class Mdl(Base):
         self.store_value("MDL", self)
         self.reader = ByteIO(filepath)
         self.header = Header()
-        self.bones = []  # type: List[Bone]
-        self.skin_groups = []  # type: List[List[str]]
-        self.materials = []  # type: List[Material]
-        self.materials_paths = []
+        self.data = b''
+        # Sections are parsed on first access, see _get_section
+        self._sections = {}
+        # Opened on first access to animation data stored outside of mdl, see get_anim_block_data
+        self._anim_block_file = None
+        self._anim_block_data = {}
+
+    def read(self):
+        self.header.read(self.reader)
+        self.reader.seek(0)
+        self.data = self.reader.read()
+        self._sections.clear()
+        self._anim_block_data.clear()
 
-        self.flex_names = []  # type:List[str]
-        self.flex_controllers = []  # type:List[FlexController]
-        self.flex_ui_controllers = []  # type:List[FlexControllerUI]
-        self.flex_rules = []  # type:List[FlexRule]
+    def _get_section(self, name, parser):
+        section = self._sections.get(name, None)
+        if section is None:
+            # Section may be parsed on another thread than header was, restore context used by structs
+            self.store_value("MDL", self)
+            self.store_value('mdl_version', self.header.version)
+            section = self._sections[name] = parser()
+        return section
 
-        self.body_parts = []  # type:List[BodyPart]
+    @property
+    def bones(self) -> List[Bone]:
+        return self._get_section('bones', lambda: Bone.read_all(self.reader, self.data, self.header.bone_offset,
+                                                                self.header.bone_count, self.header.version))
 
-        self.attachments = []  # type:List[Attachment]
-        self.anim_descs = []  # type:List[AnimDesc]
-        self.sequences = []  # type:List[Sequence]
-        self.anim_block = _AnimBlocks()
+    @property
+    def materials(self) -> List[Material]:
+        return self._get_section('materials',
+                                 lambda: Material.read_all(self.data, self.header.texture_offset,
+                                                           self.header.texture_count, self.header.version))
 
-    def read(self):
-        self.header.read(self.reader)
+    @property
+    def materials_paths(self) -> List[str]:
+        def parse():
+            offsets = np.frombuffer(self.data, np.int32, self.header.texture_path_count,
+                                    self.header.texture_path_offset)
+            return read_source1_strings(self.data, offsets.tolist())
 
-        self.reader.seek(self.header.bone_offset)
-        for _ in range(self.header.bone_count):
-            bone = Bone()
-            bone.read(self.reader)
-            self.bones.append(bone)
-
-        self.reader.seek(self.header.texture_offset)
-        for _ in range(self.header.texture_count):
-            texture = Material()
-            texture.read(self.reader)
-            self.materials.append(texture)
-
-        self.reader.seek(self.header.texture_path_offset)
-        for _ in range(self.header.texture_path_count):
-            self.materials_paths.append(self.reader.read_source1_string(0))
-
-        self.reader.seek(self.header.skin_family_offset)
-        for _ in range(self.header.skin_family_count):
-            skin_group = []
-            for _ in range(self.header.skin_reference_count):
-                texture_index = self.reader.read_uint16()
-                skin_group.append(self.materials[texture_index].name)
-            self.skin_groups.append(skin_group)
+        return self._get_section('materials_paths', parse)
+
+    @property
+    def skin_groups(self) -> List[List[str]]:
+        return self._get_section('skin_groups', self._read_skin_groups)
+
+    def _read_skin_groups(self):
+        skin_table = np.frombuffer(self.data, np.uint16,
+                                   self.header.skin_family_count * self.header.skin_reference_count,
+                                   self.header.skin_family_offset)
+        skin_table = skin_table.reshape((self.header.skin_family_count, self.header.skin_reference_count))
+        material_names = [material.name for material in self.materials]
+        skin_groups = [[material_names[texture_index] for texture_index in skin_family]
+                       for skin_family in skin_table.tolist()]
 
         diff_start = 0
-        for skin_info in self.skin_groups[1:]:
-            for n, (a, b) in enumerate(zip(self.skin_groups[0], skin_info)):
+        for skin_info in skin_groups[1:]:
+            for n, (a, b) in enumerate(zip(skin_groups[0], skin_info)):
                 if a == b:
                     diff_start = max(n, diff_start)
                     break
 
-        for n, skin_info in enumerate(self.skin_groups):
-            self.skin_groups[n] = skin_info[:diff_start]
-
-        self.reader.seek(self.header.flex_desc_offset)
-        for _ in range(self.header.flex_desc_count):
-            self.flex_names.append(self.reader.read_source1_string(self.reader.tell()))
-
-        self.reader.seek(self.header.flex_controller_offset)
-        for _ in range(self.header.flex_controller_count):
-            controller = FlexController()
-            controller.read(self.reader)
-            self.flex_controllers.append(controller)
-
-        self.reader.seek(self.header.flex_rule_offset)
-        for _ in range(self.header.flex_rule_count):
-            rule = FlexRule()
-            rule.read(self.reader)
-            self.flex_rules.append(rule)
-
-        self.reader.seek(self.header.local_attachment_offset)
-        for _ in range(self.header.local_attachment_count):
-            attachment = Attachment()
-            attachment.read(self.reader)
-            self.attachments.append(attachment)
-
-        self.reader.seek(self.header.flex_controller_ui_offset)
-        for _ in range(self.header.flex_controller_ui_count):
-            flex_controller = FlexControllerUI()
-            flex_controller.read(self.reader)
-            self.flex_ui_controllers.append(flex_controller)
-
-        self.reader.seek(self.header.body_part_offset)
-        for _ in range(self.header.body_part_count):
-            body_part = BodyPart()
-            body_part.read(self.reader)
-            self.body_parts.append(body_part)
-
-        # self.reader.seek(self.header.local_animation_offset)
-        # for _ in range(self.header.local_animation_count):
-        #     anim_desc = AnimDesc()
-        #     anim_desc.read(self.reader)
-        #     self.anim_descs.append(anim_desc)
-        #
-        # self.reader.seek(self.header.local_sequence_offset)
-        # for _ in range(self.header.local_sequence_count):
-        #     seq = Sequence()
-        #     seq.read(self.reader)
-        #     self.sequences.append(seq)
-        #
-        # self.anim_block.name = self.reader.read_from_offset(self.header.anim_block_name_offset,
-        #                                                     self.reader.read_ascii_string)
-        # self.reader.seek(self.header.anim_block_offset)
-        # for _ in range(self.header.anim_block_count):
-        #     self.anim_block.blocks.append(self.reader.read_fmt('2i'))
+        return [skin_info[:diff_start] for skin_info in skin_groups]
+
+    @property
+    def flex_names(self) -> List[str]:
+        def parse():
+            offsets = np.frombuffer(self.data, np.int32, self.header.flex_desc_count, self.header.flex_desc_offset)
+            entries = self.header.flex_desc_offset + np.arange(offsets.size, dtype=np.int64) * 4
+            return read_source1_strings(self.data, np.where(offsets != 0, entries + offsets, 0).tolist())
+
+        return self._get_section('flex_names', parse)
+
+    def _read_objects(self, object_class, offset, count):
+        self.reader.seek(offset)
+        objects = []
+        for _ in range(count):
+            obj = object_class()
+            obj.read(self.reader)
+            objects.append(obj)
+        return objects
+
+    @property
+    def flex_controllers(self) -> List[FlexController]:
+        return self._get_section('flex_controllers',
+                                 lambda: self._read_objects(FlexController, self.header.flex_controller_offset,
+                                                            self.header.flex_controller_count))
+
+    @property
+    def flex_rules(self) -> List[FlexRule]:
+        return self._get_section('flex_rules',
+                                 lambda: self._read_objects(FlexRule, self.header.flex_rule_offset,
+                                                            self.header.flex_rule_count))
+
+    @property
+    def attachments(self) -> List[Attachment]:
+        return self._get_section('attachments',
+                                 lambda: Attachment.read_all(self.data, self.header.local_attachment_offset,
+                                                             self.header.local_attachment_count))
+
+    @property
+    def flex_ui_controllers(self) -> List[FlexControllerUI]:
+        return self._get_section('flex_ui_controllers',
+                                 lambda: self._read_objects(FlexControllerUI, self.header.flex_controller_ui_offset,
+                                                            self.header.flex_controller_ui_count))
+
+    @property
+    def body_parts(self) -> List[BodyPart]:
+        def parse():
+            # Flexes resolve their names through flex table
+            _ = self.flex_names
+            return self._read_objects(BodyPart, self.header.body_part_offset, self.header.body_part_count)
+
+        return self._get_section('body_parts', parse)
+
+    @property
+    def bone_defaults(self) -> BoneDefaults:
+        return self._get_section('bone_defaults', lambda: BoneDefaults(self.bones))
+
+    @property
+    def anim_descs(self) -> List[AnimDesc]:
+        return self._get_section('anim_descs',
+                                 lambda: self._read_objects(AnimDesc, self.header.local_animation_offset,
+                                                            self.header.local_animation_count))
+
+    @property
+    def sequences(self) -> List[Sequence]:
+        return self._get_section('sequences',
+                                 lambda: self._read_objects(Sequence, self.header.local_sequence_offset,
+                                                            self.header.local_sequence_count))
+
+    @property
+    def anim_block(self) -> _AnimBlocks:
+        def parse():
+            anim_block = _AnimBlocks()
+            anim_block.name = read_source1_strings(self.data, [self.header.anim_block_name_offset])[0]
+            blocks = np.frombuffer(self.data, np.int32, self.header.anim_block_count * 2,
+                                   self.header.anim_block_offset)
+            anim_block.blocks = [tuple(block) for block in blocks.reshape((-1, 2)).tolist()]
+            return anim_block
+
+        return self._get_section('anim_block', parse)
+
+    def get_anim_block_data(self, block_id, anim_desc_entry):
+        """Returns buffer holding animation data of block and base offset animation offsets are relative to.
+
+        Block 0 is mdl itself, other blocks are read from .ani file on demand.
+        """
+        if block_id == 0:
+            return self.data, anim_desc_entry
+        data = self._anim_block_data.get(block_id, None)
+        if data is None:
+            if self._anim_block_file is None:
+                self._anim_block_file = ContentManager().find_file(self.anim_block.name)
+                if self._anim_block_file is None:
+                    raise FileNotFoundError(f'Failed to find animation block file {self.anim_block.name!r}')
+            data_start, data_end = self.anim_block.blocks[block_id]
+            self._anim_block_file.seek(data_start)
+            data = self._anim_block_data[block_id] = self._anim_block_file.read(data_end - data_start)
+        return data, 0
 
     def rebuild_flex_rules(self):
         rules = {}
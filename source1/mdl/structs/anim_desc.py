@@ -1,5 +1,8 @@
 from enum import IntFlag
 
+import numpy as np
+
+from .animation import decode_animation, decode_frame_animation
 from ....utilities.byte_io_mdl  import ByteIO
 from ....source_shared.base import Base
 
@@ -44,11 +47,10 @@ class AnimDesc(Base):
         self.span_offset = 0
         self.stall_time = 0
         self.anim_block = 0
-
-        self.animation_frames = []
+        self.entry = 0
 
     def read(self, reader: ByteIO):
-        entry = reader.tell()
+        self.entry = entry = reader.tell()
         self.base_prt = reader.read_int32()
         assert entry == abs(self.base_prt)
         self.name = reader.read_source1_string(entry)
@@ -81,32 +83,23 @@ class AnimDesc(Base):
         self.span_offset = reader.read_int32()
 
         self.stall_time = reader.read_float()
-
-        self.read_span_data(reader)
-
-        # if self.section_offset != 0 and self.section_frame_count > 0:
-        #     self.read_frames()
-        # else:
-        #     section_id = 0
-        #
-        #     self.read_frames(reader, entry + self.anim_offset, section_id)
-
-    def read_span_data(self, reader: ByteIO):
-        if self.span_count > 0 and self.span_offset != 0:
-            with reader.save_current_pos():
-                reader.seek(abs(self.base_prt) + self.span_offset)
-                # TODO: https://github.com/ZeqMacaw/Crowbar/blob/5e4effa8491b358b8bae6f205599358880b7ee85/Crowbar/Core/GameModel/SourceModel49/SourceMdlFile49.vb#L1148
-                raise NotImplementedError()
-
-    def read_frames(self, reader, offset, section_id):
-        if self.flags & AnimDescFlags.FRAMEANIM == 0:
-            from ..mdl_file import Mdl
-            mdl: Mdl = self.get_value('MDL')
-            # section_count = (self.frame_count // self.section_frame_count) + 2
-            bone_count = len(mdl.bones)
-
-            for _ in mdl.bones:
-                bone_index = reader.read_uint8()
-                if bone_count == 255:
-                    reader.skip(3)
-                assert bone_index < bone_count
+        # Zero frame spans are low precision copies of animblock frames for streaming, full data is read instead
+
+    def read_frames(self, mdl) -> np.ndarray:
+        """Decodes all frames of animation into (frames, bones, 7) array, see decode_animation"""
+        decode = decode_frame_animation if self.flags & AnimDescFlags.FRAMEANIM else decode_animation
+        bones = mdl.bone_defaults
+        delta = bool(self.flags & AnimDescFlags.DELTA)
+        if self.section_frame_count == 0:
+            data, offset = mdl.get_anim_block_data(self.anim_block_id, self.entry)
+            return decode(data, offset + self.anim_offset, self.frame_count, bones, delta)
+
+        section_count = (self.frame_count // self.section_frame_count) + 2
+        sections = np.frombuffer(mdl.data, np.int32, section_count * 2, self.entry + self.section_offset)
+        frames = []
+        for section_id, first_frame in enumerate(range(0, self.frame_count, self.section_frame_count)):
+            anim_block_id, anim_offset = sections[section_id * 2:section_id * 2 + 2].tolist()
+            data, offset = mdl.get_anim_block_data(anim_block_id, self.entry)
+            frame_count = min(self.section_frame_count, self.frame_count - first_frame)
+            frames.append(decode(data, offset + anim_offset, frame_count, bones, delta))
+        return np.concatenate(frames)
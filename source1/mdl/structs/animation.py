@@ -1,9 +1,16 @@
+import struct
 from enum import IntFlag
 
+import numpy as np
+
 from ....utilities.byte_io_mdl  import ByteIO
 from ....source_shared.base import Base
 
 
+class UnsupportedAnimationError(ValueError):
+    pass
+
+
 class AnimationFlags(IntFlag):
     RAWPOS = 0x01  # Vector48
     RAWROT = 0x02  # Quaternion48
@@ -13,6 +20,209 @@ class AnimationFlags(IntFlag):
     RAWROT2 = 0x20  # Quaternion64
 
 
+class FrameAnimationFlags(IntFlag):
+    CONST_POS = 0x01  # Vector48 in constants
+    CONST_ROT = 0x02  # Quaternion48 in constants
+    ANIM_POS = 0x04  # Vector48 in frame data
+    ANIM_ROT = 0x08  # Quaternion48 in frame data
+    ANIM_POS2 = 0x10  # Vector in frame data
+    CONST_POS2 = 0x20  # Vector in constants
+    CONST_ROT2 = 0x40  # Quaternion48S in constants
+    ANIM_ROT2 = 0x80  # Quaternion48S in frame data
+
+
+_ANIM_HEADER = struct.Struct('<BBh')
+# constantsoffset, frameoffset, framelength, unused[3]
+_FRAME_ANIM_HEADER = struct.Struct('<3i12x')
+_VALUE_PTR = struct.Struct('<3h')
+_VALUE_PTR_SIZE = _VALUE_PTR.size
+
+IDENTITY_QUATERNION = np.array([0, 0, 0, 1], np.float32)
+
+
+def read_anim_value_track(data: bytes, offset: int, frame_count: int) -> np.ndarray:
+    """Expands RLE mstudioanimvalue_t stream into one raw value per frame.
+
+    Each run header holds (valid, total) followed by `valid` int16 values,
+    frames past `valid` inside run repeat last valid value.
+    """
+    track = np.zeros(frame_count, np.float32)
+    frame = 0
+    while frame < frame_count:
+        valid, total = data[offset], data[offset + 1]
+        if total == 0:
+            break
+        values = np.frombuffer(data, np.int16, valid, offset + 2)
+        end = min(frame + total, frame_count)
+        stored = min(valid, end - frame)
+        track[frame:frame + stored] = values[:stored]
+        if valid and frame + stored < end:
+            track[frame + stored:end] = values[valid - 1]
+        frame += total
+        offset += (valid + 1) * 2
+    return track
+
+
+def decode_quaternion48_array(values: np.ndarray) -> np.ndarray:
+    """Decodes (N, 3) uint16 Quaternion48 values into (N, 4) xyzw quaternions"""
+    x, y, zw = values.astype(np.int32).T
+    quats = np.empty((len(values), 4), np.float32)
+    quats[:, 0] = (x - 32768) / 32768
+    quats[:, 1] = (y - 32768) / 32768
+    quats[:, 2] = ((zw & 0x7FFF) - 16384) / 16384
+    quats[:, 3] = np.sqrt(np.maximum(0.0, 1.0 - np.einsum('ij,ij->i', quats[:, :3], quats[:, :3])))
+    quats[zw >> 15 == 1, 3] *= -1
+    return quats
+
+
+def decode_quaternion48(raw: bytes) -> np.ndarray:
+    return decode_quaternion48_array(np.frombuffer(raw, '<u2', 3).reshape((1, 3)))[0]
+
+
+def decode_quaternion64(raw: bytes) -> np.ndarray:
+    value, = struct.unpack('<Q', raw)
+    quat = np.array([((value >> shift) & 0x1FFFFF) - 1048576 for shift in (0, 21, 42)] + [0], np.float32)
+    quat[:3] /= 1048576.5
+    quat[3] = np.sqrt(max(0.0, 1.0 - float(np.dot(quat[:3], quat[:3]))))
+    if value >> 63:
+        quat[3] = -quat[3]
+    return quat
+
+
+def angles_to_quaternions(angles: np.ndarray) -> np.ndarray:
+    """Converts (N, 3) RadianEuler angles to (N, 4) xyzw quaternions, same as AngleQuaternion from mathlib"""
+    sr, sp, sy = np.sin(angles * 0.5).T
+    cr, cp, cy = np.cos(angles * 0.5).T
+    quats = np.empty((len(angles), 4), np.float32)
+    quats[:, 0] = sr * cp * cy - cr * sp * sy
+    quats[:, 1] = cr * sp * cy + sr * cp * sy
+    quats[:, 2] = cr * cp * sy - sr * sp * cy
+    quats[:, 3] = cr * cp * cy + sr * sp * sy
+    return quats
+
+
+class BoneDefaults:
+    """Bone rest values in array form, shared by every animation of model"""
+
+    def __init__(self, bones):
+        self.position = np.array([bone.position for bone in bones], np.float32).reshape((-1, 3))
+        self.quat = np.array([bone.quat for bone in bones], np.float32).reshape((-1, 4))
+        self.rotation = np.array([bone.rotation for bone in bones], np.float32).reshape((-1, 3))
+        self.position_scale = np.array([bone.position_scale for bone in bones], np.float32).reshape((-1, 3))
+        self.rotation_scale = np.array([bone.rotation_scale for bone in bones], np.float32).reshape((-1, 3))
+
+    def __len__(self):
+        return len(self.position)
+
+
+def _read_value_tracks(data: bytes, value_ptr_offset: int, frame_count: int, scale: np.ndarray):
+    tracks = np.zeros((frame_count, 3), np.float32)
+    for axis, track_offset in enumerate(_VALUE_PTR.unpack_from(data, value_ptr_offset)):
+        if track_offset != 0:
+            tracks[:, axis] = read_anim_value_track(data, value_ptr_offset + track_offset, frame_count) * scale[axis]
+    return tracks
+
+
+def _rest_frames(frame_count: int, bones: BoneDefaults, delta: bool) -> np.ndarray:
+    frames = np.empty((frame_count, len(bones), 7), np.float32)
+    if delta:
+        frames[:, :, :3] = 0
+        frames[:, :, 3:] = IDENTITY_QUATERNION
+    else:
+        frames[:, :, :3] = bones.position
+        frames[:, :, 3:] = bones.quat
+    return frames
+
+
+def decode_animation(data: bytes, offset: int, frame_count: int, bones: BoneDefaults, delta=False) -> np.ndarray:
+    """Decodes mstudioanim_t chain into (frames, bones, 7) array of position xyz and quaternion xyzw.
+
+    Bones missing from chain keep rest pose, or identity transform in delta animations.
+    """
+    frames = _rest_frames(frame_count, bones, delta)
+
+    while True:
+        bone_index, flags, next_offset = _ANIM_HEADER.unpack_from(data, offset)
+        if bone_index >= len(bones):
+            break
+        flags = AnimationFlags(flags)
+        bone_delta = bool(flags & AnimationFlags.DELTA)
+        value_offset = offset + _ANIM_HEADER.size
+
+        if flags & AnimationFlags.RAWROT:
+            frames[:, bone_index, 3:] = decode_quaternion48(data[value_offset:value_offset + 6])
+        elif flags & AnimationFlags.RAWROT2:
+            frames[:, bone_index, 3:] = decode_quaternion64(data[value_offset:value_offset + 8])
+        elif flags & AnimationFlags.ANIMROT:
+            angles = _read_value_tracks(data, value_offset, frame_count, bones.rotation_scale[bone_index])
+            if not bone_delta:
+                angles += bones.rotation[bone_index]
+            frames[:, bone_index, 3:] = angles_to_quaternions(angles)
+        else:
+            frames[:, bone_index, 3:] = IDENTITY_QUATERNION if bone_delta else bones.quat[bone_index]
+
+        if flags & AnimationFlags.RAWPOS:
+            pos_offset = value_offset
+            pos_offset += 6 if flags & AnimationFlags.RAWROT else 0
+            pos_offset += 8 if flags & AnimationFlags.RAWROT2 else 0
+            frames[:, bone_index, :3] = np.frombuffer(data, np.float16, 3, pos_offset)
+        elif flags & AnimationFlags.ANIMPOS:
+            pos_offset = value_offset + (_VALUE_PTR_SIZE if flags & AnimationFlags.ANIMROT else 0)
+            positions = _read_value_tracks(data, pos_offset, frame_count, bones.position_scale[bone_index])
+            if not bone_delta:
+                positions += bones.position[bone_index]
+            frames[:, bone_index, :3] = positions
+        else:
+            frames[:, bone_index, :3] = 0 if bone_delta else bones.position[bone_index]
+
+        if next_offset == 0:
+            break
+        offset += next_offset
+    return frames
+
+
+def decode_frame_animation(data: bytes, offset: int, frame_count: int, bones: BoneDefaults,
+                           delta=False) -> np.ndarray:
+    """Decodes mstudio_frame_anim_t into same (frames, bones, 7) array as decode_animation.
+
+    Every frame is fixed size record, so each animated bone value is read for all frames
+    at once through strided view over frame data.
+    """
+    constants_offset, frame_offset, frame_length = _FRAME_ANIM_HEADER.unpack_from(data, offset)
+    bone_flags = np.frombuffer(data, np.uint8, len(bones), offset + _FRAME_ANIM_HEADER.size)
+    if np.any(bone_flags & (FrameAnimationFlags.CONST_ROT2 | FrameAnimationFlags.ANIM_ROT2)):
+        raise UnsupportedAnimationError('Quaternion48S frame animation values are not supported')
+    frames = _rest_frames(frame_count, bones, delta)
+    constant_offset = offset + constants_offset
+    value_offset = offset + frame_offset
+
+    def frame_values(dtype):
+        dtype = np.dtype(dtype)
+        return np.ndarray((frame_count, 3), dtype, data, value_offset, (frame_length, dtype.itemsize))
+
+    for bone_index, flags in enumerate(bone_flags.tolist()):
+        if flags & FrameAnimationFlags.CONST_ROT:
+            frames[:, bone_index, 3:] = decode_quaternion48(data[constant_offset:constant_offset + 6])
+            constant_offset += 6
+        elif flags & FrameAnimationFlags.ANIM_ROT:
+            frames[:, bone_index, 3:] = decode_quaternion48_array(frame_values('<u2'))
+            value_offset += 6
+
+        if flags & FrameAnimationFlags.CONST_POS:
+            frames[:, bone_index, :3] = np.frombuffer(data, '<f2', 3, constant_offset)
+            constant_offset += 6
+        elif flags & FrameAnimationFlags.CONST_POS2:
+            frames[:, bone_index, :3] = np.frombuffer(data, '<f4', 3, constant_offset)
+            constant_offset += 12
+        elif flags & FrameAnimationFlags.ANIM_POS:
+            frames[:, bone_index, :3] = frame_values('<f2')
+            value_offset += 6
+        elif flags & FrameAnimationFlags.ANIM_POS2:
+            frames[:, bone_index, :3] = frame_values('<f4')
+            value_offset += 12
+    return frames
+
+
 class Animation(Base):
 
     def __init__(self):
@@ -22,5 +232,6 @@ class Animation(Base):
         self.rot = []
         self.pos = []
 
-    def read(self,reader:ByteIO):
-        pass
+    def read(self, reader: ByteIO):
+        self.bone_index, flag, self.next_offset = reader.read_fmt('BBh')
+        self.flag = AnimationFlags(flag)
@@ -1,6 +1,6 @@
 import numpy as np
 
-from ....utilities.byte_io_mdl  import ByteIO
+from ....utilities.byte_io_mdl import ByteIO, read_source1_strings
 from ....source_shared.base import Base
 from ....utilities import math_utilities
 
@@ -19,6 +19,32 @@ class Attachment(Base):
         self.pos = np.zeros(3)
         self.unused = []
 
+    dtype = np.dtype([('name_offset', np.int32),
+                      ('flags', np.uint32),
+                      ('parent_bone', np.uint32),
+                      ('local_mat', np.float32, (12,)),
+                      ('unused', np.uint32, (8,)),
+                      ])
+
+    @classmethod
+    def read_all(cls, data: bytes, offset: int, count: int):
+        records = np.frombuffer(data, cls.dtype, count, offset)
+        entries = offset + np.arange(count, dtype=np.int64) * cls.dtype.itemsize
+        names = read_source1_strings(data, np.where(records['name_offset'] != 0,
+                                                     entries + records['name_offset'], 0).tolist())
+        attachments = []
+        for name, flags, parent_bone, local_mat in zip(names, records['flags'].tolist(),
+                                                       records['parent_bone'].tolist(),
+                                                       records['local_mat'].tolist()):
+            attachment = cls()
+            attachment.name = name
+            attachment.flags = flags
+            attachment.parent_bone = parent_bone
+            attachment.local_mat = local_mat
+            attachment.compute_transform()
+            attachments.append(attachment)
+        return attachments
+
     def read(self, reader: ByteIO):
         entry = reader.tell()
         self.name = reader.read_source1_string(entry)
@@ -26,6 +52,9 @@ class Attachment(Base):
         self.parent_bone = reader.read_uint32()
         self.local_mat = reader.read_fmt('12f')
         reader.skip(4 * 8)
+        self.compute_transform()
+
+    def compute_transform(self):
         self.rot[:] = math_utilities.convert_rotation_matrix_to_degrees(
             self.local_mat[4 * 0 + 0],
             self.local_mat[4 * 1 + 0],
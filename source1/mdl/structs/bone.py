@@ -2,7 +2,7 @@ from enum import IntFlag, IntEnum
 
 import numpy as np
 
-from ....utilities.byte_io_mdl import ByteIO
+from ....utilities.byte_io_mdl import ByteIO, read_source1_strings
 from ....source_shared.base import Base
 
 from .axis_interp_rule import AxisInterpRule
@@ -189,6 +189,85 @@ class Bone(Base):
             return mdl.bones[self.parent_bone_index]
         return None
 
+    @staticmethod
+    def get_dtype(version):
+        fields = [('name_offset', np.int32),
+                  ('parent_bone_index', np.int32),
+                  ('bone_controller_index', np.float32, (6,)),
+                  ('position', np.float32, (3,)),
+                  ('quat', np.float32, (4,)),
+                  ('rotation', np.float32, (3,)),
+                  ('position_scale', np.float32, (3,)),
+                  ('rotation_scale', np.float32, (3,)),
+                  ('pose_to_bone', np.float32, (12,)),
+                  ('q_alignment', np.float32, (4,)),
+                  ('flags', np.uint32),
+                  ('procedural_rule_type', np.uint32),
+                  ('procedural_rule_offset', np.uint32),
+                  ('physics_bone_index', np.uint32),
+                  ('surface_prop_offset', np.int32),
+                  ('contents', np.uint32),
+                  ]
+        if version >= 44:
+            fields.append(('unused', np.uint32, (8,)))
+        if version >= 53:
+            fields.append(('unused53', np.uint32, (7,)))
+        return np.dtype(fields)
+
+    @classmethod
+    def read_all(cls, reader: ByteIO, data: bytes, offset: int, count: int, version: int):
+        """Parses whole bone table with single frombuffer, names are resolved in bulk"""
+        dtype = cls.get_dtype(version)
+        records = np.frombuffer(data, dtype, count, offset)
+        entries = offset + np.arange(count, dtype=np.int64) * dtype.itemsize
+        names = read_source1_strings(data, np.where(records['name_offset'] != 0,
+                                                     entries + records['name_offset'], 0).tolist())
+        surface_props = read_source1_strings(data, np.where(records['surface_prop_offset'] != 0,
+                                                            entries + records['surface_prop_offset'], 0).tolist())
+        pose_to_bone = records['pose_to_bone'].astype(np.float64).reshape((-1, 3, 4)).transpose((0, 2, 1))
+        columns = zip(names, surface_props, entries.tolist(), records['parent_bone_index'].tolist(),
+                      records['bone_controller_index'].tolist(), records['position'].tolist(),
+                      records['quat'].tolist(), records['rotation'].tolist(), records['position_scale'].tolist(),
+                      records['rotation_scale'].tolist(), pose_to_bone, records['q_alignment'].tolist(),
+                      records['flags'].tolist(), records['procedural_rule_type'].tolist(),
+                      records['procedural_rule_offset'].tolist(), records['physics_bone_index'].tolist(),
+                      records['contents'].tolist())
+        bones = []
+        for (name, surface_prop, entry, parent_bone_index, bone_controller_index, position, quat, rotation,
+             position_scale, rotation_scale, bone_pose, q_alignment, flags, procedural_rule_type,
+             procedural_rule_offset, physics_bone_index, contents) in columns:
+            bone = cls()
+            bone.name = name
+            bone.surface_prop = surface_prop
+            bone.parent_bone_index = parent_bone_index
+            bone.bone_controller_index = bone_controller_index
+            bone.position = position
+            bone.quat = quat
+            bone.rotation = rotation
+            bone.position_scale = position_scale
+            bone.rotation_scale = rotation_scale
+            bone.pose_to_bone = bone_pose
+            bone.q_alignment = q_alignment
+            bone.flags = BoneFlags(flags)
+            bone.procedural_rule_type = procedural_rule_type
+            bone.physics_bone_index = physics_bone_index
+            bone.contents = Contents(contents)
+            if procedural_rule_type != 0 and procedural_rule_offset != 0:
+                reader.seek(entry + procedural_rule_offset)
+                bone.read_procedural_rule(reader)
+            bones.append(bone)
+        return bones
+
+    def read_procedural_rule(self, reader: ByteIO):
+        if self.procedural_rule_type == ProceduralBoneType.AXISINTERP:
+            self.procedural_rule = AxisInterpRule()
+        if self.procedural_rule_type == ProceduralBoneType.QUATINTERP:
+            self.procedural_rule = QuatInterpRule()
+        if self.procedural_rule_type == ProceduralBoneType.JIGGLE:
+            self.procedural_rule = JiggleRule()
+        if self.procedural_rule:
+            self.procedural_rule.read(reader)
+
     def read(self, reader: ByteIO):
         entry = reader.tell()
         self.name = reader.read_source1_string(entry)
@@ -217,11 +296,4 @@ class Bone(Base):
         if self.procedural_rule_type != 0 and procedural_rule_offset != 0:
             with reader.save_current_pos():
                 reader.seek(entry + procedural_rule_offset)
-                if self.procedural_rule_type == ProceduralBoneType.AXISINTERP:
-                    self.procedural_rule = AxisInterpRule()
-                if self.procedural_rule_type == ProceduralBoneType.QUATINTERP:
-                    self.procedural_rule = QuatInterpRule()
-                if self.procedural_rule_type == ProceduralBoneType.JIGGLE:
-                    self.procedural_rule = JiggleRule()
-                if self.procedural_rule:
-                    self.procedural_rule.read(reader)
+                self.read_procedural_rule(reader)
@@ -1,4 +1,6 @@
-from ....utilities.byte_io_mdl  import ByteIO
+import numpy as np
+
+from ....utilities.byte_io_mdl import ByteIO, read_source1_strings
 from ....source_shared.base import Base
 
 
@@ -12,6 +14,38 @@ class Material(Base):
         self.client_material_pointer = 0
         self.unused = []  # len 10
 
+    @staticmethod
+    def get_dtype(version):
+        return np.dtype([('name_offset', np.int32),
+                         ('flags', np.uint32),
+                         ('used', np.uint32),
+                         ('unused1', np.uint32),
+                         ('material_pointer', np.uint32),
+                         ('client_material_pointer', np.uint32),
+                         ('unused', np.uint32, (10 if version < 53 else 5,)),
+                         ])
+
+    @classmethod
+    def read_all(cls, data: bytes, offset: int, count: int, version: int):
+        dtype = cls.get_dtype(version)
+        records = np.frombuffer(data, dtype, count, offset)
+        entries = offset + np.arange(count, dtype=np.int64) * dtype.itemsize
+        names = read_source1_strings(data, np.where(records['name_offset'] != 0,
+                                                     entries + records['name_offset'], 0).tolist())
+        materials = []
+        for name, flags, used, unused1, material_pointer, client_material_pointer in zip(
+                names, records['flags'].tolist(), records['used'].tolist(), records['unused1'].tolist(),
+                records['material_pointer'].tolist(), records['client_material_pointer'].tolist()):
+            material = cls()
+            material.name = name
+            material.flags = flags
+            material.used = used
+            material.unused1 = unused1
+            material.material_pointer = material_pointer
+            material.client_material_pointer = client_material_pointer
+            materials.append(material)
+        return materials
+
     def read(self, reader: ByteIO):
         entry = reader.tell()
         self.name = reader.read_source1_string(entry)
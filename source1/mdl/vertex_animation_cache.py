@@ -1,3 +1,5 @@
+from typing import Dict, List, Tuple
+
 import numpy as np
 
 from ...source_shared.base import Base
@@ -8,10 +10,12 @@ from .structs.mesh import Mesh
 
 class VertexAnimationCache(Base):
 
-    def __init__(self, mdl: Mdl, vvd: Vvd):
-        self.vertex_cache = {}
+    def __init__(self, mdl: Mdl, vvd: Vvd, desired_lod=0):
+        # flex name -> list of (global vertex indices, deltas) chunks, one per mesh using the flex
+        self.vertex_cache: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
         self.mdl = mdl
         self.vvd = vvd
+        self.desired_lod = desired_lod
 
     def process_data(self):
         print("[WIP ]Pre-computing vertex animation cache")
@@ -26,13 +30,19 @@ class VertexAnimationCache(Base):
                         self.process_mesh(mesh, model.vertex_offset)
         print("[Done] Pre-computing vertex animation cache")
 
-    def process_mesh(self, mesh: Mesh, vertex_offset, desired_lod=0):
+    def process_mesh(self, mesh: Mesh, vertex_offset):
         for flex in mesh.flexes:
-            if flex.name not in self.vertex_cache:
-                vertex_cache = self.vertex_cache[flex.name] = np.copy(self.vvd.lod_data[desired_lod]['vertex'])
-            else:
-                vertex_cache = self.vertex_cache[flex.name]
-            vertex_indices = flex.vertex_animations['index'].reshape(-1) + mesh.vertex_index_start + vertex_offset
-            vertex_cache[vertex_indices] = np.add(vertex_cache[vertex_indices], flex.vertex_animations['vertex_delta'])
-
-        pass
+            vertex_indices = flex.vertex_animations['index'].reshape(-1).astype(np.uint32)
+            vertex_indices += mesh.vertex_index_start + vertex_offset
+            vertex_deltas = flex.vertex_animations['vertex_delta'].astype(np.float32)
+            self.vertex_cache.setdefault(flex.name, []).append((vertex_indices, vertex_deltas))
+
+    def get_flex_vertices(self, flex_name, vertex_offset, vertex_count):
+        """Materializes flexed positions of vertex_count vertices starting at vertex_offset"""
+        base_vertices = self.vvd.lod_data[self.desired_lod]['vertex']
+        vertices = base_vertices[vertex_offset:vertex_offset + vertex_count].astype(np.float32)
+        for vertex_indices, vertex_deltas in self.vertex_cache.get(flex_name, []):
+            in_slice = (vertex_indices >= vertex_offset) & (vertex_indices < vertex_offset + vertex_count)
+            local_indices = vertex_indices[in_slice] - vertex_offset
+            vertices[local_indices] = vertices[local_indices] + vertex_deltas[in_slice]
+        return vertices
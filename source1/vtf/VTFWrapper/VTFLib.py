@@ -5,6 +5,8 @@ import platform
 import sys
 from ctypes import *
 
+import numpy as np
+
 from ....utilities.singleton import SingletonMeta
 
 from . import VTFLibEnums, VTFLibStructures
@@ -520,6 +522,16 @@ class VTFLib(metaclass=SingletonMeta):
             sys.stderr.write('CAN\'T CONVERT IMAGE\n')
             return 0
 
+    def convert_to_rgba8888_array(self, frame=0, face=0, slice=0, mipmap_level=0):
+        """Converts single surface straight into NumPy owned (height, width, 4) uint8 array"""
+        width = max(1, self.width() >> mipmap_level)
+        height = max(1, self.height() >> mipmap_level)
+        rgba = np.empty((height, width, 4), dtype=np.uint8)
+        self.ImageConvertToRGBA8888(self.ImageGetData(frame, face, slice, mipmap_level),
+                                    rgba.ctypes.data_as(POINTER(c_byte)), width, height,
+                                    self.image_format().value)
+        return rgba
+
     ImageConvert = vtflib_cdll.vlImageConvert
     ImageConvert.argtypes = [
         POINTER(c_byte),
@@ -4,26 +4,50 @@ import bpy
 import numpy as np
 
 from ..vtf.VTFWrapper import VTFLib
+from .vtf_file import VTFFile, VTFError, is_format_supported
 from ...bpy_utilities.logging import BPYLoggingManager
 
 log_manager = BPYLoggingManager()
 logger = log_manager.get_logger('content_manager')
 
 
-def import_texture(name, file_object, update=False):
-    if bpy.data.images.get(name, None) and not update:
-        return bpy.data.images.get(name)
+def _decode_native(data: bytes):
+    vtf = VTFFile(data).read()
+    if not is_format_supported(vtf.format):
+        return None
+    pixels = vtf.read_image_float(flip=True)
+    return vtf.width, vtf.height, np.ascontiguousarray(pixels, dtype=np.float32).reshape(-1)
+
+
+def _decode_vtflib(data: bytes):
     vtf_lib = VTFLib.VTFLib()
-    logger.info(f'Loading "{name}" texture')
-    vtf_lib.image_load_from_buffer(file_object.read())
+    vtf_lib.image_load_from_buffer(data)
     if not vtf_lib.image_is_loaded():
         raise Exception("Failed to load texture :{}".format(vtf_lib.get_last_error()))
-    image_width = vtf_lib.width()
-    image_height = vtf_lib.height()
-    rgba_data = vtf_lib.convert_to_rgba8888()
-    rgba_data = vtf_lib.flip_image_external(rgba_data, image_width, image_height)
+    try:
+        image_width = vtf_lib.width()
+        image_height = vtf_lib.height()
+        rgba_data = vtf_lib.convert_to_rgba8888_array()
+        # Flip is a view, division writes straight into the only float copy
+        pixels = np.divide(rgba_data[::-1], 255, dtype=np.float32)
+        return image_width, image_height, pixels.reshape(-1)
+    finally:
+        vtf_lib.image_destroy()
 
-    pixels = np.divide(rgba_data.contents, 255, dtype=np.float32)
+
+def import_texture(name, file_object, update=False, postprocess=None):
+    if bpy.data.images.get(name, None) and not update:
+        return bpy.data.images.get(name)
+    logger.info(f'Loading "{name}" texture')
+    data = file_object.read()
+    try:
+        decoded = _decode_native(data)
+    except VTFError as ex:
+        logger.warn(f'Native VTF reader failed on "{name}": {ex}, falling back to VTFLib')
+        decoded = None
+    if decoded is None:
+        decoded = _decode_vtflib(data)
+    image_width, image_height, pixels = decoded
     try:
         image = bpy.data.images.get(name, None) or bpy.data.images.new(
             name,
@@ -34,16 +58,16 @@ def import_texture(name, file_object, update=False):
         image.filepath = name + '.tga'
         image.alpha_mode = 'CHANNEL_PACKED'
         image.file_format = 'TARGA'
+        if postprocess is not None:
+            # Conversion runs on decoded pixels, so they are uploaded and packed only once
+            postprocess(image, pixels)
 
         if bpy.app.version > (2, 83, 0):
-            image.pixels.foreach_set(pixels.tolist())
+            image.pixels.foreach_set(pixels)
         else:
             image.pixels[:] = pixels.tolist()
         image.pack()
         return image
     except Exception as ex:
         logger.error('Caught exception "{}" '.format(ex))
-    finally:
-        del rgba_data
-        vtf_lib.image_destroy()
     return None
@@ -0,0 +1,454 @@
+import struct
+from enum import IntEnum, IntFlag
+from typing import BinaryIO, Dict, Tuple, Union
+
+import numpy as np
+
+
+class VTFError(Exception):
+    pass
+
+
+class VTFImageFormat(IntEnum):
+    NONE = -1
+    RGBA8888 = 0
+    ABGR8888 = 1
+    RGB888 = 2
+    BGR888 = 3
+    RGB565 = 4
+    I8 = 5
+    IA88 = 6
+    P8 = 7
+    A8 = 8
+    RGB888_BLUESCREEN = 9
+    BGR888_BLUESCREEN = 10
+    ARGB8888 = 11
+    BGRA8888 = 12
+    DXT1 = 13
+    DXT3 = 14
+    DXT5 = 15
+    BGRX8888 = 16
+    BGR565 = 17
+    BGRX5551 = 18
+    BGRA4444 = 19
+    DXT1_ONEBITALPHA = 20
+    BGRA5551 = 21
+    UV88 = 22
+    UVWQ8888 = 23
+    RGBA16161616F = 24
+    RGBA16161616 = 25
+    UVLX8888 = 26
+
+
+class VTFFlags(IntFlag):
+    POINTSAMPLE = 0x00000001
+    TRILINEAR = 0x00000002
+    CLAMPS = 0x00000004
+    CLAMPT = 0x00000008
+    ANISOTROPIC = 0x00000010
+    HINT_DXT5 = 0x00000020
+    SRGB = 0x00000040
+    NORMAL = 0x00000080
+    NOMIP = 0x00000100
+    NOLOD = 0x00000200
+    ALL_MIPS = 0x00000400
+    PROCEDURAL = 0x00000800
+    ONEBITALPHA = 0x00001000
+    EIGHTBITALPHA = 0x00002000
+    ENVMAP = 0x00004000
+    RENDERTARGET = 0x00008000
+    DEPTHRENDERTARGET = 0x00010000
+    NODEBUGOVERRIDE = 0x00020000
+    SINGLECOPY = 0x00040000
+    NODEPTHBUFFER = 0x00800000
+    CLAMPU = 0x02000000
+    VERTEXTEXTURE = 0x04000000
+    SSBUMP = 0x08000000
+    BORDER = 0x20000000
+
+
+_BLOCK_FORMATS = {
+    VTFImageFormat.DXT1: 8,
+    VTFImageFormat.DXT1_ONEBITALPHA: 8,
+    VTFImageFormat.DXT3: 16,
+    VTFImageFormat.DXT5: 16,
+}
+
+_PIXEL_SIZES = {
+    VTFImageFormat.RGBA8888: 4,
+    VTFImageFormat.ABGR8888: 4,
+    VTFImageFormat.RGB888: 3,
+    VTFImageFormat.BGR888: 3,
+    VTFImageFormat.RGB565: 2,
+    VTFImageFormat.I8: 1,
+    VTFImageFormat.IA88: 2,
+    VTFImageFormat.P8: 1,
+    VTFImageFormat.A8: 1,
+    VTFImageFormat.RGB888_BLUESCREEN: 3,
+    VTFImageFormat.BGR888_BLUESCREEN: 3,
+    VTFImageFormat.ARGB8888: 4,
+    VTFImageFormat.BGRA8888: 4,
+    VTFImageFormat.BGRX8888: 4,
+    VTFImageFormat.BGR565: 2,
+    VTFImageFormat.BGRX5551: 2,
+    VTFImageFormat.BGRA4444: 2,
+    VTFImageFormat.BGRA5551: 2,
+    VTFImageFormat.UV88: 2,
+    VTFImageFormat.UVWQ8888: 4,
+    VTFImageFormat.RGBA16161616F: 8,
+    VTFImageFormat.RGBA16161616: 8,
+    VTFImageFormat.UVLX8888: 4,
+}
+
+_LOW_RES_IMAGE_RESOURCE = b'\x01\x00\x00'
+_HIGH_RES_IMAGE_RESOURCE = b'\x30\x00\x00'
+_RESOURCE_NO_DATA_CHUNK = 0x02
+
+_HEADER = struct.Struct('<4s2II2HI2H4x3f4xfiBi2B')
+_HEADER_72 = struct.Struct('<H')
+_HEADER_73 = struct.Struct('<3xI8x')
+_RESOURCE_ENTRY = struct.Struct('<3sBI')
+
+
+def compute_image_size(image_format: VTFImageFormat, width: int, height: int, depth: int = 1):
+    if image_format == VTFImageFormat.NONE:
+        return 0
+    if image_format in _BLOCK_FORMATS:
+        return ((width + 3) // 4) * ((height + 3) // 4) * depth * _BLOCK_FORMATS[image_format]
+    if image_format not in _PIXEL_SIZES:
+        raise VTFError(f'Unknown image format {image_format}')
+    return width * height * depth * _PIXEL_SIZES[image_format]
+
+
+def _expand_bits(value: np.ndarray, bits: int):
+    value = value.astype(np.uint16)
+    if bits < 4:
+        # Bit replication needs at least half a byte, short fields scale exactly by multiplication
+        return (value * (255 // ((1 << bits) - 1))).astype(np.uint8)
+    return ((value << (8 - bits)) | (value >> (2 * bits - 8))).astype(np.uint8)
+
+
+def _unpack_565(colors: np.ndarray):
+    red = _expand_bits((colors >> 11) & 0x1F, 5)
+    green = _expand_bits((colors >> 5) & 0x3F, 6)
+    blue = _expand_bits(colors & 0x1F, 5)
+    return np.stack([red, green, blue], axis=-1)
+
+
+def _blocks_to_image(pixels: np.ndarray, width: int, height: int):
+    """Rearranges (block_count, 16, C) block pixels into (height, width, C) image"""
+    blocks_x = (width + 3) // 4
+    blocks_y = (height + 3) // 4
+    channels = pixels.shape[-1]
+    image = pixels.reshape(blocks_y, blocks_x, 4, 4, channels).transpose(0, 2, 1, 3, 4)
+    return image.reshape(blocks_y * 4, blocks_x * 4, channels)[:height, :width]
+
+
+def _decode_color_blocks(blocks: np.ndarray, allow_transparent: bool):
+    """Decodes 8 byte DXT color blocks into (block_count, 16, 4) RGBA pixels"""
+    color0 = blocks[:, 0].astype(np.uint16) | (blocks[:, 1].astype(np.uint16) << 8)
+    color1 = blocks[:, 2].astype(np.uint16) | (blocks[:, 3].astype(np.uint16) << 8)
+    indices = blocks[:, 4:8].copy().view('<u4').reshape(-1)
+
+    rgb0 = _unpack_565(color0).astype(np.uint16)
+    rgb1 = _unpack_565(color1).astype(np.uint16)
+    four_colors = (color0 > color1)[:, None]
+    if not allow_transparent:
+        four_colors = np.ones_like(four_colors)
+
+    palette = np.empty((blocks.shape[0], 4, 4), dtype=np.uint8)
+    palette[:, 0, :3] = rgb0
+    palette[:, 1, :3] = rgb1
+    palette[:, 2, :3] = np.where(four_colors, (2 * rgb0 + rgb1) // 3, (rgb0 + rgb1) // 2)
+    palette[:, 3, :3] = np.where(four_colors, (rgb0 + 2 * rgb1) // 3, 0)
+    palette[:, :, 3] = 255
+    palette[:, 3, 3] = np.where(four_colors[:, 0], 255, 0)
+
+    pixel_indices = (indices[:, None] >> (2 * np.arange(16, dtype=np.uint32))) & 3
+    return np.take_along_axis(palette, pixel_indices[:, :, None].astype(np.intp), axis=1)
+
+
+def _decode_dxt5_alpha(blocks: np.ndarray):
+    alpha0 = blocks[:, 0].astype(np.uint16)
+    alpha1 = blocks[:, 1].astype(np.uint16)
+    bits = np.zeros(blocks.shape[0], dtype=np.uint64)
+    for n in range(6):
+        bits |= blocks[:, 2 + n].astype(np.uint64) << np.uint64(8 * n)
+
+    eight_alphas = (alpha0 > alpha1)[:, None]
+    weights = np.arange(1, 7, dtype=np.uint16)
+    interpolated8 = ((7 - weights) * alpha0[:, None] + weights * alpha1[:, None] + 3) // 7
+    weights = np.arange(1, 5, dtype=np.uint16)
+    interpolated6 = ((5 - weights) * alpha0[:, None] + weights * alpha1[:, None] + 2) // 5
+
+    palette = np.empty((blocks.shape[0], 8), dtype=np.uint16)
+    palette[:, 0] = alpha0
+    palette[:, 1] = alpha1
+    interpolated6 = np.concatenate([interpolated6, np.zeros_like(interpolated6[:, :2])], axis=1)
+    palette[:, 2:8] = np.where(eight_alphas, interpolated8, interpolated6)
+    palette[:, 7] = np.where(eight_alphas[:, 0], palette[:, 7], 255)
+
+    pixel_indices = (bits[:, None] >> (3 * np.arange(16, dtype=np.uint64))) & np.uint64(7)
+    return np.take_along_axis(palette, pixel_indices.astype(np.intp), axis=1).astype(np.uint8)
+
+
+def decode_dxt1(data, width, height, one_bit_alpha=True):
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 8)
+    return _blocks_to_image(_decode_color_blocks(blocks, one_bit_alpha), width, height)
+
+
+def decode_dxt3(data, width, height):
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 16)
+    pixels = _decode_color_blocks(blocks[:, 8:], False)
+    alpha = np.empty((blocks.shape[0], 16), dtype=np.uint8)
+    alpha[:, 0::2] = blocks[:, :8] & 0x0F
+    alpha[:, 1::2] = blocks[:, :8] >> 4
+    pixels[:, :, 3] = alpha * 17
+    return _blocks_to_image(pixels, width, height)
+
+
+def decode_dxt5(data, width, height):
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 16)
+    pixels = _decode_color_blocks(blocks[:, 8:], False)
+    pixels[:, :, 3] = _decode_dxt5_alpha(blocks[:, :8])
+    return _blocks_to_image(pixels, width, height)
+
+
+def _decode_swizzled(channel_order: Tuple[int, ...], pixel_size: int, opaque=False):
+    def decoder(data, width, height):
+        pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, pixel_size)
+        rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+        for channel, source in enumerate(channel_order):
+            if source is not None:
+                rgba[:, :, channel] = pixels[:, :, source]
+        if opaque:
+            rgba[:, :, 3] = 255
+        return rgba
+
+    return decoder
+
+
+def _decode_i8(data, width, height):
+    pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width)
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    rgba[:, :, :3] = pixels[:, :, None]
+    return rgba
+
+
+def _decode_ia88(data, width, height):
+    pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 2)
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[:, :, :3] = pixels[:, :, :1]
+    rgba[:, :, 3] = pixels[:, :, 1]
+    return rgba
+
+
+def _decode_a8(data, width, height):
+    rgba = np.zeros((height, width, 4), dtype=np.uint8)
+    rgba[:, :, 3] = np.frombuffer(data, dtype=np.uint8).reshape(height, width)
+    return rgba
+
+
+def _decode_packed16(red: Tuple[int, int], green: Tuple[int, int], blue: Tuple[int, int],
+                     alpha: Tuple[int, int] = None):
+    """Decoder for 16 bit packed formats, channels are (shift, bit count) pairs"""
+
+    def decoder(data, width, height):
+        pixels = np.frombuffer(data, dtype='<u2').reshape(height, width)
+        rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+        channels = (red, green, blue) if alpha is None else (red, green, blue, alpha)
+        for channel, (shift, bits) in enumerate(channels):
+            rgba[:, :, channel] = _expand_bits((pixels >> shift) & ((1 << bits) - 1), bits)
+        return rgba
+
+    return decoder
+
+
+def _decode_rgba16f(data, width, height):
+    return np.frombuffer(data, dtype='<f2').reshape(height, width, 4).astype(np.float32)
+
+
+def _decode_rgba16(data, width, height):
+    return np.frombuffer(data, dtype='<u2').reshape(height, width, 4) / np.float32(65535)
+
+
+_DECODERS = {
+    VTFImageFormat.DXT1: lambda data, width, height: decode_dxt1(data, width, height, True),
+    VTFImageFormat.DXT1_ONEBITALPHA: lambda data, width, height: decode_dxt1(data, width, height, True),
+    VTFImageFormat.DXT3: decode_dxt3,
+    VTFImageFormat.DXT5: decode_dxt5,
+    VTFImageFormat.RGBA8888: _decode_swizzled((0, 1, 2, 3), 4),
+    VTFImageFormat.ABGR8888: _decode_swizzled((3, 2, 1, 0), 4),
+    VTFImageFormat.ARGB8888: _decode_swizzled((1, 2, 3, 0), 4),
+    VTFImageFormat.BGRA8888: _decode_swizzled((2, 1, 0, 3), 4),
+    VTFImageFormat.BGRX8888: _decode_swizzled((2, 1, 0, None), 4),
+    VTFImageFormat.UVWQ8888: _decode_swizzled((0, 1, 2, 3), 4),
+    VTFImageFormat.UVLX8888: _decode_swizzled((0, 1, 2, 3), 4),
+    VTFImageFormat.RGB888: _decode_swizzled((0, 1, 2, None), 3),
+    VTFImageFormat.BGR888: _decode_swizzled((2, 1, 0, None), 3),
+    VTFImageFormat.RGB888_BLUESCREEN: _decode_swizzled((0, 1, 2, None), 3),
+    VTFImageFormat.BGR888_BLUESCREEN: _decode_swizzled((2, 1, 0, None), 3),
+    VTFImageFormat.UV88: _decode_swizzled((0, 1, None, None), 2),
+    VTFImageFormat.I8: _decode_i8,
+    VTFImageFormat.IA88: _decode_ia88,
+    VTFImageFormat.A8: _decode_a8,
+    # Channels in packed formats are named from least significant bit up
+    VTFImageFormat.RGB565: _decode_packed16((0, 5), (5, 6), (11, 5)),
+    VTFImageFormat.BGR565: _decode_packed16((11, 5), (5, 6), (0, 5)),
+    VTFImageFormat.BGRA4444: _decode_packed16((8, 4), (4, 4), (0, 4), (12, 4)),
+    VTFImageFormat.BGRA5551: _decode_packed16((10, 5), (5, 5), (0, 5), (15, 1)),
+    VTFImageFormat.BGRX5551: _decode_packed16((10, 5), (5, 5), (0, 5)),
+    VTFImageFormat.RGBA16161616F: _decode_rgba16f,
+    VTFImageFormat.RGBA16161616: _decode_rgba16,
+}
+
+
+def is_format_supported(image_format: VTFImageFormat):
+    return image_format in _DECODERS
+
+
+def decode_image(image_format: VTFImageFormat, data, width: int, height: int) -> np.ndarray:
+    """Decodes single image surface into (height, width, 4) RGBA array.
+
+    LDR formats decode to uint8, RGBA16161616F and RGBA16161616 decode to float32.
+    """
+    decoder = _DECODERS.get(image_format, None)
+    if decoder is None:
+        raise NotImplementedError(f'Decoding of {image_format!r} is not supported')
+    return decoder(data, width, height)
+
+
+class VTFFile:
+    """Pure NumPy VTF reader (versions 7.0-7.5).
+
+    Holds no global state, so separate instances can be decoded from different threads.
+    """
+
+    def __init__(self, file_or_buffer: Union[BinaryIO, bytes, bytearray, memoryview]):
+        if hasattr(file_or_buffer, 'read'):
+            file_or_buffer = file_or_buffer.read()
+        self.buffer = memoryview(file_or_buffer)
+        self.version = (0, 0)
+        self.header_size = 0
+        self.width = 0
+        self.height = 0
+        self.depth = 1
+        self.flags = VTFFlags(0)
+        self.frame_count = 1
+        self.first_frame = 0
+        self.face_count = 1
+        self.reflectivity = (0.0, 0.0, 0.0)
+        self.bumpmap_scale = 1.0
+        self.format = VTFImageFormat.NONE
+        self.mip_count = 1
+        self.low_res_format = VTFImageFormat.NONE
+        self.low_res_width = 0
+        self.low_res_height = 0
+        self.resources: Dict[bytes, Tuple[int, int]] = {}
+
+        self.low_res_offset = 0
+        self.high_res_offset = 0
+
+    def read(self):
+        buffer = self.buffer
+        if len(buffer) < _HEADER.size:
+            raise VTFError('File is too small to be VTF')
+        (signature, version_major, version_minor, self.header_size,
+         self.width, self.height, flags, self.frame_count, self.first_frame,
+         *reflectivity, self.bumpmap_scale, image_format, self.mip_count,
+         low_res_format, self.low_res_width, self.low_res_height) = _HEADER.unpack_from(buffer)
+        if signature != b'VTF\x00':
+            raise VTFError(f'Invalid VTF signature {signature!r}')
+        if version_major != 7 or version_minor > 5:
+            raise VTFError(f'Unsupported VTF version {version_major}.{version_minor}')
+        self.version = (version_major, version_minor)
+        self.reflectivity = tuple(reflectivity)
+        self.flags = VTFFlags(flags)
+        self.format = VTFImageFormat(image_format)
+        self.low_res_format = VTFImageFormat(low_res_format)
+        self.frame_count = max(self.frame_count, 1)
+        self.mip_count = max(self.mip_count, 1)
+
+        offset = _HEADER.size
+        if version_minor >= 2:
+            self.depth, = _HEADER_72.unpack_from(buffer, offset)
+            self.depth = max(self.depth, 1)
+            offset += _HEADER_72.size
+
+        if self.flags & VTFFlags.ENVMAP:
+            self.face_count = 7 if version_minor < 5 and self.first_frame != 0xFFFF else 6
+
+        low_res_size = compute_image_size(self.low_res_format, self.low_res_width, self.low_res_height)
+        if version_minor >= 3:
+            resource_count, = _HEADER_73.unpack_from(buffer, offset)
+            offset += _HEADER_73.size
+            for _ in range(resource_count):
+                tag, resource_flags, data = _RESOURCE_ENTRY.unpack_from(buffer, offset)
+                offset += _RESOURCE_ENTRY.size
+                self.resources[tag] = (resource_flags, data)
+            if _HIGH_RES_IMAGE_RESOURCE not in self.resources:
+                raise VTFError('VTF has no high resolution image resource')
+            self.high_res_offset = self.resources[_HIGH_RES_IMAGE_RESOURCE][1]
+            self.low_res_offset = self.resources.get(_LOW_RES_IMAGE_RESOURCE, (0, 0))[1]
+        else:
+            self.low_res_offset = self.header_size
+            self.high_res_offset = self.header_size + low_res_size
+        return self
+
+    def get_resource_data(self, tag: bytes):
+        """Returns raw data of resource, or inline value for resources without data chunk"""
+        resource_flags, data = self.resources[tag]
+        if resource_flags & _RESOURCE_NO_DATA_CHUNK:
+            return data
+        size, = struct.unpack_from('<I', self.buffer, data)
+        return self.buffer[data + 4:data + 4 + size]
+
+    def get_mip_dimensions(self, mip_level: int):
+        return (max(1, self.width >> mip_level),
+                max(1, self.height >> mip_level),
+                max(1, self.depth >> mip_level))
+
+    def get_surface_offset(self, mip_level=0, frame=0, face=0, depth_slice=0):
+        """Absolute offset of single surface; mips are stored from smallest to largest"""
+        if not (0 <= mip_level < self.mip_count):
+            raise VTFError(f'Mip level {mip_level} out of range')
+        offset = self.high_res_offset
+        for mip in range(self.mip_count - 1, mip_level, -1):
+            width, height, depth = self.get_mip_dimensions(mip)
+            offset += compute_image_size(self.format, width, height, depth) * self.frame_count * self.face_count
+        width, height, depth = self.get_mip_dimensions(mip_level)
+        surface_size = compute_image_size(self.format, width, height)
+        return offset + ((frame * self.face_count + face) * depth + depth_slice) * surface_size
+
+    def get_surface_data(self, mip_level=0, frame=0, face=0, depth_slice=0) -> memoryview:
+        width, height, _ = self.get_mip_dimensions(mip_level)
+        offset = self.get_surface_offset(mip_level, frame, face, depth_slice)
+        size = compute_image_size(self.format, width, height)
+        if offset + size > len(self.buffer):
+            raise VTFError('VTF image data is truncated')
+        return self.buffer[offset:offset + size]
+
+    def read_image(self, mip_level=0, frame=0, face=0, depth_slice=0, flip=False) -> np.ndarray:
+        """Decodes only requested surface into (height, width, 4) RGBA array"""
+        width, height, _ = self.get_mip_dimensions(mip_level)
+        data = self.get_surface_data(mip_level, frame, face, depth_slice)
+        image = decode_image(self.format, data, width, height)
+        if flip:
+            image = image[::-1]
+        return image
+
+    def read_image_float(self, mip_level=0, frame=0, face=0, depth_slice=0, flip=False) -> np.ndarray:
+        image = self.read_image(mip_level, frame, face, depth_slice, flip)
+        if image.dtype == np.uint8:
+            return image.astype(np.float32) / np.float32(255)
+        return image
+
+    def read_low_res_image(self, flip=False):
+        if self.low_res_format == VTFImageFormat.NONE or not self.low_res_offset:
+            return None
+        size = compute_image_size(self.low_res_format, self.low_res_width, self.low_res_height)
+        data = self.buffer[self.low_res_offset:self.low_res_offset + size]
+        image = decode_image(self.low_res_format, data, self.low_res_width, self.low_res_height)
+        if flip:
+            image = image[::-1]
+        return image
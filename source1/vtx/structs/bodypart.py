@@ -1,21 +1,24 @@
 from typing import List
 
+import numpy as np
+
 from ....source_shared.base import Base
-from ....utilities.byte_io_mdl  import ByteIO
 from .model import Model
 
 
 class BodyPart(Base):
+    dtype = np.dtype([('model_count', np.uint32),
+                      ('model_offset', np.uint32),
+                      ])
+
     def __init__(self):
         self.models = []  # type: List[Model]
 
-    def read(self, reader: ByteIO):
-        entry = reader.tell()
-        model_count, model_offset = reader.read_fmt('II')
-
-        with reader.save_current_pos():
-            reader.seek(entry + model_offset)
-            for _ in range(model_count):
-                model = Model()
-                model.read(reader)
-                self.models.append(model)
+    def read(self, data: bytes, entry: int, extra8: bool):
+        model_count, model_offset = np.frombuffer(data, self.dtype, 1, entry)[0].tolist()
+        model_entry = entry + model_offset
+        for n in range(model_count):
+            model = Model()
+            model.read(data, model_entry + n * Model.dtype.itemsize, extra8)
+            self.models.append(model)
+        return self
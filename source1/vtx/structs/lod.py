@@ -1,25 +1,28 @@
 from typing import List
 
+import numpy as np
+
 from ....source_shared.base import Base
-from ....utilities.byte_io_mdl  import ByteIO
 from .mesh import Mesh
 
+
 class ModelLod(Base):
+    dtype = np.dtype([('mesh_count', np.uint32),
+                      ('mesh_offset', np.uint32),
+                      ('switch_point', np.float32),
+                      ])
+
     def __init__(self, lod_id):
         self.lod = lod_id
         self.switchPoint = 0
         self.meshes = []  # type: List[Mesh]
 
-    def read(self, reader: ByteIO):
-        entry = reader.tell()
-        mesh_count = reader.read_uint32()
-        mesh_offset = reader.read_uint32()
-        self.switchPoint = reader.read_float()
-        with reader.save_current_pos():
-            if mesh_offset > 0:
-                reader.seek(entry + mesh_offset)
-                for _ in range(mesh_count):
-                    mesh = Mesh()
-                    mesh.read(reader)
-                    self.meshes.append(mesh)
+    def read(self, data: bytes, entry: int, extra8: bool):
+        mesh_count, mesh_offset, self.switchPoint = np.frombuffer(data, self.dtype, 1, entry)[0].tolist()
+        if mesh_offset > 0:
+            mesh_entry = entry + mesh_offset
+            for n in range(mesh_count):
+                mesh = Mesh()
+                mesh.read(data, mesh_entry + n * Mesh.dtype.itemsize, extra8)
+                self.meshes.append(mesh)
         return self
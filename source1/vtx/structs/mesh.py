@@ -1,25 +1,29 @@
 from typing import List
 
+import numpy as np
+
 from ....source_shared.base import Base
-from ....utilities.byte_io_mdl  import ByteIO
 from .strip_group import StripGroup
 
 
 class Mesh(Base):
+    dtype = np.dtype([('strip_group_count', np.uint32),
+                      ('strip_group_offset', np.uint32),
+                      ('flags', np.uint8),
+                      ])
 
     def __init__(self):
         self.flags = 0
         self.strip_groups = []  # type: List[StripGroup]
 
-    def read(self, reader: ByteIO):
-        entry = reader.tell()
-        strip_group_count, strip_group_offset = reader.read_fmt('2I')
-        assert strip_group_offset < reader.size()
-        self.flags = reader.read_uint8()
-        with reader.save_current_pos():
-            if strip_group_offset > 0:
-                reader.seek(entry + strip_group_offset)
-                for _ in range(strip_group_count):
-                    strip_group = StripGroup()
-                    strip_group.read(reader)
-                    self.strip_groups.append(strip_group)
+    def read(self, data: bytes, entry: int, extra8: bool):
+        strip_group_count, strip_group_offset, self.flags = np.frombuffer(data, self.dtype, 1, entry)[0].tolist()
+        assert strip_group_offset < len(data)
+        if strip_group_offset > 0 and strip_group_count:
+            strip_group_dtype = StripGroup.get_dtype(extra8)
+            headers = np.frombuffer(data, strip_group_dtype, strip_group_count, entry + strip_group_offset)
+            for n, header in enumerate(headers):
+                strip_group = StripGroup()
+                strip_group.read(data, entry + strip_group_offset + n * strip_group_dtype.itemsize, header, extra8)
+                self.strip_groups.append(strip_group)
+        return self
@@ -1,22 +1,26 @@
 from typing import List
 
+import numpy as np
+
 from ....source_shared.base import Base
-from ....utilities.byte_io_mdl import ByteIO
 
 from .lod import ModelLod
 
 
 class Model(Base):
+    dtype = np.dtype([('lod_count', np.int32),
+                      ('lod_offset', np.int32),
+                      ])
+
     def __init__(self):
         self.model_lods = []  # type: List[ModelLod]
 
-    def read(self, reader: ByteIO):
-        entry = reader.tell()
-        lod_count, lod_offset = reader.read_fmt('ii')
-        with reader.save_current_pos():
-            if lod_count > 0 and lod_offset != 0:
-                reader.seek(entry + lod_offset)
-                for lod_id in range(lod_count):
-                    model_lod = ModelLod(lod_id)
-                    model_lod.read(reader)
-                    self.model_lods.append(model_lod)
+    def read(self, data: bytes, entry: int, extra8: bool):
+        lod_count, lod_offset = np.frombuffer(data, self.dtype, 1, entry)[0].tolist()
+        if lod_count > 0 and lod_offset != 0:
+            lod_entry = entry + lod_offset
+            for lod_id in range(lod_count):
+                model_lod = ModelLod(lod_id)
+                model_lod.read(data, lod_entry + lod_id * ModelLod.dtype.itemsize, extra8)
+                self.model_lods.append(model_lod)
+        return self
@@ -1,7 +1,6 @@
 from enum import IntFlag
 
-from ....source_shared.base import Base
-from ....utilities.byte_io_mdl import ByteIO
+import numpy as np
 
 
 class StripHeaderFlags(IntFlag):
@@ -10,30 +9,18 @@ class StripHeaderFlags(IntFlag):
     IS_QUADLIST_EXTRA = 0x04  # Extraordinary
 
 
-class Strip(Base):
-    def __init__(self):
-        self.index_count = 0
-        self.index_mesh_offset = 0
-        self.vertex_count = 0
-        self.vertex_mesh_offset = 0
-        self.bone_count = 0
-        self.flags = 0
-        self.bone_state_change_count = 0
-        self.bone_state_change_offset = 0
-        self.topology_indices_count = 0
-        self.topology_offset = 0
+_STRIP_FIELDS = [('index_count', np.uint32),
+                 ('index_mesh_offset', np.uint32),
+                 ('vertex_count', np.uint32),
+                 ('vertex_mesh_offset', np.uint32),
+                 ('bone_count', np.uint16),
+                 ('flags', np.uint8),
+                 ('bone_state_change_count', np.uint32),
+                 ('bone_state_change_offset', np.uint32),
+                 ]
 
-    def read(self, reader: ByteIO):
-        (self.index_count,
-         self.index_mesh_offset,
-         self.vertex_count,
-         self.vertex_mesh_offset,
-         self.bone_count) = reader.read_fmt('4IH')
-        self.flags = StripHeaderFlags(reader.read_uint8())
-        self.bone_state_change_count, self.bone_state_change_offset = reader.read_fmt('2I')
-        if self.get_value('extra8'):
-            self.topology_indices_count = reader.read_int32()
-            self.topology_offset = reader.read_int32()
-            assert self.topology_offset < reader.size()
-        assert self.bone_state_change_offset < reader.size()
-        assert self.bone_count < 255
+# Strip headers are stored as packed records, all strips of strip group are read with single frombuffer
+strip_dtype = np.dtype(_STRIP_FIELDS)
+strip_dtype_extra8 = np.dtype(_STRIP_FIELDS + [('topology_indices_count', np.int32),
+                                               ('topology_offset', np.int32),
+                                               ])
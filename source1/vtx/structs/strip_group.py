@@ -1,11 +1,9 @@
 from enum import IntFlag
-from typing import List
 
 import numpy as np
 
 from ....source_shared.base import Base
-from ....utilities.byte_io_mdl import ByteIO
-from .strip import Strip
+from .strip import strip_dtype, strip_dtype_extra8
 
 
 class StripGroupFlags(IntFlag):
@@ -16,6 +14,16 @@ class StripGroupFlags(IntFlag):
     SUPPRESS_HW_MORPH = 0x08
 
 
+_STRIP_GROUP_FIELDS = [('vertex_count', np.uint32),
+                       ('vertex_offset', np.uint32),
+                       ('index_count', np.uint32),
+                       ('index_offset', np.uint32),
+                       ('strip_count', np.uint32),
+                       ('strip_offset', np.uint32),
+                       ('flags', np.uint8),
+                       ]
+
+
 class StripGroup(Base):
     vertex_dtype = np.dtype(
         [
@@ -26,45 +34,38 @@ class StripGroup(Base):
 
         ]
     )
+    dtype = np.dtype(_STRIP_GROUP_FIELDS)
+    dtype_extra8 = np.dtype(_STRIP_GROUP_FIELDS + [('topology_indices_count', np.uint32),
+                                                   ('topology_offset', np.uint32),
+                                                   ])
 
     def __init__(self):
         self.flags = StripGroupFlags(0)
         self.vertexes: np.ndarray = np.array([])
         self.indexes: np.ndarray = np.array([])
-        self.strips: List[Strip] = []
+        self.strips: np.ndarray = np.array([], dtype=strip_dtype)
         self.topology = []
 
-    def read(self, reader: ByteIO):
+    @classmethod
+    def get_dtype(cls, extra8: bool):
+        return cls.dtype_extra8 if extra8 else cls.dtype
 
-        entry = reader.tell()
-        vertex_count = reader.read_uint32()
-        vertex_offset = reader.read_uint32()
-        index_count = reader.read_uint32()
-        assert index_count % 3 == 0
-        index_offset = reader.read_uint32()
-        strip_count = reader.read_uint32()
-        strip_offset = reader.read_uint32()
-        assert vertex_offset < reader.size()
-        assert strip_offset < reader.size()
-        assert index_offset < reader.size()
-        self.flags = StripGroupFlags(reader.read_uint8())
-        if self.get_value('extra8'):
-            topology_indices_count = reader.read_uint32()
-            topology_offset = reader.read_uint32()
+    @property
+    def strip_vertex_count(self):
+        return int(self.strips['vertex_count'].sum())
 
-        with reader.save_current_pos():
-            reader.seek(entry + index_offset)
-            self.indexes = np.frombuffer(reader.read(2 * index_count), dtype=np.uint16)
-            reader.seek(entry + vertex_offset)
-            self.vertexes = np.frombuffer(reader.read(vertex_count * self.vertex_dtype.itemsize), self.vertex_dtype)
-            reader.seek(entry + strip_offset)
-            for _ in range(strip_count):
-                strip = Strip()
-                strip.read(reader)
-                self.strips.append(strip)
-            # reader.seek(entry + topology_offset)
-            # self.topology = (
-            #     reader.read_bytes(
-            #         topology_indices_count * 2))
+    def read(self, data: bytes, entry: int, header: np.void, extra8: bool):
+        assert header['index_count'] % 3 == 0
+        assert header['vertex_offset'] < len(data)
+        assert header['strip_offset'] < len(data)
+        assert header['index_offset'] < len(data)
+        self.flags = StripGroupFlags(int(header['flags']))
 
+        # Views over file data, nothing is copied
+        self.indexes = np.frombuffer(data, np.uint16, int(header['index_count']),
+                                     entry + int(header['index_offset']))
+        self.vertexes = np.frombuffer(data, self.vertex_dtype, int(header['vertex_count']),
+                                      entry + int(header['vertex_offset']))
+        self.strips = np.frombuffer(data, strip_dtype_extra8 if extra8 else strip_dtype, int(header['strip_count']),
+                                    entry + int(header['strip_offset']))
         return self
@@ -1,5 +1,6 @@
-import struct
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from .structs.material_replacement_list import MaterialReplacementList
 from ...source_shared.base import Base
@@ -7,36 +8,114 @@ from ...utilities.byte_io_mdl import ByteIO
 
 from .structs.header import Header
 from .structs.bodypart import BodyPart
+from .structs.model import Model
+from .structs.lod import ModelLod
+from .structs.mesh import Mesh
+from .structs.strip_group import StripGroup
+from .structs.strip import strip_dtype, strip_dtype_extra8
 
 
 class Vtx(Base):
     def __init__(self, filepath):
         self.reader = ByteIO(filepath)
         self.header = Header()
+        self.extra8 = False
         self.body_parts = []  # type: List[BodyPart]
         self.material_replacement_lists = []  # type: List[MaterialReplacementList]
 
     def read(self):
         self.header.read(self.reader)
+        self.reader.seek(0)
+        data = self.reader.read()
 
-        try:
-            self.store_value('extra8', False)
-            self.reader.seek(self.header.body_part_offset)
-            for _ in range(self.header.body_part_count):
-                body_part = BodyPart()
-                body_part.read(self.reader)
-                self.body_parts.append(body_part)
-        except (struct.error, AssertionError):
-            self.reader.seek(self.header.body_part_offset)
-            self.body_parts.clear()
-            self.store_value('extra8', True)
-            for _ in range(self.header.body_part_count):
-                body_part = BodyPart()
-                body_part.read(self.reader)
-                self.body_parts.append(body_part)
+        self.extra8 = self.detect_extra8(data)
+        for n in range(self.header.body_part_count):
+            body_part = BodyPart()
+            body_part.read(data, self.header.body_part_offset + n * BodyPart.dtype.itemsize, self.extra8)
+            self.body_parts.append(body_part)
 
         self.reader.seek(self.header.material_replacement_list_offset)
         for _ in range(self.header.lod_count):
             material_replacement_list = MaterialReplacementList()
             material_replacement_list.read(self.reader)
             self.material_replacement_lists.append(material_replacement_list)
+
+    def _iter_mesh_entries(self, data: bytes):
+        """Yields (mesh entry, mesh header) of every mesh, this part of layout does not depend on extra8"""
+        body_parts = np.frombuffer(data, BodyPart.dtype, self.header.body_part_count, self.header.body_part_offset)
+        for n, (model_count, model_offset) in enumerate(body_parts.tolist()):
+            model_entry = self.header.body_part_offset + n * BodyPart.dtype.itemsize + model_offset
+            models = np.frombuffer(data, Model.dtype, model_count, model_entry)
+            for m, (lod_count, lod_offset) in enumerate(models.tolist()):
+                if lod_count <= 0 or lod_offset == 0:
+                    continue
+                lod_entry = model_entry + m * Model.dtype.itemsize + lod_offset
+                lods = np.frombuffer(data, ModelLod.dtype, lod_count, lod_entry)
+                for k, (mesh_count, mesh_offset, _) in enumerate(lods.tolist()):
+                    if mesh_offset <= 0:
+                        continue
+                    mesh_entry = lod_entry + k * ModelLod.dtype.itemsize + mesh_offset
+                    meshes = np.frombuffer(data, Mesh.dtype, mesh_count, mesh_entry)
+                    for i, mesh in enumerate(meshes):
+                        yield mesh_entry + i * Mesh.dtype.itemsize, mesh
+
+    @staticmethod
+    def _is_valid_strip_group(data: bytes, entry: int, header: np.void):
+        size = len(data)
+        vertex_end = int(header['vertex_offset']) + int(header['vertex_count']) * StripGroup.vertex_dtype.itemsize
+        index_end = int(header['index_offset']) + int(header['index_count']) * 2
+        strip_end = int(header['strip_offset']) + int(header['strip_count']) * strip_dtype.itemsize
+        return (header['index_count'] % 3 == 0 and header['flags'] < 0x10 and
+                entry + vertex_end <= size and entry + index_end <= size and entry + strip_end <= size)
+
+    @staticmethod
+    def _is_valid_strip(strip: np.void, strip_group: np.void):
+        return (0 < strip['flags'] < 8 and strip['bone_count'] < 255 and
+                int(strip['index_mesh_offset']) + int(strip['index_count']) <= strip_group['index_count'] and
+                int(strip['vertex_mesh_offset']) + int(strip['vertex_count']) <= strip_group['vertex_count'])
+
+    def _guess_extra8(self, data: bytes, mesh_entry: int, mesh: np.void) -> Optional[bool]:
+        strip_groups_entry = mesh_entry + int(mesh['strip_group_offset'])
+        first_group = np.frombuffer(data, StripGroup.dtype, 1, strip_groups_entry)[0]
+        if not self._is_valid_strip_group(data, strip_groups_entry, first_group):
+            return None
+        candidates = {}
+        for extra8 in (False, True):
+            group_dtype = StripGroup.get_dtype(extra8)
+            one_strip_dtype = strip_dtype_extra8 if extra8 else strip_dtype
+            valid = True
+            if mesh['strip_group_count'] > 1:
+                entry = strip_groups_entry + group_dtype.itemsize
+                if entry + StripGroup.dtype.itemsize > len(data):
+                    valid = False
+                else:
+                    group = np.frombuffer(data, StripGroup.dtype, 1, entry)[0]
+                    valid = self._is_valid_strip_group(data, entry, group)
+            if valid and first_group['strip_count'] > 1:
+                strip_entry = strip_groups_entry + int(first_group['strip_offset']) + one_strip_dtype.itemsize
+                if strip_entry + strip_dtype.itemsize > len(data):
+                    valid = False
+                else:
+                    valid = self._is_valid_strip(np.frombuffer(data, strip_dtype, 1, strip_entry)[0], first_group)
+            candidates[extra8] = valid
+        if candidates[False] != candidates[True]:
+            return candidates[True]
+        return None
+
+    def detect_extra8(self, data: bytes):
+        """Detects 8 byte topology extension of strip group and strip headers (CS:GO, L4D2 era models).
+
+        Layouts differ only from second strip group/strip onward, so first element whose neighbour
+        is valid in only one of the layouts decides. Files without such element parse same either way.
+        """
+        for mesh_entry, mesh in self._iter_mesh_entries(data):
+            if mesh['strip_group_offset'] == 0 or mesh['strip_group_count'] == 0:
+                continue
+            if mesh['strip_group_count'] < 2:
+                first_group = np.frombuffer(data, StripGroup.dtype, 1, mesh_entry + int(mesh['strip_group_offset']))
+                if first_group[0]['strip_count'] < 2:
+                    continue
+            extra8 = self._guess_extra8(data, mesh_entry, mesh)
+            if extra8 is not None:
+                return extra8
+        return False
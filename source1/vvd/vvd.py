@@ -3,7 +3,6 @@ from typing import List, Dict
 import numpy as np
 
 from .structs.header import Header
-from .structs.fixup import Fixup
 from ...source_shared.base import Base
 from ...utilities.byte_io_mdl import ByteIO
 
@@ -17,12 +16,17 @@ class Vvd(Base):
                          ("uv", np.float32, 2),
                          ])
 
+    fixup_t = np.dtype([('lod_index', np.uint32),
+                        ('vertex_index', np.uint32),
+                        ('vertex_count', np.uint32),
+                        ])
+
     def __init__(self, filepath):
         self.reader = ByteIO(filepath)
         self.header = Header()
         self._vertices = np.array([], dtype=self.vertex_t)
-        self.fixups = []  # type:List[Fixup]
-        self.lod_data = {}  # type:Dict[int,np.ndarray]
+        self.fixups = np.array([], dtype=self.fixup_t)
+        self.lod_data = LodData(self)  # type:Dict[int,np.ndarray]
 
     def read(self):
         self.header.read(self.reader)
@@ -31,29 +35,42 @@ class Vvd(Base):
         self._vertices = np.frombuffer(self.reader.read(self.vertex_t.itemsize * self.header.lod_vertex_count[0]),
                                        dtype=self.vertex_t)
 
-        for n, count in enumerate(self.header.lod_vertex_count[:self.header.lod_count]):
-            self.lod_data[n] = np.zeros((count,), dtype=self.vertex_t)
-
         self.reader.seek(self.header.fixup_table_offset)
-        for _ in range(self.header.fixup_count):
-            fixup = Fixup()
-            fixup.read(self.reader)
-            self.fixups.append(fixup)
-
-        if self.header.fixup_count:
-            lod_offsets = np.zeros(len(self.lod_data), dtype=np.uint32)
-            for lod_id in range(self.header.lod_count):
-                for fixup in self.fixups:
-                    if fixup.lod_index >= lod_id:
-                        lod_data = self.lod_data[lod_id]
-                        assert fixup.vertex_index + fixup.vertex_count <= self._vertices.size, \
-                            f"{fixup.vertex_index + fixup.vertex_count}>{self._vertices.size}"
-                        lod_offset = lod_offsets[lod_id]
-                        vertex_index = fixup.vertex_index
-                        vertex_count = fixup.vertex_count
-                        lod_data[lod_offset:lod_offset + vertex_count] = self._vertices[
-                                                                         vertex_index:vertex_index + vertex_count]
-                        lod_offsets[lod_id] += fixup.vertex_count
-
-        else:
-            self.lod_data[0][:] = self._vertices[:]
+        self.fixups = np.frombuffer(self.reader.read(self.fixup_t.itemsize * self.header.fixup_count),
+                                    dtype=self.fixup_t)
+        self.lod_data.clear()
+
+    def build_lod(self, lod_id):
+        """Gathers vertices of single LOD with one fancy index built from fixup table"""
+        if not 0 <= lod_id < self.header.lod_count:
+            raise KeyError(lod_id)
+        lod_vertex_count = self.header.lod_vertex_count[lod_id]
+        if not self.fixups.size:
+            return self._vertices[:lod_vertex_count]
+
+        fixups = self.fixups[self.fixups['lod_index'] >= lod_id]
+        starts = fixups['vertex_index'].astype(np.int64)
+        counts = fixups['vertex_count'].astype(np.int64)
+        assert not counts.size or (starts + counts).max() <= self._vertices.size, \
+            f"{(starts + counts).max()}>{self._vertices.size}"
+        # Output position of each fixup run, every run continues from its own vertex_index
+        run_offsets = np.cumsum(counts) - counts
+        indices = np.arange(counts.sum(), dtype=np.int64) - np.repeat(run_offsets - starts, counts)
+        if indices.size == lod_vertex_count:
+            return self._vertices[indices]
+        lod_vertices = np.zeros((lod_vertex_count,), dtype=self.vertex_t)
+        used_count = min(lod_vertex_count, indices.size)
+        lod_vertices[:used_count] = self._vertices[indices[:used_count]]
+        return lod_vertices
+
+
+class LodData(dict):
+    """LOD id -> vertex table, each LOD is built on first access"""
+
+    def __init__(self, vvd: Vvd):
+        super().__init__()
+        self._vvd = vvd
+
+    def __missing__(self, lod_id):
+        lod_vertices = self[lod_id] = self._vvd.build_lod(lod_id)
+        return lod_vertices
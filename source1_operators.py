@@ -1,10 +1,13 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
 from bpy.props import StringProperty, BoolProperty, CollectionProperty, EnumProperty, FloatProperty
 
+from .bpy_utilities.logging import flush_logs
 from .bpy_utilities.material_loader.material_loader import Source1MaterialLoader
+from .bpy_utilities.material_loader.shader_base import ShaderBase
 from .source1.bsp.import_bsp import BSP
 from .source1.dmx.sfm.session import Session
 from .source1.vtf.export_vtf import export_texture
@@ -13,6 +16,8 @@ from .source_shared.content_manager import ContentManager
 from .utilities.math_utilities import HAMMER_UNIT_TO_METERS
 from .utilities.path_utilities import backwalk_file_resolver, find_vtx
 
+MAX_PARSE_WORKERS = 2
+
 
 # noinspection PyUnresolvedReferences,PyPep8Naming
 class MDLImport_OT_operator(bpy.types.Operator):
@@ -28,9 +33,11 @@ class MDLImport_OT_operator(bpy.types.Operator):
 
     create_flex_drivers: BoolProperty(name="Create drivers for flexes", default=False, subtype='UNSIGNED')
     import_textures: BoolProperty(name="Import materials", default=True, subtype='UNSIGNED')
+    import_animations: BoolProperty(name="Import animations", default=False, subtype='UNSIGNED')
     scale: FloatProperty(name="World scale", default=HAMMER_UNIT_TO_METERS, precision=6)
     filter_glob: StringProperty(default="*.mdl", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -42,27 +49,38 @@ class MDLImport_OT_operator(bpy.types.Operator):
 
         bpy.context.scene['content_manager_data'] = content_manager.serialize()
 
-        from .source1.mdl.import_mdl import import_model, import_materials
-        for file in self.files:
-            mdl_path = directory / file.name
-            vtx_file = find_vtx(mdl_path)
-            vvd_file = backwalk_file_resolver(directory, mdl_path.stem + '.vvd')
-
-            model_container = import_model(mdl_path.open('rb'), vvd_file.open('rb'), vtx_file.open('rb'), self.scale,
-                                           self.create_flex_drivers)
-
-            if self.import_textures:
-                try:
-                    import_materials(model_container.mdl)
-                except Exception as t_ex:
-                    print(f'Failed to import materials, caused by {t_ex}')
-                    import traceback
-                    traceback.print_exc()
-            if self.write_qc:
-                from .source1.qc.qc import generate_qc
-                from . import bl_info
-                qc_file = bpy.data.texts.new('{}.qc'.format(Path(file.name).stem))
-                generate_qc(model_container.mdl, qc_file, ".".join(map(str, bl_info['version'])))
+        from .source1.mdl.import_mdl import parse_model, build_model, import_materials, import_animations
+
+        # Parsing does not touch bpy, so files are parsed in worker threads while main thread builds
+        # Blender objects from already parsed models in selection order.
+        # Parsing is mostly pure Python and holds the GIL, so more workers do not help,
+        # threads only overlap file reads and NumPy work with building on main thread
+        max_workers = max(1, min(MAX_PARSE_WORKERS, os.cpu_count() or 1, len(self.files)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parse_jobs = []
+            for file in self.files:
+                mdl_path = directory / file.name
+                vtx_file = find_vtx(mdl_path)
+                vvd_file = backwalk_file_resolver(directory, mdl_path.stem + '.vvd')
+                parse_jobs.append((file, executor.submit(parse_model, mdl_path, vvd_file, vtx_file)))
+
+            for file, parse_job in parse_jobs:
+                model_container = build_model(parse_job.result(), self.scale, self.create_flex_drivers)
+
+                if self.import_textures:
+                    try:
+                        import_materials(model_container.mdl)
+                    except Exception as t_ex:
+                        print(f'Failed to import materials, caused by {t_ex}')
+                        import traceback
+                        traceback.print_exc()
+                if self.import_animations and model_container.armature:
+                    import_animations(model_container.mdl, model_container.armature, self.scale)
+                if self.write_qc:
+                    from .source1.qc.qc import generate_qc
+                    from . import bl_info
+                    qc_file = bpy.data.texts.new('{}.qc'.format(Path(file.name).stem))
+                    generate_qc(model_container.mdl, qc_file, ".".join(map(str, bl_info['version'])))
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -81,9 +99,11 @@ class BSPImport_OT_operator(bpy.types.Operator):
     filepath: StringProperty(subtype="FILE_PATH")
     scale: FloatProperty(name="World scale", default=HAMMER_UNIT_TO_METERS, precision=6)
     import_textures: BoolProperty(name="Import materials", default=True, subtype='UNSIGNED')
+    arrange_nodes: BoolProperty(name="Arrange material nodes", default=True, subtype='UNSIGNED')
 
     filter_glob: StringProperty(default="*.bsp", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
         content_manager = ContentManager()
         content_manager.scan_for_content(self.filepath)
@@ -91,12 +111,16 @@ class BSPImport_OT_operator(bpy.types.Operator):
         bsp_map = BSP(self.filepath, scale=self.scale)
         bpy.context.scene['content_manager_data'] = content_manager.serialize()
 
-        bsp_map.load_disp()
-        bsp_map.load_entities()
-        bsp_map.load_static_props()
-        # bsp_map.load_detail_props()
-        if self.import_textures:
-            bsp_map.load_materials()
+        ShaderBase.arrange_nodes = self.arrange_nodes
+        try:
+            bsp_map.load_disp()
+            bsp_map.load_entities()
+            bsp_map.load_static_props()
+            # bsp_map.load_detail_props()
+            if self.import_textures:
+                bsp_map.load_materials()
+        finally:
+            ShaderBase.arrange_nodes = True
 
         return {'FINISHED'}
 
@@ -118,6 +142,7 @@ class DMXImporter_OT_operator(bpy.types.Operator):
     project_dir: StringProperty(default='', name='SFM project folder (usermod)')
     filter_glob: StringProperty(default="*.dmx", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
         directory = Path(self.filepath).parent.absolute()
         preferences = context.preferences
@@ -149,6 +174,7 @@ class VTFImport_OT_operator(bpy.types.Operator):
     files: CollectionProperty(name='File paths', type=bpy.types.OperatorFileListElement)
     filter_glob: StringProperty(default="*.vtf", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
         if Path(self.filepath).is_file():
             directory = Path(self.filepath).parent.absolute()
@@ -178,6 +204,7 @@ class VMTImport_OT_operator(bpy.types.Operator):
     filter_glob: StringProperty(default="*.vmt", options={'HIDDEN'})
     override: BoolProperty(default=False, name='Override existing?')
 
+    @flush_logs
     def execute(self, context):
         if Path(self.filepath).is_file():
             directory = Path(self.filepath).parent.absolute()
@@ -253,6 +280,7 @@ class VTFExport_OT_operator(bpy.types.Operator):
         default='0'
     )
 
+    @flush_logs
     def execute(self, context):
         sima = context.space_data
         ima = sima.image
@@ -9,13 +9,22 @@ class DataBlock:
 
         self._valve_file: ValveCompiledFile = valve_file
         self.info_block: InfoBlock = info_block
-
-        with self._valve_file.reader.save_current_pos():
-            self._valve_file.reader.seek(self.info_block.absolute_offset)
-            self.reader = ByteIO(self._valve_file.reader.read(self.info_block.block_size))
+        self._reader = None
         self.data = {}
         self.parsed = False
 
+    @property
+    def buffer(self) -> memoryview:
+        """Read-only window onto block bytes inside parent file, nothing is copied"""
+        offset = self.info_block.absolute_offset
+        return self._valve_file.buffer[offset:offset + self.info_block.block_size]
+
+    @property
+    def reader(self) -> ByteIO:
+        if self._reader is None:
+            self._reader = ByteIO(self.buffer.tobytes())
+        return self._reader
+
     def read(self):
         self.parsed = True
         raise NotImplementedError()
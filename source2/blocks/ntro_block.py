@@ -1,5 +1,7 @@
 from enum import IntEnum
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from ...utilities.byte_io_mdl import ByteIO
 from ..common import Matrix, CTransform
@@ -61,6 +63,37 @@ kv_type_to_c_type = {
 }
 
 
+_FIXED_LAYOUT_TYPES = {
+    KeyValueDataType.UBYTE: np.dtype(np.uint8),
+    KeyValueDataType.BYTE: np.dtype(np.int8),
+    KeyValueDataType.SHORT: np.dtype('<i2'),
+    KeyValueDataType.USHORT: np.dtype('<u2'),
+    KeyValueDataType.INTEGER: np.dtype('<i4'),
+    KeyValueDataType.UINTEGER: np.dtype('<u4'),
+    KeyValueDataType.INT64: np.dtype('<i8'),
+    KeyValueDataType.UINT64: np.dtype('<u8'),
+    KeyValueDataType.FLOAT: np.dtype('<f4'),
+    KeyValueDataType.VECTOR2: np.dtype(('<f4', (2,))),
+    KeyValueDataType.VECTOR3: np.dtype(('<f4', (3,))),
+    KeyValueDataType.VECTOR4: np.dtype(('<f4', (4,))),
+    KeyValueDataType.QUATERNION: np.dtype(('<f4', (4,))),
+    KeyValueDataType.Fltx4: np.dtype(('<f4', (4,))),
+    KeyValueDataType.COLOR: np.dtype(('<f4', (4,))),
+    KeyValueDataType.Vector4D_44: np.dtype(('<f4', (4,))),
+    KeyValueDataType.BOOLEAN: np.dtype(np.bool_),
+}
+
+
+def _record_converter(dtype: np.dtype):
+    """Returns function that turns tolist() output of given dtype into read_field_data compatible values"""
+    if dtype.names is not None:
+        converters = [(name, _record_converter(dtype.fields[name][0])) for name in dtype.names]
+        return lambda record: {name: convert(value) for (name, convert), value in zip(converters, record)}
+    if dtype.subdtype is not None:
+        return lambda value: tuple(value.tolist())
+    return lambda value: value
+
+
 class NTRO(DataBlock):
     def __init__(self, valve_file, info_block):
         super().__init__(valve_file, info_block)
@@ -112,6 +145,9 @@ class NTRO(DataBlock):
 
 
 class NTROStruct:
+    # Compiled layouts shared between resources, keyed by (name, CRC)
+    dtype_cache = {}
+
     def __init__(self, ntro_block: NTRO):
         self.ntro_block = ntro_block
         self.introspection_version = 0
@@ -169,6 +205,29 @@ class NTROStruct:
         # print(struct_data)
         return struct_data
 
+    def get_dtype(self) -> Optional[np.dtype]:
+        """Structured dtype of struct or None if it has pointers, strings or other variable layout fields"""
+        key = (self.name, self.disc_crc)
+        if key not in self.dtype_cache:
+            self.dtype_cache[key] = self._compile_dtype()
+        return self.dtype_cache[key]
+
+    def _compile_dtype(self):
+        if not self.fields:
+            return None
+        names, formats, offsets = [], [], []
+        for field in self.fields:
+            field_dtype = field.get_dtype()
+            if field_dtype is None:
+                return None
+            names.append(field.name)
+            formats.append(field_dtype)
+            offsets.append(field.on_disc_size)
+        try:
+            return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': self.disc_size})
+        except ValueError:
+            return None
+
     def as_c_struct(self):
         buff = 'struct '
         buff += self.name + '{\n'
@@ -252,31 +311,41 @@ class NTROStructField:
                 #         return data
             else:
                 raise NotImplementedError("Unknown indirection. ({0})".format(hex(indir)))
-            if self.count > 0 and self.indirection_level > 0:
-                array = []
-                with reader.save_current_pos():
-                    reader.seek(entry + offset)
-                    for _ in range(count):
-                        data = self.read_field_data(reader)
-                        array.append(data)
-                if exit_point:
-                    reader.seek(exit_point)
-                return array
-            else:
-                array = []
-                with reader.save_current_pos():
-                    reader.seek(entry + offset)
-                    for _ in range(count):
-                        data = self.read_field_data(reader)
-                        array.append(data)
-                if exit_point:
-                    reader.seek(exit_point)
-                return array
+            array = self.read_array(reader, entry + offset, count, indir == 0x04)
+            if exit_point:
+                reader.seek(exit_point)
+            return array
         else:
             if exit_point:
                 reader.seek(exit_point)
             return self.read_field_data(reader)
 
+    def get_element_dtype(self) -> Optional[np.dtype]:
+        if self.type == KeyValueDataType.STRUCT:
+            struct = self.struct.ntro_block.get_struct_by_id(self.data_type)
+            return struct.get_dtype() if isinstance(struct, NTROStruct) else None
+        return _FIXED_LAYOUT_TYPES.get(self.type, None)
+
+    def get_dtype(self) -> Optional[np.dtype]:
+        if self.indirection_bytes:
+            return None
+        # read_field only reads first element of inline fields, layout matches that
+        return self.get_element_dtype()
+
+    def read_array(self, reader: ByteIO, offset, count, homogeneous):
+        """Reads count elements at offset, fixed layout arrays are decoded with single frombuffer"""
+        element_dtype = self.get_element_dtype() if homogeneous else None
+        with reader.save_current_pos():
+            reader.seek(offset)
+            if element_dtype is not None:
+                array = np.frombuffer(reader.read(count * element_dtype.itemsize), element_dtype, count)
+                if element_dtype.names is None:
+                    return array
+                # Struct arrays keep the same list of dicts layout as read_struct returns
+                to_dict = _record_converter(element_dtype)
+                return [to_dict(record) for record in array.tolist()]
+            return [self.read_field_data(reader) for _ in range(count)]
+
     def read_field_data(self, reader):
         # print(self.name,self.type.name)
         if self.type == KeyValueDataType.STRUCT:
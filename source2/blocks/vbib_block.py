@@ -1,3 +1,4 @@
+import struct
 from enum import IntEnum
 from typing import List, Dict
 import numpy as np
@@ -18,11 +19,23 @@ except ImportError:
     print("Failed to import native binary!\nUsing python version")
     from ..utils.compressed_buffers import decode_vertex_buffer, decode_index_buffer
 
-from ..utils.compressed_buffers import get_slice
-from ...utilities.byte_io_mdl import ByteIO
-
 from .dummy import DataBlock
 
+_BUFFER_HEADER = struct.Struct('<4I')
+_BUFFER_DATA = struct.Struct('<2I')
+_BUFFER_SIZE = 24
+_ATTRIBUTE = struct.Struct('<36siI12x')
+
+
+def _with_itemsize(dtype: np.dtype, itemsize: int):
+    """Pads structured dtype to vertex stride so array can view interleaved vertex data in place"""
+    if dtype.itemsize >= itemsize:
+        return dtype
+    return np.dtype({'names': dtype.names,
+                     'formats': [dtype.fields[name][0] for name in dtype.names],
+                     'offsets': [dtype.fields[name][1] for name in dtype.names],
+                     'itemsize': itemsize})
+
 
 class DxgiFormat(IntEnum):
     UNKNOWN = 0,
@@ -155,7 +168,6 @@ class VertexBuffer:
         self.total_size = 0
         self.attributes = []  # type:List[VertexAttribute]
         self.attribute_names = []  # type:List[str]
-        self.buffer = ByteIO()  # type: ByteIO
         self.vertexes = np.array([])  # type: np.ndarray
 
     def __repr__(self):
@@ -167,51 +179,45 @@ class VertexBuffer:
                'vertex attributes: {} >'.format(self.vertex_count, len(self.attributes), self.vertex_size, buff, )
 
     def construct_dtype(self):
-        numpy_dtype = []
-        for attrib in self.attributes:
-            numpy_dtype.append((attrib.name, *attrib.get_struct()))
-        return np.dtype(numpy_dtype)
-
-    def read(self, reader: ByteIO):
-        self.vertex_count = reader.read_uint32()
-        self.vertex_size = reader.read_uint32()
-        entry = reader.tell()
-        attributes_offset = reader.read_uint32()
-        attributes_count = reader.read_uint32()
-        with reader.save_current_pos():
-            reader.seek(entry + attributes_offset)
-            used_names = []
-            for _ in range(attributes_count):
-                v_attrib = VertexAttribute()
-                v_attrib.read(reader)
-                if v_attrib.name in used_names:
-                    tmp = v_attrib.name
-                    v_attrib.name += f"_{used_names.count(v_attrib.name)}"
-                    used_names.append(tmp)
-                else:
-                    used_names.append(v_attrib.name)
-                self.attribute_names.append(v_attrib.name)
-                self.attributes.append(v_attrib)
-
-        entry = reader.tell()
-        self.offset = reader.read_uint32()
-        self.total_size = reader.read_uint32()
-        with reader.save_current_pos():
-            reader.seek(entry + self.offset)
-            if self.total_size != self.vertex_size * self.vertex_count:
-                data = reader.read(self.total_size)
-                self.buffer.write_bytes(decode_vertex_buffer(data, self.vertex_size, self.vertex_count))
+        return np.dtype({'names': [attrib.name for attrib in self.attributes],
+                         'formats': [attrib.get_struct() for attrib in self.attributes],
+                         'offsets': [attrib.offset for attrib in self.attributes]})
+
+    def read(self, buffer: memoryview, offset: int):
+        """Reads buffer header at offset, vertexes become structured view over block memory"""
+        header = _BUFFER_HEADER.unpack_from(buffer, offset)
+        self.vertex_count, self.vertex_size, attributes_offset, attributes_count = header
+        attributes_offset += offset + 8
+        used_names = []
+        for n in range(attributes_count):
+            v_attrib = VertexAttribute()
+            v_attrib.read(buffer, attributes_offset + n * VertexAttribute.SIZE)
+            if v_attrib.name in used_names:
+                tmp = v_attrib.name
+                v_attrib.name += f"_{used_names.count(v_attrib.name)}"
+                used_names.append(tmp)
             else:
-                self.buffer.write_bytes(reader.read(self.vertex_count * self.vertex_size))
-            self.buffer.seek(0)
-        self.read_buffer()
+                used_names.append(v_attrib.name)
+            self.attribute_names.append(v_attrib.name)
+            self.attributes.append(v_attrib)
 
-    def read_buffer(self):
+        data_entry = offset + 16
+        self.offset, self.total_size = _BUFFER_DATA.unpack_from(buffer, data_entry)
+        data_offset = data_entry + self.offset
         vertex_dtype = self.construct_dtype()
-        self.vertexes = np.frombuffer(self.buffer.read(vertex_dtype.itemsize * self.vertex_count), vertex_dtype)
+        if self.total_size != self.vertex_size * self.vertex_count:
+            data = bytes(buffer[data_offset:data_offset + self.total_size])
+            data = decode_vertex_buffer(data, self.vertex_size, self.vertex_count)
+            data_offset = 0
+        else:
+            data = buffer
+        self.vertexes = np.ndarray((self.vertex_count,), dtype=_with_itemsize(vertex_dtype, self.vertex_size),
+                                   buffer=data, offset=data_offset)
 
 
 class VertexAttribute:
+    SIZE = 56
+
     def __init__(self):
         self.name = ''
         self.format = DxgiFormat(0)  # type:DxgiFormat
@@ -222,13 +228,10 @@ class VertexAttribute:
     def __repr__(self):
         return '<VertexAttribute "{}" format:{} offset:{}>'.format(self.name, self.format.name, self.offset)
 
-    def read(self, reader: ByteIO):
-        entry = reader.tell()
-        self.name = reader.read_ascii_string()
-        reader.seek(entry + 36)
-        self.format = DxgiFormat(reader.read_int32())
-        self.offset = reader.read_uint32()
-        reader.skip(12)
+    def read(self, buffer: memoryview, offset: int):
+        name, attrib_format, self.offset = _ATTRIBUTE.unpack_from(buffer, offset)
+        self.name = name.split(b'\x00', 1)[0].decode('latin', errors='replace')
+        self.format = DxgiFormat(attrib_format)
 
     def get_struct(self):
         if self.format == DxgiFormat.R32G32B32_FLOAT:
@@ -275,35 +278,25 @@ class IndexBuffer:
         self.unk1 = 0
         self.unk2 = 0
         self.total_size = 0
-        self.buffer = ByteIO()  # type:ByteIO
         self.indexes: np.ndarray = np.zeros(0)
 
     def __repr__(self):
         return '<IndexBuffer indexes:{} size:{}>'.format(self.index_count, self.index_size)
 
-    def read(self, reader: ByteIO):
-        self.index_count = reader.read_uint32()
-        self.index_size = reader.read_uint32()
-        self.unk1 = reader.read_uint32()
-        self.unk2 = reader.read_uint32()
-        entry = reader.tell()
-        self.offset = reader.read_uint32()
-        self.total_size = reader.read_uint32()
-        with reader.save_current_pos():
-            reader.seek(entry + self.offset)
-            if self.total_size != self.index_size * self.index_count:
-                self.buffer.write_bytes(decode_index_buffer(reader.read(self.total_size),
-                                                            self.index_size, self.index_count))
-            else:
-                self.buffer.write_bytes(reader.read(self.index_count * self.index_size))
-
-        self.buffer.seek(0)
-        self.read_buffer()
-
-    def read_buffer(self):
+    def read(self, buffer: memoryview, offset: int):
+        """Reads buffer header at offset, indexes become (N, 3) view over block memory"""
+        self.index_count, self.index_size, self.unk1, self.unk2 = _BUFFER_HEADER.unpack_from(buffer, offset)
+        data_entry = offset + 16
+        self.offset, self.total_size = _BUFFER_DATA.unpack_from(buffer, data_entry)
+        data_offset = data_entry + self.offset
+        if self.total_size != self.index_size * self.index_count:
+            data = bytes(buffer[data_offset:data_offset + self.total_size])
+            data = decode_index_buffer(data, self.index_size, self.index_count)
+            data_offset = 0
+        else:
+            data = buffer
         index_dtype = np.uint32 if self.index_size == 4 else np.uint16
-        self.indexes = np.frombuffer(self.buffer.read(self.index_count * self.index_size), index_dtype)
-        self.indexes = self.indexes.reshape((-1, 3))
+        self.indexes = np.frombuffer(data, index_dtype, self.index_count, data_offset).reshape((-1, 3))
 
 
 class VBIB(DataBlock):
@@ -321,22 +314,16 @@ class VBIB(DataBlock):
         return '<VBIB vertex buffers:{} index buffers:{}>'.format(self.vertex_count, self.index_count)
 
     def read(self):
-        reader = self.reader
-        self.vertex_offset = reader.read_uint32()
-        self.vertex_count = reader.read_uint32()
-        entry = reader.tell()
-        self.index_offset = reader.read_uint32()
-        self.index_count = reader.read_uint32()
-        with reader.save_current_pos():
-            reader.seek(self.vertex_offset)
-            for _ in range(self.vertex_count):
-                v_buffer = VertexBuffer()
-                v_buffer.read(reader)
-                self.vertex_buffer.append(v_buffer)
-
-        with reader.save_current_pos():
-            reader.seek(entry + self.index_offset)
-            for _ in range(self.index_count):
-                i_buffer = IndexBuffer()
-                i_buffer.read(reader)
-                self.index_buffer.append(i_buffer)
+        # Parse straight from file view, vertex/index arrays stay views into it
+        buffer = self.buffer
+        self.vertex_offset, self.vertex_count, self.index_offset, self.index_count = _BUFFER_HEADER.unpack_from(buffer)
+        for n in range(self.vertex_count):
+            v_buffer = VertexBuffer()
+            v_buffer.read(buffer, self.vertex_offset + n * _BUFFER_SIZE)
+            self.vertex_buffer.append(v_buffer)
+
+        index_entry = 8 + self.index_offset
+        for n in range(self.index_count):
+            i_buffer = IndexBuffer()
+            i_buffer.read(buffer, index_entry + n * _BUFFER_SIZE)
+            self.index_buffer.append(i_buffer)
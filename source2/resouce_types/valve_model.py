@@ -15,7 +15,8 @@ from ..common import convert_normals
 from ..source2 import ValveCompiledFile
 import numpy as np
 
-from ...bpy_utilities.utils import get_material, get_or_create_collection, get_new_unique_collection
+from ...bpy_utilities.utils import get_material, get_or_create_collection, get_new_unique_collection, \
+    fill_triangle_mesh
 from ...source_shared.content_manager import ContentManager
 
 
@@ -136,7 +137,8 @@ class ValveCompiledModel(ValveCompiledFile):
                     mesh_obj_original = bpy.data.objects.get(model_name, None)
                     mesh_data_original = bpy.data.meshes.get(f'{model_name}_mesh', False)
                     if mesh_obj_original and mesh_data_original:
-                        model_mesh = mesh_data_original.copy()
+                        # Linked duplicate, mesh data is shared with the original object
+                        model_mesh = mesh_data_original
                         mesh_obj = mesh_obj_original.copy()
                         mesh_obj['skin_groups'] = mesh_obj_original['skin_groups']
                         mesh_obj['active_skin'] = mesh_obj_original['active_skin']
@@ -191,23 +193,21 @@ class ValveCompiledModel(ValveCompiledFile):
                 if normals.dtype.char == 'B' and normals.shape[1] == 4:
                     normals = convert_normals(normals)
 
-                mesh.from_pydata(used_vertices, [],
-                                 index_buffer.indexes[start_index:start_index + index_count].tolist())
-                mesh.update()
+                triangles = index_buffer.indexes[start_index:start_index + index_count]
+                fill_triangle_mesh(mesh, used_vertices, triangles)
+                vertex_indices = triangles.reshape(-1)
                 n = 0
                 for attrib in vertex_buffer.attributes:
                     if 'TEXCOORD' in attrib.name.upper():
-                        uv_layer = vertex_buffer.vertexes[attrib.name].copy()
+                        uv_layer = vertex_buffer.vertexes[attrib.name][used_range]
                         if uv_layer.shape[1] != 2:
                             continue
+                        new_uv_data = uv_layer[vertex_indices].astype(np.float32)
                         if invert_uv:
-                            uv_layer[:, 1] = np.subtract(1, uv_layer[:, 1])
+                            new_uv_data[:, 1] = np.subtract(1, new_uv_data[:, 1])
 
                         uv_data = mesh.uv_layers.new(name=attrib.name).data
-                        vertex_indices = np.zeros((len(mesh.loops, )), dtype=np.uint32)
-                        mesh.loops.foreach_get('vertex_index', vertex_indices)
-                        new_uv_data = uv_layer[used_range][vertex_indices]
-                        uv_data.foreach_set('uv', new_uv_data.flatten())
+                        uv_data.foreach_set('uv', new_uv_data.reshape(-1))
                         n += 1
                 if armature:
                     model_skeleton = data_block.data['m_modelSkeleton']
@@ -239,6 +239,7 @@ class ValveCompiledModel(ValveCompiledFile):
                                 bone_name = new_bone_names[remap_table[remaps_start:][int(bone_index)]]
                                 weight_groups[bone_name].add([n], 1.0, 'REPLACE')
 
+                mesh.validate()
                 mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons)))
                 mesh.normals_split_custom_set_from_vertices(normals)
                 mesh.use_auto_smooth = True
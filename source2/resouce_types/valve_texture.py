@@ -12,7 +12,7 @@ class ValveCompiledTexture(ValveCompiledFile):
     def __init__(self, path_or_file):
         super().__init__(path_or_file)
 
-    def load(self,name, flip: bool):
+    def load(self, name, flip: bool, postprocess=None):
         print(f'Loading {name} texture')
         if name + '.tga' in bpy.data.images:
             print('Using already loaded texture')
@@ -32,8 +32,10 @@ class ValveCompiledTexture(ValveCompiledFile):
         image.filepath_raw = f'{name}.tga'
 
         if pixel_data.shape[0] > 0:
+            if postprocess is not None:
+                postprocess(image, pixel_data)
             if bpy.app.version > (2, 83, 0):
-                image.pixels.foreach_set(pixel_data.tolist())
+                image.pixels.foreach_set(pixel_data)
             else:
                 image.pixels[:] = pixel_data.tolist()
         image.pack()
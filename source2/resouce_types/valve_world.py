@@ -14,7 +14,6 @@ from ..source2 import ValveCompiledFile
 from ..utils.entity_keyvalues import EntityKeyValues
 from ...bpy_utilities.logging import BPYLoggingManager, BPYLogger
 from ...source_shared.content_manager import ContentManager
-from ...utilities.byte_io_mdl import ByteIO
 from ...utilities.math_utilities import parse_hammer_vector, convert_rotation_source2_to_blender
 from ...bpy_utilities.utils import get_new_unique_collection, get_or_create_collection
 
@@ -115,11 +114,7 @@ class ValveCompiledWorld(ValveCompiledFile):
 
     def load_entity_lump(self, lump_name, entity_lump):
         entity_data_block = entity_lump.get_data_block(block_name='DATA')[0]
-        for entity_kv in entity_data_block.data['m_entityKeyValues']:
-            a = EntityKeyValues()
-            reader = ByteIO(entity_kv['m_keyValuesData'])
-            a.read(reader)
-            entity_data = a.base
+        for entity_data in EntityKeyValues.read_entity_lump(entity_data_block.data['m_entityKeyValues']):
             class_name: str = entity_data['classname']
 
             if class_name.startswith('npc_'):
@@ -127,13 +122,13 @@ class ValveCompiledWorld(ValveCompiledFile):
             if class_name.startswith('prop_'):
                 self.handle_model(class_name, entity_data)
             elif class_name == 'light_omni':
-                self.load_light(a.base, "POINT")
+                self.load_light(entity_data, "POINT")
             elif class_name == 'light_ortho':
-                self.load_light(a.base, "AREA")
+                self.load_light(entity_data, "AREA")
             elif class_name == 'light_spot':
-                self.load_light(a.base, "SPOT")
+                self.load_light(entity_data, "SPOT")
             elif class_name == 'light_sun':
-                self.load_light(a.base, "SUN")
+                self.load_light(entity_data, "SUN")
 
     def handle_model(self, entity_class, entity_data):
         entity_name = get_entity_name(entity_data)
@@ -1,4 +1,6 @@
+import io
 import math
+import mmap
 import sys
 from pathlib import Path
 from typing import List, BinaryIO, Union, Optional, TypeVar
@@ -22,10 +24,45 @@ class ValveCompiledFile:
         self.info_blocks = []  # type: List[InfoBlock]
         self.data_blocks = []  # type: List[Union[DataBlock,None]]
         self.available_resources = {}
+        self._buffer: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
 
         self.read_block_info()
         self.check_external_resources()
 
+    @property
+    def buffer(self) -> memoryview:
+        """Whole file as memoryview, shared by all data blocks"""
+        if self._buffer is None:
+            file = self.reader.file
+            if hasattr(file, 'getbuffer'):
+                self._buffer = file.getbuffer()
+            else:
+                try:
+                    self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._buffer = memoryview(self._mmap)
+                except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                    with self.reader.save_current_pos():
+                        self.reader.seek(0)
+                        self._buffer = memoryview(self.reader.read())
+        return self._buffer
+
+    def release_buffer(self):
+        """Releases file mapping so file is not locked, buffer is mapped again on next access"""
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Something still holds a view into the map, it is unmapped once that view is collected
+                pass
+            self._mmap = None
+
+    def __del__(self):
+        self.release_buffer()
+
     def read_block_info(self):
         self.info_blocks.clear()
         self.data_blocks.clear()
@@ -40,14 +77,11 @@ class ValveCompiledFile:
             block_info = self.info_blocks[i]
             if self.data_blocks[i] is not None:
                 continue
-            with self.reader.save_current_pos():
-                self.reader.seek(block_info.entry + block_info.block_offset)
-                block_class = self.get_data_block_class(block_info.block_name)
-                if block_class is None:
-                    self.data_blocks[self.info_blocks.index(block_info)] = None
-                    continue
-                block = block_class(self, block_info)
-                self.data_blocks[self.info_blocks.index(block_info)] = block
+            block_class = self.get_data_block_class(block_info.block_name)
+            if block_class is None:
+                self.data_blocks[i] = None
+                continue
+            self.data_blocks[i] = block_class(self, block_info)
 
     def get_data_block(self, *, block_id: Optional[int] = None, block_name: Optional[str] = None) \
             -> Union[DataBlock, List[DataBlock], None, TypeVar('DATA')]:
@@ -60,9 +94,9 @@ class ValveCompiledFile:
                 return None
             block = self.data_blocks[block_id]
             if not block.parsed:
-                block.reader.seek(0)
                 block.read()
                 block.parsed = True
+                self._release_if_parsed()
             return block
         if block_name is not None:
             blocks = []
@@ -73,8 +107,13 @@ class ValveCompiledFile:
                             block.read()
                             block.parsed = True
                         blocks.append(block)
+            self._release_if_parsed()
             return blocks
 
+    def _release_if_parsed(self):
+        if all(block is None or block.parsed for block in self.data_blocks):
+            self.release_buffer()
+
     def get_data_block_class(self, block_name):
         from .blocks import TEXR, DATA, NTRO, REDI, RERL, VBIB, MRPH, ANIM
 
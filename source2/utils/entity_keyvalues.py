@@ -1,6 +1,37 @@
+import struct
+from typing import List, Dict, Any
+
 from ...utilities.byte_io_mdl import ByteIO
 from .entity_keyvalues_keys import EntityKeyValuesKeys
 
+_HEADER = struct.Struct('<iII')
+_UINT32 = struct.Struct('<I')
+
+
+def _build_value_readers():
+    readers = {}
+    for value_types, fmt, single in (((6,), '<b', True),  # bool
+                                     ((5, 16, 37), '<i', True),  # int32
+                                     ((1, 15), '<f', True),  # float
+                                     ((9,), '<4B', False),  # color
+                                     ((26,), '<Q', True),
+                                     ((3, 14, 40, 43, 45, 54, 39), '<3f', False),
+                                     ((25,), '<2f', False),
+                                     ((4, 27), '<4f', False),
+                                     ((46,), '<3i', False),
+                                     ):
+        for value_type in value_types:
+            readers[value_type] = (struct.Struct(fmt), single)
+    return readers
+
+
+_VALUE_READERS = _build_value_readers()
+
+
+def _read_string(data: bytes, offset: int):
+    end = data.index(b'\x00', offset)
+    return data[offset:end].decode('latin', errors='replace'), end + 1
+
 
 class EntityKeyValues:
     def __init__(self):
@@ -8,45 +39,52 @@ class EntityKeyValues:
         self.base = {}
 
     def read(self, reader: ByteIO):
-        version = reader.read_int32()
+        data = reader.read(-1)
+        consumed = self.parse_buffer(data, self.base, self.key_lookup.lookup_table)
+        reader.rewind(len(data) - consumed)
+
+    @classmethod
+    def read_entity_lump(cls, entity_key_values: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Decodes m_keyValuesData of every entity in lump in one pass, sharing single key lookup table"""
+        lookup_table = EntityKeyValuesKeys().lookup_table
+        entities = []
+        for entity_kv in entity_key_values:
+            data = entity_kv['m_keyValuesData']
+            if not isinstance(data, bytes):
+                data = bytes(data)
+            entity_data = {}
+            cls.parse_buffer(data, entity_data, lookup_table)
+            entities.append(entity_data)
+        return entities
+
+    @staticmethod
+    def parse_buffer(data: bytes, parent: Dict[str, Any], lookup_table: Dict[int, str]):
+        version, hashed_fields_count, string_fields_count = _HEADER.unpack_from(data)
         assert version == 1, f"Unknown version of entity keyvalues:{version}"
-        hashed_fields_count = reader.read_uint32()
-        string_fields_count = reader.read_uint32()
-        for _ in range(hashed_fields_count):
-            self.read_value(self.base, reader)
-        for _ in range(string_fields_count):
-            self.read_value(self.base, reader, True)
-
-    def read_value(self, parent, reader: ByteIO, use_string: bool = False):
-        key = reader.read_uint32()
-        key = self.key_lookup.get(key)
-        if use_string:
-            key = reader.read_ascii_string()
-        else:
-            key = str(key)
-        value_type = reader.read_uint32()
-
-        if value_type == 30:
-            parent[key] = reader.read_ascii_string()
-        elif value_type == 6:  # bool
-            parent[key] = reader.read_int8()
-        elif value_type == 5 or value_type == 16:  # int32
-            parent[key] = reader.read_int32()
-        elif value_type == 1 or value_type == 15:  # float
-            parent[key] = reader.read_float()
-        elif value_type == 9:  # color
-            parent[key] = reader.read_fmt("4B")
-        elif value_type == 26:
-            parent[key] = str(reader.read_uint64())
-        elif value_type == 37:
-            parent[key] = reader.read_int32()
-        elif value_type in [3, 14, 40, 43, 45, 54, 39]:
-            parent[key] = reader.read_fmt('3f')
-        elif value_type in [25]:
-            parent[key] = reader.read_fmt('2f')
-        elif value_type in [4, 27]:
-            parent[key] = reader.read_fmt('4f')
-        elif value_type == 39 or value_type == 46:
-            parent[key] = reader.read_fmt('3i')
-        else:
-            raise NotImplementedError(f"Unknown value type({value_type}) offset:{reader.tell()}")
+        offset = _HEADER.size
+        for field_id in range(hashed_fields_count + string_fields_count):
+            key_hash, = _UINT32.unpack_from(data, offset)
+            offset += 4
+            if field_id >= hashed_fields_count:
+                key, offset = _read_string(data, offset)
+            else:
+                key = str(lookup_table.get(key_hash, key_hash))
+            value_type, = _UINT32.unpack_from(data, offset)
+            offset += 4
+
+            if value_type == 30:
+                parent[key], offset = _read_string(data, offset)
+                continue
+            value_reader = _VALUE_READERS.get(value_type, None)
+            if value_reader is None:
+                raise NotImplementedError(f"Unknown value type({value_type}) offset:{offset}")
+            value_struct, single = value_reader
+            value = value_struct.unpack_from(data, offset)
+            offset += value_struct.size
+            if value_type == 26:
+                parent[key] = str(value[0])
+            elif single:
+                parent[key] = value[0]
+            else:
+                parent[key] = value
+        return offset
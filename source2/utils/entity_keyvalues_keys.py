@@ -1,22 +1,64 @@
+import array
+import struct
+import zlib
 from pathlib import Path
+
 from .murmurhash2 import murmur_hash2
 
 MURMUR2SEED = 0x31415926
 
+KEY_LIST_PATH = Path(__file__).parent / "entitykeyvalues_list.txt"
+KEY_HASH_CACHE_PATH = Path(__file__).parent / "entitykeyvalues_list.bin"
+
+_CACHE_HEADER = struct.Struct('<4sII')
+_CACHE_MAGIC = b'EKVH'
+
 
 class EntityKeyValuesKeys:
     lookup_table = {}
-    _all_keys = []
 
-    def __init__(self, key_list: Path = Path(__file__).parent / Path("./entitykeyvalues_list.txt")):
+    def __init__(self, key_list: Path = KEY_LIST_PATH, hash_cache: Path = KEY_HASH_CACHE_PATH):
         if not self.lookup_table:
-            self._all_keys = key_list.open('r').readlines()
-            self.precompute_keys()
+            key_data = key_list.read_bytes()
+            key_list_crc = zlib.crc32(key_data)
+            keys = key_data.decode('ascii').splitlines()
+            hashes = self.load_hash_cache(hash_cache, key_list_crc, len(keys))
+            if hashes is None:
+                hashes = self.precompute_keys(keys)
+                self.save_hash_cache(hash_cache, key_list_crc, hashes)
+            self.lookup_table.update(zip(hashes, keys))
+
+    @staticmethod
+    def precompute_keys(keys):
+        return array.array('I', (murmur_hash2(key, MURMUR2SEED) for key in keys))
+
+    @staticmethod
+    def load_hash_cache(hash_cache: Path, key_list_crc: int, key_count: int):
+        """Returns cached hashes in key list order or None if cache is missing or stale"""
+        try:
+            data = hash_cache.read_bytes()
+        except OSError:
+            return None
+        if len(data) < _CACHE_HEADER.size:
+            return None
+        magic, crc, count = _CACHE_HEADER.unpack_from(data)
+        if magic != _CACHE_MAGIC or crc != key_list_crc or count != key_count:
+            return None
+        hashes = array.array('I')
+        hashes.frombytes(data[_CACHE_HEADER.size:_CACHE_HEADER.size + count * 4])
+        if len(hashes) != count:
+            return None
+        return hashes
 
-    def precompute_keys(self):
-        for skey in self._all_keys:
-            mhash = murmur_hash2(skey.strip('\n'), MURMUR2SEED)
-            self.lookup_table[mhash] = skey.strip('\n')
+    @staticmethod
+    def save_hash_cache(hash_cache: Path, key_list_crc: int, hashes: array.array):
+        try:
+            with hash_cache.open('wb') as f:
+                f.write(_CACHE_HEADER.pack(_CACHE_MAGIC, key_list_crc, len(hashes)))
+                f.write(hashes.tobytes())
+        except OSError:
+            # Add-on folder may be read-only, hashes will be recomputed next session
+            pass
 
     def get(self, key_hash):
         return self.lookup_table.get(key_hash, key_hash)
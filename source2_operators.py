@@ -3,6 +3,7 @@ from pathlib import Path
 import bpy
 from bpy.props import StringProperty, BoolProperty, CollectionProperty, EnumProperty, FloatProperty
 
+from .bpy_utilities.logging import flush_logs
 from .source2.misc.camera_loader import load_camera
 from .source2.resouce_types.valve_model import ValveCompiledModel
 from .source2.resouce_types.valve_texture import ValveCompiledTexture
@@ -26,6 +27,7 @@ class VMDLImport_OT_operator(bpy.types.Operator):
 
     filter_glob: StringProperty(default="*.vmdl_c", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -61,6 +63,7 @@ class VWRLDImport_OT_operator(bpy.types.Operator):
     invert_uv: BoolProperty(name="invert UV?", default=True)
     scale: FloatProperty(name="World scale", default=HAMMER_UNIT_TO_METERS, precision=6)
 
+    @flush_logs
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -93,6 +96,7 @@ class VMATImport_OT_operator(bpy.types.Operator):
     split_alpha: BoolProperty(name="Extract alpha texture", default=True)
     filter_glob: StringProperty(default="*.vmat_c", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
 
         if Path(self.filepath).is_file():
@@ -123,6 +127,7 @@ class VTEXImport_OT_operator(bpy.types.Operator):
     files: CollectionProperty(name='File paths', type=bpy.types.OperatorFileListElement)
     filter_glob: StringProperty(default="*.vtex_c", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
         if Path(self.filepath).is_file():
             directory = Path(self.filepath).parent.absolute()
@@ -149,6 +154,7 @@ class DMXCameraImport_OT_operator(bpy.types.Operator):
     files: CollectionProperty(name='File paths', type=bpy.types.OperatorFileListElement)
     filter_glob: StringProperty(default="*.dmx", options={'HIDDEN'})
 
+    @flush_logs
     def execute(self, context):
         if Path(self.filepath).is_file():
             directory = Path(self.filepath).parent.absolute()
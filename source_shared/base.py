@@ -1,10 +1,28 @@
+import threading
+
+
 class Base:
     storage = {}
+    _thread_storage = threading.local()
+
+    @classmethod
+    def _local_storage(cls):
+        local_storage = getattr(Base._thread_storage, 'storage', None)
+        if local_storage is None:
+            local_storage = Base._thread_storage.storage = {}
+        return local_storage
 
     @classmethod
     def store_value(cls, key, value):
-        cls.storage[key] = value
+        # Files can be parsed from worker threads, each thread keeps values of its own parser.
+        # Only main thread publishes to shared storage, so worker values never leak into other threads
+        cls._local_storage()[key] = value
+        if threading.current_thread() is threading.main_thread():
+            cls.storage[key] = value
 
     @classmethod
     def get_value(cls, key):
-        return cls.storage.get(key, None)
\ No newline at end of file
+        local_storage = cls._local_storage()
+        if key in local_storage:
+            return local_storage[key]
+        return cls.storage.get(key, None)
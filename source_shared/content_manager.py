@@ -1,9 +1,11 @@
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union, Dict
+from typing import Union, Dict, Optional, Tuple, Iterable
 
 from ..bpy_utilities.logging import BPYLoggingManager
 from ..source_shared.non_source_sub_manager import NonSourceContentProvider
 from ..source_shared.content_provider_base import ContentProviderBase
+from ..source_shared.lazy_sub_manager import LazyContentProvider
 from ..source_shared.vpk_sub_manager import VPKContentProvider
 from ..source1.source1_content_provider import GameinfoContentProvider as Source1GameinfoContentProvider
 from ..source2.source2_content_provider import GameinfoContentProvider as Source2GameinfoContentProvider
@@ -13,11 +15,48 @@ from ..utilities.singleton import SingletonMeta
 log_manager = BPYLoggingManager()
 logger = log_manager.get_logger('content_manager')
 
+# Max number of remembered failed lookups
+NEGATIVE_CACHE_SIZE = 8192
+
+
+def _get_mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _open_bsp_pak_lump(path: Path):
+    from ..source1.bsp.bsp_file import open_bsp
+    bsp = open_bsp(path)
+    bsp.parse()
+    return bsp.get_lump('LUMP_PAK')
+
 
 class ContentManager(metaclass=SingletonMeta):
     def __init__(self):
         self.content_providers: Dict[str, ContentProviderBase] = {}
         self._titanfall_mode = False
+        self._provider_mtimes: Dict[str, Optional[float]] = {}
+        # Filesystem probing results, dropped whenever provider set changes
+        self._mod_root_cache: Dict[Path, Tuple[bool, Path]] = {}
+        self._provider_by_directory: Dict[Path, ContentProviderBase] = {}
+        # Paths no provider has, in least recently missed order
+        self._missing_files: 'OrderedDict[str, None]' = OrderedDict()
+
+    def register_content_provider(self, name: str, content_provider: ContentProviderBase):
+        if content_provider is None:
+            return
+        old_provider = self.content_providers.get(name, None)
+        self.content_providers[name] = content_provider
+        if old_provider is not None and all(provider is not old_provider
+                                            for provider in self.content_providers.values()):
+            old_provider.close()
+        self._mod_root_cache.clear()
+        self._provider_by_directory.clear()
+        self._missing_files.clear()
+        filepath = Path(content_provider.filepath)
+        self._provider_mtimes[str(filepath)] = _get_mtime(filepath)
 
     def scan_for_content(self, source_game_path: Union[str, Path]):
 
@@ -31,11 +70,11 @@ class ContentManager(metaclass=SingletonMeta):
             vpk_path = source_game_path
             if vpk_path.exists():
                 sub_manager = VPKContentProvider(vpk_path)
-                self.content_providers[f'{source_game_path.parent.stem}_{source_game_path.stem}'] = sub_manager
+                self.register_content_provider(f'{source_game_path.parent.stem}_{source_game_path.stem}', sub_manager)
                 logger.info(f'Registered sub manager for {source_game_path.parent.stem}_{source_game_path.stem}')
                 return
 
-        is_source, root_path = self.is_source_mod(source_game_path)
+        is_source, root_path = self.get_mod_root(source_game_path)
         if root_path.stem in self.content_providers:
             return
         if is_source:
@@ -44,58 +83,62 @@ class ContentManager(metaclass=SingletonMeta):
                 sub_manager = Source1GameinfoContentProvider(gameinfo)
                 if sub_manager.data.get('game', None) == 'Titanfall':
                     self._titanfall_mode = True
-                self.content_providers[root_path.stem] = sub_manager
+                self.register_content_provider(root_path.stem, sub_manager)
                 logger.info(f'Registered sub manager for {root_path.stem}')
                 for mod in sub_manager.get_search_paths():
                     self.scan_for_content(mod)
             gameinfos = root_path.glob('*gameinfo*.gi')
             for gameinfo in gameinfos:
                 sub_manager = Source2GameinfoContentProvider(gameinfo)
-                self.content_providers[root_path.stem] = sub_manager
+                self.register_content_provider(root_path.stem, sub_manager)
                 logger.info(f'Registered sub manager for {root_path.stem}')
                 for mod in sub_manager.get_search_paths():
                     self.scan_for_content(mod)
         elif 'workshop' in root_path.name:
             sub_manager = NonSourceContentProvider(root_path)
-            self.content_providers[root_path.stem] = sub_manager
+            self.register_content_provider(root_path.stem, sub_manager)
             logger.info(f'Registered sub manager for {root_path.stem}')
             for mod in root_path.parent.iterdir():
                 if mod.is_dir():
                     self.scan_for_content(mod)
         elif 'download' in root_path.name:
             sub_manager = NonSourceContentProvider(root_path)
-            self.content_providers[root_path.stem] = sub_manager
+            self.register_content_provider(root_path.stem, sub_manager)
             logger.info(f'Registered sub manager for {root_path.stem}')
             self.scan_for_content(root_path.parent)
         else:
             if root_path.is_dir():
                 sub_manager = NonSourceContentProvider(root_path)
-                self.content_providers[root_path.stem] = sub_manager
+                self.register_content_provider(root_path.stem, sub_manager)
                 logger.info(f'Registered sub manager for {source_game_path.stem}')
 
     def deserialize(self, data: Dict[str, str]):
+        """Registers serialized providers, reusing ones already registered for the same unchanged file.
+
+        VPK and BSP providers are wrapped in LazyContentProvider, so their directory trees
+        and pak lumps are only read on the first lookup.
+        """
+        registered = {str(Path(provider.filepath)): provider for provider in self.content_providers.values()}
         for name, path in data.items():
+            filepath = Path(path)
+            existing = registered.get(str(filepath), None)
+            if existing is not None and self._provider_mtimes.get(str(filepath)) == _get_mtime(filepath):
+                if self.content_providers.get(name, None) is not existing:
+                    self.register_content_provider(name, existing)
+                continue
             if path.endswith('.vpk'):
-                sub_manager = VPKContentProvider(Path(path))
-                self.content_providers[name] = sub_manager
+                sub_manager = LazyContentProvider(filepath, VPKContentProvider)
             elif path.endswith('.txt'):
-                sub_manager = Source1GameinfoContentProvider(Path(path))
+                sub_manager = Source1GameinfoContentProvider(filepath)
                 if sub_manager.data['game'] == 'Titanfall':
                     self._titanfall_mode = True
-                self.content_providers[name] = sub_manager
             elif path.endswith('.gi'):
-                sub_manager = Source2GameinfoContentProvider(Path(path))
-                self.content_providers[name] = sub_manager
+                sub_manager = Source2GameinfoContentProvider(filepath)
             elif path.endswith('.bsp'):
-                from ..source1.bsp.bsp_file import open_bsp
-                bsp = open_bsp(path)
-                bsp.parse()
-                pak_lump = bsp.get_lump('LUMP_PAK')
-                if pak_lump:
-                    self.content_providers[name] = pak_lump
+                sub_manager = LazyContentProvider(filepath, _open_bsp_pak_lump)
             else:
-                sub_manager = NonSourceContentProvider(Path(path))
-                self.content_providers[name] = sub_manager
+                sub_manager = NonSourceContentProvider(filepath)
+            self.register_content_provider(name, sub_manager)
 
     @staticmethod
     def is_source_mod(path: Path, second=False):
@@ -110,21 +153,72 @@ class ContentManager(metaclass=SingletonMeta):
             return ContentManager.is_source_mod(get_mod_path(path), True)
         return False, path
 
-    def find_file(self, filepath: str, additional_dir=None, extension=None, *, silent=False):
+    def get_mod_root(self, path: Path) -> Tuple[bool, Path]:
+        """Memoized is_source_mod"""
+        mod_root = self._mod_root_cache.get(path, None)
+        if mod_root is None:
+            mod_root = self._mod_root_cache[path] = self.is_source_mod(path)
+        return mod_root
 
+    @staticmethod
+    def _build_path(filepath, additional_dir=None, extension=None) -> Path:
         new_filepath = Path(str(filepath).strip('/\\').rstrip('/\\'))
         if additional_dir:
             new_filepath = Path(additional_dir, new_filepath)
         if extension:
             new_filepath = new_filepath.with_suffix(extension)
+        return new_filepath
+
+    def _is_known_missing(self, filepath: Path):
+        key = filepath.as_posix()
+        try:
+            self._missing_files.move_to_end(key)
+        except KeyError:
+            return False
+        return True
+
+    def _mark_missing(self, filepath: Path):
+        self._missing_files[filepath.as_posix()] = None
+        if len(self._missing_files) > NEGATIVE_CACHE_SIZE:
+            self._missing_files.popitem(last=False)
+
+    def find_file(self, filepath: str, additional_dir=None, extension=None, *, silent=False):
+
+        new_filepath = self._build_path(filepath, additional_dir, extension)
         if not silent:
             logger.info(f'Requesting {new_filepath} file')
+        if self._is_known_missing(new_filepath):
+            return None
         for mod, submanager in self.content_providers.items():
             file = submanager.find_file(new_filepath)
             if file is not None:
                 if not silent:
                     logger.debug(f'Found in {mod}!')
                 return file
+        self._mark_missing(new_filepath)
+        return None
+
+    def find_first(self, candidates: Iterable[Union[str, Path]], additional_dir=None, extension=None, *,
+                   silent=False):
+        """Returns first found file of alternative paths.
+
+        Providers are walked once, within a provider earlier candidates win.
+        """
+        candidates = [self._build_path(candidate, additional_dir, extension) for candidate in candidates]
+        if not silent:
+            logger.info(f'Requesting first of {", ".join(map(str, candidates))} files')
+        candidates = [candidate for candidate in candidates if not self._is_known_missing(candidate)]
+        if not candidates:
+            return None
+        for mod, submanager in self.content_providers.items():
+            for candidate in candidates:
+                file = submanager.find_file(candidate)
+                if file is not None:
+                    if not silent:
+                        logger.debug(f'Found {candidate} in {mod}!')
+                    return file
+        for candidate in candidates:
+            self._mark_missing(candidate)
         return None
 
     def find_texture(self, filepath, *, silent=False):
@@ -143,9 +237,15 @@ class ContentManager(metaclass=SingletonMeta):
 
     def get_content_provider_from_path(self, filepath):
         filepath = Path(filepath)
-        for name, content_provider in self.content_providers.items():
-            cp_root = content_provider.filepath.parent
-            is_sm, fp_root = self.is_source_mod(filepath)
-            if fp_root == cp_root:
-                return content_provider
-        return NonSourceContentProvider(filepath.parent)
+        directory = filepath.parent
+        provider = self._provider_by_directory.get(directory, None)
+        if provider is None:
+            _, fp_root = self.get_mod_root(filepath)
+            for content_provider in self.content_providers.values():
+                if fp_root == content_provider.filepath.parent:
+                    provider = content_provider
+                    break
+            else:
+                provider = NonSourceContentProvider(directory)
+            self._provider_by_directory[directory] = provider
+        return provider
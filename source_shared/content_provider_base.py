@@ -9,6 +9,10 @@ class ContentProviderBase:
     def find_file(self, filepath: str):
         raise NotImplementedError('Implement me!')
 
+    def close(self):
+        """Releases files held open by provider"""
+        pass
+
     @property
     def steam_id(self):
         return 0
@@ -0,0 +1,37 @@
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..source_shared.content_provider_base import ContentProviderBase
+
+
+class LazyContentProvider(ContentProviderBase):
+    """Defers construction of expensive providers (VPK directory trees, BSP pak lumps) until first lookup"""
+
+    def __init__(self, filepath: Path, factory: Callable[[Path], Optional[ContentProviderBase]]):
+        super().__init__(filepath)
+        self._factory = factory
+        self._provider: Optional[ContentProviderBase] = None
+        self._created = False
+
+    @property
+    def provider(self) -> Optional[ContentProviderBase]:
+        if not self._created:
+            self._provider = self._factory(self.filepath)
+            self._created = True
+        return self._provider
+
+    def find_file(self, filepath: str):
+        provider = self.provider
+        if provider is None:
+            return None
+        return provider.find_file(filepath)
+
+    def close(self):
+        if self._provider is not None:
+            self._provider.close()
+        self._provider = None
+        self._created = False
+
+    @property
+    def steam_id(self):
+        return getattr(self.provider, 'steam_id', 0)
@@ -11,10 +11,80 @@ class OffsetOutOfBounds(Exception):
     pass
 
 
+class MemoryViewReader(io.RawIOBase):
+    """Read-only seekable file over existing buffer (memoryview of mmap, bytes), nothing is copied until read"""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._buffer = memoryview(buffer)
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        if offset < 0:
+            raise ValueError(f'Negative seek position {offset}')
+        self._position = offset
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def readinto(self, buffer):
+        data = self._buffer[self._position:self._position + len(buffer)]
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def read(self, size=-1):
+        end = len(self._buffer) if size is None or size < 0 else self._position + size
+        data = self._buffer[self._position:end].tobytes()
+        self._position += len(data)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def close(self):
+        try:
+            self._buffer.release()
+        except BufferError:
+            pass
+        super().close()
+
+    def getbuffer(self):
+        # New view each call like BytesIO.getbuffer, so caller can release it without breaking reader
+        return memoryview(self._buffer)
+
+
 def split(array, n=3):
     return [array[i:i + n] for i in range(0, len(array), n)]
 
 
+def read_source1_strings(data: bytes, offsets) -> list:
+    """Resolves many null terminated strings by absolute offset, offsets of 0 yield empty strings.
+
+    Offsets are usually heavily shared (surface props, parent names), so each is decoded once.
+    """
+    cache = {0: ''}
+    strings = []
+    for offset in offsets:
+        string = cache.get(offset, None)
+        if string is None:
+            end = data.find(b'\x00', offset)
+            string = cache[offset] = data[offset:end if end >= 0 else len(data)].decode('latin', errors='replace')
+        strings.append(string)
+    return strings
+
+
 class ByteIO:
     @contextlib.contextmanager
     def save_current_pos(self):
@@ -113,6 +113,23 @@ def quat_to_matrix(quat):
     return matrix
 
 
+def quat_multiply_array(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product of xyzw quaternion arrays, broadcast over leading axes"""
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack([aw * bx + ax * bw + ay * bz - az * by,
+                     aw * by - ax * bz + ay * bw + az * bx,
+                     aw * bz + ax * by - ay * bx + az * bw,
+                     aw * bw - ax * bx - ay * by - az * bz], -1)
+
+
+def quat_rotate_array(quat: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Rotates vectors by xyzw quaternions, broadcast over leading axes"""
+    u = quat[..., :3]
+    t = 2 * np.cross(u, vectors)
+    return vectors + quat[..., 3:] * t + np.cross(u, t)
+
+
 def convert_rotation_source2_to_blender(source2_rotation: Union[List[float], np.ndarray]) -> List[float]:
     # XYZ -> ZXY
     return [math.radians(source2_rotation[2]), math.radians(source2_rotation[0]),
@@ -33,10 +33,8 @@ def find_vtx(mdl_path: Path):
 
 def find_vtx_cm(mdl_path: Path, content_manager):
     possible_vtx_vertsion = [70, 80, 90, 11, 12]
-    for vtx_version in possible_vtx_vertsion[::-1]:
-        path = content_manager.find_file(mdl_path.with_suffix(f'.dx{vtx_version}.vtx'))
-        if path:
-            return path
+    return content_manager.find_first([mdl_path.with_suffix(f'.dx{vtx_version}.vtx')
+                                       for vtx_version in possible_vtx_vertsion[::-1]])
 
 
 def backwalk_file_resolver(current_path, file_to_find):